@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""Benchmark daemon handlers end to end on a synthetic capture.
+
+Every case runs a JSON-RPC request through ``_handle_request`` and encodes the
+response the way the server would (``_encode_response``/``_encode_stream``),
+against a capture built by ``tests/mocks/capture_gen.py``. Cases that clear a
+per-replay cache first measure the cold path (action walk, pass list, usage
+table); the rest measure the warm one.
+
+Usage::
+
+    python scripts/bench_daemon.py                # compare with the baseline
+    python scripts/bench_daemon.py --update       # record a new baseline
+    python scripts/bench_daemon.py --scale 20     # ~200k-event capture
+
+Times are normalised by a fixed pure-Python calibration loop, so a baseline
+recorded on one machine is roughly comparable on another. A case fails when
+its normalised time exceeds the baseline by more than ``--threshold``
+(default 2x, loose enough for shared CI runners); the exit status is then 1.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+_ROOT = Path(__file__).resolve().parent.parent
+for _p in (_ROOT / "src", _ROOT / "tests" / "mocks"):
+    if str(_p) not in sys.path:
+        sys.path.insert(0, str(_p))
+
+import capture_gen  # noqa: E402
+
+from rdc.daemon_server import (  # noqa: E402
+    DaemonState,
+    _encode_response,
+    _encode_stream,
+    _handle_request,
+)
+
+BASELINE_PATH = Path(__file__).resolve().parent / "bench_baseline.json"
+DEFAULT_THRESHOLD = 2.0
+
+Case = Callable[[], Any]
+
+
+def _calibrate() -> float:
+    """Time (ms) of a fixed dict/str workload, used to normalise results."""
+
+    def _work() -> None:
+        d: dict[int, str] = {}
+        for i in range(200_000):
+            d[i] = str(i)
+        json.dumps(d)
+
+    return _best_ms(_work, 5)
+
+
+_MIN_SAMPLE_S = 0.02
+
+
+def _best_ms(fn: Case, repeat: int) -> float:
+    """Best per-call time (ms) over *repeat* samples.
+
+    Fast cases are called in a loop so each sample lasts at least 20 ms,
+    like ``timeit.Timer.autorange``.
+    """
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= _MIN_SAMPLE_S:
+            break
+        number *= 10 if elapsed < _MIN_SAMPLE_S / 10 else 2
+    best = elapsed
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, time.perf_counter() - start)
+    return best / number * 1000.0
+
+
+def _rpc(state: DaemonState, method: str, params: dict[str, Any] | None = None) -> int:
+    """Dispatch one request and encode its response; returns the bytes produced."""
+    request = {"jsonrpc": "2.0", "id": 1, "method": method, "params": {"_token": "tok"}}
+    request["params"].update(params or {})
+    response, _ = _handle_request(request, state)
+    if "error" in response:
+        raise RuntimeError(f"{method}: {response['error']['message']}")
+    result = response["result"]
+    if isinstance(result, dict) and "_stream" in result:
+        return sum(len(chunk) for chunk in _encode_stream(response))
+    line, binary = _encode_response(response)
+    return len(line) + (binary.nbytes if isinstance(binary, memoryview) else 0)
+
+
+def build_cases(scale: float) -> dict[str, Case]:
+    """Generate the capture for *scale* and return the benchmark cases by name."""
+    from rdc.diff.alignment import lcs_align
+
+    cap = capture_gen.generate(capture_gen.CaptureSpec().scaled(scale))
+    state = capture_gen.load_state(cap)
+    draw = cap.draw_eids[len(cap.draw_eids) // 2]
+    keys = [(a.eid % 7, a.num_indices % 5) for a in state._action_index.flat]
+    n_align = min(len(keys), 1500)
+    keys_a, keys_b = keys[:n_align], keys[1 : n_align + 1]
+
+    def _cold(attr: str, method: str, params: dict[str, Any] | None = None) -> Case:
+        def _run() -> int:
+            setattr(state, attr, None)
+            return _rpc(state, method, params)
+
+        return _run
+
+    return {
+        "load": lambda: capture_gen.load_state(cap),
+        "events": _cold("_action_index", "events"),
+        "events_stream": lambda: _rpc(state, "events", {"_stream": True}),
+        "draws": lambda: _rpc(state, "draws"),
+        "passes": _cold("_pass_catalog", "passes"),
+        "vfs_ls_draws": lambda: _rpc(state, "vfs_ls", {"path": "/draws"}),
+        "usage_all": _cold("_usage_table", "usage_all"),
+        "mesh_data_json": lambda: _rpc(state, "mesh_data", {"eid": draw}),
+        "mesh_data_binary": lambda: _rpc(state, "mesh_data", {"eid": draw, "binary": True}),
+        "buf_raw": lambda: _rpc(state, "buf_raw", {"id": cap.vertex_buffer, "binary": True}),
+        "lcs_align": lambda: lcs_align(keys_a, keys_b),
+    }
+
+
+def run(scale: float, repeat: int, only: list[str] | None = None) -> dict[str, Any]:
+    """Run the suite; returns ``{"scale", "calibration_ms", "cases": {name: ms}}``."""
+    cases = build_cases(scale)
+    calibration = _calibrate()
+    results: dict[str, float] = {}
+    for name, fn in cases.items():
+        if only and name not in only:
+            continue
+        fn()  # warm-up: imports, first-use caches
+        results[name] = round(_best_ms(fn, repeat), 4)
+    calibration = min(calibration, _calibrate())
+    return {"scale": scale, "calibration_ms": round(calibration, 3), "cases": results}
+
+
+def compare(
+    current: dict[str, Any], baseline: dict[str, Any], threshold: float
+) -> list[dict[str, Any]]:
+    """Return one row per case with its normalised ratio against *baseline*."""
+    cal = current["calibration_ms"] / baseline["calibration_ms"]
+    rows = []
+    for name, ms in current["cases"].items():
+        base = baseline["cases"].get(name)
+        ratio = ms / (base * cal) if base else None
+        rows.append(
+            {
+                "case": name,
+                "ms": ms,
+                "baseline_ms": base,
+                "ratio": None if ratio is None else round(ratio, 3),
+                "regressed": ratio is not None and ratio > threshold,
+            }
+        )
+    return rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=float, default=1.0, help="capture size multiplier")
+    parser.add_argument("--repeat", type=int, default=7, help="samples per case (best is kept)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--update", action="store_true", help="write the baseline and exit")
+    parser.add_argument("--case", action="append", dest="cases", help="run only this case")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    current = run(args.scale, args.repeat, args.cases)
+    if args.update:
+        args.baseline.write_text(json.dumps(current, indent=2, sort_keys=True) + "\n")
+        print(f"baseline written to {args.baseline}")
+        return 0
+    if not args.baseline.is_file():
+        print(f"no baseline at {args.baseline}; run with --update first", file=sys.stderr)
+        return 2
+    baseline = json.loads(args.baseline.read_text())
+    if baseline.get("scale") != args.scale:
+        print(
+            f"baseline was recorded at --scale {baseline.get('scale')}, not {args.scale}",
+            file=sys.stderr,
+        )
+        return 2
+    rows = compare(current, baseline, args.threshold)
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        print("CASE\tMS\tBASELINE_MS\tRATIO")
+        for r in rows:
+            flag = "\tREGRESSED" if r["regressed"] else ""
+            print(f"{r['case']}\t{r['ms']}\t{r['baseline_ms']}\t{r['ratio']}{flag}")
+    return 1 if any(r["regressed"] for r in rows) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
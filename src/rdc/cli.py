@@ -79,6 +79,14 @@ def _set_session_env(ctx: click.Context, param: click.Parameter, value: str | No
     os.environ["RDC_SESSION"] = value
 
 
+def _set_profile_env(ctx: click.Context, param: click.Parameter, value: str | None) -> None:
+    """Export --profile/--profile-mem PATH so daemon calls request a profile."""
+    if value is None:
+        return
+    env = "RDC_PROFILE" if param.name == "profile" else "RDC_PROFILE_MEM"
+    os.environ[env] = os.path.abspath(value)
+
+
 def _fix_win_encoding() -> None:
     """Prevent UnicodeEncodeError on Windows cp1252 terminals (B77)."""
     if sys.platform == "win32":
@@ -98,6 +106,24 @@ def _fix_win_encoding() -> None:
     callback=_set_session_env,
     help="Named session (default: value of $RDC_SESSION or 'default').",
 )
+@click.option(
+    "--profile",
+    default=None,
+    metavar="PATH",
+    expose_value=False,
+    is_eager=True,
+    callback=_set_profile_env,
+    help="Profile the command's daemon requests with cProfile; save merged .pstats to PATH.",
+)
+@click.option(
+    "--profile-mem",
+    default=None,
+    metavar="PATH",
+    expose_value=False,
+    is_eager=True,
+    callback=_set_profile_env,
+    help="Save a tracemalloc snapshot of the command's daemon requests to PATH.",
+)
 def main() -> None:
     """rdc: Unix-friendly CLI for RenderDoc captures."""
 
@@ -5,6 +5,8 @@ from __future__ import annotations
 import contextlib
 import io
 import json
+import os
+from collections.abc import Callable, Iterator
 from pathlib import Path
 from typing import Any, NoReturn, cast
 
@@ -12,7 +14,12 @@ import click
 from click.shell_completion import CompletionItem
 
 from rdc.capture_core import CaptureResult
-from rdc.daemon_client import send_request, send_request_binary
+from rdc.daemon_client import (
+    send_batch,
+    send_request,
+    send_request_binary,
+    send_request_stream,
+)
 from rdc.discover import find_renderdoc
 from rdc.protocol import _request
 from rdc.session_state import SessionState, load_session
@@ -21,6 +28,9 @@ __all__ = [
     "require_session",
     "require_renderdoc",
     "call",
+    "call_many",
+    "call_stream",
+    "iter_pages",
     "call_binary",
     "call_with_code",
     "try_call",
@@ -85,7 +95,7 @@ def require_session() -> tuple[str, int, str]:
     if isinstance(pid, int) and pid <= 0:
         try:
             ping = ping_request(session.token)
-            resp = send_request(session.host, session.port, ping, timeout=2.0)
+            resp = send_request(session.host, session.port, ping, timeout=2.0, pooled=True)
             if resp.get("result", {}).get("ok") is True:
                 return session.host, session.port, session.token
         except Exception:  # noqa: BLE001
@@ -98,9 +108,72 @@ def require_session() -> tuple[str, int, str]:
     return session.host, session.port, session.token
 
 
+_PROFILE_ENV = {"cpu": "RDC_PROFILE", "mem": "RDC_PROFILE_MEM"}
+_profile_dumps: dict[str, int] = {}
+
+
+def _payload(method: str, request_id: int, token: str, params: dict[str, Any]) -> dict[str, Any]:
+    """Build a request, asking the daemon to profile it when ``--profile`` is active."""
+    extra: dict[str, Any] = {"_token": token}
+    if method != "file_read":
+        cpu, mem = (bool(os.environ.get(env)) for env in _PROFILE_ENV.values())
+        if cpu or mem:
+            extra["_profile"] = "all" if cpu and mem else "cpu" if cpu else "mem"
+    return _request(method, request_id, {**extra, **params}).to_dict()
+
+
+def _collect_profile(response: dict[str, Any]) -> None:
+    """Fetch the profile dumps named in *response* into the ``--profile`` paths.
+
+    cProfile dumps from every request of a command are merged into one
+    ``.pstats`` file; tracemalloc snapshots cannot be merged, so the second
+    and later ones get a ``.N`` suffix.
+    """
+    body = response.get("result")
+    if not isinstance(body, dict):
+        body = response.get("error", {}).get("data")
+    info = body.pop("_profile", None) if isinstance(body, dict) else None
+    if not isinstance(info, dict):
+        return
+    if "error" in info:
+        click.echo(f"warning: profile not recorded: {info['error']}", err=True)
+    for kind, key in (("cpu", "pstats"), ("mem", "tracemalloc")):
+        out = os.environ.get(_PROFILE_ENV[kind])
+        if not out or key not in info:
+            continue
+        try:
+            data = fetch_remote_file(info[key])
+        except SystemExit:
+            click.echo(f"warning: could not fetch profile {info[key]}", err=True)
+            continue
+        _save_profile(kind, Path(out), data)
+
+
+def _save_profile(kind: str, out: Path, data: bytes) -> None:
+    seen = _profile_dumps.get(kind, 0)
+    _profile_dumps[kind] = seen + 1
+    if seen == 0:
+        out.write_bytes(data)
+        click.echo(f"profile: {out}", err=True)
+        return
+    if kind == "mem":
+        out.with_name(f"{out.stem}.{seen + 1}{out.suffix}").write_bytes(data)
+        return
+    import pstats
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        part = Path(tmp) / "part.pstats"
+        part.write_bytes(data)
+        pstats.Stats(str(out)).add(str(part)).dump_stats(str(out))
+
+
 def call(method: str, params: dict[str, Any], *, timeout: float = 30.0) -> dict[str, Any]:
     """Send a JSON-RPC request to the daemon and return the result.
 
+    Requests share one pooled keep-alive connection per daemon, so a command
+    issuing many calls pays the connect/handshake cost once.
+
     Args:
         method: The JSON-RPC method name.
         params: Request parameters.
@@ -113,16 +186,111 @@ def call(method: str, params: dict[str, Any], *, timeout: float = 30.0) -> dict[
         SystemExit: If the daemon returns an error.
     """
     host, port, token = require_session()
-    payload = _request(method, 1, {"_token": token, **params}).to_dict()
+    payload = _payload(method, 1, token, params)
     try:
-        response = send_request(host, port, payload, timeout=timeout)
+        response = send_request(host, port, payload, timeout=timeout, pooled=True)
     except (OSError, ValueError) as exc:
         _emit_error(f"daemon unreachable: {exc}")
+    _collect_profile(response)
     if "error" in response:
         _emit_error(response["error"]["message"])
     return cast(dict[str, Any], response["result"])
 
 
+PAGE_SIZE = 2000
+
+
+def iter_pages(
+    method: str,
+    params: dict[str, Any],
+    *,
+    page_size: int = PAGE_SIZE,
+    fetch: Callable[[str, dict[str, Any]], dict[str, Any]] | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Yield the results of a paginated list call one page at a time.
+
+    Follows ``next_cursor`` until the daemon reports the last page. A daemon
+    that does not paginate answers with everything in one page.
+
+    Args:
+        method: The JSON-RPC method name.
+        params: Request parameters (without ``cursor``/``page_size``).
+        page_size: Rows requested per page.
+        fetch: Function sending one request; defaults to :func:`call`.
+    """
+    fetch = fetch or call
+    page = fetch(method, {**params, "page_size": page_size})
+    yield page
+    while cursor := page.get("next_cursor"):
+        page = fetch(method, {**params, "page_size": page_size, "cursor": cursor})
+        yield page
+
+
+def call_stream(
+    method: str, params: dict[str, Any], key: str, *, timeout: float = 30.0
+) -> Iterator[dict[str, Any]]:
+    """Send a list request and return an iterator over the streamed ``result[key]`` rows.
+
+    The daemon answers with NDJSON framing, so rows can be printed as they
+    arrive without holding the whole list in memory.
+
+    Raises:
+        SystemExit: If the daemon returns an error, up front or mid-stream.
+    """
+    host, port, token = require_session()
+    payload = _payload(method, 1, token, params)
+    try:
+        response, rows = send_request_stream(host, port, payload, key, timeout=timeout)
+    except (OSError, ValueError) as exc:
+        _emit_error(f"daemon unreachable: {exc}")
+    _collect_profile(response)
+    if "error" in response:
+        _emit_error(response["error"]["message"])
+
+    def _rows() -> Iterator[dict[str, Any]]:
+        try:
+            yield from rows
+        except (OSError, ValueError) as exc:
+            _emit_error(str(exc))
+
+    return _rows()
+
+
+def call_many(
+    calls: list[tuple[str, dict[str, Any]]], *, timeout: float = 30.0
+) -> list[tuple[dict[str, Any] | None, dict[str, Any] | None]]:
+    """Send several requests to the daemon as one JSON-RPC batch.
+
+    The daemon runs the calls in order and answers them in a single round
+    trip. A failing call does not abort the others.
+
+    Args:
+        calls: ``(method, params)`` pairs.
+        timeout: Socket timeout in seconds for the whole batch.
+
+    Returns:
+        One ``(result, error)`` pair per call, in order. Exactly one side is
+        None; ``error`` is the JSON-RPC error object (``code``/``message``).
+
+    Raises:
+        SystemExit: If the daemon is unreachable.
+    """
+    if not calls:
+        return []
+    host, port, token = require_session()
+    payloads = [_payload(method, i + 1, token, params) for i, (method, params) in enumerate(calls)]
+    try:
+        responses = send_batch(host, port, payloads, timeout=timeout, pooled=True)
+    except (OSError, ValueError) as exc:
+        _emit_error(f"daemon unreachable: {exc}")
+    for r in responses:
+        _collect_profile(r)
+    return [
+        (None, r["error"]) if "error" in r else (cast(dict[str, Any], r.get("result", {})), None)
+        for r in responses
+    ]
+
+
 def try_call(method: str, params: dict[str, Any]) -> dict[str, Any] | None:
     """Send a JSON-RPC request, returning None on failure.
 
@@ -133,11 +301,12 @@ def try_call(method: str, params: dict[str, Any]) -> dict[str, Any] | None:
         host, port, token = require_session()
     except SystemExit:
         return None
-    payload = _request(method, 1, {"_token": token, **params}).to_dict()
+    payload = _payload(method, 1, token, params)
     try:
-        response = send_request(host, port, payload)
+        response = send_request(host, port, payload, pooled=True)
     except (OSError, ValueError):
         return None
+    _collect_profile(response)
     if "error" in response:
         return None
     return cast(dict[str, Any], response.get("result", {}))
@@ -156,11 +325,12 @@ def call_with_code(method: str, params: dict[str, Any]) -> tuple[dict[str, Any]
         host, port, token = require_session()
     except SystemExit:
         return None, None
-    payload = _request(method, 1, {"_token": token, **params}).to_dict()
+    payload = _payload(method, 1, token, params)
     try:
-        response = send_request(host, port, payload)
+        response = send_request(host, port, payload, pooled=True)
     except (OSError, ValueError):
         return None, None
+    _collect_profile(response)
     if "error" in response:
         return None, response["error"].get("code")
     return cast(dict[str, Any], response.get("result", {})), None
@@ -182,11 +352,12 @@ def call_binary(method: str, params: dict[str, Any]) -> tuple[dict[str, Any], by
         SystemExit: If the daemon returns an error or is unreachable.
     """
     host, port, token = require_session()
-    payload = _request(method, 1, {"_token": token, **params}).to_dict()
+    payload = _payload(method, 1, token, params)
     try:
-        response, binary = send_request_binary(host, port, payload)
+        response, binary = send_request_binary(host, port, payload, pooled=True)
     except (OSError, ValueError) as exc:
         _emit_error(f"daemon unreachable: {exc}")
+    _collect_profile(response)
     if "error" in response:
         _emit_error(response["error"]["message"])
     return cast(dict[str, Any], response["result"]), binary
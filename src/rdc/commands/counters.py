@@ -10,6 +10,7 @@ from rdc.commands._helpers import call, complete_eid
 from rdc.formatters.json_fmt import write_json
 from rdc.formatters.options import list_output_options, render_list
 from rdc.formatters.tsv import write_tsv
+from rdc.services.counter_service import table_rows
 
 
 @click.command("counters")
@@ -59,12 +60,15 @@ def counters_cmd(
         )
         return
 
-    params: dict[str, Any] = {}
+    params: dict[str, Any] = {"columnar": True}
     if eid is not None:
         params["eid"] = eid
     if name_filter is not None:
         params["name"] = name_filter
     result = call("counter_fetch", params)
+    if "columns" in result:
+        rows = table_rows(result)
+        result = {"rows": rows, "total": len(rows)}
     if use_json:
         write_json(result)
         return
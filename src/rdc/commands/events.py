@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from typing import Any
 
 import click
 
-from rdc.commands._helpers import call, complete_eid, complete_pass_name
-from rdc.formatters.json_fmt import write_json
+from rdc.commands._helpers import (
+    call,
+    call_stream,
+    complete_eid,
+    complete_pass_name,
+    iter_pages,
+)
+from rdc.formatters.json_fmt import write_json, write_jsonl
 from rdc.formatters.kv import write_kv
 from rdc.formatters.options import list_output_options, render_list
 from rdc.formatters.tsv import write_footer, write_tsv
@@ -39,11 +46,14 @@ def events_cmd(
         params["limit"] = limit
     if eid_range:
         params["range"] = eid_range
-    result = call("events", params)
-    rows_data = result.get("events", [])
+    if use_jsonl:
+        write_jsonl(call_stream("events", params, "events"))
+        return
+    pages = iter_pages("events", params, fetch=call)
+    rows_data = (r for page in pages for r in page.get("events", []))
 
     def _table() -> None:
-        rows = [[r["eid"], r["type"], r["name"]] for r in rows_data]
+        rows = ([r["eid"], r["type"], r["name"]] for r in rows_data)
         write_tsv(rows, header=["EID", "TYPE", "NAME"], no_header=no_header)
 
     render_list(
@@ -84,13 +94,19 @@ def draws_cmd(
         params["sort"] = sort_field
     if limit is not None:
         params["limit"] = limit
-    result = call("draws", params)
-    rows_data = result.get("draws", [])
-    summary = result.get("summary", "")
+    summary = ""
+
+    def _draw_rows() -> Iterator[dict[str, Any]]:
+        nonlocal summary
+        for page in iter_pages("draws", params, fetch=call):
+            summary = page.get("summary", "")
+            yield from page.get("draws", [])
+
+    rows_data = _draw_rows()
 
     def _table() -> None:
         header = ["EID", "TYPE", "TRIANGLES", "INSTANCES", "PASS", "MARKER"]
-        rows = [
+        rows = (
             [
                 r["eid"],
                 r["type"],
@@ -100,7 +116,7 @@ def draws_cmd(
                 r.get("marker", "-"),
             ]
             for r in rows_data
-        ]
+        )
         write_tsv(rows, header=header, no_header=no_header)
         if summary:
             write_footer(summary)
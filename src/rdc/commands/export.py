@@ -20,7 +20,12 @@ from rdc.session_state import load_session
 from rdc.vfs.router import resolve_path
 
 
-def _export_vfs_path(vfs_path: str, output: str | None, raw: bool) -> None:
+def _export_vfs_path(
+    vfs_path: str,
+    output: str | None,
+    raw: bool,
+    byte_range: dict[str, int] | None = None,
+) -> None:
     """Resolve a VFS path and deliver binary content."""
     result = call("vfs_ls", {"path": vfs_path})
     kind = result.get("kind")
@@ -35,7 +40,7 @@ def _export_vfs_path(vfs_path: str, output: str | None, raw: bool) -> None:
         click.echo(f"error: {vfs_path}: no content handler", err=True)
         raise SystemExit(1)
 
-    _deliver_binary(vfs_path, match, raw, output)
+    _deliver_binary(vfs_path, match, raw, output, byte_range)
 
 
 def _complete_resource_id_for_export(incomplete: str, kind_substring: str) -> list[CompletionItem]:
@@ -229,6 +234,16 @@ def rt_cmd(
 @click.argument("id", type=int, shell_complete=_complete_buffer_id)
 @click.option("-o", "--output", type=click.Path(), default=None, help="Write to file")
 @click.option("--raw", is_flag=True, help="Force raw output even on TTY")
-def buffer_cmd(id: int, output: str | None, raw: bool) -> None:
-    """Export buffer raw data."""
-    _export_vfs_path(f"/buffers/{id}/data", output, raw)
+@click.option(
+    "--offset", type=click.IntRange(min=0), default=0, help="First byte to export (default 0)"
+)
+@click.option(
+    "--length",
+    type=click.IntRange(min=0),
+    default=0,
+    help="Number of bytes to export (default: to the end)",
+)
+def buffer_cmd(id: int, output: str | None, raw: bool, offset: int, length: int) -> None:
+    """Export buffer raw data, or the --offset/--length range of it."""
+    byte_range = {"offset": offset, "length": length} if offset or length else None
+    _export_vfs_path(f"/buffers/{id}/data", output, raw, byte_range)
@@ -1,14 +1,23 @@
-"""rdc mesh -- export post-transform mesh as OBJ."""
+"""rdc mesh -- export post-transform mesh as OBJ, PLY or glTF."""
 
 from __future__ import annotations
 
+import sys
 from pathlib import Path
 from typing import Any
 
 import click
 
-from rdc.commands._helpers import call, complete_eid
+from rdc.commands._helpers import call, call_binary, complete_eid, complete_pass_name
 from rdc.formatters.json_fmt import write_json
+from rdc.formatters.mesh import (
+    MESH_FORMATS,
+    encode_glb,
+    encode_ply,
+    triangle_faces,
+    write_chunks,
+    write_mesh_file,
+)
 
 
 @click.command("mesh")
@@ -19,7 +28,24 @@ from rdc.formatters.json_fmt import write_json
     default="vs-out",
     help="Mesh data stage (default: vs-out)",
 )
-@click.option("-o", "--output", type=click.Path(), default=None, help="Write to file")
+@click.option(
+    "-o", "--output", type=click.Path(), default=None, help="Write to file (directory for batches)"
+)
+@click.option(
+    "--format",
+    "fmt",
+    type=click.Choice(MESH_FORMATS),
+    default=None,
+    help="Output format (default: from -o suffix, else obj; ply for batches)",
+)
+@click.option(
+    "--pass",
+    "pass_name",
+    default=None,
+    help="Export every draw in this pass to -o DIR",
+    shell_complete=complete_pass_name,
+)
+@click.option("--range", "eid_range", default=None, help="Export every draw in EID range A:B")
 @click.option("--json", "use_json", is_flag=True, help="JSON output")
 @click.option("--no-header", is_flag=True, help="Suppress OBJ header comment")
 @click.option("--position-attribute", default=None, help="VS-IN position input name/semantic")
@@ -30,6 +56,9 @@ def mesh_cmd(
     eid: int | None,
     stage: str,
     output: str | None,
+    fmt: str | None,
+    pass_name: str | None,
+    eid_range: str | None,
     use_json: bool,
     no_header: bool,
     position_attribute: str | None,
@@ -37,7 +66,25 @@ def mesh_cmd(
     position_slot: int | None,
     position_offset: int | None,
 ) -> None:
-    """Export post-transform mesh as OBJ."""
+    """Export post-transform mesh as OBJ, binary PLY, GLB or glTF.
+
+    PLY and GLB can be written to a pipe; .gltf needs -o and writes its
+    buffer next to it as <name>.bin.
+
+    With --pass or --range every draw in the selection is exported in one
+    daemon round trip, one file per draw named <eid>.<format> in -o DIR.
+    """
+    batch = pass_name is not None or eid_range is not None
+    if batch:
+        if eid is not None or use_json:
+            raise click.UsageError("--pass/--range cannot be combined with EID or --json")
+        if pass_name is not None and eid_range is not None:
+            raise click.UsageError("use either --pass or --range, not both")
+        if output is None:
+            raise click.UsageError("--pass/--range need -o DIR")
+    fmt = (fmt or "ply") if batch else _resolve_format(fmt, output)
+    if use_json and fmt != "obj":
+        raise click.UsageError("--json cannot be combined with binary mesh formats")
     params: dict[str, Any] = {"stage": stage}
     if eid is not None:
         params["eid"] = eid
@@ -50,6 +97,17 @@ def mesh_cmd(
     if position_offset is not None:
         params["position_offset"] = position_offset
 
+    if batch:
+        if pass_name is not None:
+            params["pass"] = pass_name
+        else:
+            params["range"] = eid_range
+        _export_batch(params, fmt, Path(str(output)), no_header)
+        return
+    if fmt != "obj":
+        _export_binary(params, fmt, output, no_header)
+        return
+
     result = call("mesh_data", params)
 
     if use_json:
@@ -95,30 +153,21 @@ def _extract_positions(vertices: list[list[float]]) -> list[tuple[float, float,
 
 def _generate_faces(vertex_count: int, indices: list[int], topology: str) -> list[list[int]]:
     """Generate triangle faces from topology. Returns 0-indexed triples."""
-    idx = indices if indices else list(range(vertex_count))
-    n = len(idx)
-    faces: list[list[int]] = []
-    match topology:
-        case "TriangleList":
-            for i in range(0, n - 2, 3):
-                faces.append([idx[i], idx[i + 1], idx[i + 2]])
-        case "TriangleStrip":
-            for i in range(n - 2):
-                if i % 2 == 0:
-                    faces.append([idx[i], idx[i + 1], idx[i + 2]])
-                else:
-                    faces.append([idx[i + 1], idx[i], idx[i + 2]])
-        case "TriangleFan":
-            for i in range(1, n - 1):
-                faces.append([idx[0], idx[i], idx[i + 1]])
-        case _:
-            pass
+    faces: list[list[int]] = _triangle_faces(vertex_count, indices, topology).tolist()
     return faces
 
 
-def _warn_if_no_faces(topology: str, vertex_count: int, faces: list[list[int]]) -> None:
-    """Warn on stderr when a non-triangle topology produces no OBJ faces."""
-    if faces or topology.startswith("Triangle"):
+def _triangle_faces(vertex_count: int, indices: Any, topology: str) -> Any:
+    """Faces as a ``(m, 3)`` uint32 array; non-indexed draws use vertex order."""
+    import numpy as np
+
+    idx = indices if len(indices) else np.arange(vertex_count, dtype=np.uint32)
+    return triangle_faces(idx, topology)
+
+
+def _warn_if_no_faces(topology: str, vertex_count: int, faces: Any) -> None:
+    """Warn on stderr when a non-triangle topology produces no mesh faces."""
+    if len(faces) or topology.startswith("Triangle"):
         return
     click.echo(
         f"mesh: topology {topology!r} has no OBJ face mapping; "
@@ -127,6 +176,140 @@ def _warn_if_no_faces(topology: str, vertex_count: int, faces: list[list[int]])
     )
 
 
+def _resolve_format(fmt: str | None, output: str | None) -> str:
+    if fmt is not None:
+        return fmt
+    suffix = Path(output).suffix.lower().lstrip(".") if output else ""
+    return suffix if suffix in MESH_FORMATS else "obj"
+
+
+def _mesh_arrays(result: dict[str, Any], payload: Any) -> tuple[Any, Any]:
+    """Return float32 ``(n, 3)`` positions and uint32 indices for a mesh_data result.
+
+    Binary payloads are viewed in place; a daemon that answered with JSON
+    ``vertices``/``indices`` is handled too.
+    """
+    import numpy as np
+
+    n = int(result["vertex_count"])
+    if payload is not None:
+        positions = np.frombuffer(payload, dtype="<f4", count=n * 3).reshape(n, 3)
+        indices = np.frombuffer(
+            payload,
+            dtype="<u4",
+            count=int(result["index_count"]),
+            offset=int(result.get("indices_offset", n * 12)),
+        )
+        return positions, indices
+    xyz = _extract_positions(result.get("vertices", []))
+    positions = np.asarray(xyz, dtype="<f4").reshape(len(xyz), 3)
+    return positions, np.asarray(result.get("indices", []), dtype="<u4")
+
+
+def _export_binary(params: dict[str, Any], fmt: str, output: str | None, no_header: bool) -> None:
+    if output is None and fmt == "gltf":
+        raise click.UsageError("--format gltf needs -o (use glb to write to a pipe)")
+    if output is None and sys.stdout.isatty():
+        click.echo(f"error: {fmt} is binary data, use redirect (>) or -o", err=True)
+        raise SystemExit(1)
+
+    result, payload = call_binary("mesh_data", {**params, "binary": True})
+    positions, indices = _mesh_arrays(result, payload)
+    faces = _triangle_faces(len(positions), indices, result["topology"])
+    _warn_if_no_faces(result["topology"], len(positions), faces)
+    if result.get("position_warning"):
+        click.echo(f"mesh: warning: {result['position_warning']}", err=True)
+    comment = ""
+    if not no_header:
+        comment = _export_header(
+            len(positions),
+            len(faces),
+            eid=result["eid"],
+            stage=result["stage"],
+            topology=result["topology"],
+            position_metadata=result,
+        )
+
+    if output:
+        write_mesh_file(Path(output), fmt, positions, faces, comment=comment)
+        click.echo(f"mesh: {len(positions)} vertices, {len(faces)} faces -> {output}", err=True)
+    else:
+        chunks = (
+            encode_ply(positions, faces, comment=comment)
+            if fmt == "ply"
+            else encode_glb(positions, faces)
+        )
+        write_chunks(chunks, sys.stdout.buffer)
+        sys.stdout.buffer.flush()
+
+
+def _export_batch(params: dict[str, Any], fmt: str, out_dir: Path, no_header: bool) -> None:
+    result, payload = call_binary("mesh_batch", params)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    data = memoryview(payload or b"")
+    for mesh in result.get("meshes", []):
+        eid = mesh["eid"]
+        start = int(mesh["offset"])
+        positions, indices = _mesh_arrays(mesh, data[start : start + int(mesh["size"])])
+        faces = _triangle_faces(len(positions), indices, mesh["topology"])
+        _warn_if_no_faces(mesh["topology"], len(positions), faces)
+        if mesh.get("position_warning"):
+            click.echo(f"mesh: warning: eid {eid}: {mesh['position_warning']}", err=True)
+        path = out_dir / f"{eid}.{fmt}"
+        if fmt == "obj":
+            text = _format_obj(
+                positions.tolist(),
+                faces.tolist(),
+                eid=eid,
+                stage=result["stage"],
+                topology=mesh["topology"],
+                no_header=no_header,
+                position_metadata=mesh,
+            )
+            path.write_text(text)
+            continue
+        comment = ""
+        if not no_header:
+            comment = _export_header(
+                len(positions),
+                len(faces),
+                eid=eid,
+                stage=result["stage"],
+                topology=mesh["topology"],
+                position_metadata=mesh,
+            )
+        write_mesh_file(path, fmt, positions, faces, comment=comment)
+    for skip in result.get("skipped", []):
+        click.echo(f"mesh: skipped eid {skip['eid']}: {skip['error']}", err=True)
+    click.echo(
+        f"mesh: {len(result.get('meshes', []))} draws -> {out_dir}"
+        f" ({len(result.get('skipped', []))} skipped)",
+        err=True,
+    )
+
+
+def _export_header(
+    vertex_count: int,
+    face_count: int,
+    *,
+    eid: int,
+    stage: str,
+    topology: str,
+    position_metadata: dict[str, Any] | None = None,
+) -> str:
+    header = (
+        f"rdc mesh export: eid={eid} stage={stage} "
+        f"vertices={vertex_count} faces={face_count} "
+        f"topology={topology}"
+    )
+    if position_metadata and position_metadata.get("position_attribute"):
+        header += (
+            f" position={position_metadata['position_attribute']}"
+            f" position_source={position_metadata.get('position_source', 'unknown')}"
+        )
+    return header
+
+
 def _format_obj(
     positions: list[tuple[float, float, float]],
     faces: list[list[int]],
@@ -140,17 +323,15 @@ def _format_obj(
     """Format vertex positions and faces as OBJ text."""
     lines: list[str] = []
     if not no_header:
-        header = (
-            f"# rdc mesh export: eid={eid} stage={stage} "
-            f"vertices={len(positions)} faces={len(faces)} "
-            f"topology={topology}"
+        header = _export_header(
+            len(positions),
+            len(faces),
+            eid=eid,
+            stage=stage,
+            topology=topology,
+            position_metadata=position_metadata,
         )
-        if position_metadata and position_metadata.get("position_attribute"):
-            header += (
-                f" position={position_metadata['position_attribute']}"
-                f" position_source={position_metadata.get('position_source', 'unknown')}"
-            )
-        lines.append(header)
+        lines.append(f"# {header}")
     for x, y, z in positions:
         lines.append(f"v {x:.6f} {y:.6f} {z:.6f}")
     for face in faces:
@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import os
 from pathlib import Path
+from typing import Any
 
 import click
 from click.shell_completion import CompletionItem
@@ -142,6 +143,12 @@ def _complete_capture_path(
     shell_complete=_complete_capture_path,
 )
 @click.option("--preload", is_flag=True, default=False, help="Preload shader cache after open.")
+@click.option(
+    "--warm",
+    is_flag=True,
+    default=False,
+    help="Warm shader cache, action index and usage table in the background.",
+)
 @click.option(
     "--proxy",
     "proxy_url",
@@ -198,6 +205,7 @@ def _complete_capture_path(
 def open_cmd(
     capture: str | None,
     preload: bool,
+    warm: bool,
     proxy_url: str | None,
     android: bool,
     serial: str | None,
@@ -330,10 +338,17 @@ def open_cmd(
 
         result = call("shaders_preload", {})
         click.echo(f"preloaded {result['shaders']} shader(s)")
+    if warm:
+        from rdc.commands._helpers import call
+
+        call("warm", {})
+        click.echo("warming caches in background (see: rdc status)")
 
 
 @click.command("status")
-def status_cmd() -> None:
+@click.option("--metrics", "show_metrics", is_flag=True, help="Show daemon request metrics.")
+@click.option("--json", "use_json", is_flag=True, help="JSON output")
+def status_cmd(show_metrics: bool, use_json: bool) -> None:
     """Show current daemon-backed session status."""
     ok, result = status_session()
     if not ok:
@@ -342,6 +357,16 @@ def status_cmd() -> None:
 
     payload = result
     assert isinstance(payload, dict)
+    metrics: dict[str, Any] | None = None
+    if show_metrics:
+        from rdc.commands._helpers import call
+
+        metrics = call("metrics", {})
+    if use_json:
+        from rdc.formatters.json_fmt import write_json
+
+        write_json({**payload, "metrics": metrics} if metrics is not None else payload)
+        return
     click.echo(f"session: {os.environ.get('RDC_SESSION') or 'default'}")
     click.echo(f"capture: {payload['capture']}")
     click.echo(f"current_eid: {payload['current_eid']}")
@@ -349,6 +374,58 @@ def status_cmd() -> None:
     click.echo(f"daemon: {payload['daemon']}")
     if "remote" in payload:
         click.echo(f"remote: {payload['remote']}")
+    if "warm" in payload:
+        click.echo(f"warm: {_format_warm(payload['warm'])}")
+    if metrics is not None:
+        _write_metrics(metrics)
+
+
+def _write_metrics(metrics: dict[str, Any]) -> None:
+    """Render the ``metrics`` RPC result: totals, a per-method table and cache sizes."""
+    from rdc.formatters.tsv import write_tsv
+
+    seeks = metrics["seeks"]
+    rate = seeks.get("hit_rate")
+    click.echo(f"requests: {metrics['requests']}  bytes_out: {metrics['bytes_out']}")
+    click.echo(
+        f"seeks: {seeks['issued']} issued, {seeks['cache_hits']} cache hits"
+        + (f" ({rate:.0%})" if rate is not None else "")
+    )
+    methods = sorted(metrics["methods"].items(), key=lambda kv: -kv[1]["total_ms"])
+    rows = (
+        [
+            name,
+            m["count"],
+            m["errors"],
+            f"{m['total_ms']:.1f}",
+            f"{m['mean_ms']:.2f}",
+            "-" if m["p95_ms"] is None else m["p95_ms"],
+            f"{m['max_ms']:.1f}",
+            m["bytes"],
+        ]
+        for name, m in methods
+    )
+    header = ["METHOD", "COUNT", "ERRORS", "TOTAL_MS", "MEAN_MS", "P95_MS", "MAX_MS", "BYTES"]
+    write_tsv(rows, header=header)
+    caches = metrics.get("caches", {})
+    if caches:
+        click.echo("caches: " + ", ".join(f"{k}={v}" for k, v in caches.items()))
+
+
+def _format_warm(warm: dict[str, Any]) -> str:
+    """Render warm-up progress as one status line."""
+    if warm.get("error"):
+        head = f"failed ({warm['error']})"
+    elif warm.get("done"):
+        head = "done"
+    else:
+        head = f"running ({warm.get('stage')})"
+    parts = []
+    if warm.get("shaders"):
+        parts.append("shaders {}/{} draws".format(*warm["shaders"]))
+    if warm.get("usage"):
+        parts.append("usage {}/{} resources".format(*warm["usage"]))
+    return f"{head}: {', '.join(parts)}" if parts else head
 
 
 @click.command("goto")
@@ -5,17 +5,20 @@ from __future__ import annotations
 import datetime
 import json
 from pathlib import Path
+from typing import Any
 
 import click
 
 from rdc.commands._helpers import (
-    call,
-    call_with_code,
+    _emit_error,
+    call_many,
     complete_eid,
     fetch_remote_file,
-    try_call,
 )
 from rdc.formatters.json_fmt import write_json
+from rdc.services.query_service import STAGE_MAP
+
+_MAX_COLOR_TARGETS = 8
 
 
 @click.command("snapshot")
@@ -29,18 +32,39 @@ def snapshot_cmd(eid: int, output: str, use_json: bool) -> None:
 
     files: list[str] = []
 
+    # Everything the bundle needs goes out as one batch: the daemon answers
+    # pipeline, shader list, per-stage disassembly and every attachment
+    # export in a single round trip. Unbound stages simply disassemble to
+    # nothing and are dropped below.
+    stage_names = list(STAGE_MAP)
+    calls: list[tuple[str, dict[str, Any]]] = [
+        ("pipeline", {"eid": eid}),
+        ("shader_all", {"eid": eid}),
+        *(("shader_disasm", {"eid": eid, "stage": stage}) for stage in stage_names),
+        *(("rt_export", {"eid": eid, "target": i}) for i in range(_MAX_COLOR_TARGETS)),
+        ("rt_depth", {"eid": eid}),
+    ]
+    # The daemon replies once every call has finished, so give the batch
+    # the budget the calls would have had one request at a time.
+    responses = call_many(calls, timeout=30.0 * len(calls))
+    pipeline_data, pipe_err = responses[0]
+    shader_resp, _ = responses[1]
+    disasm_resps = dict(zip(stage_names, responses[2 : 2 + len(stage_names)], strict=True))
+    rt_resps = responses[2 + len(stage_names) : -1]
+    depth_result, depth_err = responses[-1]
+
     # Pipeline (fatal on failure)
-    pipeline_data = call("pipeline", {"eid": eid})
+    if pipe_err is not None:
+        _emit_error(pipe_err.get("message", "pipeline failed"))
     pipe_path = out_dir / "pipeline.json"
     pipe_path.write_text(json.dumps(pipeline_data, indent=2) + "\n")
     files.append("pipeline.json")
 
     # Shaders
-    shader_resp = try_call("shader_all", {"eid": eid})
     if shader_resp:
         for s in shader_resp.get("stages", []):
             stage = s["stage"]
-            disasm_resp = try_call("shader_disasm", {"eid": eid, "stage": stage})
+            disasm_resp, _ = disasm_resps.get(stage, (None, None))
             if disasm_resp:
                 (out_dir / f"shader_{stage}.txt").write_text(disasm_resp["disasm"])
                 files.append(f"shader_{stage}.txt")
@@ -48,14 +72,13 @@ def snapshot_cmd(eid: int, output: str, use_json: bool) -> None:
     # Color targets: stop when a target is absent (-32001), but skip-and-warn
     # on a decode failure (-32002, e.g. an unsupported remote format) so one
     # bad target does not silently truncate the rest of the bundle.
-    for i in range(8):
-        result, code = call_with_code("rt_export", {"eid": eid, "target": i})
+    for i, (result, err) in enumerate(rt_resps):
         if result is not None:
             data = fetch_remote_file(result["path"])
             (out_dir / f"color{i}.png").write_bytes(data)
             files.append(f"color{i}.png")
             continue
-        if code == -32002:
+        if err is not None and err.get("code") == -32002:
             click.echo(f"snapshot: skipped color{i} (decode unsupported)", err=True)
             continue
         break
@@ -63,12 +86,11 @@ def snapshot_cmd(eid: int, output: str, use_json: bool) -> None:
     # Depth target: surface a warning when depth decode is unsupported
     # (combined depth-stencil or MSAA in remote mode) instead of silently
     # omitting depth.png.
-    depth_result, depth_code = call_with_code("rt_depth", {"eid": eid})
     if depth_result is not None:
         data = fetch_remote_file(depth_result["path"])
         (out_dir / "depth.png").write_bytes(data)
         files.append("depth.png")
-    elif depth_code == -32002:
+    elif depth_err is not None and depth_err.get("code") == -32002:
         click.echo("snapshot: skipped depth (decode unsupported)", err=True)
 
     # Manifest
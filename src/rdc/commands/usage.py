@@ -7,7 +7,7 @@ from typing import Any
 import click
 from click.shell_completion import CompletionItem
 
-from rdc.commands._helpers import _sort_numeric_like, call, completion_call
+from rdc.commands._helpers import _sort_numeric_like, call, call_stream, completion_call
 from rdc.formatters.json_fmt import write_json
 from rdc.formatters.options import list_output_options, render_list
 from rdc.formatters.tsv import write_tsv
@@ -93,12 +93,14 @@ def _complete_usage_kind(
     shell_complete=_complete_usage_kind,
     help="Filter by usage type.",
 )
+@click.option("--range", "eid_range", default=None, help="Only events in EID range N:M.")
 @list_output_options
 def usage_cmd(
     resource_id: int | None,
     show_all: bool,
     res_type: str | None,
     usage_filter: str | None,
+    eid_range: str | None,
     use_json: bool,
     no_header: bool,
     use_jsonl: bool,
@@ -115,14 +117,15 @@ def usage_cmd(
             params["type"] = res_type
         if usage_filter is not None:
             params["usage"] = usage_filter
-        result = call("usage_all", params)
+        if eid_range is not None:
+            params["range"] = eid_range
         if use_json:
-            write_json(result)
+            write_json(call("usage_all", params))
             return
-        rows = result.get("rows", [])
+        rows = call_stream("usage_all", params, "rows")
 
         def _all_table() -> None:
-            tsv_rows = [[r["id"], r["name"], r["eid"], r["usage"]] for r in rows]
+            tsv_rows = ([r["id"], r["name"], r["eid"], r["usage"]] for r in rows)
             write_tsv(tsv_rows, header=["ID", "NAME", "EID", "USAGE"], no_header=no_header)
 
         render_list(
@@ -139,7 +142,12 @@ def usage_cmd(
         click.echo("error: provide RESOURCE_ID or use --all", err=True)
         raise SystemExit(1)
 
-    result = call("usage", {"id": resource_id})
+    params = {"id": resource_id}
+    if usage_filter is not None:
+        params["usage"] = usage_filter
+    if eid_range is not None:
+        params["range"] = eid_range
+    result = call("usage", params)
     if use_json:
         write_json(result)
         return
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import contextlib
 import io
+import itertools
 import os
 import re
 import shutil
@@ -15,7 +16,7 @@ from typing import Any
 import click
 from click.shell_completion import CompletionItem
 
-from rdc.commands._helpers import call, fetch_remote_file
+from rdc.commands._helpers import call, call_binary, fetch_remote_file, iter_pages
 from rdc.formatters.json_fmt import write_json
 from rdc.formatters.kv import format_kv
 from rdc.formatters.options import render_list
@@ -185,25 +186,28 @@ def ls_cmd(
     if use_long:
         params["long"] = True
 
-    result = call("vfs_ls", params)
-    if result.get("kind") != "dir":
-        click.echo(f"error: {path}: Not a directory", err=True)
-        raise SystemExit(1)
-
-    children = result.get("children", [])
-
     if use_json:
+        result = call("vfs_ls", params)
+        _require_dir(result, path)
         if use_long and result.get("long"):
             write_json(result)
         else:
-            write_json(children)
+            write_json(result.get("children", []))
         return
 
+    pages = iter_pages("vfs_ls", params, fetch=call)
+    result = next(pages)
+    _require_dir(result, path)
+    all_pages = itertools.chain([result], pages)
+
     if use_long and result.get("long"):
+        columns = result.get("columns", [])
+        children = (c for page in all_pages for c in page.get("children", []))
 
         def _table() -> None:
-            columns = result.get("columns", [])
-            click.echo(render_ls_long(children, columns, no_header=no_header))
+            for i, page in enumerate(all_pages):
+                header_off = no_header or i > 0
+                click.echo(render_ls_long(page.get("children", []), columns, no_header=header_off))
 
         render_list(
             children,
@@ -214,15 +218,38 @@ def ls_cmd(
             table=_table,
         )
     else:
-        click.echo(render_ls(children, classify=classify))
+        for page in all_pages:
+            click.echo(render_ls(page.get("children", []), classify=classify))
+
+
+def _require_dir(result: dict[str, Any], path: str) -> None:
+    if result.get("kind") != "dir":
+        click.echo(f"error: {path}: Not a directory", err=True)
+        raise SystemExit(1)
 
 
 def _stdout_is_tty() -> bool:
     return sys.stdout.isatty()
 
 
-def _deliver_binary(path: str, match: Any, raw: bool, output: str | None) -> None:
-    """Handle binary leaf delivery: TTY protection, -o, or pipe."""
+# Handlers that can send their bytes over the binary side channel (``binary``)
+# and accept an ``offset``/``length`` range.
+_STREAMED_HANDLERS = frozenset({"tex_raw", "buf_raw", "cbuffer_raw"})
+
+
+def _deliver_binary(
+    path: str,
+    match: Any,
+    raw: bool,
+    output: str | None,
+    byte_range: dict[str, int] | None = None,
+) -> None:
+    """Handle binary leaf delivery: TTY protection, -o, or pipe.
+
+    Raw texture/buffer/cbuffer bytes are streamed straight from the daemon;
+    other leaves (PNG exports) are rendered to a daemon temp file and
+    fetched from there.
+    """
     if _stdout_is_tty() and not raw and output is None:
         click.echo(
             f"error: {path}: binary data, use redirect (>) or -o",
@@ -230,7 +257,14 @@ def _deliver_binary(path: str, match: Any, raw: bool, output: str | None) -> Non
         )
         raise SystemExit(1)
 
-    content_result = call(match.handler, match.args)
+    if match.handler in _STREAMED_HANDLERS:
+        params = {**match.args, **(byte_range or {}), "binary": True}
+        content_result, payload = call_binary(match.handler, params)
+        if payload is not None:
+            _write_binary(path, payload, output)
+            return
+    else:
+        content_result = call(match.handler, match.args)
     temp_path = content_result.get("path")
     if temp_path is None:
         click.echo(f"error: {path}: handler did not return file path", err=True)
@@ -267,6 +301,17 @@ def _deliver_binary(path: str, match: Any, raw: bool, output: str | None) -> Non
         raise SystemExit(1) from None
 
 
+def _write_binary(path: str, data: bytes, output: str | None) -> None:
+    try:
+        if output is not None:
+            Path(output).write_bytes(data)
+        else:
+            sys.stdout.buffer.write(data)
+    except OSError as exc:
+        click.echo(f"error: {path}: {exc}", err=True)
+        raise SystemExit(1) from None
+
+
 @click.command("cat")
 @click.argument("path", shell_complete=_complete_vfs_path)
 @click.option("--json", "use_json", is_flag=True, help="JSON output")
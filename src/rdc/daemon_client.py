@@ -1,23 +1,294 @@
 from __future__ import annotations
 
+import atexit
 import json
+import select
 import socket
-from typing import Any
+import threading
+from collections.abc import Iterator
+from typing import IO, Any
 
 from rdc._transport import recv_line as _recv_line
 
+_MAX_LINE_BYTES = 256 * 1024 * 1024
+
+
+def _read_line(f: IO[bytes]) -> bytes:
+    """Read one newline-terminated line (newline stripped) from a buffered reader."""
+    line = f.readline(_MAX_LINE_BYTES + 1)
+    if not line:
+        raise OSError("empty response from daemon")
+    if not line.endswith(b"\n"):
+        if len(line) > _MAX_LINE_BYTES:
+            raise ValueError("recv_line: message exceeds max_bytes limit")
+        raise OSError("connection closed mid-response")
+    return line.rstrip(b"\n")
+
+
+def _read_response_line(f: IO[bytes]) -> dict[str, Any]:
+    """Read one JSON-RPC response line from a buffered socket reader."""
+    parsed: dict[str, Any] = json.loads(_read_line(f).decode("utf-8"))
+    return parsed
+
+
+def _read_binary(f: IO[bytes], parsed: dict[str, Any]) -> bytes | None:
+    """Read the binary payload announced by ``_binary_size``, if any."""
+    result = parsed.get("result")
+    binary_size = result.get("_binary_size") if isinstance(result, dict) else None
+    if binary_size is None:
+        return None
+    binary_size = int(binary_size)
+    if binary_size < 0:
+        raise ValueError("invalid _binary_size: must be >= 0")
+    if binary_size == 0:
+        return b""
+    chunks: list[bytes] = []
+    remaining = binary_size
+    while remaining > 0:
+        chunk = f.read(min(remaining, 65536))
+        if not chunk:
+            raise OSError("connection closed before all binary data received")
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+def _read_stream(f: IO[bytes], parsed: dict[str, Any], key: str) -> Iterator[dict[str, Any]]:
+    """Yield the rows of a response, reading NDJSON rows if the daemon streamed them.
+
+    A streamed response names its list in ``result["_stream"]`` and is
+    followed by one JSON row per line and a ``_stream_end`` trailer. A
+    plain response (an older daemon, or an error) yields ``result[key]``.
+
+    Raises:
+        ValueError: If the trailer reports an error.
+    """
+    result = parsed.get("result")
+    if not isinstance(result, dict):
+        return
+    if "_stream" not in result:
+        yield from result.get(key, [])
+        return
+    while True:
+        row: dict[str, Any] = json.loads(_read_line(f))
+        if row.get("_stream_end") is True:
+            error = row.get("error")
+            if error:
+                raise ValueError(error.get("message", "stream aborted"))
+            return
+        yield row
+
+
+class _SendError(OSError):
+    """The request could not be written, so the daemon never executed it."""
+
+
+class DaemonConnection:
+    """Persistent connection carrying many newline-delimited JSON-RPC requests.
+
+    The daemon keeps a connection open until the client closes it, so one
+    socket can serve a whole command (or a whole script) instead of paying
+    connect/teardown per call. Requests may be pipelined: :meth:`pipeline`
+    writes every request before reading any response and matches them up
+    by ``id``.
+    """
+
+    def __init__(self, host: str, port: int, timeout: float = 30.0) -> None:
+        self.host = host
+        self.port = port
+        self._sock = socket.create_connection((host, port), timeout=timeout)
+        self._reader = self._sock.makefile("rb")
+        self.requests_sent = 0
+
+    def settimeout(self, timeout: float) -> None:
+        self._sock.settimeout(timeout)
+
+    def is_stale(self) -> bool:
+        """True if the daemon closed this idle connection (or sent stray bytes).
+
+        An idle keep-alive connection has nothing to read, so a readable
+        socket means EOF (idle reap, restart, a daemon without keep-alive).
+        """
+        try:
+            readable, _, _ = select.select([self._sock], [], [], 0)
+        except (OSError, ValueError):
+            return True
+        return bool(readable)
+
+    def _sendall(self, data: bytes) -> None:
+        try:
+            self._sock.sendall(data)
+        except TimeoutError:
+            raise
+        except OSError as exc:
+            raise _SendError(str(exc)) from exc
+
+    def _send(self, payloads: list[dict[str, Any]]) -> None:
+        data = b"".join((json.dumps(p) + "\n").encode("utf-8") for p in payloads)
+        self._sendall(data)
+        self.requests_sent += len(payloads)
+
+    def request(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Send one request and return its response."""
+        self._send([payload])
+        return _read_response_line(self._reader)
+
+    def request_binary(self, payload: dict[str, Any]) -> tuple[dict[str, Any], bytes | None]:
+        """Send one request and return (response, binary_data | None)."""
+        self._send([payload])
+        parsed = _read_response_line(self._reader)
+        return parsed, _read_binary(self._reader, parsed)
+
+    def request_stream(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Send one request asking for a streamed list and return its header.
+
+        The rows must then be read with :func:`_read_stream` on ``_reader``
+        before the connection carries another request.
+        """
+        self._send([{**payload, "params": {**payload.get("params", {}), "_stream": True}}])
+        return _read_response_line(self._reader)
+
+    def pipeline(self, payloads: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Send all requests up front, then collect responses in request order.
+
+        Every payload must carry a distinct ``id``; responses are matched by
+        ``id`` so the result list lines up with *payloads*. Binary payloads
+        are not supported on a pipelined exchange.
+        """
+        ids = [p.get("id") for p in payloads]
+        if len(set(ids)) != len(ids):
+            raise ValueError("pipelined requests need distinct ids")
+        self._send(payloads)
+        by_id: dict[Any, dict[str, Any]] = {}
+        for _ in payloads:
+            parsed = _read_response_line(self._reader)
+            if _read_binary(self._reader, parsed):
+                raise ValueError("binary response on a pipelined request")
+            by_id[parsed.get("id")] = parsed
+        missing = [i for i in ids if i not in by_id]
+        if missing:
+            raise OSError(f"daemon returned no response for ids {missing}")
+        return [by_id[i] for i in ids]
+
+    def batch(self, payloads: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Send a JSON-RPC 2.0 batch array and return responses in request order.
+
+        The daemon executes the whole batch in one round trip and answers with
+        one array; responses are matched back to *payloads* by ``id``.
+        """
+        ids = [p.get("id") for p in payloads]
+        if len(set(ids)) != len(ids):
+            raise ValueError("batched requests need distinct ids")
+        self._sendall((json.dumps(payloads) + "\n").encode("utf-8"))
+        self.requests_sent += 1
+        parsed = json.loads(_read_line(self._reader).decode("utf-8"))
+        if not isinstance(parsed, list):
+            message = parsed.get("error", {}).get("message", "unexpected response")
+            raise ValueError(f"batch rejected by daemon: {message}")
+        by_id = {r.get("id"): r for r in parsed if isinstance(r, dict)}
+        return [
+            by_id.get(i)
+            or {"jsonrpc": "2.0", "id": i, "error": {"code": -32603, "message": "no response"}}
+            for i in ids
+        ]
+
+    def close(self) -> None:
+        try:
+            self._reader.close()
+        finally:
+            self._sock.close()
+
+
+_pool: dict[tuple[str, int], DaemonConnection] = {}
+_pool_lock = threading.Lock()
+
+
+def _acquire(host: str, port: int, timeout: float) -> tuple[DaemonConnection, bool]:
+    """Take the pooled connection for (host, port), or open one.
+
+    Returns the connection and whether it was reused. The connection is
+    removed from the pool while in use so concurrent callers never share it.
+    A pooled connection the daemon has already closed is replaced up front.
+    """
+    with _pool_lock:
+        conn = _pool.pop((host, port), None)
+    if conn is not None:
+        if not conn.is_stale():
+            conn.settimeout(timeout)
+            return conn, True
+        conn.close()
+    return DaemonConnection(host, port, timeout=timeout), False
+
+
+def _release(conn: DaemonConnection) -> None:
+    with _pool_lock:
+        old = _pool.pop((conn.host, conn.port), None)
+        _pool[(conn.host, conn.port)] = conn
+    if old is not None and old is not conn:
+        old.close()
+
+
+def close_pool() -> None:
+    """Close every pooled daemon connection."""
+    with _pool_lock:
+        conns = list(_pool.values())
+        _pool.clear()
+    for conn in conns:
+        try:
+            conn.close()
+        except OSError:
+            pass
+
+
+atexit.register(close_pool)
+
+
+def _pooled(host: str, port: int, timeout: float, op: Any) -> Any:
+    """Run *op* on a pooled connection, reconnecting once if it went stale.
+
+    A reused connection may have been closed by the daemon (idle reap,
+    restart, or a daemon that predates keep-alive). ``_acquire`` replaces
+    one that is visibly closed; if the close races the request and writing
+    it fails, the request never reached the daemon and is retried on a fresh
+    socket. Any failure after the request was written propagates, since
+    the daemon may have executed it and not every RPC is idempotent.
+    """
+    conn, reused = _acquire(host, port, timeout)
+    try:
+        result = op(conn)
+    except _SendError:
+        conn.close()
+        if not reused:
+            raise
+        conn = DaemonConnection(host, port, timeout=timeout)
+        try:
+            result = op(conn)
+        except (OSError, ValueError):
+            conn.close()
+            raise
+    except (OSError, ValueError):
+        conn.close()
+        raise
+    _release(conn)
+    return result
+
 
 def send_request(
     host: str,
     port: int,
     payload: dict[str, Any],
     timeout: float = 30.0,
+    *,
+    pooled: bool = False,
 ) -> dict[str, Any]:
+    if pooled:
+        parsed: dict[str, Any] = _pooled(host, port, timeout, lambda c: c.request(payload))
+        return parsed
     data = (json.dumps(payload) + "\n").encode("utf-8")
     with socket.create_connection((host, port), timeout=timeout) as sock:
         sock.sendall(data)
         response = _recv_line(sock)
-    parsed: dict[str, Any] = json.loads(response)
+    parsed = json.loads(response)
     return parsed
 
 
@@ -26,11 +297,18 @@ def send_request_binary(
     port: int,
     payload: dict[str, Any],
     timeout: float = 30.0,
+    *,
+    pooled: bool = False,
 ) -> tuple[dict[str, Any], bytes | None]:
     """Send JSON-RPC request and return (response_dict, binary_data | None).
 
     Uses a buffered reader to avoid losing bytes past the JSON newline.
     """
+    if pooled:
+        result: tuple[dict[str, Any], bytes | None] = _pooled(
+            host, port, timeout, lambda c: c.request_binary(payload)
+        )
+        return result
     data = (json.dumps(payload) + "\n").encode("utf-8")
     with socket.create_connection((host, port), timeout=timeout) as sock:
         sock.sendall(data)
@@ -39,20 +317,90 @@ def send_request_binary(
         if not line:
             raise OSError("empty response from daemon")
         parsed: dict[str, Any] = json.loads(line.rstrip(b"\n").decode("utf-8"))
-        binary_size = parsed.get("result", {}).get("_binary_size")
-        if binary_size is not None:
-            binary_size = int(binary_size)
-            if binary_size < 0:
-                raise ValueError("invalid _binary_size: must be >= 0")
-            if binary_size == 0:
-                return parsed, b""
-            chunks: list[bytes] = []
-            remaining = binary_size
-            while remaining > 0:
-                chunk = f.read(min(remaining, 65536))
-                if not chunk:
-                    raise OSError("connection closed before all binary data received")
-                chunks.append(chunk)
-                remaining -= len(chunk)
-            return parsed, b"".join(chunks)
-        return parsed, None
+        return parsed, _read_binary(f, parsed)
+
+
+def send_request_stream(
+    host: str,
+    port: int,
+    payload: dict[str, Any],
+    key: str,
+    timeout: float = 30.0,
+) -> tuple[dict[str, Any], Iterator[dict[str, Any]]]:
+    """Send a list request over a pooled connection and stream its rows back.
+
+    Returns the response header (the result without its rows) and an
+    iterator over the rows of ``result[key]``. Rows are parsed as they
+    arrive, so memory stays flat however long the list is. The connection
+    returns to the pool once the iterator is exhausted; abandoning it early
+    closes the connection instead.
+    """
+    conn, reused = _acquire(host, port, timeout)
+    try:
+        header = conn.request_stream(payload)
+    except _SendError:
+        conn.close()
+        if not reused:
+            raise
+        conn = DaemonConnection(host, port, timeout=timeout)
+        try:
+            header = conn.request_stream(payload)
+        except (OSError, ValueError):
+            conn.close()
+            raise
+    except (OSError, ValueError):
+        conn.close()
+        raise
+    result = header.get("result")
+    if not isinstance(result, dict) or "_stream" not in result:
+        _release(conn)
+        rows = result.get(key, []) if isinstance(result, dict) else []
+        return header, iter(rows)
+    return header, _drain_stream(conn, header, key)
+
+
+def _drain_stream(
+    conn: DaemonConnection, header: dict[str, Any], key: str
+) -> Iterator[dict[str, Any]]:
+    done = False
+    try:
+        yield from _read_stream(conn._reader, header, key)
+        done = True
+    finally:
+        if done:
+            _release(conn)
+        else:
+            conn.close()
+
+
+def send_pipelined(
+    host: str,
+    port: int,
+    payloads: list[dict[str, Any]],
+    timeout: float = 30.0,
+) -> list[dict[str, Any]]:
+    """Pipeline several requests over one pooled connection.
+
+    Returns the responses in the same order as *payloads*.
+    """
+    responses: list[dict[str, Any]] = _pooled(host, port, timeout, lambda c: c.pipeline(payloads))
+    return responses
+
+
+def send_batch(
+    host: str,
+    port: int,
+    payloads: list[dict[str, Any]],
+    timeout: float = 30.0,
+    *,
+    pooled: bool = False,
+) -> list[dict[str, Any]]:
+    """Send a JSON-RPC 2.0 batch and return one response per payload, in order."""
+    if pooled:
+        responses: list[dict[str, Any]] = _pooled(host, port, timeout, lambda c: c.batch(payloads))
+        return responses
+    conn = DaemonConnection(host, port, timeout=timeout)
+    try:
+        return conn.batch(payloads)
+    finally:
+        conn.close()
@@ -4,29 +4,35 @@ import argparse
 import atexit
 import json
 import logging
+import os
 import secrets
+import selectors
 import shutil
 import socket
 import sys
 import threading
 import time
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, NamedTuple
 
 from rdc import _platform
 from rdc._progress import make_progress_cb
-from rdc._transport import recv_line as _recv_line
 from rdc.adapter import RenderDocAdapter
 from rdc.handlers._helpers import (
     _build_shader_cache,
     _enum_name,
     _error_response,
+    _get_action_index,
+    _get_pass_catalog,
+    _get_search_index,
     _max_eid,
     _result_response,
     _sanitize_size,
     _seek_replay,
     _set_frame_event,
+    _step_shader_cache,
 )
 from rdc.handlers._helpers import (
     _get_flat_actions as _get_flat_actions,
@@ -46,8 +52,17 @@ from rdc.handlers.shader_edit import HANDLERS as _SHADER_EDIT_HANDLERS
 from rdc.handlers.texture import HANDLERS as _TEXTURE_HANDLERS
 from rdc.handlers.unused import HANDLERS as _UNUSED_HANDLERS
 from rdc.handlers.vfs import HANDLERS as _VFS_HANDLERS
+from rdc.services.metrics import DaemonMetrics
+from rdc.services.profiling import profile_call, profile_mode
+from rdc.services.usage_service import UsageTable
 
 if TYPE_CHECKING:
+    from rdc.handlers._helpers import ShaderCacheBuild, WarmUp
+    from rdc.services.counter_service import CounterTable
+    from rdc.services.pipe_cache import PipeSnapshotCache
+    from rdc.services.query_service import ActionIndex, PassCatalog
+    from rdc.services.search_index import DisasmIndex
+    from rdc.services.target_service import TargetTable
     from rdc.vfs.tree_cache import VfsTree
 
 from rdc.handlers._types import Handler
@@ -104,6 +119,7 @@ _NO_REPLAY_METHODS: frozenset[str] = frozenset(
         "shutdown",
         "count",
         "file_read",
+        "metrics",
         "capture_run",
         "remote_connect_run",
         "remote_list_run",
@@ -123,7 +139,15 @@ class DaemonState:
     api_name: str = ""
     max_eid: int = 0
     vfs_tree: VfsTree | None = field(default=None, repr=False)
+    _action_index: ActionIndex | None = field(default=None, repr=False)
+    _pass_catalog: PassCatalog | None = field(default=None, repr=False)
+    _usage_table: UsageTable | None = field(default=None, repr=False)
+    _counter_table: CounterTable | None = field(default=None, repr=False)
+    _target_table: TargetTable | None = field(default=None, repr=False)
+    _pipe_snapshots: PipeSnapshotCache | None = field(default=None, repr=False)
     _eid_cache: int = field(default=-1, repr=False)
+    _generation: int = field(default=0, repr=False)
+    _generation_source: Any = field(default=None, repr=False)
     temp_dir: Path | None = None
     tex_map: dict[int, Any] = field(default_factory=dict)
     buf_map: dict[int, Any] = field(default_factory=dict)
@@ -139,6 +163,10 @@ class DaemonState:
     replay_output: Any = None
     replay_output_dims: tuple[int, int] | None = None
     _shader_cache_built: bool = field(default=False, repr=False)
+    _shader_store_key: str | None = field(default=None, repr=False)
+    _shader_build: ShaderCacheBuild | None = field(default=None, repr=False)
+    _warm: WarmUp | None = field(default=None, repr=False)
+    _search_index: DisasmIndex | None = field(default=None, repr=False)
     _debug_messages_cache: list[Any] | None = None
     remote: Any = None
     remote_url: str = ""
@@ -148,6 +176,9 @@ class DaemonState:
     local_capture_is_temp: bool = False
     _ping_stop: Any = None
     _ping_thread: Any = None
+    metrics: DaemonMetrics = field(default_factory=DaemonMetrics, repr=False)
+    profile_dir: Path | None = None
+    _profile_seq: int = field(default=0, repr=False)
 
 
 def _detect_version(rd: Any) -> tuple[int, int]:
@@ -436,6 +467,12 @@ def _init_adapter_state(state: DaemonState) -> None:
 
     root_actions = state.adapter.get_root_actions()
     state.max_eid = _max_eid(root_actions)
+    state._action_index = None
+    state._pass_catalog = None
+    state._usage_table = None
+    state._counter_table = None
+    state._target_table = None
+    state._pipe_snapshots = None
 
     from rdc.vfs.tree_cache import build_vfs_skeleton
 
@@ -452,9 +489,17 @@ def _init_adapter_state(state: DaemonState) -> None:
     }
     state.res_rid_map = {int(r.resourceId): r for r in resources}
 
+    catalog = _get_pass_catalog(state)
     state.vfs_tree = build_vfs_skeleton(
-        root_actions, resources, textures, buffers, state.structured_file
+        root_actions,
+        resources,
+        textures,
+        buffers,
+        state.structured_file,
+        pass_list=catalog.passes,
+        flat=_get_action_index(state).flat,
     )
+    state._shader_store_key = None
 
     import tempfile
 
@@ -516,6 +561,7 @@ def cleanup_state(state: DaemonState) -> None:
         state.built_shaders.clear()
     _cleanup_temp(state)
     state.temp_dir = None
+    state.metrics.close_trace()
     _cleanup_temp_capture(state)
     if state.is_remote:
         _stop_ping_thread(state)
@@ -706,8 +752,52 @@ def _handle_request(request: dict[str, Any], state: DaemonState) -> tuple[dict[s
         return _error_response(request_id, -32601, "method not found"), True
     if method not in _NO_REPLAY_METHODS and state.adapter is None:
         return _error_response(request_id, -32002, "no replay loaded"), True
-    result: tuple[dict[str, Any], bool] = handler(request_id, params, state)
-    return result
+    try:
+        mode = profile_mode(params.get("_profile"))
+    except ValueError as exc:
+        return _error_response(request_id, -32602, str(exc)), True
+    if mode is None and state.profile_dir is not None:
+        mode = "cpu"
+    if mode is None:
+        result: tuple[dict[str, Any], bool] = handler(request_id, params, state)
+        return result
+    return _profiled_request(handler, request_id, params, state, method, mode)
+
+
+def _profiled_request(
+    handler: Handler,
+    request_id: int,
+    params: dict[str, Any],
+    state: DaemonState,
+    method: str,
+    mode: str,
+) -> tuple[dict[str, Any], bool]:
+    """Run *handler* under the profiler and note the dump files in the response.
+
+    Dumps go to ``--profile-dir`` if set, else ``<temp_dir>/profile`` so the
+    client can fetch them with ``file_read``. The paths are reported under
+    ``_profile`` in the result (or in ``error.data`` for errors). Rows of a
+    streamed result are produced after the handler returns and are not
+    covered.
+    """
+    out_dir = state.profile_dir
+    if out_dir is None and state.temp_dir is not None:
+        out_dir = state.temp_dir / "profile"
+    if out_dir is None:
+        response, running = handler(request_id, params, state)
+        info: dict[str, Any] = {"error": "no temp directory available"}
+    else:
+        state._profile_seq += 1
+        stem = f"{state._profile_seq:04d}-{method}"
+        (response, running), info = profile_call(
+            lambda: handler(request_id, params, state), out_dir, stem, mode
+        )
+    result = response.get("result")
+    if isinstance(result, dict):
+        result["_profile"] = info
+    elif "error" in response:
+        response["error"].setdefault("data", {})["_profile"] = info
+    return response, running
 
 
 def _process_request(request: dict[str, Any], state: DaemonState) -> tuple[dict[str, Any], bool]:
@@ -725,77 +815,365 @@ def _process_request(request: dict[str, Any], state: DaemonState) -> tuple[dict[
         return response, running
 
 
+_INVALID_REQUEST: dict[str, Any] = {
+    "jsonrpc": "2.0",
+    "error": {"code": -32600, "message": "invalid request"},
+    "id": None,
+}
+
+
+def _metric_name(request: Any) -> str:
+    """Key under which *request* is counted; unknown methods share one bucket."""
+    method = request.get("method") if isinstance(request, dict) else None
+    if not isinstance(method, str):
+        return "<invalid>"
+    return method if method in _DISPATCH else "<unknown>"
+
+
+def _process_batch(requests: list[Any], state: DaemonState) -> tuple[list[dict[str, Any]], bool]:
+    """Dispatch a JSON-RPC 2.0 batch, one response per entry in request order.
+
+    Each entry goes through ``_process_request`` (token check, dispatch table,
+    replay guard) exactly as if it had arrived alone. Entries after a
+    ``shutdown`` are not executed. Binary side payloads cannot be framed
+    inside an array, so such results are turned into per-entry errors;
+    streamed rows are collected back into a plain list.
+    """
+    responses: list[dict[str, Any]] = []
+    running = True
+    for entry in requests:
+        if not isinstance(entry, dict):
+            responses.append(dict(_INVALID_REQUEST))
+            continue
+        request_id = entry.get("id")
+        if not running:
+            error = {"code": -32000, "message": "daemon shutting down"}
+            responses.append({"jsonrpc": "2.0", "id": request_id, "error": error})
+            continue
+        started, seeks = time.perf_counter(), state.metrics.seeks
+        response, running = _process_request(entry, state)
+        state.metrics.record(
+            _metric_name(entry),
+            time.perf_counter() - started,
+            ok="error" not in response,
+            seeks=state.metrics.seeks - seeks,
+        )
+        result = response.get("result")
+        if isinstance(result, dict) and "_binary_size" in result:
+            error = {"code": -32602, "message": "binary responses are not supported in a batch"}
+            response = {"jsonrpc": "2.0", "id": request_id, "error": error}
+        elif isinstance(result, dict) and "_stream" in result:
+            key = result.pop("_stream")
+            result[key] = list(result[key])
+        responses.append(response)
+    return responses, running
+
+
+_CONN_IDLE_TIMEOUT_S = 300.0
+_MAX_REQUEST_BYTES = 256 * 1024 * 1024
+
+
+@dataclass
+class _ClientConn:
+    """A keep-alive client connection and its partially received input."""
+
+    sock: socket.socket
+    buf: bytearray = field(default_factory=bytearray)
+    last_seen: float = field(default_factory=time.time)
+
+
+def _dumps_response(response: dict[str, Any]) -> tuple[str, bool]:
+    """JSON-encode one response, substituting an error if it is not serializable.
+
+    Returns the text and whether the original response was encoded.
+    """
+    try:
+        return json.dumps(response), True
+    except (TypeError, ValueError, RecursionError) as exc:
+        _log.warning("serialization error: %s", exc)
+        err_resp: dict[str, Any] = {
+            "jsonrpc": "2.0",
+            "id": response.get("id"),
+            "error": {"code": -32603, "message": f"serialization error: {exc}"},
+        }
+        return json.dumps(err_resp), False
+
+
+def _encode_response(response: dict[str, Any]) -> tuple[bytes, str | memoryview | None]:
+    """Serialize a response line, splitting off any binary side payload.
+
+    A handler announces binary data with ``_binary_size`` and supplies it
+    either as a file (``_binary_path``) or in memory (``_binary_data``, any
+    buffer; it is sent through a memoryview without copying).
+    """
+    result = response.get("result")
+    binary: str | memoryview | None = None
+    if isinstance(result, dict):
+        binary = result.pop("_binary_path", None)
+        data = result.pop("_binary_data", None)
+        if data is not None:
+            binary = memoryview(data)
+    text, ok = _dumps_response(response)
+    return (text + "\n").encode("utf-8"), binary if ok else None
+
+
+_STREAM_CHUNK_BYTES = 64 * 1024
+
+
+def _encode_stream(response: dict[str, Any]) -> Iterator[bytes]:
+    """Serialize a streamed list result as NDJSON, one chunk at a time.
+
+    A handler streams a list by naming its key in ``_stream`` and putting an
+    iterable of rows under that key. The framing is a header line (the
+    response with the rows removed and ``_stream`` kept), one JSON line per
+    row, then a trailer line ``{"_stream_end": true, "count": N}``. If a row
+    fails mid-stream the trailer carries an ``error`` object instead of
+    aborting the connection.
+    """
+    result = response["result"]
+    rows = result.pop(result["_stream"])
+    header, ok = _dumps_response(response)
+    yield (header + "\n").encode("utf-8")
+    if not ok:
+        return
+    trailer: dict[str, Any] = {"_stream_end": True}
+    count = 0
+    chunk: list[str] = []
+    size = 0
+    try:
+        for row in rows:
+            line = json.dumps(row)
+            chunk.append(line)
+            size += len(line) + 1
+            count += 1
+            if size >= _STREAM_CHUNK_BYTES:
+                yield ("\n".join(chunk) + "\n").encode("utf-8")
+                chunk.clear()
+                size = 0
+    except Exception as exc:  # noqa: BLE001
+        _log.warning("stream aborted after %d rows: %s", count, exc)
+        trailer["error"] = {"code": -32603, "message": f"stream aborted: {exc}"}
+    if chunk:
+        yield ("\n".join(chunk) + "\n").encode("utf-8")
+    trailer["count"] = count
+    yield (json.dumps(trailer) + "\n").encode("utf-8")
+
+
+def _encode_batch(responses: list[dict[str, Any]]) -> bytes:
+    """Serialize a batch response array as one line, entry by entry."""
+    return ("[" + ",".join(_dumps_response(r)[0] for r in responses) + "]\n").encode("utf-8")
+
+
+def _serve_line(conn: socket.socket, line: bytes, state: DaemonState) -> bool:
+    """Answer one request line on *conn*. Returns False once the daemon should stop."""
+    try:
+        request = json.loads(line)
+    except (json.JSONDecodeError, ValueError):
+        error_resp = {
+            "jsonrpc": "2.0",
+            "error": {"code": -32700, "message": "parse error"},
+            "id": None,
+        }
+        try:
+            conn.sendall((json.dumps(error_resp) + "\n").encode("utf-8"))
+        except OSError:
+            pass
+        return True
+    if isinstance(request, list) and request:
+        responses, running = _process_batch(request, state)
+        data = _encode_batch(responses)
+        state.metrics.bytes_out += len(data)
+        try:
+            conn.sendall(data)
+        except OSError:
+            pass
+        return running
+    started, seeks = time.perf_counter(), state.metrics.seeks
+    if isinstance(request, dict):
+        response, running = _process_request(request, state)
+    else:
+        response, running = dict(_INVALID_REQUEST), True
+    ok = "error" not in response
+    sent = _send_response(conn, response)
+    state.metrics.record(
+        _metric_name(request),
+        time.perf_counter() - started,
+        ok=ok,
+        nbytes=sent,
+        seeks=state.metrics.seeks - seeks,
+    )
+    return running
+
+
+def _send_response(conn: socket.socket, response: dict[str, Any]) -> int:
+    """Write one response (plain, streamed or with a binary payload) to *conn*.
+
+    Returns the number of bytes written.
+    """
+    sent = 0
+    result = response.get("result")
+    if isinstance(result, dict) and "_stream" in result:
+        try:
+            for chunk in _encode_stream(response):
+                conn.sendall(chunk)
+                sent += len(chunk)
+        except OSError:
+            pass
+        return sent
+    payload, binary = _encode_response(response)
+    try:
+        conn.sendall(payload)
+        sent += len(payload)
+        if isinstance(binary, memoryview):
+            conn.sendall(binary)
+            sent += binary.nbytes
+        elif binary:
+            try:
+                with Path(binary).open("rb") as bf:
+                    while chunk := bf.read(65536):
+                        conn.sendall(chunk)
+                        sent += len(chunk)
+            except OSError:
+                _log.warning("failed to send binary payload: %s", binary)
+    except OSError:
+        pass
+    return sent
+
+
+_IDLE_USAGE_BATCH = 32
+_IDLE_SHADER_BATCH = 8
+
+
+def _warm_step(state: DaemonState) -> None:
+    """Run one slice of the current warm-up stage."""
+    assert state.adapter is not None and state._warm is not None
+    stage = state._warm.pending[0]
+    if stage == "actions":
+        _get_action_index(state)
+        done = True
+    elif stage == "shaders":
+        done = _step_shader_cache(state, limit=_IDLE_SHADER_BATCH)
+    elif stage == "search":
+        _get_search_index(state)
+        done = True
+    else:
+        table = state._usage_table
+        if table is None or table.source is not state.adapter:
+            table = UsageTable(state.res_rid_map, source=state.adapter)
+            state._usage_table = table
+        done = table.fill(state.adapter.controller.GetUsage, limit=_IDLE_USAGE_BATCH)
+    if done:
+        state._warm.pending.pop(0)
+
+
+def _idle_step(state: DaemonState) -> bool:
+    """Do one slice of deferred work between requests.
+
+    Advances a warm-up started by the ``warm`` RPC: action index, shader
+    cache ``_IDLE_SHADER_BATCH`` draws at a time, search index, then the
+    usage table ``_IDLE_USAGE_BATCH`` resources at a time. Slices run on
+    the serving thread between requests, so replay access stays serialized.
+
+    Returns:
+        True if more work remains.
+    """
+    if state.adapter is None:
+        return False
+    warm = state._warm
+    if warm is None or not warm.pending:
+        return False
+    try:
+        _warm_step(state)
+    except Exception as exc:  # noqa: BLE001
+        _log.warning("warm-up stage %r failed: %s", warm.pending[0], exc)
+        warm.error = f"{warm.pending[0]}: {exc}"
+        warm.pending.clear()
+    return bool(warm.pending)
+
+
 def run_server(  # pragma: no cover
     host: str,
     port: int,
     state: DaemonState,
     idle_timeout_s: int = 1800,
 ) -> None:
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server:
+    """Serve newline-delimited JSON-RPC until shutdown or idle timeout.
+
+    Connections are keep-alive: a client may send any number of requests
+    (pipelined or not) over one socket, and responses are written back in
+    request order. Requests are still executed one at a time, so replay
+    access stays single-threaded. Connections idle for longer than
+    ``_CONN_IDLE_TIMEOUT_S`` are reaped. While deferred work is pending
+    (see :func:`_idle_step`) the loop polls instead of blocking.
+    """
+    with (
+        socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server,
+        selectors.DefaultSelector() as sel,
+    ):
         server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         server.bind((host, port))
         server.listen(32)
-        server.settimeout(1.0)
+        server.setblocking(False)
+        sel.register(server, selectors.EVENT_READ, None)
+        clients: dict[socket.socket, _ClientConn] = {}
+
+        def _drop(client: _ClientConn) -> None:
+            sel.unregister(client.sock)
+            clients.pop(client.sock, None)
+            client.sock.close()
 
         running = True
         idle_exit = False
         last_activity = time.time()
+        pending_work = True
         while running:
-            if idle_timeout_s > 0 and time.time() - last_activity > idle_timeout_s:
+            now = time.time()
+            if idle_timeout_s > 0 and now - last_activity > idle_timeout_s:
                 idle_exit = True
                 break
-
-            try:
-                conn, _addr = server.accept()
-            except TimeoutError:
-                continue
-
-            with conn:
-                conn.settimeout(10.0)
-                try:
-                    line = _recv_line(conn)
-                except (ValueError, TimeoutError):
-                    continue
-                if not line:
-                    continue
-                try:
-                    request = json.loads(line)
-                except (json.JSONDecodeError, ValueError):
-                    error_resp = {
-                        "jsonrpc": "2.0",
-                        "error": {"code": -32700, "message": "parse error"},
-                        "id": None,
-                    }
+            for client in list(clients.values()):
+                if now - client.last_seen > _CONN_IDLE_TIMEOUT_S:
+                    _drop(client)
+
+            events = sel.select(timeout=0 if pending_work else 1.0)
+            if not events:
+                pending_work = _idle_step(state)
+            for key, _mask in events:
+                if key.data is None:
                     try:
-                        conn.sendall((json.dumps(error_resp) + "\n").encode("utf-8"))
-                    except OSError:
-                        pass
+                        conn, _addr = server.accept()
+                    except (BlockingIOError, TimeoutError):
+                        continue
+                    conn.settimeout(10.0)
+                    clients[conn] = _ClientConn(conn)
+                    sel.register(conn, selectors.EVENT_READ, clients[conn])
                     continue
-                response, running = _process_request(request, state)
-                binary_path = response.get("result", {}).pop("_binary_path", None)
-                try:
-                    payload = json.dumps(response) + "\n"
-                except (TypeError, ValueError, RecursionError) as exc:
-                    _log.warning("serialization error: %s", exc)
-                    err_resp: dict[str, Any] = {
-                        "jsonrpc": "2.0",
-                        "id": response.get("id"),
-                        "error": {"code": -32603, "message": f"serialization error: {exc}"},
-                    }
-                    payload = json.dumps(err_resp) + "\n"
-                    binary_path = None
+
+                client = key.data
                 try:
-                    conn.sendall(payload.encode("utf-8"))
-                    if binary_path:
-                        try:
-                            with Path(binary_path).open("rb") as bf:
-                                while chunk := bf.read(65536):
-                                    conn.sendall(chunk)
-                        except OSError:
-                            _log.warning("failed to send binary payload: %s", binary_path)
+                    chunk = client.sock.recv(65536)
                 except OSError:
-                    pass
-                last_activity = time.time()
+                    chunk = b""
+                if not chunk:
+                    _drop(client)
+                    continue
+                client.buf += chunk
+                client.last_seen = time.time()
+                while running and (nl := client.buf.find(b"\n")) >= 0:
+                    line = bytes(client.buf[:nl])
+                    del client.buf[: nl + 1]
+                    if not line.strip():
+                        continue
+                    running = _serve_line(client.sock, line, state)
+                    last_activity = time.time()
+                    pending_work = True
+                if len(client.buf) > _MAX_REQUEST_BYTES:
+                    _drop(client)
+                if not running:
+                    break
+
+        for client in list(clients.values()):
+            _drop(client)
 
     # The shutdown RPC runs cleanup via _handle_shutdown before exiting the
     # loop; an idle-timeout exit must release replay resources here so the
@@ -816,11 +1194,25 @@ def main() -> None:  # pragma: no cover
     parser.add_argument("--no-replay", action="store_true", help=argparse.SUPPRESS)
     parser.add_argument("--remote-url", default=None)
     parser.add_argument("--gpu", default=None)
+    parser.add_argument(
+        "--profile-dir",
+        type=Path,
+        default=None,
+        help="Profile every request with cProfile, dumping .pstats files here",
+    )
+    parser.add_argument(
+        "--trace",
+        default=os.environ.get("RDC_TRACE") or None,
+        help="Append one JSON line per request to this file (default: $RDC_TRACE)",
+    )
     args = parser.parse_args()
 
     state = DaemonState(
         capture=args.capture, current_eid=0, token=args.token, gpu_pref=args.gpu or ""
     )
+    if args.trace:
+        state.metrics.open_trace(args.trace)
+    state.profile_dir = args.profile_dir
 
     if not args.no_replay:
         if args.remote_url:
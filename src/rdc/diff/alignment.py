@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import bisect
 from collections import defaultdict
-from collections.abc import Sequence
+from collections.abc import Callable, Iterator, Sequence
 from dataclasses import dataclass
 from typing import TypeAlias
 
@@ -79,7 +80,6 @@ def lcs_align(
                 dp[i][j] = max(dp[i - 1][j], dp[i][j - 1])
 
     # Backtrack to build alignment
-    result: list[tuple[int | None, int | None]] = []
     i, j = n, m
     matched: list[tuple[int, int]] = []
     while i > 0 and j > 0:
@@ -92,8 +92,14 @@ def lcs_align(
         else:
             j -= 1
     matched.reverse()
+    return _merge_matches(matched, n, m)
+
 
-    # Merge matched pairs with unmatched items
+def _merge_matches(
+    matched: list[tuple[int, int]], n: int, m: int
+) -> list[tuple[int | None, int | None]]:
+    """Interleave matched index pairs with the unmatched items around them."""
+    result: list[tuple[int | None, int | None]] = []
     prev_a, prev_b = 0, 0
     for ai, bi in matched:
         # Deletions from a before this match
@@ -110,10 +116,223 @@ def lcs_align(
         result.append((x, None))
     for y in range(prev_b, m):
         result.append((None, y))
+    return result
+
+
+def _myers_levels(
+    keys_a: Sequence[MatchKey],
+    keys_b: Sequence[MatchKey],
+    start: tuple[int, list[int]] | None = None,
+) -> Iterator[tuple[int, list[int], int]]:
+    """Run Myers' forward search, yielding ``(d, v, offset)`` per edit level.
+
+    ``v[offset + k]`` is the furthest x reached on diagonal ``k = x - y``
+    with ``d`` insertions/deletions, for ``k`` in ``-d..d`` of ``d``'s
+    parity. Because edit distance never decreases along a diagonal, every
+    point ``(x, x - k)`` with ``x <= v[offset + k]`` is within ``d`` edits
+    of the origin. Iteration stops after the level that reaches the end.
+
+    Args:
+        keys_a: First sequence.
+        keys_b: Second sequence.
+        start: ``(d, snapshot)`` from :func:`_snapshot` to resume after.
+    """
+    n, m = len(keys_a), len(keys_b)
+    offset = n + m + 1
+    v = [0] * (2 * offset + 1)
+    first = 0
+    if start is not None:
+        d0, snap = start
+        v[offset - d0 : offset + d0 + 1] = snap
+        first = d0 + 1
+    for d in range(first, n + m + 1):
+        done = False
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[offset + k - 1] < v[offset + k + 1]):
+                x = v[offset + k + 1]
+            else:
+                x = v[offset + k - 1] + 1
+            y = x - k
+            while x < n and y < m and keys_a[x] == keys_b[y]:
+                x += 1
+                y += 1
+            v[offset + k] = x
+            if x >= n and y >= m:
+                done = True
+        yield d, v, offset
+        if done:
+            return
+
+
+def _snapshot(d: int, v: list[int], offset: int) -> list[int]:
+    """Copy the part of *v* level ``d + 1`` reads from."""
+    return v[offset - d : offset + d + 1]
+
 
+def myers_align(
+    keys_a: Sequence[MatchKey],
+    keys_b: Sequence[MatchKey],
+) -> list[tuple[int | None, int | None]]:
+    """Align two key sequences in O((n+m)·D) time without an n×m table.
+
+    Output is identical to :func:`lcs_align`: the same backtrack is walked
+    from the end, but each "up or left" decision is answered from Myers'
+    furthest-reaching diagonals instead of the DP table. Levels are
+    checkpointed every ~sqrt(D) steps and recomputed block by block while
+    walking, so memory stays O(D·sqrt(D)) instead of O(n·m).
+
+    Returns:
+        List of (index_a | None, index_b | None) pairs.
+    """
+    n, m = len(keys_a), len(keys_b)
+    if n == 0 or m == 0:
+        return lcs_align(keys_a, keys_b)
+
+    # The backtrack always takes the diagonal on equal keys, so a common
+    # suffix is matched as-is.
+    tail = 0
+    while tail < min(n, m) and keys_a[n - 1 - tail] == keys_b[m - 1 - tail]:
+        tail += 1
+    na, nb = n - tail, m - tail
+    a, b = keys_a[:na], keys_b[:nb]
+    tail_pairs = [(na + t, nb + t) for t in range(tail)]
+    if na == 0 or nb == 0:
+        return _merge_matches(tail_pairs, n, m)
+
+    # Forward pass: edit distance, plus checkpoints every `step` levels,
+    # thinned as D grows so that len(checkpoints) stays around step.
+    step = 16
+    checkpoints: dict[int, list[int]] = {}
+    dist = 0
+    for d, v, offset in _myers_levels(a, b):
+        dist = d
+        if d % step == 0:
+            checkpoints[d] = _snapshot(d, v, offset)
+            if len(checkpoints) > step:
+                step *= 2
+                checkpoints = {c: s for c, s in checkpoints.items() if c % step == 0}
+
+    block: dict[int, list[int]] = {}
+    block_start = -1
+
+    def within(level: int, k: int, x: int) -> bool:
+        """True if point (x, x - k) is at most *level* edits from the origin."""
+        nonlocal block, block_start
+        if abs(k) > level:
+            return False
+        start = level - level % step
+        if start != block_start:
+            block = {start: checkpoints[start]}
+            if start < dist:
+                for d, v, offset in _myers_levels(a, b, (start, checkpoints[start])):
+                    block[d] = _snapshot(d, v, offset)
+                    if d >= min(start + step - 1, dist):
+                        break
+            block_start = start
+        return block[level][level + k] >= x
+
+    matched: list[tuple[int, int]] = []
+    i, j, r = na, nb, dist
+    while i > 0 and j > 0:
+        if a[i - 1] == b[j - 1]:
+            matched.append((i - 1, j - 1))
+            i -= 1
+            j -= 1
+        elif within(r - 1, i - 1 - j, i - 1):
+            i -= 1
+            r -= 1
+        else:
+            j -= 1
+            r -= 1
+    matched.reverse()
+    return _merge_matches(matched + tail_pairs, n, m)
+
+
+def patience_align(
+    keys_a: Sequence[MatchKey],
+    keys_b: Sequence[MatchKey],
+) -> list[tuple[int | None, int | None]]:
+    """Align by anchoring on keys unique to both sides (patience diff).
+
+    Keys that occur exactly once in each sequence are paired, the longest
+    increasing run of those pairs becomes a set of fixed anchors, and the
+    gaps between anchors are aligned with :func:`myers_align`. Each gap is
+    small even when the whole sequences are not, but the result can differ
+    from :func:`lcs_align` when an anchor is not on the LCS.
+
+    Returns:
+        List of (index_a | None, index_b | None) pairs.
+    """
+    count_a: dict[MatchKey, int] = defaultdict(int)
+    count_b: dict[MatchKey, int] = defaultdict(int)
+    for key in keys_a:
+        count_a[key] += 1
+    pos_b: dict[MatchKey, int] = {}
+    for j, key in enumerate(keys_b):
+        count_b[key] += 1
+        pos_b[key] = j
+    candidates = [
+        (i, pos_b[key])
+        for i, key in enumerate(keys_a)
+        if count_a[key] == 1 and count_b.get(key) == 1
+    ]
+
+    # Longest increasing subsequence of b positions (patience sorting).
+    tops: list[int] = []
+    tops_idx: list[int] = []
+    back: list[int] = []
+    for idx, (_i, j) in enumerate(candidates):
+        pile = bisect.bisect_left(tops, j)
+        back.append(tops_idx[pile - 1] if pile else -1)
+        if pile == len(tops):
+            tops.append(j)
+            tops_idx.append(idx)
+        else:
+            tops[pile] = j
+            tops_idx[pile] = idx
+    anchors: list[tuple[int, int]] = []
+    idx = tops_idx[-1] if tops_idx else -1
+    while idx >= 0:
+        anchors.append(candidates[idx])
+        idx = back[idx]
+    anchors.reverse()
+
+    result: list[tuple[int | None, int | None]] = []
+    prev_a, prev_b = 0, 0
+    for ai, bi in [*anchors, (len(keys_a), len(keys_b))]:
+        for ga, gb in myers_align(keys_a[prev_a:ai], keys_b[prev_b:bi]):
+            result.append(
+                (None if ga is None else prev_a + ga, None if gb is None else prev_b + gb)
+            )
+        if ai < len(keys_a):
+            result.append((ai, bi))
+        prev_a, prev_b = ai + 1, bi + 1
     return result
 
 
+_LCS_MAX_CELLS = 250_000
+
+_ALIGNERS: dict[str, Callable[..., list[tuple[int | None, int | None]]]] = {
+    "lcs": lcs_align,
+    "myers": myers_align,
+    "patience": patience_align,
+}
+
+
+def _align_keys(
+    keys_a: Sequence[MatchKey],
+    keys_b: Sequence[MatchKey],
+    method: str,
+) -> list[tuple[int | None, int | None]]:
+    """Dispatch to an aligner; ``auto`` keeps the DP table for small inputs."""
+    if method == "auto":
+        method = "lcs" if len(keys_a) * len(keys_b) <= _LCS_MAX_CELLS else "myers"
+    aligner = _ALIGNERS.get(method)
+    if aligner is None:
+        raise ValueError(f"unknown alignment method: {method}")
+    return aligner(keys_a, keys_b)
+
+
 def _top_level_marker(path: str) -> str:
     """Extract top-level marker group (before first '/')."""
     idx = path.find("/")
@@ -131,7 +350,7 @@ def _group_by_marker(
 
 
 def align_draws(
-    a: list[DrawRecord], b: list[DrawRecord]
+    a: list[DrawRecord], b: list[DrawRecord], *, method: str = "auto"
 ) -> list[tuple[DrawRecord | None, DrawRecord | None]]:
     """Align two draw call sequences for diff comparison.
 
@@ -139,13 +358,19 @@ def align_draws(
     to signature-based keys. Groups by top-level marker when combined
     length exceeds 500 for performance.
 
+    Args:
+        a: Draw records of the first capture.
+        b: Draw records of the second capture.
+        method: ``"lcs"``, ``"myers"``, ``"patience"`` or ``"auto"`` (DP
+            table for small inputs, linear-space Myers otherwise).
+
     Returns:
         List of (record_a | None, record_b | None) aligned pairs.
     """
     use_markers = has_markers(a) or has_markers(b)
 
     if use_markers and len(a) + len(b) > 500:
-        return _grouped_align(a, b)
+        return _grouped_align(a, b, method)
 
     keys_a: Sequence[MatchKey]
     keys_b: Sequence[MatchKey]
@@ -156,14 +381,14 @@ def align_draws(
         keys_a = make_fallback_keys(a)
         keys_b = make_fallback_keys(b)
 
-    pairs = lcs_align(keys_a, keys_b)
+    pairs = _align_keys(keys_a, keys_b, method)
     return [
         (a[ia] if ia is not None else None, b[ib] if ib is not None else None) for ia, ib in pairs
     ]
 
 
 def _grouped_align(
-    a: list[DrawRecord], b: list[DrawRecord]
+    a: list[DrawRecord], b: list[DrawRecord], method: str = "auto"
 ) -> list[tuple[DrawRecord | None, DrawRecord | None]]:
     """Align with grouping by top-level marker for large sequences."""
     groups_a = _group_by_marker(a)
@@ -177,7 +402,7 @@ def _grouped_align(
         sub_b = [b[i] for i in groups_b.get(group, [])]
         keys_a = make_match_keys(sub_a)
         keys_b = make_match_keys(sub_b)
-        pairs = lcs_align(keys_a, keys_b)
+        pairs = _align_keys(keys_a, keys_b, method)
         for ia, ib in pairs:
             ra = sub_a[ia] if ia is not None else None
             rb = sub_b[ib] if ib is not None else None
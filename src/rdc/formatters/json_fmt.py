@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import sys
+from collections.abc import Iterable
 from typing import Any, TextIO
 
 
@@ -13,7 +14,7 @@ def write_json(data: Any, *, out: TextIO | None = None, indent: int = 2) -> None
     dest.write(json.dumps(data, default=str, indent=indent) + "\n")
 
 
-def write_jsonl(rows: list[dict[str, Any]], *, out: TextIO | None = None) -> None:
+def write_jsonl(rows: Iterable[dict[str, Any]], *, out: TextIO | None = None) -> None:
     """Write rows as JSONL (one JSON object per line)."""
     dest = out or sys.stdout
     for row in rows:
@@ -0,0 +1,201 @@
+"""Binary mesh encoders (PLY, glTF/GLB) for rdc mesh.
+
+Positions arrive as a float32 ``(n, 3)`` array and faces as a uint32
+``(m, 3)`` array. The encoders return the output as a list of bytes-like
+chunks that view those arrays in place, so they can be written out without
+copying the vertex data.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+from pathlib import Path
+from typing import Any, BinaryIO
+
+MESH_FORMATS = ("obj", "ply", "glb", "gltf")
+
+_GLB_MAGIC = 0x46546C67  # "glTF"
+_GLB_JSON = 0x4E4F534A  # "JSON"
+_GLB_BIN = 0x004E4942  # "BIN\0"
+_GL_ARRAY_BUFFER = 34962
+_GL_ELEMENT_ARRAY_BUFFER = 34963
+_GL_FLOAT = 5126
+_GL_UNSIGNED_INT = 5125
+
+
+def triangle_faces(indices: Any, topology: str) -> Any:
+    """Expand an index sequence into a ``(m, 3)`` uint32 array of triangles.
+
+    Strips alternate winding so every triangle keeps the orientation of the
+    first; fans share the first index. Non-triangle topologies give no faces.
+    """
+    import numpy as np
+
+    idx = np.asarray(indices, dtype=np.uint32).ravel()
+    n = idx.size
+    if topology == "TriangleList":
+        return idx[: n - n % 3].reshape(-1, 3)
+    if n < 3 or topology not in ("TriangleStrip", "TriangleFan"):
+        return np.empty((0, 3), dtype=np.uint32)
+    faces = np.empty((n - 2, 3), dtype=np.uint32)
+    if topology == "TriangleStrip":
+        faces[:, 0] = idx[:-2]
+        faces[:, 1] = idx[1:-1]
+        faces[1::2, 0] = idx[2:-1:2]
+        faces[1::2, 1] = idx[1:-2:2]
+    else:
+        faces[:, 0] = idx[0]
+        faces[:, 1] = idx[1:-1]
+    faces[:, 2] = idx[2:]
+    return faces
+
+
+def encode_ply(positions: Any, faces: Any, *, comment: str = "") -> list[Any]:
+    """Encode a binary little-endian PLY file."""
+    import numpy as np
+
+    header = ["ply", "format binary_little_endian 1.0"]
+    if comment:
+        header.append(f"comment {comment}")
+    header += [
+        f"element vertex {len(positions)}",
+        "property float x",
+        "property float y",
+        "property float z",
+        f"element face {len(faces)}",
+        "property list uchar uint vertex_indices",
+        "end_header",
+    ]
+    face_rows = np.empty(len(faces), dtype=[("n", "u1"), ("v", "<u4", (3,))])
+    face_rows["n"] = 3
+    face_rows["v"] = faces
+    return [
+        ("\n".join(header) + "\n").encode("ascii"),
+        _le_bytes(positions, "<f4"),
+        memoryview(face_rows.view(np.uint8)),
+    ]
+
+
+def _le_bytes(array: Any, dtype: str) -> memoryview:
+    """A byte view of *array* as contiguous *dtype*, copying only if needed."""
+    import numpy as np
+
+    return memoryview(np.ascontiguousarray(array, dtype=dtype).reshape(-1).view(np.uint8))
+
+
+def _pad4(size: int) -> int:
+    return -size % 4
+
+
+def _gltf_document(positions: Any, faces: Any, bin_uri: str | None) -> tuple[dict[str, Any], int]:
+    """Build the glTF JSON for one triangle mesh; returns it and the buffer length."""
+    pos_bytes = len(positions) * 12
+    pos_pad = _pad4(pos_bytes)
+    idx_bytes = faces.size * 4
+    buffer: dict[str, Any] = {"byteLength": pos_bytes + pos_pad + idx_bytes}
+    if bin_uri is not None:
+        buffer["uri"] = bin_uri
+    if len(positions):
+        lo = [float(v) for v in positions.min(axis=0)]
+        hi = [float(v) for v in positions.max(axis=0)]
+    else:
+        lo = hi = [0.0, 0.0, 0.0]
+    primitive: dict[str, Any] = {"attributes": {"POSITION": 0}, "mode": 4}
+    buffer_views: list[dict[str, Any]] = [
+        {"buffer": 0, "byteOffset": 0, "byteLength": pos_bytes, "target": _GL_ARRAY_BUFFER}
+    ]
+    accessors: list[dict[str, Any]] = [
+        {
+            "bufferView": 0,
+            "componentType": _GL_FLOAT,
+            "count": len(positions),
+            "type": "VEC3",
+            "min": lo,
+            "max": hi,
+        }
+    ]
+    if faces.size:
+        primitive["indices"] = 1
+        buffer_views.append(
+            {
+                "buffer": 0,
+                "byteOffset": pos_bytes + pos_pad,
+                "byteLength": idx_bytes,
+                "target": _GL_ELEMENT_ARRAY_BUFFER,
+            }
+        )
+        accessors.append(
+            {
+                "bufferView": 1,
+                "componentType": _GL_UNSIGNED_INT,
+                "count": int(faces.size),
+                "type": "SCALAR",
+            }
+        )
+    doc = {
+        "asset": {"version": "2.0", "generator": "rdc-cli"},
+        "scene": 0,
+        "scenes": [{"nodes": [0]}],
+        "nodes": [{"mesh": 0}],
+        "meshes": [{"primitives": [primitive]}],
+        "buffers": [buffer],
+        "bufferViews": buffer_views,
+        "accessors": accessors,
+    }
+    return doc, buffer["byteLength"]
+
+
+def _gltf_bin(positions: Any, faces: Any) -> list[Any]:
+    pos = _le_bytes(positions, "<f4")
+    return [pos, b"\0" * _pad4(len(pos)), _le_bytes(faces, "<u4")]
+
+
+def encode_glb(positions: Any, faces: Any) -> list[Any]:
+    """Encode a single-mesh binary glTF (GLB) file."""
+    doc, bin_len = _gltf_document(positions, faces, None)
+    json_bytes = json.dumps(doc, separators=(",", ":")).encode("utf-8")
+    json_bytes += b" " * _pad4(len(json_bytes))
+    bin_pad = _pad4(bin_len)
+    total = 12 + 8 + len(json_bytes) + 8 + bin_len + bin_pad
+    return [
+        struct.pack("<III", _GLB_MAGIC, 2, total),
+        struct.pack("<II", len(json_bytes), _GLB_JSON),
+        json_bytes,
+        struct.pack("<II", bin_len + bin_pad, _GLB_BIN),
+        *_gltf_bin(positions, faces),
+        b"\0" * bin_pad,
+    ]
+
+
+def encode_gltf(positions: Any, faces: Any, bin_name: str) -> tuple[bytes, list[Any]]:
+    """Encode a ``.gltf`` document plus its external ``.bin`` buffer chunks."""
+    doc, _ = _gltf_document(positions, faces, bin_name)
+    return json.dumps(doc, indent=2).encode("utf-8") + b"\n", _gltf_bin(positions, faces)
+
+
+def write_chunks(chunks: list[Any], out: BinaryIO) -> int:
+    """Write encoder chunks to *out*; returns the number of bytes written."""
+    total = 0
+    for chunk in chunks:
+        out.write(chunk)
+        total += len(chunk)
+    return total
+
+
+def write_mesh_file(path: Path, fmt: str, positions: Any, faces: Any, *, comment: str = "") -> None:
+    """Write *positions*/*faces* to *path* as PLY, GLB or glTF (+ sidecar ``.bin``)."""
+    if fmt == "ply":
+        chunks = encode_ply(positions, faces, comment=comment)
+    elif fmt == "glb":
+        chunks = encode_glb(positions, faces)
+    elif fmt == "gltf":
+        bin_path = path.with_suffix(".bin")
+        doc, chunks = encode_gltf(positions, faces, bin_path.name)
+        with bin_path.open("wb") as f:
+            write_chunks(chunks, f)
+        chunks = [doc]
+    else:
+        raise ValueError(f"unsupported mesh format: {fmt}")
+    with path.open("wb") as f:
+        write_chunks(chunks, f)
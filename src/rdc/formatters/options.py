@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import functools
 import sys
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from typing import Any, TextIO
 
 import click
@@ -27,7 +27,7 @@ def list_output_options(fn: Callable[..., Any]) -> Callable[..., Any]:
 
 
 def render_list(
-    rows: list[dict[str, Any]],
+    rows: Iterable[dict[str, Any]],
     *,
     use_json: bool,
     use_jsonl: bool,
@@ -51,7 +51,8 @@ def render_list(
     key yields ``quiet_default`` instead of raising ``KeyError``.
 
     Args:
-        rows: List of row dicts to render in the json/jsonl/quiet branches.
+        rows: Row dicts to render in the json/jsonl/quiet branches. May be a
+            lazy iterable (e.g. rows of paginated calls); it is consumed once.
         use_json: Emit a single JSON array.
         use_jsonl: Emit one JSON object per line.
         quiet: Emit only the quiet-key column.
@@ -61,7 +62,7 @@ def render_list(
         out: Output stream for the quiet branch. Defaults to ``sys.stdout``.
     """
     if use_json:
-        write_json(rows, out=out)
+        write_json(list(rows), out=out)
         return
     if use_jsonl:
         write_jsonl(rows, out=out)
@@ -7,6 +7,7 @@ Numbers are always raw (e.g. 1200000 not 1.2M). Empty fields are '-'.
 from __future__ import annotations
 
 import sys
+from collections.abc import Iterable
 from typing import Any, TextIO
 
 
@@ -33,7 +34,7 @@ def format_row(fields: list[Any]) -> str:
 
 
 def write_tsv(
-    rows: list[list[Any]],
+    rows: Iterable[list[Any]],
     *,
     header: list[str] | None = None,
     no_header: bool = False,
@@ -42,7 +43,7 @@ def write_tsv(
     """Write rows as TSV to the given output stream.
 
     Args:
-        rows: List of rows, each row is a list of field values.
+        rows: Rows, each a list of field values; consumed lazily.
         header: Column names for the header row.
         no_header: If True, skip the header row even if provided.
         out: Output stream. Defaults to sys.stdout.
@@ -6,17 +6,30 @@ circular imports. daemon_server re-exports these for backward compat.
 
 from __future__ import annotations
 
+import base64
+import json
 import logging
 import re
-from typing import TYPE_CHECKING, Any
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, TypeVar
 
+from rdc.handlers._types import Handler
+from rdc.services.counter_service import CounterTable
+from rdc.services.pipe_cache import PipeSnapshotCache, max_cache_bytes
 from rdc.services.query_service import STAGE_MAP as STAGE_MAP
+from rdc.services.query_service import ActionIndex, PassCatalog
+from rdc.services.target_service import OutputTargets, TargetTable
+from rdc.services.usage_service import UsageTable
 
 if TYPE_CHECKING:
     from rdc.daemon_server import DaemonState
+    from rdc.services.search_index import DisasmIndex
 
 _log = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 
 class PipeError(Exception):
     """Raised by require_pipe when pipeline state cannot be obtained."""
@@ -93,6 +106,7 @@ def _set_frame_event(state: DaemonState, eid: int) -> str | None:
     if state.max_eid > 0 and eid > state.max_eid:
         return f"eid {eid} out of range (max: {state.max_eid})"
     if state.adapter is not None:
+        state.metrics.seek(hit=state._eid_cache == eid)
         if state._eid_cache != eid:
             state.adapter.set_frame_event(eid)
             state._eid_cache = eid
@@ -106,18 +120,337 @@ def _seek_replay(state: DaemonState, eid: int) -> str | None:
         return "eid must be >= 0"
     if state.max_eid > 0 and eid > state.max_eid:
         return f"eid {eid} out of range (max: {state.max_eid})"
-    if state.adapter is not None and state._eid_cache != eid:
-        state.adapter.set_frame_event(eid)
-        state._eid_cache = eid
+    if state.adapter is not None:
+        state.metrics.seek(hit=state._eid_cache == eid)
+        if state._eid_cache != eid:
+            state.adapter.set_frame_event(eid)
+            state._eid_cache = eid
     return None
 
 
-def _get_flat_actions(state: DaemonState) -> list[Any]:
+def for_each_event(
+    state: DaemonState, eids: Iterable[int], visit: Callable[[int], _T]
+) -> dict[int, _T]:
+    """Call *visit* once per distinct eid, with the replay sitting on that event.
+
+    Events are visited in ascending order, so each is seeked at most once and
+    the replay only moves forward. The user's cursor (``current_eid`` and the
+    replay head) is restored once at the end, also when *visit* raises, so
+    visitors may go through ``require_pipe``.
+
+    Returns:
+        ``{eid: visit(eid)}`` in visiting order.
+
+    Raises:
+        ValueError: If an eid is out of range; earlier events were visited.
+    """
+    cursor = state.current_eid
+    out: dict[int, _T] = {}
+    moved = False
+    try:
+        for eid in sorted(set(eids)):
+            err = _seek_replay(state, eid)
+            if err:
+                raise ValueError(err)
+            moved = True
+            out[eid] = visit(eid)
+    finally:
+        state.current_eid = cursor
+        if moved and cursor != 0:
+            _seek_replay(state, cursor)
+    return out
+
+
+def _get_action_index(state: DaemonState) -> ActionIndex:
+    """Return the flattened action index, walking the action tree once per replay."""
+    from rdc.services.query_service import build_action_index, walk_actions
+
+    index = state._action_index
+    if index is not None and index.source is state.adapter:
+        return index
     if state.adapter is None:
-        return []
-    from rdc.services.query_service import walk_actions
+        return build_action_index([])
+    flat = walk_actions(state.adapter.get_root_actions(), state.structured_file)
+    state._action_index = build_action_index(flat, source=state.adapter)
+    return state._action_index
+
+
+def _get_flat_actions(state: DaemonState) -> list[Any]:
+    return _get_action_index(state).flat
+
+
+def _get_usage_table(state: DaemonState, rid: int | None = None) -> UsageTable:
+    """Return the resource usage table, finishing any pending fill first.
+
+    ``GetUsage`` runs once per resource per replay; a table started by the
+    ``warm`` RPC's usage stage is completed here on first use. With *rid*
+    only that resource is guaranteed to be filled.
+    """
+    table = state._usage_table
+    if table is None or table.source is not state.adapter:
+        table = UsageTable(state.res_rid_map, source=state.adapter)
+        state._usage_table = table
+    if not table.complete and state.adapter is not None:
+        if rid is None:
+            table.fill(state.adapter.controller.GetUsage)
+        else:
+            table.ensure(rid, state.adapter.controller.GetUsage)
+    return table
+
+
+def _get_target_table(state: DaemonState) -> TargetTable:
+    """Return the per-event output-target table for the current replay."""
+    table = state._target_table
+    if table is None or table.source is not state.adapter:
+        table = TargetTable(source=state.adapter)
+        state._target_table = table
+    return table
+
 
-    return walk_actions(state.adapter.get_root_actions(), state.structured_file)
+def _get_pipe_snapshots(state: DaemonState) -> PipeSnapshotCache:
+    """Return the per-event pipeline snapshot cache for the current replay."""
+    cache = state._pipe_snapshots
+    if cache is None or cache.source is not state.adapter:
+        cache = PipeSnapshotCache(max_cache_bytes(), source=state.adapter)
+        state._pipe_snapshots = cache
+    return cache
+
+
+def cached_pipe(method: str, handler: Handler) -> Handler:
+    """Wrap a pure pipeline-state handler so its results are kept per event.
+
+    The snapshot key is *method* plus the request params other than ``eid``
+    and the ``_``-prefixed transport params. A hit moves ``current_eid`` like
+    ``require_pipe`` would, but leaves the replay where it is.
+    """
+
+    def _cached(
+        request_id: int, params: dict[str, Any], state: DaemonState
+    ) -> tuple[dict[str, Any], bool]:
+        if state.adapter is None:
+            return handler(request_id, params, state)
+        try:
+            eid = int(params.get("eid", state.current_eid))
+        except (TypeError, ValueError):
+            return handler(request_id, params, state)
+        cache = _get_pipe_snapshots(state)
+        if cache.max_bytes <= 0:
+            return handler(request_id, params, state)
+        extra = {k: v for k, v in params.items() if k != "eid" and not k.startswith("_")}
+        key = method + json.dumps(extra, sort_keys=True, default=str) if extra else method
+        text = cache.get(eid, key)
+        if text is not None:
+            state.metrics.seek(hit=True)
+            state.current_eid = eid
+            return _result_response(request_id, json.loads(text)), True
+        response, running = handler(request_id, params, state)
+        if "result" in response:
+            try:
+                cache.put(eid, key, json.dumps(response["result"]))
+            except (TypeError, ValueError):
+                pass  # not serializable; the server reports it when encoding
+        return response, running
+
+    return _cached
+
+
+def _output_targets(state: DaemonState, eid: int) -> OutputTargets | None:
+    """Return the targets bound at *eid*, seeking the replay only on a table miss.
+
+    Like ``_seek_replay``, a miss leaves the replay head at *eid*. Returns
+    None if *eid* is out of range.
+    """
+    table = _get_target_table(state)
+    targets = table.get(eid)
+    if targets is not None:
+        return targets
+    if state.adapter is None or _seek_replay(state, eid):
+        return None
+    return table.record(eid, state.adapter.get_pipeline_state(), state.tex_map)
+
+
+def _prefetch_targets(state: DaemonState, eids: Iterable[int]) -> TargetTable:
+    """Record the targets of every eid in *eids* missing from the target table.
+
+    The missing events are visited with ``for_each_event``; events whose
+    pipeline state cannot be read are left out of the table.
+    """
+    table = _get_target_table(state)
+    adapter = state.adapter
+    if adapter is None:
+        return table
+
+    def _record(eid: int) -> None:
+        try:
+            table.record(eid, adapter.get_pipeline_state(), state.tex_map)
+        except Exception:  # noqa: BLE001
+            _log.debug("no output targets for eid %d", eid, exc_info=True)
+
+    for_each_event(state, [eid for eid in eids if eid not in table], _record)
+    return table
+
+
+def _get_counter_table(state: DaemonState) -> CounterTable:
+    """Return the counter table, enumerating and describing counters once per replay."""
+    table = state._counter_table
+    if table is not None and table.source is state.adapter:
+        return table
+    table = CounterTable(source=state.adapter)
+    if state.adapter is not None:
+        controller = state.adapter.controller
+        for c in controller.EnumerateCounters():
+            try:
+                desc = controller.DescribeCounter(c)
+            except Exception:  # noqa: BLE001
+                continue
+            if not desc.name or desc.name.startswith("ERROR"):
+                continue
+            table.add(
+                c,
+                {
+                    "id": int(c),
+                    "name": desc.name,
+                    "category": _enum_name(desc.category),
+                    "description": desc.description,
+                    "unit": _enum_name(desc.unit),
+                    "type": _enum_name(desc.resultType),
+                    "byte_width": desc.resultByteWidth,
+                    "uuid": str(getattr(desc, "uuid", "") or ""),
+                },
+            )
+    state._counter_table = table
+    return table
+
+
+def _parse_eid_range(value: Any) -> tuple[int | None, int | None]:
+    """Parse an ``"N:M"`` EID range; either side may be empty."""
+    if value is None or value == "":
+        return None, None
+    if ":" not in str(value):
+        raise ValueError(f"bad range: {value!r}")
+    lo, hi = str(value).split(":", 1)
+    return (int(lo) if lo else None), (int(hi) if hi else None)
+
+
+def _replay_generation(state: DaemonState) -> int:
+    """Return a number that changes whenever a different replay is loaded."""
+    if state._generation_source is not state.adapter:
+        state._generation += 1
+        state._generation_source = state.adapter
+    return state._generation
+
+
+def _encode_cursor(generation: int, offset: int) -> str:
+    return base64.urlsafe_b64encode(f"{generation}:{offset}".encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, generation: int) -> int:
+    """Return the offset held by *cursor*; raise ValueError if bad or stale."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        gen_s, offset_s = raw.split(":", 1)
+        gen, offset = int(gen_s), int(offset_s)
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError(f"invalid cursor: {cursor!r}") from None
+    if gen != generation:
+        raise ValueError("stale cursor: the capture was reloaded")
+    if offset < 0:
+        raise ValueError(f"invalid cursor: {cursor!r}")
+    return offset
+
+
+def _paginate(
+    params: dict[str, Any], state: DaemonState, items: Sequence[_T]
+) -> tuple[Sequence[_T], dict[str, Any]]:
+    """Cut one page out of *items* according to ``cursor``/``page_size``.
+
+    Returns the page and the fields to merge into the result: ``total`` and
+    ``next_cursor`` (None on the last page). Without either param the whole
+    sequence is returned and no fields are added, so unpaged callers see the
+    old response shape. Cursors are opaque and tied to the current replay.
+
+    Raises:
+        ValueError: On a malformed or stale cursor or a bad page size.
+    """
+    cursor = params.get("cursor")
+    page_size = params.get("page_size")
+    if cursor is None and page_size is None:
+        return items, {}
+    generation = _replay_generation(state)
+    start = _decode_cursor(str(cursor), generation) if cursor else 0
+    if page_size is None:
+        end = len(items)
+    else:
+        try:
+            size = int(page_size)
+        except (TypeError, ValueError):
+            raise ValueError("page_size must be an integer") from None
+        if size < 1:
+            raise ValueError("page_size must be >= 1")
+        end = min(start + size, len(items))
+    next_cursor = _encode_cursor(generation, end) if end < len(items) else None
+    return items[start:end], {"total": len(items), "next_cursor": next_cursor}
+
+
+def _list_field(params: dict[str, Any], key: str, rows: Iterable[Any]) -> dict[str, Any]:
+    """Return ``{key: rows}``, deferring the rows when the caller asked for ``_stream``.
+
+    Streamed rows are serialized one per line by the server (see
+    ``daemon_server._encode_stream``) instead of as one JSON document.
+    """
+    if params.get("_stream"):
+        return {"_stream": key, key: rows}
+    return {key: list(rows)}
+
+
+def _byte_range(params: dict[str, Any]) -> tuple[int, int]:
+    """Parse the ``offset``/``length`` params of a raw-bytes request.
+
+    A ``length`` of 0 (the default) means "to the end".
+
+    Raises:
+        ValueError: If either is not a non-negative integer.
+    """
+    try:
+        offset = int(params.get("offset", 0) or 0)
+        length = int(params.get("length", 0) or 0)
+    except (TypeError, ValueError):
+        raise ValueError("offset and length must be integers") from None
+    if offset < 0 or length < 0:
+        raise ValueError("offset and length must be >= 0")
+    return offset, length
+
+
+def _binary_result(
+    result: dict[str, Any], data: Any, offset: int = 0, length: int = 0
+) -> dict[str, Any]:
+    """Attach ``data[offset:offset + length]`` to *result* as the binary payload.
+
+    The slice is a memoryview over *data*, so nothing is copied before the
+    server writes it to the socket. ``size`` is the payload length and
+    ``total`` the length of *data*.
+    """
+    view = memoryview(data).cast("B") if len(data) else memoryview(b"")
+    end = len(view) if length == 0 else min(offset + length, len(view))
+    payload = view[offset:end]
+    result.update(offset=offset, size=len(payload), total=len(view))
+    result["_binary_size"] = len(payload)
+    result["_binary_data"] = payload
+    return result
+
+
+def _get_pass_catalog(state: DaemonState) -> PassCatalog:
+    """Return the merged pass list and its lookups, computed once per replay."""
+    from rdc.services.query_service import build_pass_catalog
+
+    catalog = state._pass_catalog
+    if catalog is not None and catalog.source is state.adapter:
+        return catalog
+    if state.adapter is None:
+        return PassCatalog(passes=[])
+    actions = state.adapter.get_root_actions()
+    state._pass_catalog = build_pass_catalog(actions, state.structured_file, source=state.adapter)
+    return state._pass_catalog
 
 
 def _action_type_str(flags: int) -> str:
@@ -147,92 +480,254 @@ def _action_type_str(flags: int) -> str:
     return "Other"
 
 
+class ShaderCacheBuild:
+    """Resumable walk behind ``_build_shader_cache``.
+
+    The draws and dispatches to visit are listed up front in eid order (no
+    replay); :meth:`step` then seeks to a slice of them at a time,
+    snapshotting the bound shader IDs and disassembling each shader the
+    first time it is seen. Results are kept here and only published to ``DaemonState`` by
+    :meth:`finish`, so handlers never observe a half-built cache.
+    """
+
+    def __init__(self, state: DaemonState) -> None:
+        from rdc.services.query_service import _DISPATCH as _QS_DISPATCH
+        from rdc.services.query_service import _DRAWCALL, _MESHDRAW
+
+        assert state.adapter is not None
+        self.source = state.adapter
+        self.target = get_default_disasm_target(state.adapter.controller)
+        mask = _DRAWCALL | _MESHDRAW | _QS_DISPATCH
+        self.actions: list[Any] = []
+        stack = list(reversed(state.adapter.get_root_actions()))
+        while stack:
+            a = stack.pop()
+            if int(a.flags) & mask:
+                self.actions.append(a)
+            if a.children:
+                stack.extend(reversed(a.children))
+        self.actions = sorted(
+            {a.eventId: a for a in self.actions}.values(), key=lambda a: a.eventId
+        )
+        self.pos = 0
+        self.disasm: dict[int, str] = {}
+        self.pipe_states: dict[int, dict[int, int]] = {}
+        self.stages: dict[int, list[str]] = {}
+        self.eids: dict[int, list[int]] = {}
+        self.reflections: dict[int, Any] = {}
+
+    @property
+    def complete(self) -> bool:
+        return self.pos >= len(self.actions)
+
+    @property
+    def progress(self) -> tuple[int, int]:
+        """Return (draws visited, draws total)."""
+        return self.pos, len(self.actions)
+
+    def step(self, state: DaemonState, limit: int | None = None) -> bool:
+        """Visit up to *limit* pending draws (all if None); True when done.
+
+        The slice is walked with ``for_each_event``, which returns the replay
+        head to the user's event afterwards.
+        """
+        assert state.adapter is not None
+        stop = len(self.actions) if limit is None else min(self.pos + limit, len(self.actions))
+        eids = [a.eventId for a in self.actions[self.pos : stop]]
+        for_each_event(state, eids, lambda eid: self._visit(state, eid))
+        return self.complete
+
+    def _visit(self, state: DaemonState, eid: int) -> None:
+        assert state.adapter is not None
+        controller = state.adapter.controller
+        targets = _get_target_table(state)
+        self.pos += 1
+        pipe = state.adapter.get_pipeline_state()
+        # Snapshot shader IDs (pipe is a mutable reference)
+        self.pipe_states[eid] = {sv: int(pipe.GetShader(sv)) for sv in range(6)}
+        if eid not in targets:
+            try:
+                targets.record(eid, pipe, state.tex_map)
+            except Exception:  # noqa: BLE001
+                pass  # targets are optional here; read on demand later
+
+        for stage_val, stage_name in _STAGE_NAMES.items():
+            sid = int(pipe.GetShader(stage_val))
+            if sid == 0:
+                continue
+            if sid not in self.stages:
+                self.stages[sid] = []
+                self.eids[sid] = []
+            if stage_name not in self.stages[sid]:
+                self.stages[sid].append(stage_name)
+            self.eids[sid].append(eid)
+
+            if sid not in self.reflections:
+                refl = pipe.GetShaderReflection(stage_val)
+                self.reflections[sid] = refl
+                if refl is None:
+                    self.disasm[sid] = ""
+                else:
+                    pipeline = get_pipeline_for_stage(pipe, stage_val)
+                    self.disasm[sid] = (
+                        controller.DisassembleShader(pipeline, refl, self.target)
+                        if hasattr(controller, "DisassembleShader")
+                        else ""
+                    )
+
+    def finish(self, state: DaemonState) -> None:
+        """Publish the collected caches to *state* and persist them."""
+        state.disasm_cache.update(self.disasm)
+        state._pipe_states_cache.update(self.pipe_states)
+        for sid, refl in self.reflections.items():
+            state.shader_meta[sid] = {
+                "stages": self.stages[sid],
+                "uses": len(self.eids[sid]),
+                "first_eid": self.eids[sid][0],
+                "eids": self.eids[sid],
+                "entry": getattr(refl, "entryPoint", "main") if refl else "main",
+                "inputs": len(getattr(refl, "readOnlyResources", [])) if refl else 0,
+                "outputs": len(getattr(refl, "readWriteResources", [])) if refl else 0,
+            }
+
+        state._shader_cache_built = True
+
+        # Caches built with a shader replaced do not describe the capture on disk.
+        if state._shader_store_key is not None and not state.shader_replacements:
+            from rdc.services import shader_store
+
+            shader_store.store(
+                state._shader_store_key,
+                shader_store.ShaderCacheData(
+                    state.disasm_cache, state.shader_meta, state._pipe_states_cache
+                ),
+            )
+
+        if state.vfs_tree is not None:
+            from rdc.vfs.tree_cache import populate_shaders_subtree
+
+            populate_shaders_subtree(state.vfs_tree, state.shader_meta)
+
+
+def _step_shader_cache(state: DaemonState, limit: int | None = None) -> bool:
+    """Advance the shader-cache build by up to *limit* draws; True once built.
+
+    A new build first tries the persisted store, so the capture is only
+    hashed once something needs the shader cache. The replay head is
+    returned to the user's event after each slice.
+    """
+    if state._shader_cache_built or state.adapter is None:
+        return True
+    build = state._shader_build
+    if build is None or build.source is not state.adapter:
+        if _restore_shader_cache(state):
+            return True
+        build = ShaderCacheBuild(state)
+        state._shader_build = build
+    done = build.step(state, limit)
+    if done:
+        build.finish(state)
+        state._shader_build = None
+    return done
+
+
 def _build_shader_cache(state: DaemonState) -> None:
     """Single-pass shader cache: collect pipe states, disassembly, and metadata.
 
     Populates state.disasm_cache, state.shader_meta, and
-    state._pipe_states_cache in one recursive walk. No-op if already built.
-    Also populates the /shaders/ VFS subtree as a side effect.
+    state._pipe_states_cache in one walk, finishing a build that warm-up
+    already started. No-op if already built. Also populates the /shaders/
+    VFS subtree as a side effect.
     """
-    if state._shader_cache_built or state.adapter is None:
-        return
+    _step_shader_cache(state)
+
 
-    from rdc.services.query_service import _DISPATCH as _QS_DISPATCH
-    from rdc.services.query_service import _DRAWCALL, _MESHDRAW
+def _get_search_index(state: DaemonState) -> DisasmIndex:
+    """Return the ``search`` index over the disassembly, building the shader cache first.
 
-    controller = state.adapter.controller
-    target = get_default_disasm_target(controller)
+    The index is rebuilt if the replay or any cached disassembly changed.
+    """
+    from rdc.services.search_index import DisasmIndex
 
-    shader_stages: dict[int, list[str]] = {}
-    shader_eids: dict[int, list[int]] = {}
-    shader_reflections: dict[int, Any] = {}
-    seen: set[int] = set()
+    _build_shader_cache(state)
+    index = state._search_index
+    if (
+        index is None
+        or index.source is not state.adapter
+        or not index.is_current(state.disasm_cache)
+    ):
+        index = DisasmIndex(state.disasm_cache, source=state.adapter)
+        state._search_index = index
+    return index
 
-    def _walk(actions: list[Any]) -> None:
-        assert state.adapter is not None
-        for a in actions:
-            flags = int(a.flags)
-            if (flags & (_DRAWCALL | _MESHDRAW)) or (flags & _QS_DISPATCH):
-                _seek_replay(state, a.eventId)
-                pipe = state.adapter.get_pipeline_state()
-                # Snapshot shader IDs (pipe is a mutable reference)
-                stage_snap: dict[int, int] = {}
-                for sv in range(6):
-                    stage_snap[sv] = int(pipe.GetShader(sv))
-                state._pipe_states_cache[a.eventId] = stage_snap
-
-                for stage_val, stage_name in _STAGE_NAMES.items():
-                    sid = int(pipe.GetShader(stage_val))
-                    if sid == 0:
-                        continue
-                    if sid not in shader_stages:
-                        shader_stages[sid] = []
-                        shader_eids[sid] = []
-                    if stage_name not in shader_stages[sid]:
-                        shader_stages[sid].append(stage_name)
-                    shader_eids[sid].append(a.eventId)
-
-                    if sid not in seen:
-                        seen.add(sid)
-                        refl = pipe.GetShaderReflection(stage_val)
-                        shader_reflections[sid] = refl
-                        if refl is None:
-                            state.disasm_cache[sid] = ""
-                        else:
-                            pipeline = get_pipeline_for_stage(pipe, stage_val)
-                            disasm = (
-                                controller.DisassembleShader(pipeline, refl, target)
-                                if hasattr(controller, "DisassembleShader")
-                                else ""
-                            )
-                            state.disasm_cache[sid] = disasm
-            if a.children:
-                _walk(a.children)
-
-    _walk(state.adapter.get_root_actions())
-
-    # Restore replay head to user's position
-    if state.current_eid != 0:
-        _seek_replay(state, state.current_eid)
-
-    for sid in seen:
-        refl = shader_reflections.get(sid)
-        state.shader_meta[sid] = {
-            "stages": shader_stages[sid],
-            "uses": len(shader_eids[sid]),
-            "first_eid": shader_eids[sid][0],
-            "eids": shader_eids[sid],
-            "entry": getattr(refl, "entryPoint", "main") if refl else "main",
-            "inputs": len(getattr(refl, "readOnlyResources", [])) if refl else 0,
-            "outputs": len(getattr(refl, "readWriteResources", [])) if refl else 0,
-        }
 
-    state._shader_cache_built = True
+WARM_STAGES: tuple[str, ...] = ("actions", "shaders", "search", "usage")
+
+
+@dataclass
+class WarmUp:
+    """Warm-up requested by the ``warm`` RPC; stages run in daemon idle time."""
+
+    pending: list[str] = field(default_factory=lambda: list(WARM_STAGES))
+    error: str | None = None
+
 
+def _warm_status(state: DaemonState) -> dict[str, Any]:
+    """Return warm-up progress as reported by ``status`` and ``warm``."""
+    warm = state._warm
+    pending = warm.pending if warm is not None else []
+    shaders: list[int] | None = None
+    if state._shader_cache_built:
+        shaders = [len(state._pipe_states_cache)] * 2
+    elif state._shader_build is not None and state._shader_build.source is state.adapter:
+        shaders = list(state._shader_build.progress)
+    table = state._usage_table
+    usage = list(table.progress) if table is not None and table.source is state.adapter else None
+    index = state._action_index
+    return {
+        "done": not pending,
+        "stage": pending[0] if pending else None,
+        "error": warm.error if warm is not None else None,
+        "actions": index is not None and index.source is state.adapter,
+        "shaders": shaders,
+        "usage": usage,
+    }
+
+
+def _restore_shader_cache(state: DaemonState) -> bool:
+    """Load a persisted shader cache for the open capture, if one exists.
+
+    Hashes the whole capture, so it runs when a build starts rather than at
+    open. Sets ``state._shader_store_key`` so the build saves its result,
+    and returns True when the cache was restored.
+    """
+    state._shader_store_key = None
+    if state.adapter is None:
+        return False
+
+    from rdc.services import shader_store
+
+    if shader_store.max_cache_bytes() <= 0:
+        return False
+    get_version = getattr(state.rd, "GetVersionString", None)
+    version = (
+        str(get_version()) if callable(get_version) else ".".join(map(str, state.adapter.version))
+    )
+    target = get_default_disasm_target(state.adapter.controller)
+    key = shader_store.capture_key(state.local_capture_path or state.capture, version, target)
+    state._shader_store_key = key
+    data = shader_store.load(key) if key is not None else None
+    if data is None:
+        return False
+    state.disasm_cache = data.disasm
+    state.shader_meta = data.meta
+    state._pipe_states_cache = data.pipe_states
+    state._shader_cache_built = True
     if state.vfs_tree is not None:
         from rdc.vfs.tree_cache import populate_shaders_subtree
 
         populate_shaders_subtree(state.vfs_tree, state.shader_meta)
+    return True
 
 
 def _make_texsave(
@@ -641,6 +1136,7 @@ def _ensure_shader_populated(
         pipe = state.adapter.get_pipeline_state()  # type: ignore[union-attr]
         assert state.vfs_tree is not None
         populate_draw_subtree(state.vfs_tree, eid, pipe)
+        _get_target_table(state).record(eid, pipe, state.tex_map)
     return None
 
 
@@ -671,4 +1167,5 @@ def _ensure_pass_attachments_populated(
     from rdc.vfs.tree_cache import populate_pass_attachments
 
     populate_pass_attachments(state.vfs_tree, pass_name, pipe)
+    _get_target_table(state).record(begin_eid, pipe, state.tex_map)
     return None
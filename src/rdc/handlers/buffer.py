@@ -1,19 +1,25 @@
-"""Buffer handlers: buf_info, buf_raw, postvs, mesh_data, cbuffer/vbuffer/ibuffer decode."""
+"""Buffer handlers: buf_info, buf_raw, postvs, mesh_*, cbuffer/vbuffer/ibuffer decode."""
 
 from __future__ import annotations
 
-import struct
+import bisect
 from typing import TYPE_CHECKING, Any
 
 from rdc.handlers._helpers import (
     STAGE_MAP,
     PipeError,
+    _binary_result,
+    _byte_range,
     _enum_name,
     _error_response,
+    _get_action_index,
+    _get_pass_catalog,
+    _parse_eid_range,
     _result_response,
     _set_frame_event,
     _shader_value_lane_fallback,
     _shader_value_lane_name,
+    for_each_event,
     get_pipeline_for_stage,
     require_pipe,
 )
@@ -23,27 +29,65 @@ if TYPE_CHECKING:
     from rdc.daemon_server import DaemonState
 
 
-def _decode_float_components(
-    data: bytes, offset: int, comp_width: int, comp_count: int
-) -> list[float]:
-    """Decode comp_count float components of comp_width bytes each starting at offset."""
-    result: list[float] = []
-    for i in range(comp_count):
-        off = offset + i * comp_width
-        if comp_width == 4:
-            result.append(struct.unpack_from("<f", data, off)[0])
-        elif comp_width == 2:
-            result.append(struct.unpack_from("<e", data, off)[0])
-        else:  # comp_width == 1
-            result.append(data[off] / 255.0)
-    return result
+_INDEX_DTYPES = {1: "u1", 2: "<u2", 4: "<u4"}
+_INDEX_FORMATS = {1: "uint8", 2: "uint16", 4: "uint32"}
+
+
+def _decode_index_array(data: bytes, stride: int) -> Any:
+    """Decode an index buffer into a NumPy array without copying.
+
+    A trailing partial index is ignored.
+    """
+    import numpy as np
+
+    dtype = np.dtype(_INDEX_DTYPES[stride])
+    return np.frombuffer(data, dtype=dtype, count=len(data) // stride)
 
 
 def _decode_index_buffer(data: bytes, stride: int) -> list[int]:
     """Decode a flat index buffer with given per-index stride."""
-    fmt = {1: "B", 2: "<H", 4: "<I"}[stride]
-    item_size = struct.calcsize(fmt)
-    return [struct.unpack_from(fmt, data, i)[0] for i in range(0, len(data), item_size)]
+    indices: list[int] = _decode_index_array(data, stride).tolist()
+    return indices
+
+
+def _restart_index(pipe_state: Any, stride: int, override: Any = None) -> int | None:
+    """Return the primitive-restart index in effect for *stride*, or None.
+
+    *override* (a bool) forces restart on or off; otherwise the pipeline's
+    ``IsRestartEnabled`` decides, when the API exposes it.
+    """
+    mask = (1 << (8 * stride)) - 1
+    if override is not None:
+        enabled = bool(override)
+    else:
+        is_enabled = getattr(pipe_state, "IsRestartEnabled", None)
+        enabled = bool(is_enabled()) if callable(is_enabled) else False
+    if not enabled:
+        return None
+    get_index = getattr(pipe_state, "GetRestartIndex", None)
+    return (int(get_index()) & mask) if callable(get_index) else mask
+
+
+def _index_stats(indices: Any, restart: int | None) -> dict[str, Any]:
+    """Count, restart count, min/max and distinct vertices of an index array."""
+    import numpy as np
+
+    valid = indices if restart is None else indices[indices != restart]
+    stats: dict[str, Any] = {
+        "count": int(indices.size),
+        "restarts": int(indices.size - valid.size),
+        "min": None,
+        "max": None,
+        "unique": 0,
+    }
+    if valid.size:
+        lo, hi = int(valid.min()), int(valid.max())
+        stats["min"], stats["max"] = lo, hi
+        if hi - lo <= 4 * valid.size + 65536:
+            stats["unique"] = int(np.count_nonzero(np.bincount(valid - lo)))
+        else:
+            stats["unique"] = int(np.unique(valid).size)
+    return stats
 
 
 def _shader_variable_value_kind(var_type: Any) -> str:
@@ -104,15 +148,33 @@ def _handle_buf_info(
 def _handle_buf_raw(
     request_id: int, params: dict[str, Any], state: DaemonState
 ) -> tuple[dict[str, Any], bool]:
+    """Return a buffer's bytes, or the ``offset``/``length`` range of them.
+
+    With ``binary: true`` the bytes go straight over the binary side channel;
+    otherwise they are written to a temp file whose ``path`` is returned.
+    Only the requested range is read from the replay.
+    """
     assert state.adapter is not None
-    if state.temp_dir is None:
+    binary = bool(params.get("binary"))
+    if not binary and state.temp_dir is None:
         return _error_response(request_id, -32002, "temp directory not available"), True
+    try:
+        offset, length = _byte_range(params)
+    except ValueError as exc:
+        return _error_response(request_id, -32602, str(exc)), True
     res_id = int(params.get("id", 0))
     buf = state.buf_map.get(res_id)
     if buf is None:
         return _error_response(request_id, -32001, f"buffer {res_id} not found"), True
     controller = state.adapter.controller
-    raw_data = controller.GetBufferData(buf.resourceId, 0, 0)
+    total = int(getattr(buf, "length", 0) or 0)
+    in_range = offset == 0 or total == 0 or offset < total
+    raw_data = controller.GetBufferData(buf.resourceId, offset, length) if in_range else b""
+    if binary:
+        result = _binary_result({"id": res_id}, raw_data)
+        result.update(offset=offset, total=total or len(raw_data))
+        return _result_response(request_id, result), True
+    assert state.temp_dir is not None
     temp_path = state.temp_dir / f"buf_{res_id}.bin"
     temp_path.write_bytes(raw_data)
     return _result_response(
@@ -229,13 +291,20 @@ def _handle_cbuffer_decode(  # noqa: PLR0912
 def _handle_cbuffer_raw(
     request_id: int, params: dict[str, Any], state: DaemonState
 ) -> tuple[dict[str, Any], bool]:
+    """Return the bytes backing a constant block, optionally an ``offset``/``length`` range.
+
+    With ``binary: true`` the bytes go straight over the binary side channel
+    instead of through a temp file.
+    """
     cb_set = int(params.get("set", 0))
     cb_binding = int(params.get("binding", 0))
+    binary = bool(params.get("binary"))
     try:
         stage_name, stage_val = _shader_stage_param(params)
+        offset, length = _byte_range(params)
     except ValueError as exc:
         return _error_response(request_id, -32602, str(exc)), True
-    if state.temp_dir is None:
+    if not binary and state.temp_dir is None:
         return _error_response(request_id, -32002, "temp directory not available"), True
     try:
         eid, pipe_state = require_pipe(params, state, request_id)
@@ -289,6 +358,12 @@ def _handle_cbuffer_raw(
             "cbuffer size is unknown (descriptor and reflection both report 0)",
         ), True
     raw_data = controller.GetBufferData(cb_resource, cb_offset, cb_size)
+    if binary or offset or length:
+        result = _binary_result({"eid": eid}, raw_data, offset, length)
+        if binary:
+            return _result_response(request_id, result), True
+        raw_data = result["_binary_data"]
+    assert state.temp_dir is not None
     temp_path = state.temp_dir / f"cbuffer_{eid}_{stage_name}_{cb_set}_{cb_binding}.bin"
     temp_path.write_bytes(raw_data)
     return _result_response(
@@ -297,9 +372,15 @@ def _handle_cbuffer_raw(
     ), True
 
 
-def _handle_vbuffer_decode(  # noqa: PLR0912
+def _handle_vbuffer_decode(
     request_id: int, params: dict[str, Any], state: DaemonState
 ) -> tuple[dict[str, Any], bool]:
+    """Decode bound vertex buffers into per-component columns.
+
+    With ``binary: true`` the values are sent as typed little-endian column
+    buffers over the binary side channel (one block per column, described
+    by ``layout``) instead of a JSON ``vertices`` matrix.
+    """
     try:
         eid, pipe_state = require_pipe(params, state, request_id)
     except PipeError as exc:
@@ -309,26 +390,6 @@ def _handle_vbuffer_decode(  # noqa: PLR0912
     if not inputs:
         return _result_response(request_id, {"eid": eid, "columns": [], "vertices": []}), True
     controller = state.adapter.controller  # type: ignore[union-attr]
-    columns: list[str] = []
-    col_defs: list[dict[str, Any]] = []
-    for vi in inputs:
-        fmt = getattr(vi, "format", None)
-        comp_count = getattr(fmt, "compCount", 1) if fmt else 1
-        attr_name = getattr(vi, "name", "attr")
-        if comp_count == 1:
-            columns.append(attr_name)
-        else:
-            suffixes = ["x", "y", "z", "w"][:comp_count]
-            columns.extend(f"{attr_name}.{s}" for s in suffixes)
-        col_defs.append(
-            {
-                "name": attr_name,
-                "vbSlot": getattr(vi, "vertexBuffer", 0),
-                "byteOffset": getattr(vi, "byteOffset", 0),
-                "compCount": comp_count,
-                "compByteWidth": getattr(fmt, "compByteWidth", 4) if fmt else 4,
-            }
-        )
     buf_data: dict[int, bytes] = {}
     for i, vb in enumerate(vbuffers):
         rid = getattr(vb, "resourceId", None)
@@ -343,32 +404,146 @@ def _handle_vbuffer_decode(  # noqa: PLR0912
         if stride > 0:
             data_len = len(buf_data.get(0, b""))
             num_verts = data_len // stride
-    vertices: list[list[float]] = []
-    for vi_idx in range(num_verts):
-        vtx_row: list[float] = []
-        for cd in col_defs:
-            slot = cd["vbSlot"]
-            data = buf_data.get(slot, b"")
-            vb = vbuffers[slot] if slot < len(vbuffers) else None
-            stride = getattr(vb, "byteStride", 0) if vb else 0
-            base = vi_idx * stride + cd["byteOffset"]
-            cw = cd["compByteWidth"]
-            cc = cd["compCount"]
-            if base + cw * cc <= len(data) and cw in (1, 2, 4):
-                vtx_row.extend(_decode_float_components(data, base, cw, cc))
-            else:
-                for c in range(cc):
-                    off = base + c * cw
-                    if off + cw <= len(data) and cw in (1, 2, 4):
-                        vtx_row.extend(_decode_float_components(data, off, cw, 1))
-                    else:
-                        vtx_row.append(0.0)
-        vertices.append(vtx_row)
+
+    columns: list[str] = []
+    blocks: list[tuple[Any, str]] = []
+    for vi in inputs:
+        fmt = getattr(vi, "format", None)
+        comp_count = getattr(fmt, "compCount", 1) if fmt else 1
+        attr_name = getattr(vi, "name", "attr")
+        if comp_count == 1:
+            columns.append(attr_name)
+        else:
+            suffixes = ["x", "y", "z", "w"][:comp_count]
+            columns.extend(f"{attr_name}.{s}" for s in suffixes)
+        slot = getattr(vi, "vertexBuffer", 0)
+        vb = vbuffers[slot] if slot < len(vbuffers) else None
+        blocks.append(
+            _decode_vertex_attribute(
+                buf_data.get(slot, b""),
+                num_verts,
+                getattr(vb, "byteStride", 0) if vb else 0,
+                getattr(vi, "byteOffset", 0),
+                comp_count,
+                getattr(fmt, "compByteWidth", 4) if fmt else 4,
+                int(getattr(fmt, "compType", 0) or 0) if fmt else 0,
+            )
+        )
+
+    if params.get("binary"):
+        chunks: list[bytes] = []
+        layout: list[dict[str, Any]] = []
+        pos = 0
+        names = iter(columns)
+        for values, col_dtype in blocks:
+            for c in range(values.shape[1]):
+                chunk = values[:, c].astype(col_dtype).tobytes()
+                layout.append({"name": next(names), "dtype": col_dtype, "offset": pos})
+                chunks.append(chunk)
+                pos += len(chunk)
+        data = b"".join(chunks)
+        return _result_response(
+            request_id,
+            {
+                "eid": eid,
+                "columns": columns,
+                "count": num_verts,
+                "layout": layout,
+                "_binary_size": len(data),
+                "_binary_data": data,
+            },
+        ), True
+
+    import numpy as np
+
+    matrix = np.hstack([values for values, _ in blocks])
     return _result_response(
-        request_id, {"eid": eid, "columns": columns, "vertices": vertices}
+        request_id, {"eid": eid, "columns": columns, "vertices": matrix.tolist()}
     ), True
 
 
+# RenderDoc CompType values.
+_CT_FLOAT, _CT_UNORM, _CT_SNORM, _CT_UINT, _CT_SINT = 1, 2, 3, 4, 5
+_CT_USCALED, _CT_SSCALED, _CT_DEPTH, _CT_UNORM_SRGB = 6, 7, 8, 9
+
+# (comp_type, comp_byte_width) -> (source dtype, normalization divisor, column dtype)
+_VERTEX_FORMATS: dict[tuple[int, int], tuple[str, float, str]] = {
+    (_CT_FLOAT, 2): ("<f2", 0.0, "<f4"),
+    (_CT_FLOAT, 4): ("<f4", 0.0, "<f4"),
+    (_CT_FLOAT, 8): ("<f8", 0.0, "<f8"),
+    (_CT_DEPTH, 4): ("<f4", 0.0, "<f4"),
+    (_CT_SNORM, 1): ("i1", 127.0, "<f4"),
+    (_CT_SNORM, 2): ("<i2", 32767.0, "<f4"),
+    (_CT_SNORM, 4): ("<i4", 2147483647.0, "<f4"),
+    (_CT_UINT, 1): ("u1", 0.0, "<u4"),
+    (_CT_UINT, 2): ("<u2", 0.0, "<u4"),
+    (_CT_UINT, 4): ("<u4", 0.0, "<u4"),
+    (_CT_SINT, 1): ("i1", 0.0, "<i4"),
+    (_CT_SINT, 2): ("<i2", 0.0, "<i4"),
+    (_CT_SINT, 4): ("<i4", 0.0, "<i4"),
+}
+for _ct in (_CT_UNORM, _CT_UNORM_SRGB, _CT_DEPTH):
+    _VERTEX_FORMATS.setdefault((_ct, 1), ("u1", 255.0, "<f4"))
+    _VERTEX_FORMATS.setdefault((_ct, 2), ("<u2", 65535.0, "<f4"))
+    _VERTEX_FORMATS.setdefault((_ct, 4), ("<u4", 4294967295.0, "<f4"))
+for (_ct, _w), (_src, _div, _col) in list(_VERTEX_FORMATS.items()):
+    if _ct == _CT_UINT:
+        _VERTEX_FORMATS[(_CT_USCALED, _w)] = (_src, _div, "<f4")
+    elif _ct == _CT_SINT:
+        _VERTEX_FORMATS[(_CT_SSCALED, _w)] = (_src, _div, "<f4")
+
+# Formats without a usable CompType (Typeless) keep the historical reading:
+# 4-byte float, 2-byte half, 1-byte unorm.
+_VERTEX_FORMATS_UNTYPED: dict[int, tuple[str, float, str]] = {
+    4: ("<f4", 0.0, "<f4"),
+    2: ("<f2", 0.0, "<f4"),
+    1: ("u1", 255.0, "<f4"),
+}
+
+
+def _decode_vertex_attribute(
+    data: bytes,
+    count: int,
+    stride: int,
+    offset: int,
+    comp_count: int,
+    comp_width: int,
+    comp_type: int = 0,
+) -> tuple[Any, str]:
+    """Decode one vertex attribute for *count* vertices.
+
+    Each component is read through a strided NumPy view over *data*, so no
+    per-vertex Python work is done. Normalized formats are scaled to
+    [0, 1] / [-1, 1]; components past the end of *data* or in an
+    unsupported format decode as 0.
+
+    Returns:
+        ``(values, column_dtype)``: a float64 ``(count, comp_count)`` array
+        and the dtype the column should be transmitted as.
+    """
+    import numpy as np
+
+    spec = _VERTEX_FORMATS.get((comp_type, comp_width)) or _VERTEX_FORMATS_UNTYPED.get(comp_width)
+    values = np.zeros((count, comp_count), dtype=np.float64)
+    if spec is None:
+        return values, "<f4"
+    src_name, divisor, col_dtype = spec
+    src = np.dtype(src_name)
+    for c in range(comp_count):
+        start = offset + c * comp_width
+        if count <= 0 or start < 0 or start + comp_width > len(data):
+            continue
+        n = count if stride <= 0 else min(count, (len(data) - start - comp_width) // stride + 1)
+        view = np.ndarray((n,), dtype=src, buffer=data, offset=start, strides=(max(stride, 0),))
+        with np.errstate(invalid="ignore"):
+            values[:n, c] = view
+    if divisor:
+        values /= divisor
+        if src.kind == "i":
+            np.maximum(values, -1.0, out=values)
+    return values, col_dtype
+
+
 _MESH_STAGE_MAP: dict[str, int] = {"vs-in": 0, "vs-out": 1, "gs-out": 2}
 _ACTION_INDEXED = 0x10000
 _UINT64_MAX = (1 << 64) - 1
@@ -399,7 +574,36 @@ def _same_postvs_source(a: Any, b: Any) -> bool:
     return all(getattr(a, key, None) == getattr(b, key, None) for key in keys)
 
 
-def _decode_mesh_postvs(controller: Any, mesh: Any) -> dict[str, Any]:
+class _VertexReuse:
+    """The last vertex buffer read and decoded, kept for the next draw.
+
+    Consecutive draws of a batch often read the same buffer range with the
+    same position layout; ``get`` only calls *build* when the key changes.
+    ``reset`` forgets the value when the buffer may have been rewritten.
+    """
+
+    def __init__(self) -> None:
+        self.key: tuple[Any, ...] | None = None
+        self.value: Any = None
+        self.hits = 0
+
+    def get(self, key: tuple[Any, ...], build: Any) -> Any:
+        if key == self.key:
+            self.hits += 1
+        else:
+            self.key, self.value = key, build()
+        return self.value
+
+    def reset(self) -> None:
+        self.key, self.value = None, None
+
+
+def _decode_mesh_postvs(
+    controller: Any, mesh: Any, reuse: _VertexReuse | None = None
+) -> dict[str, Any]:
+    """Decode PostVS positions; ``vertices``/``indices`` are NumPy arrays."""
+    import numpy as np
+
     vrid = int(getattr(mesh, "vertexResourceId", 0))
     stride = getattr(mesh, "vertexByteStride", 0)
     if vrid == 0 or stride == 0:
@@ -411,59 +615,52 @@ def _decode_mesh_postvs(controller: Any, mesh: Any) -> dict[str, Any]:
     v_size = _known_byte_size(getattr(mesh, "vertexByteSize", 0))
     if v_size == 0:
         raise ValueError("PostVS vertex buffer size is unknown")
-    raw = controller.GetBufferData(mesh.vertexResourceId, 0, v_size)
-    num_verts = len(raw) // stride if stride > 0 else 0
+
+    def _read() -> Any:
+        raw = controller.GetBufferData(mesh.vertexResourceId, 0, v_size)
+        count = len(raw) // stride
+        return _decode_positions(raw, count, stride, pos_offset, comp_width, comp_count)
+
+    key = (vrid, 0, v_size, stride, pos_offset, comp_width, comp_count)
+    vertices = (reuse or _VertexReuse()).get(key, _read)
     num_indices = getattr(mesh, "numIndices", 0)
     if num_indices > 0:
         irid = getattr(mesh, "indexResourceId", None)
         if irid is None or int(irid) == 0:
-            num_verts = min(num_verts, num_indices)
-    vertices = _decode_position_rows(raw, num_verts, stride, pos_offset, comp_width, comp_count)
+            vertices = vertices[:num_indices]
+    num_verts = len(vertices)
 
     irid = int(getattr(mesh, "indexResourceId", 0))
     base_vertex = getattr(mesh, "baseVertex", 0)
-    indices: list[int] = []
+    indices: Any = np.empty(0, dtype=np.int64)
     if irid != 0:
         i_offset = getattr(mesh, "indexByteOffset", 0)
         i_size = getattr(mesh, "indexByteSize", 0)
         i_stride = getattr(mesh, "indexByteStride", 0)
         if i_stride in (2, 4) and i_size > 0:
             iraw = controller.GetBufferData(mesh.indexResourceId, i_offset, i_size)
-            indices = [i + base_vertex for i in _decode_index_buffer(iraw, i_stride)]
+            indices = _decode_index_array(iraw, i_stride).astype("int64") + base_vertex
     return {
         "topology": _enum_name(getattr(mesh, "topology", "")),
         "vertex_count": num_verts,
         "comp_count": comp_count,
         "stride": stride,
         "vertices": vertices,
-        "index_count": len(indices),
+        "index_count": int(indices.size),
         "indices": indices,
     }
 
 
-def _decode_position_rows(
+def _decode_positions(
     raw: bytes,
     num_verts: int,
     stride: int,
     pos_offset: int,
     comp_width: int,
     comp_count: int,
-) -> list[list[float]]:
-    vertices: list[list[float]] = []
-    for i in range(num_verts):
-        base = i * stride + pos_offset
-        if base + comp_width * comp_count <= len(raw) and comp_width in (1, 2, 4):
-            vertices.append(_decode_float_components(raw, base, comp_width, comp_count))
-        else:
-            comps: list[float] = []
-            for c in range(comp_count):
-                off = base + c * comp_width
-                if off + comp_width <= len(raw) and comp_width in (1, 2, 4):
-                    comps.extend(_decode_float_components(raw, off, comp_width, 1))
-                else:
-                    comps.append(0.0)
-            vertices.append(comps)
-    return vertices
+) -> Any:
+    values, _ = _decode_vertex_attribute(raw, num_verts, stride, pos_offset, comp_count, comp_width)
+    return values
 
 
 def _input_display_name(vi: Any) -> str:
@@ -603,8 +800,15 @@ def _select_position_input(
 
 
 def _mesh_data_from_ia(
-    controller: Any, pipe_state: Any, action: Any | None, params: dict[str, Any]
+    controller: Any,
+    pipe_state: Any,
+    action: Any | None,
+    params: dict[str, Any],
+    reuse: _VertexReuse | None = None,
 ) -> dict[str, Any]:
+    """Decode VS-IN positions from the bound vertex buffers (NumPy arrays, as PostVS)."""
+    import numpy as np
+
     if action is None:
         raise ValueError("no draw action found for eid")
     inputs = pipe_state.GetVertexInputs()
@@ -630,7 +834,7 @@ def _mesh_data_from_ia(
     action_count = int(getattr(action, "numIndices", 0) or 0)
 
     first_vertex = 0
-    local_indices: list[int] = []
+    local_indices: Any = np.empty(0, dtype=np.int64)
     ib = pipe_state.GetIBuffer()
     irid = getattr(ib, "resourceId", None)
     i_stride = getattr(ib, "byteStride", 0)
@@ -644,13 +848,17 @@ def _mesh_data_from_ia(
         if i_size > 0:
             iraw = controller.GetBufferData(irid, i_offset, i_size)
             base_vertex = int(getattr(action, "baseVertex", 0) or 0)
-            referenced = [i + base_vertex for i in _decode_index_buffer(iraw, i_stride)]
-            if referenced:
-                first_vertex = min(referenced)
+            referenced = _decode_index_array(iraw, i_stride).astype("int64") + base_vertex
+            if referenced.size:
+                first_vertex = int(referenced.min())
                 if first_vertex < 0:
                     raise ValueError("indexed draw references a negative vertex")
-                local_indices = [i - first_vertex for i in referenced]
-        num_verts = max(local_indices) + 1 if local_indices else 0
+                local_indices = referenced - first_vertex
+                num_verts = int(local_indices.max()) + 1
+            else:
+                num_verts = 0
+        else:
+            num_verts = 0
     elif is_indexed:
         raise ValueError("indexed draw index buffer is not bound")
     else:
@@ -661,16 +869,18 @@ def _mesh_data_from_ia(
     if known_vb_size > 0:
         remaining = max(known_vb_size - first_vertex * stride, 0)
         num_verts = min(num_verts, remaining // stride)
-        if local_indices and any(i >= num_verts for i in local_indices):
+        if local_indices.size and int(local_indices.max()) >= num_verts:
             raise ValueError("indexed draw references vertices outside the bound vertex buffer")
     pos_offset = getattr(pos_input, "byteOffset", 0)
+    read_offset = vb_offset + first_vertex * stride
     read_size = num_verts * stride
-    raw = (
-        controller.GetBufferData(vrid, vb_offset + first_vertex * stride, read_size)
-        if read_size
-        else b""
-    )
-    vertices = _decode_position_rows(raw, num_verts, stride, pos_offset, comp_width, comp_count)
+
+    def _read() -> Any:
+        raw = controller.GetBufferData(vrid, read_offset, read_size) if read_size else b""
+        return _decode_positions(raw, num_verts, stride, pos_offset, comp_width, comp_count)
+
+    key = (int(vrid), read_offset, read_size, stride, pos_offset, comp_width, comp_count)
+    vertices = (reuse or _VertexReuse()).get(key, _read)
 
     result = {
         "topology": _enum_name(pipe_state.GetPrimitiveTopology()),
@@ -678,7 +888,7 @@ def _mesh_data_from_ia(
         "comp_count": comp_count,
         "stride": stride,
         "vertices": vertices,
-        "index_count": len(local_indices),
+        "index_count": int(local_indices.size),
         "indices": local_indices,
         "position_attribute": _input_display_name(pos_input),
         "position_source": position_source,
@@ -693,52 +903,201 @@ def _mesh_data_from_ia(
     return result
 
 
+def _decode_mesh(
+    state: DaemonState,
+    eid: int,
+    stage_name: str,
+    params: dict[str, Any],
+    reuse: _VertexReuse | None = None,
+) -> dict[str, Any]:
+    """Decode the mesh of *eid* (the current replay event) at *stage_name*.
+
+    Raises:
+        ValueError: If the stage has no usable vertex data.
+    """
+    assert state.adapter is not None
+    controller = state.adapter.controller
+    mesh = controller.GetPostVSData(0, 0, _MESH_STAGE_MAP[stage_name])
+    if stage_name == "vs-in":
+        use_ia = not _mesh_data_usable(mesh)
+        if not use_ia:
+            vs_out = controller.GetPostVSData(0, 0, _MESH_STAGE_MAP["vs-out"])
+            use_ia = _mesh_data_usable(vs_out) and _same_postvs_source(mesh, vs_out)
+        if use_ia:
+            pipe_state = state.adapter.get_pipeline_state()
+            action = _find_action(state.adapter.get_root_actions(), eid)
+            return _mesh_data_from_ia(controller, pipe_state, action, params, reuse)
+    return _decode_mesh_postvs(controller, mesh, reuse)
+
+
+def _mesh_binary(decoded: dict[str, Any]) -> tuple[dict[str, Any], bytes]:
+    """Split a decoded mesh into its metadata and the binary payload.
+
+    The payload is the float32 xyz positions (``vertex_count`` rows)
+    followed by the uint32 indices, starting at ``indices_offset``.
+    """
+    meta = {k: v for k, v in decoded.items() if k not in ("vertices", "indices")}
+    positions = _mesh_xyz(decoded["vertices"])
+    meta["position_dtype"] = "<f4"
+    meta["index_dtype"] = "<u4"
+    meta["indices_offset"] = positions.nbytes
+    return meta, positions.tobytes() + decoded["indices"].astype("<u4").tobytes()
+
+
+def _mesh_stage(params: dict[str, Any]) -> str:
+    stage_name = str(params.get("stage", "vs-out"))
+    if stage_name not in _MESH_STAGE_MAP:
+        raise ValueError(f"invalid stage {stage_name!r}; use vs-in, vs-out or gs-out")
+    return stage_name
+
+
 def _handle_mesh_data(
     request_id: int, params: dict[str, Any], state: DaemonState
 ) -> tuple[dict[str, Any], bool]:
-    """Decode post-transform vertex data into position arrays."""
+    """Decode post-transform vertex data into position arrays.
+
+    With ``binary: true`` the positions (float32 xyz, ``vertex_count`` rows)
+    followed by the indices (uint32, starting at ``indices_offset``) are sent
+    over the binary side channel instead of as JSON ``vertices``/``indices``.
+    """
     assert state.adapter is not None
-    stage_name = str(params.get("stage", "vs-out"))
-    stage_val = _MESH_STAGE_MAP.get(stage_name)
-    if stage_val is None:
-        return _error_response(
-            request_id, -32602, f"invalid stage {stage_name!r}; use vs-in, vs-out or gs-out"
-        ), True
+    try:
+        stage_name = _mesh_stage(params)
+    except ValueError as exc:
+        return _error_response(request_id, -32602, str(exc)), True
     eid = int(params.get("eid", state.current_eid))
     err = _set_frame_event(state, eid)
     if err:
         return _error_response(request_id, -32002, err), True
-    controller = state.adapter.controller
-    mesh = controller.GetPostVSData(0, 0, stage_val)
     try:
-        if stage_name == "vs-in":
-            use_ia = not _mesh_data_usable(mesh)
-            if not use_ia:
-                vs_out = controller.GetPostVSData(0, 0, _MESH_STAGE_MAP["vs-out"])
-                use_ia = _mesh_data_usable(vs_out) and _same_postvs_source(mesh, vs_out)
-            if use_ia:
-                pipe_state = state.adapter.get_pipeline_state()
-                action = _find_action(state.adapter.get_root_actions(), eid)
-                decoded = _mesh_data_from_ia(controller, pipe_state, action, params)
-            else:
-                decoded = _decode_mesh_postvs(controller, mesh)
-        else:
-            decoded = _decode_mesh_postvs(controller, mesh)
+        decoded = _decode_mesh(state, eid, stage_name, params)
     except ValueError as exc:
         return _error_response(request_id, -32001, str(exc)), True
-    return _result_response(
-        request_id,
-        {
-            "eid": eid,
-            "stage": stage_name,
-            **decoded,
-        },
-    ), True
+    result: dict[str, Any] = {"eid": eid, "stage": stage_name}
+    if params.get("binary"):
+        meta, payload = _mesh_binary(decoded)
+        result.update(meta)
+        result["_binary_size"] = len(payload)
+        result["_binary_data"] = payload
+    else:
+        result.update(decoded)
+        result["vertices"] = decoded["vertices"].tolist()
+        result["indices"] = decoded["indices"].tolist()
+    return _result_response(request_id, result), True
+
+
+def _mesh_xyz(vertices: Any) -> Any:
+    """Little-endian float32 ``(n, 3)`` xyz positions, zero-filling missing components."""
+    import numpy as np
+
+    xyz = np.zeros((len(vertices), 3), dtype="<f4")
+    cols = min(vertices.shape[1], 3) if vertices.ndim == 2 else 0
+    xyz[:, :cols] = vertices[:, :cols]
+    return xyz
+
+
+def _batch_draw_eids(params: dict[str, Any], state: DaemonState) -> list[int]:
+    """Draw EIDs selected by ``pass`` or ``range``, in replay order.
+
+    Raises:
+        KeyError: If the named pass does not exist.
+        ValueError: If neither selector is given or the range is malformed.
+    """
+    if "pass" in params:
+        name = str(params["pass"])
+        if state.vfs_tree and name in state.vfs_tree.pass_name_map:
+            name = state.vfs_tree.pass_name_map[name]
+        found = _get_pass_catalog(state).find(name)
+        if found is None:
+            raise KeyError(f"pass not found: {name}")
+        lo, hi = int(found["begin_eid"]), int(found["end_eid"])
+    elif "range" in params:
+        first, last = _parse_eid_range(params["range"])
+        lo = first if first is not None else 0
+        hi = last if last is not None else state.max_eid
+    else:
+        raise ValueError("missing pass or range")
+    draws = _get_action_index(state).of_type("draw")
+    return sorted({a.eid for a in draws if lo <= a.eid <= hi})
+
+
+def _handle_mesh_batch(
+    request_id: int, params: dict[str, Any], state: DaemonState
+) -> tuple[dict[str, Any], bool]:
+    """Decode the meshes of every draw in a pass (``pass``) or EID range (``range``).
+
+    Draws are visited in replay order and a vertex buffer range shared by
+    consecutive draws is read and decoded once, unless a clear, copy,
+    resolve or dispatch between them may have rewritten it. All meshes travel in one
+    binary payload: ``meshes[i]`` describes draw *i* and its ``offset``/
+    ``size`` slice of the payload, laid out as in ``mesh_data`` with
+    ``binary: true``. Draws without vertex data are listed in ``skipped``.
+    The current event is left unchanged.
+    """
+    assert state.adapter is not None
+    try:
+        stage_name = _mesh_stage(params)
+    except ValueError as exc:
+        return _error_response(request_id, -32602, str(exc)), True
+    try:
+        eids = _batch_draw_eids(params, state)
+    except KeyError as exc:
+        return _error_response(request_id, -32001, str(exc.args[0])), True
+    except ValueError as exc:
+        return _error_response(request_id, -32602, str(exc)), True
+    index = _get_action_index(state)
+    writes = sorted(index.flat[i].eid for i in index.writes)
+    reuse = _VertexReuse()
+    last_eid = -1
+    meshes: list[dict[str, Any]] = []
+    skipped: list[dict[str, Any]] = []
+    parts: list[bytes] = []
+    offset = 0
+
+    def _decode(eid: int) -> dict[str, Any] | ValueError:
+        nonlocal last_eid
+        if bisect.bisect_left(writes, eid) > bisect.bisect_right(writes, last_eid):
+            reuse.reset()
+        last_eid = eid
+        try:
+            return _decode_mesh(state, eid, stage_name, params, reuse)
+        except ValueError as exc:
+            return exc
+
+    try:
+        decoded_by_eid = for_each_event(state, eids, _decode)
+    except ValueError as exc:
+        return _error_response(request_id, -32002, str(exc)), True
+    for eid, decoded in decoded_by_eid.items():
+        if isinstance(decoded, ValueError):
+            skipped.append({"eid": eid, "error": str(decoded)})
+            continue
+        meta, payload = _mesh_binary(decoded)
+        meshes.append({"eid": eid, **meta, "offset": offset, "size": len(payload)})
+        parts.append(payload)
+        offset += len(payload)
+    data = b"".join(parts)
+    result = {
+        "stage": stage_name,
+        "meshes": meshes,
+        "skipped": skipped,
+        "reused": reuse.hits,
+        "_binary_size": len(data),
+        "_binary_data": data,
+    }
+    return _result_response(request_id, result), True
 
 
 def _handle_ibuffer_decode(
     request_id: int, params: dict[str, Any], state: DaemonState
 ) -> tuple[dict[str, Any], bool]:
+    """Decode the bound index buffer.
+
+    Returns the indices plus ``stats`` (count, restarts, min, max, unique),
+    honouring primitive restart when the pipeline enables it (``restart``
+    overrides). With ``binary: true`` the indices are sent as a raw
+    little-endian array over the binary side channel instead of JSON.
+    """
     try:
         eid, pipe_state = require_pipe(params, state, request_id)
     except PipeError as exc:
@@ -749,13 +1108,25 @@ def _handle_ibuffer_decode(
         return _result_response(request_id, {"eid": eid, "format": "none", "indices": []}), True
     controller = state.adapter.controller  # type: ignore[union-attr]
     raw_stride = getattr(ib, "byteStride", 0)
-    stride = raw_stride if raw_stride in (2, 4) else 2
+    stride = raw_stride if raw_stride in _INDEX_FORMATS else 2
     offset = getattr(ib, "byteOffset", 0)
     size = getattr(ib, "byteSize", 0)
     data = controller.GetBufferData(rid, offset, size)
-    indices = _decode_index_buffer(data, stride)
-    fmt_name = "uint16" if stride == 2 else "uint32"
-    return _result_response(request_id, {"eid": eid, "format": fmt_name, "indices": indices}), True
+    indices = _decode_index_array(data, stride)
+    restart = _restart_index(pipe_state, stride, params.get("restart"))
+    result: dict[str, Any] = {
+        "eid": eid,
+        "format": _INDEX_FORMATS[stride],
+        "restart_index": restart,
+        "stats": _index_stats(indices, restart),
+    }
+    if params.get("binary"):
+        payload = indices.tobytes()
+        result["_binary_size"] = len(payload)
+        result["_binary_data"] = payload
+    else:
+        result["indices"] = indices.tolist()
+    return _result_response(request_id, result), True
 
 
 HANDLERS: dict[str, Handler] = {
@@ -767,4 +1138,5 @@ HANDLERS: dict[str, Handler] = {
     "vbuffer_decode": _handle_vbuffer_decode,
     "ibuffer_decode": _handle_ibuffer_decode,
     "mesh_data": _handle_mesh_data,
+    "mesh_batch": _handle_mesh_batch,
 }
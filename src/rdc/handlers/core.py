@@ -1,4 +1,4 @@
-"""Core daemon handlers: ping, status, goto, count, shutdown, file_read."""
+"""Core daemon handlers: ping, status, warm, goto, count, shutdown, file_read, metrics."""
 
 from __future__ import annotations
 
@@ -6,9 +6,13 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from rdc.handlers._helpers import (
+    WarmUp,
     _error_response,
+    _get_action_index,
+    _get_pass_catalog,
     _result_response,
     _set_frame_event,
+    _warm_status,
 )
 from rdc.handlers._types import Handler
 
@@ -34,9 +38,24 @@ def _handle_status(
     if state.is_remote:
         result["remote"] = state.remote_url
         result["remote_connected"] = state.remote is not None
+    if state._warm is not None:
+        result["warm"] = _warm_status(state)
     return _result_response(request_id, result), True
 
 
+def _handle_warm(
+    request_id: int, params: dict[str, Any], state: DaemonState
+) -> tuple[dict[str, Any], bool]:
+    """Start the background warm-up (idempotent) and return its progress.
+
+    The action index, shader cache and usage table are then filled in
+    slices while the daemon is idle; ``status`` reports progress.
+    """
+    if state._warm is None or state._warm.error is not None:
+        state._warm = WarmUp()
+    return _result_response(request_id, _warm_status(state)), True
+
+
 def _handle_goto(
     request_id: int, params: dict[str, Any], state: DaemonState
 ) -> tuple[dict[str, Any], bool]:
@@ -72,8 +91,13 @@ def _handle_count(
             return _error_response(request_id, -32002, "no replay loaded"), True
         from rdc.services.query_service import count_from_actions
 
-        actions = state.adapter.get_root_actions()
-        value = count_from_actions(actions, what, pass_name=pass_name)
+        value = count_from_actions(
+            state.adapter.get_root_actions(),
+            what,
+            pass_name=pass_name,
+            catalog=_get_pass_catalog(state),
+            flat=_get_action_index(state).flat,
+        )
         return _result_response(request_id, {"value": value}), True
     except ValueError as exc:
         return _error_response(request_id, -32602, str(exc)), True
@@ -112,11 +136,58 @@ def _handle_file_read(
     ), True
 
 
+def _cache_sizes(state: DaemonState) -> dict[str, Any]:
+    """Entry counts of the per-replay caches held by *state*.
+
+    The pipeline snapshot cache also reports its hit and miss counters.
+    """
+    sizes: dict[str, Any] = {
+        "shader_meta": len(state.shader_meta),
+        "disasm": len(state.disasm_cache),
+        "pipe_states": len(state._pipe_states_cache),
+        "actions": len(state._action_index.flat) if state._action_index is not None else 0,
+        "targets": len(state._target_table) if state._target_table is not None else 0,
+        "counters_fetched": (
+            state._counter_table.fetched if state._counter_table is not None else 0
+        ),
+        "search_index": len(state._search_index.sids) if state._search_index is not None else 0,
+    }
+    snapshots = state._pipe_snapshots
+    snap_stats = snapshots.stats() if snapshots is not None else {}
+    sizes["pipe_snapshots"] = snap_stats.get("events", 0)
+    sizes["pipe_snapshot_bytes"] = snap_stats.get("bytes", 0)
+    sizes["pipe_snapshot_hits"] = snap_stats.get("hits", 0)
+    sizes["pipe_snapshot_misses"] = snap_stats.get("misses", 0)
+    usage = state._usage_table
+    sizes["usage"] = len(usage) if usage is not None else 0
+    sizes["usage_complete"] = usage.complete if usage is not None else False
+    tree = state.vfs_tree
+    sizes["vfs_nodes"] = len(tree.static) if tree is not None else 0
+    sizes["vfs_draw_subtrees"] = len(tree._draw_subtrees) if tree is not None else 0
+    return sizes
+
+
+def _handle_metrics(
+    request_id: int, params: dict[str, Any], state: DaemonState
+) -> tuple[dict[str, Any], bool]:
+    """Return request counters, latency histograms, seek stats and cache sizes.
+
+    ``reset: true`` clears the counters after taking the snapshot.
+    """
+    result = state.metrics.snapshot()
+    result["caches"] = _cache_sizes(state)
+    if params.get("reset"):
+        state.metrics.reset()
+    return _result_response(request_id, result), True
+
+
 HANDLERS: dict[str, Handler] = {
     "ping": _handle_ping,
     "status": _handle_status,
+    "warm": _handle_warm,
     "goto": _handle_goto,
     "count": _handle_count,
     "shutdown": _handle_shutdown,
     "file_read": _handle_file_read,
+    "metrics": _handle_metrics,
 }
@@ -8,7 +8,7 @@ from typing import TYPE_CHECKING, Any
 from rdc.handlers._helpers import (
     _STAGE_NAMES,
     _error_response,
-    _get_flat_actions,
+    _get_action_index,
     _result_response,
     _set_frame_event,
     _shader_value_lane_fallback,
@@ -237,8 +237,7 @@ def _handle_debug_thread(
 
     from rdc.services.query_service import _DISPATCH
 
-    actions = _get_flat_actions(state)
-    action = next((a for a in actions if a.eid == eid), None)
+    action = _get_action_index(state).get(eid)
     if action is None or not (int(action.flags) & _DISPATCH):
         return _error_response(request_id, -32602, "event is not a Dispatch"), True
 
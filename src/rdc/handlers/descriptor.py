@@ -8,10 +8,17 @@ from rdc.handlers._helpers import (
     PipeError,
     _enum_name,
     _error_response,
+    _get_counter_table,
+    _get_usage_table,
+    _list_field,
+    _paginate,
+    _parse_eid_range,
     _result_response,
+    cached_pipe,
     require_pipe,
 )
 from rdc.handlers._types import Handler
+from rdc.services.counter_service import table_rows
 
 if TYPE_CHECKING:
     from rdc.daemon_server import DaemonState
@@ -159,9 +166,18 @@ def _handle_usage(
     resid = int(params.get("id", 0))
     if resid not in state.res_names:
         return _error_response(request_id, -32001, f"resource {resid} not found"), True
-    rid_obj = state.res_rid_map[resid]
-    usage_list = state.adapter.controller.GetUsage(rid_obj.resourceId)
-    entries = [{"eid": u.eventId, "usage": _enum_name(u.usage)} for u in usage_list]
+    try:
+        lo, hi = _parse_eid_range(params.get("range"))
+    except ValueError:
+        return _error_response(request_id, -32602, "range must be N:M"), True
+    table = _get_usage_table(state, resid)
+    usage_filter = params.get("usage")
+    kinds = table.kinds_named(usage_filter) if usage_filter else None
+    names = table.usage_names
+    entries = [
+        {"eid": eid, "usage": names[u]}
+        for eid, u in table.query(resid, eid_min=lo, eid_max=hi, kinds=kinds)
+    ]
     result_data: dict[str, Any] = {"id": resid, "entries": entries}
     if params.get("resolve_names", True):
         result_data["name"] = state.res_names.get(resid, "")
@@ -174,122 +190,69 @@ def _handle_usage_all(
     assert state.adapter is not None
     type_filter = params.get("type")
     usage_filter = params.get("usage")
-    usage_rows: list[dict[str, Any]] = []
-    for resid, name in state.res_names.items():
+    try:
+        lo, hi = _parse_eid_range(params.get("range"))
+    except ValueError:
+        return _error_response(request_id, -32602, "range must be N:M"), True
+    table = _get_usage_table(state)
+    kinds = table.kinds_named(usage_filter) if usage_filter else None
+    names = table.usage_names
+    hits: list[tuple[int, int, int]] = []
+    for resid in sorted(state.res_names):
         if type_filter and state.res_types.get(resid, "") != type_filter:
             continue
-        rid_obj = state.res_rid_map.get(resid)
-        if rid_obj is None:
-            continue
-        usage_list = state.adapter.controller.GetUsage(rid_obj.resourceId)
-        for u in usage_list:
-            uname = _enum_name(u.usage)
-            if usage_filter and uname != usage_filter:
-                continue
-            usage_rows.append({"id": resid, "name": name, "eid": u.eventId, "usage": uname})
-    usage_rows.sort(key=lambda r: (r["id"], r["eid"]))
-    return _result_response(request_id, {"rows": usage_rows, "total": len(usage_rows)}), True
+        rows = table.query(resid, eid_min=lo, eid_max=hi, kinds=kinds)
+        hits.extend((resid, eid, u) for eid, u in rows)
+    try:
+        page, paging = _paginate(params, state, hits)
+    except ValueError as exc:
+        return _error_response(request_id, -32602, str(exc)), True
+    usage_rows = (
+        {"id": resid, "name": state.res_names[resid], "eid": eid, "usage": names[u]}
+        for resid, eid, u in page
+    )
+    listing = _list_field(params, "rows", usage_rows)
+    return _result_response(request_id, {**listing, "total": len(hits), **paging}), True
 
 
-def _handle_counter_list(  # noqa: PLR0912
+def _handle_counter_list(
     request_id: int, params: dict[str, Any], state: DaemonState
 ) -> tuple[dict[str, Any], bool]:
     assert state.adapter is not None
-    controller = state.adapter.controller
-    raw_counters = controller.EnumerateCounters()
-    counters_out = []
-    for c in raw_counters:
-        try:
-            desc = controller.DescribeCounter(c)
-        except Exception:  # noqa: BLE001
-            continue
-        if not desc.name or desc.name.startswith("ERROR"):
-            continue
-        cat = desc.category
-        cat_str = _enum_name(cat)
-        counters_out.append(
-            {
-                "id": int(c),
-                "name": desc.name,
-                "category": cat_str,
-                "description": desc.description,
-                "unit": _enum_name(desc.unit),
-                "type": _enum_name(desc.resultType),
-                "byte_width": desc.resultByteWidth,
-                "uuid": str(getattr(desc, "uuid", "") or ""),
-            }
-        )
+    counters_out = list(_get_counter_table(state).descriptors.values())
     return (
         _result_response(request_id, {"counters": counters_out, "total": len(counters_out)}),
         True,
     )
 
 
-def _handle_counter_fetch(  # noqa: PLR0912
+def _handle_counter_fetch(
     request_id: int, params: dict[str, Any], state: DaemonState
 ) -> tuple[dict[str, Any], bool]:
+    """Return counter values as rows, or as a columnar table with ``columnar: true``.
+
+    ``FetchCounters`` runs only for counters not fetched earlier in this
+    replay; filters are applied to the cached columns.
+    """
     assert state.adapter is not None
-    controller = state.adapter.controller
-    raw_counters = controller.EnumerateCounters()
-    counter_info: dict[int, dict[str, Any]] = {}
-    for c in raw_counters:
-        try:
-            desc = controller.DescribeCounter(c)
-        except Exception:  # noqa: BLE001
-            continue
-        if not desc.name or desc.name.startswith("ERROR"):
-            continue
-        counter_info[int(c)] = {
-            "name": desc.name,
-            "unit": _enum_name(desc.unit),
-            "result_type": desc.resultType,
-            "byte_width": desc.resultByteWidth,
-        }
-    name_filter = params.get("name")
-    if name_filter:
-        name_lower = str(name_filter).lower()
-        counter_info = {k: v for k, v in counter_info.items() if name_lower in v["name"].lower()}
-    if not counter_info:
-        return _result_response(request_id, {"rows": [], "total": 0}), True
-    fetch_counter_objs = [c for c in raw_counters if int(c) in counter_info]
-    results = controller.FetchCounters(fetch_counter_objs)
     eid_filter = params.get("eid")
     if eid_filter is not None:
         try:
             eid_filter = int(eid_filter)
         except (TypeError, ValueError):
             return _error_response(request_id, -32602, "eid must be an integer"), True
-    fetch_rows: list[dict[str, Any]] = []
-    for r in results:
-        if eid_filter is not None and r.eventId != eid_filter:
-            continue
-        cid = int(r.counter)
-        info = counter_info.get(cid)
-        if info is None:
-            continue
-        rt = info["result_type"]
-        bw = info["byte_width"]
-        rt_name = _enum_name(rt)
-        if rt_name == "Float":
-            val: int | float = r.value.f if bw == 4 else r.value.d
-        elif rt_name in ("UInt", "UNorm"):
-            val = r.value.u32 if bw == 4 else r.value.u64
-        else:
-            val = r.value.u32 if bw == 4 else r.value.u64
-        fetch_rows.append(
-            {
-                "eid": r.eventId,
-                "counter": info["name"],
-                "value": val,
-                "unit": info["unit"],
-            }
-        )
-    fetch_rows.sort(key=lambda row: (row["eid"], row["counter"]))
-    return _result_response(request_id, {"rows": fetch_rows, "total": len(fetch_rows)}), True
+    table = _get_counter_table(state)
+    cids = table.match(params.get("name"))
+    table.fetch(cids, state.adapter.controller.FetchCounters)
+    columnar = table.table(cids, eid_filter)
+    if params.get("columnar"):
+        return _result_response(request_id, {**columnar, "total": len(columnar["eids"])}), True
+    rows = table_rows(columnar)
+    return _result_response(request_id, {"rows": rows, "total": len(rows)}), True
 
 
 HANDLERS: dict[str, Handler] = {
-    "descriptors": _handle_descriptors,
+    "descriptors": cached_pipe("descriptors", _handle_descriptors),
     "usage": _handle_usage,
     "usage_all": _handle_usage_all,
     "counter_list": _handle_counter_list,
@@ -12,6 +12,7 @@ from rdc.handlers._helpers import (
     _flatten_shader_var,
     _result_response,
     _sanitize_size,
+    cached_pipe,
     get_pipeline_for_stage,
     require_pipe,
 )
@@ -345,17 +346,17 @@ def _handle_pipe_msaa(
 
 
 HANDLERS: dict[str, Handler] = {
-    "pipe_topology": _handle_pipe_topology,
-    "pipe_viewport": _handle_pipe_viewport,
-    "pipe_scissor": _handle_pipe_scissor,
-    "pipe_blend": _handle_pipe_blend,
-    "pipe_stencil": _handle_pipe_stencil,
-    "pipe_vinputs": _handle_pipe_vinputs,
-    "pipe_samplers": _handle_pipe_samplers,
-    "pipe_vbuffers": _handle_pipe_vbuffers,
-    "pipe_ibuffer": _handle_pipe_ibuffer,
-    "pipe_push_constants": _handle_pipe_push_constants,
-    "pipe_rasterizer": _handle_pipe_rasterizer,
-    "pipe_depth_stencil": _handle_pipe_depth_stencil,
-    "pipe_msaa": _handle_pipe_msaa,
+    "pipe_topology": cached_pipe("pipe_topology", _handle_pipe_topology),
+    "pipe_viewport": cached_pipe("pipe_viewport", _handle_pipe_viewport),
+    "pipe_scissor": cached_pipe("pipe_scissor", _handle_pipe_scissor),
+    "pipe_blend": cached_pipe("pipe_blend", _handle_pipe_blend),
+    "pipe_stencil": cached_pipe("pipe_stencil", _handle_pipe_stencil),
+    "pipe_vinputs": cached_pipe("pipe_vinputs", _handle_pipe_vinputs),
+    "pipe_samplers": cached_pipe("pipe_samplers", _handle_pipe_samplers),
+    "pipe_vbuffers": cached_pipe("pipe_vbuffers", _handle_pipe_vbuffers),
+    "pipe_ibuffer": cached_pipe("pipe_ibuffer", _handle_pipe_ibuffer),
+    "pipe_push_constants": cached_pipe("pipe_push_constants", _handle_pipe_push_constants),
+    "pipe_rasterizer": cached_pipe("pipe_rasterizer", _handle_pipe_rasterizer),
+    "pipe_depth_stencil": cached_pipe("pipe_depth_stencil", _handle_pipe_depth_stencil),
+    "pipe_msaa": cached_pipe("pipe_msaa", _handle_pipe_msaa),
 }
@@ -1,9 +1,11 @@
 """Query handlers: shader_map, pipeline, bindings, shader, shaders, resources,
-resource, passes, pass, events, draws, event, draw, search, info, stats, log.
+resource, passes, pass, events, draws, event, draw, search, info, stats, log,
+per_event.
 """
 
 from __future__ import annotations
 
+import heapq
 import re
 from typing import TYPE_CHECKING, Any
 
@@ -18,8 +20,18 @@ from rdc.handlers._helpers import (
     _build_shader_cache,
     _enum_name,
     _error_response,
+    _get_action_index,
+    _get_pass_catalog,
+    _get_search_index,
+    _get_usage_table,
+    _list_field,
+    _output_targets,
+    _paginate,
+    _prefetch_targets,
     _result_response,
     _seek_replay,
+    cached_pipe,
+    for_each_event,
     require_pipe,
 )
 from rdc.handlers._types import Handler
@@ -218,8 +230,7 @@ def _handle_passes(
     assert state.adapter is not None
     from rdc.services.query_service import get_pass_hierarchy
 
-    actions = state.adapter.get_root_actions()
-    tree = get_pass_hierarchy(actions, state.structured_file)
+    tree = get_pass_hierarchy([], catalog=_get_pass_catalog(state))
 
     return _result_response(request_id, {"tree": tree}), True
 
@@ -243,19 +254,13 @@ def _handle_pass(
         identifier = name
     else:
         return _error_response(request_id, -32602, "missing index or name"), True
-    actions = state.adapter.get_root_actions()
-    detail = get_pass_detail(actions, state.structured_file, identifier)
+    detail = get_pass_detail([], identifier=identifier, catalog=_get_pass_catalog(state))
     if detail is None:
         return _error_response(request_id, -32001, "pass not found"), True
-    err = _seek_replay(state, detail["begin_eid"])
-    if err is None:
-        pipe = state.adapter.get_pipeline_state()
-        detail["color_targets"] = [
-            _enrich_target(int(t.resource), state)
-            for t in pipe.GetOutputTargets()
-            if int(t.resource) != 0
-        ]
-        depth_id = int(pipe.GetDepthTarget().resource)
+    targets = _output_targets(state, detail["begin_eid"])
+    if targets is not None:
+        detail["color_targets"] = [_enrich_target(rid, state) for rid in targets.bound_colors]
+        depth_id = targets.depth
         detail["depth_target"] = _enrich_target(depth_id, state) if depth_id != 0 else None
     else:
         detail["color_targets"] = []
@@ -356,33 +361,16 @@ def _handle_stats(
     for a in flat:
         if (a.flags & (_DRAWCALL | _MESHDRAW)) and a.pass_name not in pass_first_draw:
             pass_first_draw[a.pass_name] = a.eid
+    table = _prefetch_targets(state, pass_first_draw.values())
     for ps in stats.per_pass:
         draw_eid = pass_first_draw.get(ps.name)
-        if draw_eid is None:
-            continue
-        err = _seek_replay(state, draw_eid)
-        if err:
-            continue
-        try:
-            pipe = state.adapter.get_pipeline_state()
-            targets = pipe.GetOutputTargets()
-            non_null = [t for t in targets if int(t.resource) != 0]
-            ps.attachments = len(non_null)
-            depth_id = int(pipe.GetDepthTarget().resource)
-            if depth_id != 0:
-                ps.attachments += 1
-            if non_null:
-                rid = int(non_null[0].resource)
-                tex = state.tex_map.get(rid)
-                if tex is not None:
-                    ps.rt_w = tex.width
-                    ps.rt_h = tex.height
-        except Exception:
-            pass  # fallback to defaults (0)
-
-    # Restore replay head to user's position
-    if state.current_eid != 0:
-        _seek_replay(state, state.current_eid)
+        targets = table.get(draw_eid) if draw_eid is not None else None
+        if targets is None:
+            continue  # fallback to defaults (0)
+        ps.attachments = targets.attachments
+        if targets.width:
+            ps.rt_w = targets.width
+            ps.rt_h = targets.height
 
     per_pass = [
         {
@@ -406,11 +394,13 @@ def _handle_stats(
     ]
 
     # Largest resources by byte size
+    sized = (
+        (rid, res, size)
+        for rid, res in state.res_rid_map.items()
+        if (size := getattr(res, "byteSize", 0)) > 0
+    )
     largest: list[dict[str, Any]] = []
-    for rid, res in state.res_rid_map.items():
-        size = getattr(res, "byteSize", 0)
-        if size <= 0:
-            continue
+    for rid, res, size in heapq.nlargest(5, sized, key=lambda item: item[2]):
         t = getattr(res, "type", None)
         type_name = getattr(t, "name", str(t)) if t is not None else ""
         fmt = "-"
@@ -427,8 +417,6 @@ def _handle_stats(
                 "format": fmt,
             }
         )
-    largest.sort(key=lambda r: r["size"], reverse=True)
-    largest = largest[:5]
 
     return _result_response(
         request_id,
@@ -445,12 +433,11 @@ def _handle_events(
     request_id: int, params: dict[str, Any], state: DaemonState
 ) -> tuple[dict[str, Any], bool]:
     assert state.adapter is not None
-    from rdc.services.query_service import filter_by_pattern, filter_by_type
+    from rdc.services.query_service import filter_by_pattern
 
-    flat = _get_flat_actions(state)
+    index = _get_action_index(state)
     event_type = params.get("type")
-    if event_type:
-        flat = filter_by_type(flat, event_type)
+    flat = index.of_type(event_type) if event_type else index.flat
     pattern = params.get("filter")
     if pattern:
         flat = filter_by_pattern(flat, pattern)
@@ -463,28 +450,25 @@ def _handle_events(
     limit = params.get("limit")
     if limit is not None:
         flat = flat[: int(limit)]
-    events = [{"eid": a.eid, "type": _action_type_str(a.flags), "name": a.name} for a in flat]
-    return _result_response(request_id, {"events": events}), True
+    try:
+        page, paging = _paginate(params, state, flat)
+    except ValueError as exc:
+        return _error_response(request_id, -32602, str(exc)), True
+    events = ({"eid": a.eid, "type": _action_type_str(a.flags), "name": a.name} for a in page)
+    return _result_response(request_id, {**_list_field(params, "events", events), **paging}), True
 
 
 def _handle_draws(
     request_id: int, params: dict[str, Any], state: DaemonState
 ) -> tuple[dict[str, Any], bool]:
     assert state.adapter is not None
-    from rdc.services.query_service import (
-        aggregate_stats,
-        filter_by_pass,
-        filter_by_type,
-        pass_name_for_eid,
-    )
+    from rdc.services.query_service import aggregate_stats, filter_by_pass, filter_by_type
 
     all_flat = _get_flat_actions(state)
-    passes = state.vfs_tree.pass_list if state.vfs_tree else []
+    catalog = _get_pass_catalog(state)
     pass_name = params.get("pass")
     if pass_name:
-        _actions = state.adapter.get_root_actions()
-        _sf = state.structured_file
-        all_flat = filter_by_pass(all_flat, pass_name, actions=_actions, sf=_sf)
+        all_flat = filter_by_pass(all_flat, pass_name, catalog=catalog)
     stats = aggregate_stats(all_flat)
     flat = filter_by_type(all_flat, "draw")
     sort_field = params.get("sort")
@@ -493,24 +477,42 @@ def _handle_draws(
     limit = params.get("limit")
     if limit is not None:
         flat = flat[: int(limit)]
+    try:
+        page, paging = _paginate(params, state, flat)
+    except ValueError as exc:
+        return _error_response(request_id, -32602, str(exc)), True
     draws = [
         {
             "eid": a.eid,
             "type": _action_type_str(a.flags),
             "triangles": (a.num_indices // 3) * a.num_instances,
             "instances": a.num_instances,
-            "pass": pass_name_for_eid(a.eid, passes),
+            "pass": catalog.index.name_for(a.eid),
             "marker": a.parent_marker,
         }
-        for a in flat
+        for a in page
     ]
+    if params.get("targets"):
+        table = _prefetch_targets(state, (a.eid for a in page))
+        for a, row in zip(page, draws, strict=True):
+            targets = table.get(a.eid)
+            row["targets"] = (
+                None
+                if targets is None
+                else {
+                    "colors": targets.bound_colors,
+                    "depth": targets.depth,
+                    "width": targets.width,
+                    "height": targets.height,
+                }
+            )
     summary = (
         f"{stats.total_draws} draw calls "
         f"({stats.indexed_draws} indexed, "
         f"{stats.dispatches} dispatches, "
         f"{stats.clears} clears)"
     )
-    return _result_response(request_id, {"draws": draws, "summary": summary}), True
+    return _result_response(request_id, {"draws": draws, "summary": summary, **paging}), True
 
 
 def _extract_sd_value(child: Any) -> str:
@@ -546,10 +548,8 @@ def _handle_event(
     eid = params.get("eid")
     if eid is None:
         return _error_response(request_id, -32602, "missing eid parameter"), True
-    from rdc.services.query_service import find_action_by_eid
-
     eid = int(eid)
-    action = find_action_by_eid(state.adapter.get_root_actions(), eid)
+    action = _get_action_index(state).get(eid)
     if action is None:
         return (
             _error_response(request_id, -32002, f"eid {eid} out of range (max: {state.max_eid})"),
@@ -587,33 +587,24 @@ def _handle_draw(
     request_id: int, params: dict[str, Any], state: DaemonState
 ) -> tuple[dict[str, Any], bool]:
     assert state.adapter is not None
-    from rdc.services.query_service import find_action_by_eid, walk_actions
-
     eid = params.get("eid")
     if eid is None:
         eid = state.current_eid
     eid = int(eid)
-    root_actions = state.adapter.get_root_actions()
-    action = find_action_by_eid(root_actions, eid)
+    action = _get_action_index(state).get(eid)
     if action is None:
         return (
             _error_response(request_id, -32002, f"eid {eid} out of range (max: {state.max_eid})"),
             True,
         )
-    sf = state.structured_file
-    flat = walk_actions(root_actions, sf)
-    flat_match = [a for a in flat if a.eid == eid]
-    name = action.GetName(sf) if sf else getattr(action, "_name", "-")
-    marker = flat_match[0].parent_marker if flat_match else "-"
-    tris = (action.numIndices // 3) * max(action.numInstances, 1)
     return _result_response(
         request_id,
         {
             "Event": eid,
-            "Type": name,
-            "Marker": marker,
-            "Triangles": tris,
-            "Instances": max(action.numInstances, 1),
+            "Type": action.name,
+            "Marker": action.parent_marker,
+            "Triangles": (action.num_indices // 3) * action.num_instances,
+            "Instances": action.num_instances,
         },
     ), True
 
@@ -638,16 +629,18 @@ def _handle_search(
         compiled = re.compile(pattern, flags)
     except re.error as exc:
         return _error_response(request_id, -32602, f"invalid regex: {exc}"), True
-    _build_shader_cache(state)
+    index = _get_search_index(state)
+
+    def _keep(sid: int) -> bool:
+        return not stage_filter or stage_filter in state.shader_meta.get(sid, {}).get("stages", [])
+
     matches: list[dict[str, Any]] = []
     truncated = False
-    for sid, text in state.disasm_cache.items():
+    for sid, lines, linenos in index.candidates(compiled, _keep):
         meta = state.shader_meta.get(sid, {})
         shader_stages: list[str] = meta.get("stages", [])
-        if stage_filter and stage_filter not in shader_stages:
-            continue
-        lines = text.splitlines()
-        for lineno, line in enumerate(lines):
+        for lineno in linenos:
+            line = lines[lineno]
             if compiled.search(line):
                 ctx_before = lines[max(0, lineno - context_lines) : lineno]
                 ctx_after = lines[lineno + 1 : lineno + 1 + context_lines]
@@ -674,14 +667,11 @@ def _handle_pass_deps(
     request_id: int, params: dict[str, Any], state: DaemonState
 ) -> tuple[dict[str, Any], bool]:
     assert state.adapter is not None
-    from rdc.services.query_service import _build_pass_list, build_pass_deps
+    from rdc.services.query_service import build_pass_deps
 
-    actions = state.adapter.get_root_actions()
-    passes = _build_pass_list(actions, state.structured_file)
-    usage_data: dict[int, list[Any]] = {}
-    for resid, rid_obj in state.res_rid_map.items():
-        usage_data[resid] = state.adapter.controller.GetUsage(rid_obj.resourceId)
-    result = build_pass_deps(passes, usage_data)
+    catalog = _get_pass_catalog(state)
+    usage = _get_usage_table(state)
+    result = build_pass_deps(catalog.passes, usage, index=catalog.index)
     return _result_response(request_id, result), True
 
 
@@ -698,18 +688,17 @@ def _handle_pass_attachment(
     if state.vfs_tree and name in state.vfs_tree.pass_name_map:
         name = state.vfs_tree.pass_name_map[name]
 
-    actions = state.adapter.get_root_actions()
-    detail = get_pass_detail(actions, state.structured_file, name)
+    detail = get_pass_detail([], identifier=name, catalog=_get_pass_catalog(state))
     if detail is None:
         return _error_response(request_id, -32001, f"pass not found: {name}"), True
 
-    err = _seek_replay(state, detail["begin_eid"])
-    if err:
+    targets = _output_targets(state, detail["begin_eid"])
+    if targets is None:
+        err = _seek_replay(state, detail["begin_eid"]) or "no replay loaded"
         return _error_response(request_id, -32002, err), True
-    pipe = state.adapter.get_pipeline_state()
 
     if attachment == "depth":
-        depth_id = int(pipe.GetDepthTarget().resource)
+        depth_id = targets.depth
         if depth_id == 0:
             return _error_response(request_id, -32001, "no depth target"), True
         return _result_response(
@@ -721,12 +710,12 @@ def _handle_pass_attachment(
             idx = int(attachment[5:])
         except ValueError:
             return _error_response(request_id, -32602, f"invalid attachment: {attachment}"), True
-        all_targets = pipe.GetOutputTargets()
-        if idx < 0 or idx >= len(all_targets) or int(all_targets[idx].resource) == 0:
+        colors = targets.colors
+        if idx < 0 or idx >= len(colors) or colors[idx] == 0:
             return _error_response(request_id, -32001, f"color target {idx} not found"), True
         return _result_response(
             request_id,
-            {"pass": name, "attachment": attachment, "resource_id": int(all_targets[idx].resource)},
+            {"pass": name, "attachment": attachment, "resource_id": colors[idx]},
         ), True
 
     return _error_response(request_id, -32001, f"unknown attachment: {attachment}"), True
@@ -743,11 +732,98 @@ def _handle_preload(
     ), True
 
 
+def _handle_targets(
+    request_id: int, params: dict[str, Any], state: DaemonState
+) -> tuple[dict[str, Any], bool]:
+    """Output targets bound at one event (the ``targets`` per-event extractor)."""
+    eid = int(params.get("eid", state.current_eid))
+    targets = _output_targets(state, eid)
+    if targets is None:
+        return _error_response(request_id, -32602, f"eid {eid} out of range"), True
+    return _result_response(
+        request_id,
+        {
+            "eid": eid,
+            "colors": targets.bound_colors,
+            "depth": targets.depth,
+            "width": targets.width,
+            "height": targets.height,
+        },
+    ), True
+
+
+def _event_extractors() -> dict[str, Handler]:
+    """Handlers ``per_event`` may run; each reads one event's pipeline state."""
+    from rdc.handlers.descriptor import HANDLERS as DESCRIPTOR_HANDLERS
+    from rdc.handlers.pipe_state import HANDLERS as PIPE_HANDLERS
+    from rdc.handlers.shader import HANDLERS as SHADER_HANDLERS
+
+    return {
+        **{name: HANDLERS[name] for name in ("pipeline", "bindings", "shader")},
+        **PIPE_HANDLERS,
+        "descriptors": DESCRIPTOR_HANDLERS["descriptors"],
+        "shader_reflect": SHADER_HANDLERS["shader_reflect"],
+        "shader_all": SHADER_HANDLERS["shader_all"],
+        "targets": _handle_targets,
+    }
+
+
+def _handle_per_event(
+    request_id: int, params: dict[str, Any], state: DaemonState
+) -> tuple[dict[str, Any], bool]:
+    """Run the named extractors at every event of ``eids`` in one sweep.
+
+    Events are deduplicated and visited in ascending order with
+    ``for_each_event``, so each costs at most one seek and the current event
+    is left unchanged. ``params`` is passed to every extractor. Each row of
+    ``events`` holds the extractors' ``results`` by name, plus ``errors``
+    (name -> message) for those that failed at that event.
+    """
+    eids = params.get("eids")
+    names = params.get("extractors")
+    extra = params.get("params") or {}
+    if not isinstance(eids, list) or not all(isinstance(e, int) for e in eids):
+        return _error_response(request_id, -32602, "eids must be a list of integers"), True
+    if not isinstance(names, list) or not names:
+        return _error_response(request_id, -32602, "extractors must be a non-empty list"), True
+    if not isinstance(extra, dict):
+        return _error_response(request_id, -32602, "params must be an object"), True
+    extractors = _event_extractors()
+    unknown = [n for n in names if n not in extractors]
+    if unknown:
+        return _error_response(request_id, -32602, f"unknown extractor: {unknown[0]}"), True
+    bad = [e for e in eids if e < 0 or (state.max_eid > 0 and e > state.max_eid)]
+    if bad:
+        return _error_response(
+            request_id, -32602, f"eid {bad[0]} out of range (max: {state.max_eid})"
+        ), True
+
+    names = list(dict.fromkeys(names))
+    shared = {k: v for k, v in extra.items() if k != "eid"}
+
+    def _extract(eid: int) -> dict[str, Any]:
+        row: dict[str, Any] = {"eid": eid, "results": {}}
+        for name in names:
+            try:
+                resp, _ = extractors[name](request_id, {**shared, "eid": eid}, state)
+            except Exception as exc:  # noqa: BLE001
+                row.setdefault("errors", {})[name] = str(exc) or type(exc).__name__
+                continue
+            if "error" in resp:
+                row.setdefault("errors", {})[name] = resp["error"]["message"]
+            else:
+                row["results"][name] = resp["result"]
+        return row
+
+    rows = for_each_event(state, eids, _extract)
+    return _result_response(request_id, {"events": list(rows.values())}), True
+
+
 HANDLERS: dict[str, Handler] = {
     "shader_map": _handle_shader_map,
-    "pipeline": _handle_pipeline,
-    "bindings": _handle_bindings,
-    "shader": _handle_shader,
+    "pipeline": cached_pipe("pipeline", _handle_pipeline),
+    "bindings": cached_pipe("bindings", _handle_bindings),
+    "shader": cached_pipe("shader", _handle_shader),
     "shaders": _handle_shaders,
     "resources": _handle_resources,
     "resource": _handle_resource,
@@ -764,4 +840,5 @@ HANDLERS: dict[str, Handler] = {
     "draw": _handle_draw,
     "search": _handle_search,
     "shaders_preload": _handle_preload,
+    "per_event": _handle_per_event,
 }
@@ -11,6 +11,7 @@ from rdc.handlers._helpers import (
     _error_response,
     _flatten_shader_var,
     _result_response,
+    cached_pipe,
     get_default_disasm_target,
     get_pipeline_for_stage,
     require_pipe,
@@ -284,11 +285,11 @@ def _handle_shader_list_disasm(
 
 HANDLERS: dict[str, Handler] = {
     "shader_targets": _handle_shader_targets,
-    "shader_reflect": _handle_shader_reflect,
+    "shader_reflect": cached_pipe("shader_reflect", _handle_shader_reflect),
     "shader_constants": _handle_shader_constants,
     "shader_source": _handle_shader_source,
     "shader_disasm": _handle_shader_disasm,
-    "shader_all": _handle_shader_all,
+    "shader_all": cached_pipe("shader_all", _handle_shader_all),
     "shader_list_info": _handle_shader_list_info,
     "shader_list_disasm": _handle_shader_list_disasm,
     "shader_used_by": _handle_shader_used_by,
@@ -100,6 +100,8 @@ def _handle_shader_replace(
     controller.ReplaceResource(original_rid, replacement_rid)
     state.shader_replacements[int(original_rid)] = original_rid
     state._eid_cache = -1
+    state._pipe_snapshots = None
+    state._counter_table = None
     return _result_response(request_id, {"ok": True, "original_id": int(original_rid)}), True
 
 
@@ -124,6 +126,8 @@ def _handle_shader_restore(
     controller.RemoveReplacement(original_rid)
     del state.shader_replacements[int(original_rid)]
     state._eid_cache = -1
+    state._pipe_snapshots = None
+    state._counter_table = None
     return _result_response(request_id, {"ok": True}), True
 
 
@@ -143,6 +147,8 @@ def _handle_shader_restore_all(
     state.shader_replacements.clear()
     state.built_shaders.clear()
     state._eid_cache = -1
+    state._pipe_snapshots = None
+    state._counter_table = None
     return _result_response(
         request_id, {"ok": True, "restored": restored_count, "freed": freed_count}
     ), True
@@ -7,6 +7,8 @@ from typing import TYPE_CHECKING, Any
 
 from rdc.handlers._helpers import (
     PipeError,
+    _binary_result,
+    _byte_range,
     _decode_texture_png,
     _error_response,
     _make_subresource,
@@ -222,12 +224,22 @@ def _handle_tex_export(
 def _handle_tex_raw(
     request_id: int, params: dict[str, Any], state: DaemonState
 ) -> tuple[dict[str, Any], bool]:
+    """Return a texture's raw bytes (mip 0, slice 0), optionally an ``offset``/``length`` range.
+
+    With ``binary: true`` the bytes go straight over the binary side channel
+    instead of through a temp file.
+    """
     if state.adapter is None:
         return _error_response(request_id, -32002, "no replay loaded"), True
     if state.rd is None:
         return _error_response(request_id, -32002, "renderdoc module not available"), True
-    if state.temp_dir is None:
+    binary = bool(params.get("binary"))
+    if not binary and state.temp_dir is None:
         return _error_response(request_id, -32002, "temp directory not available"), True
+    try:
+        offset, length = _byte_range(params)
+    except ValueError as exc:
+        return _error_response(request_id, -32602, str(exc)), True
     res_id = int(params.get("id", 0))
     tex = state.tex_map.get(res_id)
     if tex is None:
@@ -244,6 +256,12 @@ def _handle_tex_raw(
         return _error_response(request_id, -32002, f"GetTextureData failed: {exc}"), True
     if not raw_data:
         return _error_response(request_id, -32002, "no texture data returned"), True
+    if binary or offset or length:
+        result = _binary_result({"id": res_id, "eid": eid}, raw_data, offset, length)
+        if binary:
+            return _result_response(request_id, result), True
+        raw_data = result["_binary_data"]
+    assert state.temp_dir is not None
     temp_path = state.temp_dir / f"tex_{res_id}.raw"
     temp_path.write_bytes(raw_data)
     return _result_response(
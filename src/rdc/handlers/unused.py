@@ -4,7 +4,12 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from rdc.handlers._helpers import _error_response, _result_response
+from rdc.handlers._helpers import (
+    _error_response,
+    _get_pass_catalog,
+    _get_usage_table,
+    _result_response,
+)
 from rdc.handlers._types import Handler
 
 if TYPE_CHECKING:
@@ -18,20 +23,17 @@ def _handle_unused_targets(
     if state.adapter is None:
         return _error_response(request_id, -32002, "no replay loaded"), True
 
-    from rdc.services.query_service import _pass_list_with_fallback, find_unused_targets
-
-    actions = state.adapter.get_root_actions()
-    passes = _pass_list_with_fallback(actions, state.structured_file)
-
-    usage_data: dict[int, list[Any]] = {}
-    for resid, rid_obj in state.res_rid_map.items():
-        usage_data[resid] = state.adapter.controller.GetUsage(rid_obj.resourceId)
+    from rdc.services.query_service import find_unused_targets
 
+    catalog = _get_pass_catalog(state)
+    usage = _get_usage_table(state)
     swapchain_ids: set[int] = {
         rid for rid, tname in state.res_types.items() if tname == "SwapchainImage"
     }
 
-    result = find_unused_targets(passes, usage_data, state.res_names, swapchain_ids)
+    result = find_unused_targets(
+        catalog.passes, usage, state.res_names, swapchain_ids, index=catalog.index
+    )
     return _result_response(request_id, result), True
 
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any
 
 from rdc.handlers._helpers import (
@@ -10,7 +11,8 @@ from rdc.handlers._helpers import (
     _ensure_pass_attachments_populated,
     _ensure_shader_populated,
     _error_response,
-    _get_flat_actions,
+    _get_action_index,
+    _paginate,
     _resolve_vfs_path,
     _result_response,
 )
@@ -18,7 +20,6 @@ from rdc.handlers._types import Handler
 
 if TYPE_CHECKING:
     from rdc.daemon_server import DaemonState
-    from rdc.vfs.tree_cache import VfsNode
 
 # Column definitions per path context
 _COLUMNS: dict[str, list[str]] = {
@@ -34,9 +35,9 @@ _DEFAULT_COLUMNS = ["NAME", "TYPE"]
 
 
 def _ls_long_children(
-    path: str, node: VfsNode, state: DaemonState
+    path: str, names: Sequence[str], state: DaemonState
 ) -> tuple[list[str], list[dict[str, Any]]]:
-    """Enrich children with metadata based on path context.
+    """Enrich the children *names* of *path* with metadata based on path context.
 
     Returns:
         Tuple of (columns, enriched_children).
@@ -51,32 +52,32 @@ def _ls_long_children(
     if depth == 1 and context in _COLUMNS:
         columns = _COLUMNS[context]
         if context == "passes":
-            children = _long_passes(node, state)
+            children = _long_passes(names, state)
         elif context == "draws":
-            children = _long_draws(node, parent, state)
+            children = _long_draws(names, parent, state)
         elif context == "events":
-            children = _long_events(node, parent, state)
+            children = _long_events(names, parent, state)
         elif context == "resources":
-            children = _long_resources(node, state)
+            children = _long_resources(names, state)
         elif context == "textures":
-            children = _long_textures(node, state)
+            children = _long_textures(names, state)
         elif context == "buffers":
-            children = _long_buffers(node, state)
+            children = _long_buffers(names, state)
         else:  # shaders
-            children = _long_shaders(node, state)
+            children = _long_shaders(names, state)
     else:
         columns = _DEFAULT_COLUMNS
-        children = _long_default(node, parent, state)
+        children = _long_default(names, parent, state)
 
     return columns, children
 
 
-def _long_passes(node: VfsNode, state: DaemonState) -> list[dict[str, Any]]:
+def _long_passes(names: Sequence[str], state: DaemonState) -> list[dict[str, Any]]:
     assert state.vfs_tree is not None
     pass_map = {p["name"]: p for p in (state.vfs_tree.pass_list or [])}
     safe_map = state.vfs_tree.pass_name_map
     result: list[dict[str, Any]] = []
-    for name in node.children:
+    for name in names:
         orig = safe_map.get(name, name)
         p = pass_map.get(orig, {})
         result.append(
@@ -91,15 +92,14 @@ def _long_passes(node: VfsNode, state: DaemonState) -> list[dict[str, Any]]:
     return result
 
 
-def _long_draws(node: VfsNode, parent: str, state: DaemonState) -> list[dict[str, Any]]:
+def _long_draws(names: Sequence[str], parent: str, state: DaemonState) -> list[dict[str, Any]]:
     assert state.vfs_tree is not None
-    flat = _get_flat_actions(state)
-    eid_map = {str(a.eid): a for a in flat}
+    index = _get_action_index(state)
     result: list[dict[str, Any]] = []
-    for name in node.children:
+    for name in names:
         child_path = f"{parent}/{name}" if parent != "/" else f"/{name}"
         child_node = state.vfs_tree.static.get(child_path)
-        a = eid_map.get(name)
+        a = index.get(int(name)) if name.isdigit() else None
         if a:
             triangles = (a.num_indices // 3) * a.num_instances
             result.append(
@@ -126,15 +126,14 @@ def _long_draws(node: VfsNode, parent: str, state: DaemonState) -> list[dict[str
     return result
 
 
-def _long_events(node: VfsNode, parent: str, state: DaemonState) -> list[dict[str, Any]]:
+def _long_events(names: Sequence[str], parent: str, state: DaemonState) -> list[dict[str, Any]]:
     assert state.vfs_tree is not None
-    flat = _get_flat_actions(state)
-    eid_map = {str(a.eid): a for a in flat}
+    index = _get_action_index(state)
     result: list[dict[str, Any]] = []
-    for name in node.children:
+    for name in names:
         child_path = f"{parent}/{name}" if parent != "/" else f"/{name}"
         child_node = state.vfs_tree.static.get(child_path)
-        a = eid_map.get(name)
+        a = index.get(int(name)) if name.isdigit() else None
         if a:
             result.append(
                 {
@@ -156,9 +155,9 @@ def _long_events(node: VfsNode, parent: str, state: DaemonState) -> list[dict[st
     return result
 
 
-def _long_resources(node: VfsNode, state: DaemonState) -> list[dict[str, Any]]:
+def _long_resources(names: Sequence[str], state: DaemonState) -> list[dict[str, Any]]:
     result: list[dict[str, Any]] = []
-    for name in node.children:
+    for name in names:
         rid_int = int(name) if name.isdigit() else 0
         res_type = state.res_types.get(rid_int, "-")
         rid_obj = state.res_rid_map.get(rid_int)
@@ -175,9 +174,9 @@ def _long_resources(node: VfsNode, state: DaemonState) -> list[dict[str, Any]]:
     return result
 
 
-def _long_textures(node: VfsNode, state: DaemonState) -> list[dict[str, Any]]:
+def _long_textures(names: Sequence[str], state: DaemonState) -> list[dict[str, Any]]:
     result: list[dict[str, Any]] = []
-    for name in node.children:
+    for name in names:
         rid_int = int(name) if name.isdigit() else 0
         tex = state.tex_map.get(rid_int)
         if tex:
@@ -207,9 +206,9 @@ def _long_textures(node: VfsNode, state: DaemonState) -> list[dict[str, Any]]:
     return result
 
 
-def _long_buffers(node: VfsNode, state: DaemonState) -> list[dict[str, Any]]:
+def _long_buffers(names: Sequence[str], state: DaemonState) -> list[dict[str, Any]]:
     result: list[dict[str, Any]] = []
-    for name in node.children:
+    for name in names:
         rid_int = int(name) if name.isdigit() else 0
         buf = state.buf_map.get(rid_int)
         length = getattr(buf, "length", "-") if buf else "-"
@@ -224,10 +223,10 @@ def _long_buffers(node: VfsNode, state: DaemonState) -> list[dict[str, Any]]:
     return result
 
 
-def _long_shaders(node: VfsNode, state: DaemonState) -> list[dict[str, Any]]:
+def _long_shaders(names: Sequence[str], state: DaemonState) -> list[dict[str, Any]]:
     _build_shader_cache(state)
     result: list[dict[str, Any]] = []
-    for name in node.children:
+    for name in names:
         sid = int(name) if name.isdigit() else 0
         meta = state.shader_meta.get(sid, {})
         stages = ",".join(meta.get("stages", []))
@@ -245,10 +244,10 @@ def _long_shaders(node: VfsNode, state: DaemonState) -> list[dict[str, Any]]:
     return result
 
 
-def _long_default(node: VfsNode, parent: str, state: DaemonState) -> list[dict[str, Any]]:
+def _long_default(names: Sequence[str], parent: str, state: DaemonState) -> list[dict[str, Any]]:
     assert state.vfs_tree is not None
     result: list[dict[str, Any]] = []
-    for name in node.children:
+    for name in names:
         child_path = f"{parent}/{name}" if parent != "/" else f"/{name}"
         child_node = state.vfs_tree.static.get(child_path)
         result.append(
@@ -289,8 +288,13 @@ def _handle_vfs_ls(
     if node is None:
         return _error_response(request_id, -32001, f"not found: {path}"), True
 
+    try:
+        names, paging = _paginate(params, state, node.children)
+    except ValueError as exc:
+        return _error_response(request_id, -32602, str(exc)), True
+
     if long and node.kind == "dir":
-        columns, children = _ls_long_children(path, node, state)
+        columns, children = _ls_long_children(path, names, state)
         result: dict[str, Any] = {
             "path": path,
             "kind": node.kind,
@@ -301,13 +305,13 @@ def _handle_vfs_ls(
     else:
         parent = path.rstrip("/")
         children_list: list[dict[str, Any]] = []
-        for c in node.children:
+        for c in names:
             child_path = f"{parent}/{c}" if parent != "/" else f"/{c}"
             child_node = state.vfs_tree.static.get(child_path)
             children_list.append({"name": c, "kind": child_node.kind if child_node else "dir"})
         result = {"path": path, "kind": node.kind, "children": children_list}
 
-    return _result_response(request_id, result), True
+    return _result_response(request_id, {**result, **paging}), True
 
 
 class _VfsPopulateError(Exception):
@@ -0,0 +1,106 @@
+"""GPU counter descriptors and fetched values, cached per replay.
+
+``EnumerateCounters``/``DescribeCounter`` are answered once per replay, and
+``FetchCounters`` (a full-frame GPU counter pass) runs at most once per
+counter: its results are stored as one ``eid -> value`` column per counter
+and served from there by every later ``counter_fetch``, whatever its
+``name``/``eid`` filters.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from typing import Any
+
+
+class CounterTable:
+    """Per-replay counter descriptors plus memoized per-counter value columns."""
+
+    def __init__(self, source: Any = None) -> None:
+        self.source = source
+        self._objs: dict[int, Any] = {}
+        self.descriptors: dict[int, dict[str, Any]] = {}
+        self._columns: dict[int, dict[int, int | float]] = {}
+
+    def add(self, counter: Any, descriptor: dict[str, Any]) -> None:
+        """Register *counter* (the ``EnumerateCounters`` object) and its descriptor.
+
+        *descriptor* carries at least ``id``, ``name``, ``unit``, ``type``
+        and ``byte_width``.
+        """
+        cid = int(descriptor["id"])
+        self._objs[cid] = counter
+        self.descriptors[cid] = descriptor
+
+    def match(self, name: str | None = None) -> list[int]:
+        """Counter IDs whose name contains *name* (case-insensitive), by name."""
+        needle = (name or "").lower()
+        cids = [cid for cid, d in self.descriptors.items() if needle in d["name"].lower()]
+        return sorted(cids, key=lambda cid: self.descriptors[cid]["name"])
+
+    @property
+    def fetched(self) -> int:
+        """Number of counters whose values are cached."""
+        return len(self._columns)
+
+    def fetch(self, cids: Iterable[int], fetch_counters: Callable[[list[Any]], Any]) -> None:
+        """Run one ``FetchCounters`` pass for the *cids* not fetched yet."""
+        missing = [cid for cid in cids if cid not in self._columns]
+        if not missing:
+            return
+        columns: dict[int, dict[int, int | float]] = {cid: {} for cid in missing}
+        for r in fetch_counters([self._objs[cid] for cid in missing]):
+            cid = int(r.counter)
+            column = columns.get(cid)
+            if column is None:
+                continue
+            desc = self.descriptors[cid]
+            narrow = desc["byte_width"] == 4
+            if desc["type"] == "Float":
+                val: int | float = r.value.f if narrow else r.value.d
+            else:
+                val = r.value.u32 if narrow else r.value.u64
+            column[int(r.eventId)] = val
+        self._columns.update(columns)
+
+    def table(self, cids: list[int], eid: int | None = None) -> dict[str, Any]:
+        """Return a columnar ``{eids, counters, columns}`` view of fetched counters.
+
+        ``columns[i][j]`` is counter ``cids[i]`` at ``eids[j]`` (None when the
+        counter has no result for that event).
+        """
+        columns = [self._columns.get(cid, {}) for cid in cids]
+        if eid is not None:
+            eids = [eid] if any(eid in col for col in columns) else []
+        else:
+            eids = sorted(set().union(*columns))
+        return {
+            "eids": eids,
+            "counters": [
+                {
+                    "id": cid,
+                    "name": self.descriptors[cid]["name"],
+                    "unit": self.descriptors[cid]["unit"],
+                }
+                for cid in cids
+            ],
+            "columns": [[col.get(e) for e in eids] for col in columns],
+        }
+
+
+def table_rows(table: dict[str, Any]) -> list[dict[str, Any]]:
+    """Expand a columnar counter table into ``{eid, counter, value, unit}`` rows."""
+    counters = table["counters"]
+    rows: list[dict[str, Any]] = []
+    for j, eid in enumerate(table["eids"]):
+        for counter, column in zip(counters, table["columns"], strict=True):
+            if column[j] is not None:
+                rows.append(
+                    {
+                        "eid": eid,
+                        "counter": counter["name"],
+                        "value": column[j],
+                        "unit": counter["unit"],
+                    }
+                )
+    return rows
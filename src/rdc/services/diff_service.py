@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from typing import Any
 
 from rdc import _platform
-from rdc.daemon_client import send_request
+from rdc.daemon_client import send_batch, send_request
 from rdc.protocol import shutdown_request
 from rdc.services.session_service import pick_port, start_daemon, wait_for_ping
 from rdc.session_state import is_pid_alive
@@ -146,6 +146,29 @@ def _do_query(
         out[idx] = None
 
 
+def _do_batch(
+    host: str,
+    port: int,
+    token: str,
+    calls: list[tuple[str, dict[str, Any]]],
+    timeout_s: float,
+    out: list[dict[str, Any] | None],
+) -> None:
+    """Worker for one side's batched calls. Stores each result at out[i]."""
+    if not calls:
+        return
+    payloads = [
+        {"jsonrpc": "2.0", "method": method, "id": i, "params": {**params, "_token": token}}
+        for i, (method, params) in enumerate(calls, start=1)
+    ]
+    try:
+        responses = send_batch(host, port, payloads, timeout=timeout_s)
+    except Exception:  # noqa: BLE001
+        return
+    for i, resp in enumerate(responses):
+        out[i] = None if "error" in resp else resp
+
+
 def query_both(
     ctx: DiffContext,
     method: str,
@@ -190,6 +213,8 @@ def query_each_sync(
     """Send N calls to daemon A and M calls to daemon B concurrently.
 
     Accepts separate call lists per side (e.g. different EIDs per daemon).
+    Each side's calls travel as one JSON-RPC batch, so a side costs a single
+    round trip regardless of N; a failing entry only nulls its own slot.
 
     Returns:
         (results_a, results_b, error_string). Order matches input call lists.
@@ -197,28 +222,20 @@ def query_each_sync(
     na, nb = len(calls_a), len(calls_b)
     out_a: list[dict[str, Any] | None] = [None] * na
     out_b: list[dict[str, Any] | None] = [None] * nb
-    threads: list[threading.Thread] = []
-
-    for i, (method, params) in enumerate(calls_a):
-        t = threading.Thread(
-            target=_do_query,
-            args=(ctx.host, ctx.port_a, ctx.token_a, method, params, timeout_s, out_a, i),
-            daemon=True,
-        )
-        threads.append(t)
-
-    for i, (method, params) in enumerate(calls_b):
-        t = threading.Thread(
-            target=_do_query,
-            args=(ctx.host, ctx.port_b, ctx.token_b, method, params, timeout_s, out_b, i),
-            daemon=True,
-        )
-        threads.append(t)
-
-    for t in threads:
-        t.start()
-    for t in threads:
-        t.join()
+    t_a = threading.Thread(
+        target=_do_batch,
+        args=(ctx.host, ctx.port_a, ctx.token_a, calls_a, timeout_s, out_a),
+        daemon=True,
+    )
+    t_b = threading.Thread(
+        target=_do_batch,
+        args=(ctx.host, ctx.port_b, ctx.token_b, calls_b, timeout_s, out_b),
+        daemon=True,
+    )
+    t_a.start()
+    t_b.start()
+    t_a.join()
+    t_b.join()
 
     all_none = (na + nb > 0) and all(r is None for r in out_a) and all(r is None for r in out_b)
     err = "all queries failed" if all_none else ""
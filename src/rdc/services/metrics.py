@@ -0,0 +1,160 @@
+"""Daemon request metrics: per-method counts, latency histograms and bytes sent.
+
+The server records every request it answers (see ``daemon_server._serve_line``
+and ``_process_batch``); the seek helpers count ``SetFrameEvent`` calls issued
+versus skipped because the replay was already at the requested event. With a
+trace file attached, each request is also appended to it as one JSON line.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import time
+from pathlib import Path
+from typing import IO, Any
+
+# Upper bounds (ms) of the latency histogram buckets; a final bucket catches
+# everything slower.
+LATENCY_BUCKETS_MS: tuple[float, ...] = (
+    1,
+    2,
+    5,
+    10,
+    25,
+    50,
+    100,
+    250,
+    500,
+    1000,
+    2500,
+    5000,
+    10000,
+)
+
+
+class MethodStats:
+    """Counters for one RPC method."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.bytes = 0
+        self.seeks = 0
+        self.histogram = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def percentile(self, q: float) -> float | None:
+        """Upper bound (ms) of the bucket holding the *q* quantile; None if unbounded."""
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.histogram):
+            seen += n
+            if n and seen >= rank:
+                return LATENCY_BUCKETS_MS[i] if i < len(LATENCY_BUCKETS_MS) else None
+        return None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "bytes": self.bytes,
+            "seeks": self.seeks,
+            "histogram": list(self.histogram),
+        }
+
+
+class DaemonMetrics:
+    """Request metrics for one daemon process."""
+
+    def __init__(self) -> None:
+        self.started = time.time()
+        self.methods: dict[str, MethodStats] = {}
+        self.bytes_out = 0
+        self.seeks = 0
+        self.seek_hits = 0
+        self._trace: IO[str] | None = None
+        self.trace_path: Path | None = None
+
+    def reset(self) -> None:
+        """Clear all counters; an attached trace file stays open."""
+        self.started = time.time()
+        self.methods.clear()
+        self.bytes_out = 0
+        self.seeks = 0
+        self.seek_hits = 0
+
+    def seek(self, *, hit: bool) -> None:
+        """Count a replay seek request; *hit* means no ``SetFrameEvent`` was needed."""
+        if hit:
+            self.seek_hits += 1
+        else:
+            self.seeks += 1
+
+    def record(
+        self, method: str, seconds: float, *, ok: bool, nbytes: int = 0, seeks: int = 0
+    ) -> None:
+        """Account one answered request (and append it to the trace, if any)."""
+        ms = seconds * 1000.0
+        stats = self.methods.get(method)
+        if stats is None:
+            stats = self.methods[method] = MethodStats()
+        stats.count += 1
+        stats.errors += 0 if ok else 1
+        stats.total_ms += ms
+        stats.max_ms = max(stats.max_ms, ms)
+        stats.bytes += nbytes
+        stats.seeks += seeks
+        stats.histogram[bisect.bisect_left(LATENCY_BUCKETS_MS, ms)] += 1
+        self.bytes_out += nbytes
+        if self._trace is not None:
+            entry = {
+                "ts": round(time.time(), 6),
+                "method": method,
+                "ms": round(ms, 3),
+                "ok": ok,
+                "bytes": nbytes,
+                "seeks": seeks,
+            }
+            try:
+                self._trace.write(json.dumps(entry) + "\n")
+            except OSError:
+                self.close_trace()
+
+    def open_trace(self, path: str | Path) -> None:
+        """Append one JSON line per request to *path* from now on."""
+        self.close_trace()
+        self.trace_path = Path(path)
+        self._trace = self.trace_path.open("a", encoding="utf-8", buffering=1)
+
+    def close_trace(self) -> None:
+        if self._trace is not None:
+            try:
+                self._trace.close()
+            except OSError:
+                pass
+        self._trace = None
+        self.trace_path = None
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the counters as a JSON-serializable dict."""
+        lookups = self.seeks + self.seek_hits
+        return {
+            "uptime_s": round(time.time() - self.started, 3),
+            "requests": sum(s.count for s in self.methods.values()),
+            "bytes_out": self.bytes_out,
+            "seeks": {
+                "issued": self.seeks,
+                "cache_hits": self.seek_hits,
+                "hit_rate": round(self.seek_hits / lookups, 4) if lookups else None,
+            },
+            "latency_buckets_ms": list(LATENCY_BUCKETS_MS),
+            "methods": {name: s.to_dict() for name, s in sorted(self.methods.items())},
+            "trace": str(self.trace_path) if self.trace_path is not None else None,
+        }
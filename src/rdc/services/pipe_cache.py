@@ -0,0 +1,92 @@
+"""Per-event pipeline snapshot cache.
+
+Handlers such as ``pipeline``, ``bindings``, ``shader``, ``descriptors`` and
+the ``pipe_*`` sections seek the replay and read ``GetPipelineState()`` on
+every call, although their answer for a given event never changes within a
+replay. ``PipeSnapshotCache`` keeps what they extracted, as serialized JSON
+per (event, section), so repeated inspections of the same draws are answered
+without touching the replay. Whole events are evicted least recently used
+first once the byte budget is exceeded.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from collections import OrderedDict
+from typing import Any
+
+_log = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+
+def max_cache_bytes() -> int:
+    """Return the cache's byte budget; ``RDC_PIPE_CACHE_MB`` overrides it.
+
+    A budget of 0 disables the cache.
+    """
+    raw = os.environ.get("RDC_PIPE_CACHE_MB")
+    if raw:
+        try:
+            return max(int(raw), 0) * 1024 * 1024
+        except ValueError:
+            _log.warning("ignoring invalid RDC_PIPE_CACHE_MB=%r", raw)
+    return DEFAULT_MAX_BYTES
+
+
+class PipeSnapshotCache:
+    """``eid -> {section key: JSON text}`` for one replay, LRU by event."""
+
+    def __init__(self, max_bytes: int, source: Any = None) -> None:
+        self.source = source
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._snapshots: OrderedDict[int, dict[str, str]] = OrderedDict()
+        self._sizes: dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+    def get(self, eid: int, key: str) -> str | None:
+        """Return the stored section for *eid*, marking the event recently used."""
+        snap = self._snapshots.get(eid)
+        text = snap.get(key) if snap is not None else None
+        if text is None:
+            self.misses += 1
+            return None
+        self._snapshots.move_to_end(eid)
+        self.hits += 1
+        return text
+
+    def put(self, eid: int, key: str, text: str) -> None:
+        """Store one section of *eid*'s snapshot, evicting old events to fit."""
+        size = len(text)
+        if size > self.max_bytes:
+            return
+        snap = self._snapshots.get(eid)
+        if snap is None:
+            snap = self._snapshots[eid] = {}
+            self._sizes[eid] = 0
+        else:
+            self._snapshots.move_to_end(eid)
+        old = snap.get(key)
+        delta = size - (len(old) if old is not None else 0)
+        snap[key] = text
+        self._sizes[eid] += delta
+        self.nbytes += delta
+        while self.nbytes > self.max_bytes and len(self._snapshots) > 1:
+            victim, _ = self._snapshots.popitem(last=False)
+            self.nbytes -= self._sizes.pop(victim)
+
+    def stats(self) -> dict[str, int]:
+        """Return the event count, byte usage and hit/miss counters."""
+        return {
+            "events": len(self._snapshots),
+            "bytes": self.nbytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
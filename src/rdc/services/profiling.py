@@ -0,0 +1,71 @@
+"""Opt-in per-request profiling for the daemon.
+
+``profile_call`` runs one handler under cProfile and/or tracemalloc and dumps
+the results next to each other: ``<stem>.pstats`` (load with ``pstats.Stats``)
+and ``<stem>.tracemalloc`` (load with ``tracemalloc.Snapshot.load``).
+"""
+
+from __future__ import annotations
+
+import cProfile
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, TypeVar
+
+_T = TypeVar("_T")
+
+PROFILE_MODES = ("cpu", "mem", "all")
+
+
+def profile_mode(value: Any) -> str | None:
+    """Normalize a ``_profile`` request value; True means ``"cpu"``.
+
+    Raises:
+        ValueError: If *value* is not a bool or one of ``PROFILE_MODES``.
+    """
+    if value is None or value is False:
+        return None
+    if value is True:
+        return "cpu"
+    if value in PROFILE_MODES:
+        return str(value)
+    raise ValueError(f"_profile must be true or one of {', '.join(PROFILE_MODES)}")
+
+
+def profile_call(
+    fn: Callable[[], _T], out_dir: Path, stem: str, mode: str
+) -> tuple[_T, dict[str, Any]]:
+    """Call *fn* under the profilers selected by *mode*.
+
+    Returns *fn*'s result and a dict naming the dump files written
+    (``pstats``/``tracemalloc``) plus ``peak_bytes`` for memory profiles.
+    Dumps are written even if *fn* raises.
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    info: dict[str, Any] = {}
+    cpu = mode in ("cpu", "all")
+    mem = mode in ("mem", "all")
+    started_tracing = False
+    if mem:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            started_tracing = True
+        tracemalloc.reset_peak()
+    profiler = cProfile.Profile() if cpu else None
+    try:
+        if profiler is not None:
+            return profiler.runcall(fn), info
+        return fn(), info
+    finally:
+        if profiler is not None:
+            path = out_dir / f"{stem}.pstats"
+            profiler.dump_stats(str(path))
+            info["pstats"] = str(path)
+        if mem:
+            path = out_dir / f"{stem}.tracemalloc"
+            tracemalloc.take_snapshot().dump(str(path))
+            info["tracemalloc"] = str(path)
+            info["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+            if started_tracing:
+                tracemalloc.stop()
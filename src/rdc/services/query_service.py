@@ -8,9 +8,12 @@ pass-dependency-DAG helpers.
 
 from __future__ import annotations
 
+import bisect
 import fnmatch
+import heapq
 import logging
 import re
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -22,6 +25,8 @@ _DRAWCALL = 0x0002
 _DISPATCH = 0x0004
 _MESHDRAW = 0x0008
 _COPY = 0x0400
+_RESOLVE = 0x0800
+_DISPATCH_RAY = 0x4000
 _INDEXED = 0x10000
 _PUSH_MARKER = 0x0040
 _CMD_BUFFER = 0x1000000
@@ -136,15 +141,74 @@ def walk_actions(
     return result
 
 
+_TYPE_FLAGS: dict[str, int] = {
+    "draw": _DRAWCALL | _MESHDRAW,
+    "dispatch": _DISPATCH,
+    "clear": _CLEAR,
+    "copy": _COPY,
+}
+
+
+@dataclass
+class ActionIndex:
+    """Flattened action table with an eid lookup and per-type index arrays.
+
+    Built once per replay; ``draws``/``dispatches``/``clears``/``copies`` hold
+    positions into ``flat`` (in walk order) so type queries skip the full scan.
+    ``writes`` holds the non-draw actions that can write resources (clears,
+    copies, resolves, dispatches).
+    """
+
+    flat: list[FlatAction]
+    eid_to_index: dict[int, int] = field(default_factory=dict)
+    draws: list[int] = field(default_factory=list)
+    dispatches: list[int] = field(default_factory=list)
+    clears: list[int] = field(default_factory=list)
+    copies: list[int] = field(default_factory=list)
+    writes: list[int] = field(default_factory=list)
+    source: Any = field(default=None, repr=False, compare=False)
+
+    def get(self, eid: int) -> FlatAction | None:
+        """Return the flattened action for *eid*, or None."""
+        idx = self.eid_to_index.get(eid)
+        return self.flat[idx] if idx is not None else None
+
+    def of_type(self, action_type: str) -> list[FlatAction]:
+        """Same result as ``filter_by_type(self.flat, action_type)``."""
+        indices = {
+            "draw": self.draws,
+            "dispatch": self.dispatches,
+            "clear": self.clears,
+            "copy": self.copies,
+        }.get(action_type.lower())
+        if indices is None:
+            return []
+        flat = self.flat
+        return [flat[i] for i in indices]
+
+
+def build_action_index(flat: list[FlatAction], source: Any = None) -> ActionIndex:
+    """Index a flattened action list by eid and by action type."""
+    index = ActionIndex(flat=flat, source=source)
+    buckets = (
+        (_TYPE_FLAGS["draw"], index.draws),
+        (_DISPATCH, index.dispatches),
+        (_CLEAR, index.clears),
+        (_COPY, index.copies),
+        (_CLEAR | _COPY | _RESOLVE | _DISPATCH | _DISPATCH_RAY, index.writes),
+    )
+    eid_to_index = index.eid_to_index
+    for i, a in enumerate(flat):
+        eid_to_index.setdefault(a.eid, i)
+        for flag, bucket in buckets:
+            if a.flags & flag:
+                bucket.append(i)
+    return index
+
+
 def filter_by_type(flat: list[FlatAction], action_type: str) -> list[FlatAction]:
     """Filter flattened actions by type string (draw/dispatch/clear/copy)."""
-    type_map: dict[str, int] = {
-        "draw": _DRAWCALL | _MESHDRAW,
-        "dispatch": _DISPATCH,
-        "clear": _CLEAR,
-        "copy": _COPY,
-    }
-    flag = type_map.get(action_type.lower())
+    flag = _TYPE_FLAGS.get(action_type.lower())
     if flag is None:
         return []
     return [a for a in flat if a.flags & flag]
@@ -155,16 +219,20 @@ def filter_by_pass(
     pass_name: str,
     actions: list[Any] | None = None,
     sf: Any = None,
+    *,
+    catalog: PassCatalog | None = None,
 ) -> list[FlatAction]:
     """Filter flattened actions by pass name (case-insensitive).
 
-    When `actions` is provided, uses EID-range matching via `_build_pass_list`
-    to support semantic pass names (e.g. 'Colour Pass #1'). Falls back to
-    `a.pass_name` string comparison when no pass matches or `actions` is None.
+    When `actions` or a prebuilt `catalog` is provided, uses EID-range matching
+    over the merged pass list to support semantic pass names (e.g. 'Colour
+    Pass #1'). Falls back to `a.pass_name` string comparison when no pass
+    matches or neither is given.
     """
-    if actions is not None:
-        passes = _pass_list_with_fallback(actions, sf)
-        target = next((p for p in passes if p["name"].lower() == pass_name.lower()), None)
+    if catalog is None and actions is not None:
+        catalog = build_pass_catalog(actions, sf)
+    if catalog is not None:
+        target = catalog.by_name.get(pass_name.lower())
         if target:
             return [a for a in flat if target["begin_eid"] <= a.eid <= target["end_eid"]]
     lower = pass_name.lower()
@@ -257,6 +325,8 @@ def count_from_actions(
     what: str,
     *,
     pass_name: str | None = None,
+    catalog: PassCatalog | None = None,
+    flat: list[FlatAction] | None = None,
 ) -> int:
     """Count items from the action tree.
 
@@ -264,6 +334,8 @@ def count_from_actions(
         actions: Root action list from ReplayController.
         what: One of draws, events, triangles, dispatches, clears, passes.
         pass_name: Optional pass filter.
+        catalog: Cached pass catalog; used for ``passes`` and the pass filter.
+        flat: Cached flattened actions; avoids re-walking *actions*.
 
     Raises:
         ValueError: If what is not a recognized target.
@@ -274,13 +346,14 @@ def count_from_actions(
         )
 
     if what == "events":
-        return _count_events_recursive(actions)
+        return len(flat) if flat is not None else _count_events_recursive(actions)
     if what == "passes":
-        return _count_passes(actions)
+        return len(catalog.passes) if catalog is not None else _count_passes(actions)
 
-    flat = walk_actions(actions)
+    if flat is None:
+        flat = walk_actions(actions)
     if pass_name:
-        flat = filter_by_pass(flat, pass_name)
+        flat = filter_by_pass(flat, pass_name, catalog=catalog)
 
     if what == "draws":
         return len(filter_by_type(flat, "draw"))
@@ -443,9 +516,11 @@ def get_resource_detail(adapter: Any, resid: int) -> dict[str, Any] | None:
 # ---------------------------------------------------------------------------
 
 
-def get_pass_hierarchy(actions: list[Any], sf: Any = None) -> dict[str, Any]:
-    """Get render pass hierarchy from actions."""
-    enriched = _pass_list_with_fallback(actions, sf)
+def get_pass_hierarchy(
+    actions: list[Any], sf: Any = None, *, catalog: PassCatalog | None = None
+) -> dict[str, Any]:
+    """Get render pass hierarchy from actions (or a prebuilt catalog)."""
+    enriched = catalog.passes if catalog is not None else _pass_list_with_fallback(actions, sf)
     return {"passes": enriched}
 
 
@@ -541,13 +616,71 @@ def _friendly_pass_name(api_name: str, index: int) -> str:
 
 
 def pass_name_for_eid(eid: int, passes: list[dict[str, Any]]) -> str:
-    """Map an EID to its friendly pass name using EID-range matching."""
+    """Map an EID to its friendly pass name using EID-range matching.
+
+    For many lookups against the same pass list, build a ``PassIndex`` once.
+    """
     for p in passes:
         if p["begin_eid"] <= eid <= p["end_eid"]:
             return str(p["name"])
     return "-"
 
 
+class PassIndex:
+    """Sorted-interval index answering "which pass contains this EID?".
+
+    The pass ranges are flattened into disjoint segments (``starts`` sorted,
+    ``owners`` holding a position in ``passes`` or -1 for gaps), so a lookup
+    is one bisect. Where ranges overlap, the earliest pass in list order
+    wins, matching a linear scan over ``passes``.
+    """
+
+    def __init__(self, passes: list[dict[str, Any]]) -> None:
+        self.passes = passes
+        self.starts: list[int] = []
+        self.owners: list[int] = []
+        opening: dict[int, list[int]] = {}
+        closing: dict[int, list[int]] = {}
+        for i, p in enumerate(passes):
+            begin, end = int(p["begin_eid"]), int(p["end_eid"])
+            if begin > end:
+                continue
+            opening.setdefault(begin, []).append(i)
+            closing.setdefault(end + 1, []).append(i)
+        active: list[int] = []
+        ended: set[int] = set()
+        for bound in sorted(opening.keys() | closing.keys()):
+            ended.update(closing.get(bound, ()))
+            for i in opening.get(bound, ()):
+                heapq.heappush(active, i)
+            while active and active[0] in ended:
+                heapq.heappop(active)
+            owner = active[0] if active else -1
+            if self.owners and self.owners[-1] == owner:
+                continue
+            self.starts.append(bound)
+            self.owners.append(owner)
+
+    def lookup(self, eid: int) -> int:
+        """Return the position in ``passes`` of the pass containing *eid*, or -1."""
+        seg = bisect.bisect_right(self.starts, eid) - 1
+        return self.owners[seg] if seg >= 0 else -1
+
+    def name_for(self, eid: int) -> str:
+        """Return the name of the pass containing *eid*, or ``"-"``."""
+        idx = self.lookup(eid)
+        return str(self.passes[idx]["name"]) if idx >= 0 else "-"
+
+    def overlaps(self, begin: int, end: int) -> bool:
+        """Return True if any indexed pass intersects ``[begin, end]``."""
+        seg = max(bisect.bisect_right(self.starts, begin) - 1, 0)
+        while seg < len(self.starts) and self.starts[seg] <= end:
+            if self.owners[seg] >= 0:
+                return True
+            seg += 1
+        return False
+
+
 _LOAD_STORE_RE = re.compile(r"(C|DS|D|S)=([^,)]+)")
 
 
@@ -783,13 +916,8 @@ def _pass_list_with_fallback(actions: list[Any], sf: Any = None) -> list[dict[st
     if not synthetic:
         return explicit
     # Keep synthetic passes whose EID range doesn't overlap any explicit pass
-    gap_fills = [
-        s
-        for s in synthetic
-        if not any(
-            s["begin_eid"] <= e["end_eid"] and s["end_eid"] >= e["begin_eid"] for e in explicit
-        )
-    ]
+    explicit_index = PassIndex(explicit)
+    gap_fills = [s for s in synthetic if not explicit_index.overlaps(s["begin_eid"], s["end_eid"])]
     if not gap_fills:
         return explicit
     merged = explicit + gap_fills
@@ -797,20 +925,53 @@ def _pass_list_with_fallback(actions: list[Any], sf: Any = None) -> list[dict[st
     return merged
 
 
+@dataclass
+class PassCatalog:
+    """Merged pass list computed once per replay, with lookup structures.
+
+    ``by_name`` is keyed by lower-cased pass name (first pass wins on
+    duplicates, like a linear case-insensitive scan); ``index`` buckets EIDs
+    into passes. Treat the pass dicts as read-only: they are shared.
+    """
+
+    passes: list[dict[str, Any]]
+    by_name: dict[str, dict[str, Any]] = field(default_factory=dict)
+    index: PassIndex = field(init=False, repr=False)
+    source: Any = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        for p in self.passes:
+            self.by_name.setdefault(str(p["name"]).lower(), p)
+        self.index = PassIndex(self.passes)
+
+    def find(self, identifier: int | str) -> dict[str, Any] | None:
+        """Return a pass by list position (int) or case-insensitive name (str)."""
+        if isinstance(identifier, int):
+            ok = 0 <= identifier < len(self.passes)
+            return self.passes[identifier] if ok else None
+        return self.by_name.get(identifier.lower())
+
+
+def build_pass_catalog(actions: list[Any], sf: Any = None, source: Any = None) -> PassCatalog:
+    """Build the merged (explicit + gap-filling synthetic) pass catalog."""
+    return PassCatalog(passes=_pass_list_with_fallback(actions, sf), source=source)
+
+
 def get_pass_detail(
     actions: list[Any],
     sf: Any = None,
     identifier: int | str = 0,
+    *,
+    catalog: PassCatalog | None = None,
 ) -> dict[str, Any] | None:
-    """Get detail for a single pass by index (int) or name (str)."""
-    passes = _pass_list_with_fallback(actions, sf)
-    if isinstance(identifier, int):
-        return passes[identifier] if 0 <= identifier < len(passes) else None
-    lower = identifier.lower()
-    for p in passes:
-        if p["name"].lower() == lower:
-            return p
-    return None
+    """Get detail for a single pass by index (int) or name (str).
+
+    The returned dict is a copy, so callers may enrich it freely.
+    """
+    if catalog is None:
+        catalog = build_pass_catalog(actions, sf)
+    found = catalog.find(identifier)
+    return dict(found) if found is not None else None
 
 
 # ---------------------------------------------------------------------------
@@ -868,15 +1029,21 @@ _READ_USAGES: frozenset[int] = frozenset(
 )
 
 
+_DEPTH_STENCIL_USAGE: int = 33  # DepthStencilTarget
+
+
 def build_pass_deps(
     passes: list[dict[str, Any]],
-    usage_data: dict[int, list[Any]],
+    usage_data: Mapping[int, Sequence[Any]],
+    *,
+    index: PassIndex | None = None,
 ) -> dict[str, Any]:
     """Build a pass dependency DAG from pass list and resource usage data.
 
     Args:
         passes: List of pass dicts with name, begin_eid, end_eid keys.
         usage_data: Map of resource ID to list of EventUsage objects.
+        index: Prebuilt ``PassIndex`` over *passes*; built on demand if None.
 
     Returns:
         Dict with ``edges`` (list of edge dicts) and ``per_pass``
@@ -895,77 +1062,98 @@ def build_pass_deps(
         ]
         return {"edges": [], "per_pass": per_pass}
 
-    n = len(passes)
+    if index is None:
+        index = PassIndex(passes)
+    writes, reads, res_writers, res_readers = _bucket_usage(index, usage_data)
+
+    # Inverted map: only passes that touch the same resource can share an
+    # edge, so the cost follows the number of writer/reader pairs, not P^2.
+    shared: dict[tuple[int, int], set[int]] = {}
+    for rid, writer_passes in res_writers.items():
+        for b in res_readers.get(rid, ()):
+            for a in writer_passes:
+                if a != b:
+                    shared.setdefault((a, b), set()).add(rid)
+    edges = [
+        {
+            "src": passes[a]["name"],
+            "dst": passes[b]["name"],
+            "resources": sorted(shared[(a, b)]),
+        }
+        for a, b in sorted(shared)
+    ]
+
+    per_pass = [
+        {
+            "name": passes[i]["name"],
+            "reads": sorted(reads[i]),
+            "writes": sorted(writes[i]),
+            "load_ops": passes[i].get("load_ops", []),
+            "store_ops": passes[i].get("store_ops", []),
+        }
+        for i in range(len(passes))
+    ]
+    return {"edges": edges, "per_pass": per_pass}
+
+
+def _bucket_usage(
+    index: PassIndex,
+    usage_data: Mapping[int, Sequence[Any]],
+    out_of_pass_reads: set[int] | None = None,
+    depth_resources: set[int] | None = None,
+) -> tuple[list[set[int]], list[set[int]], dict[int, list[int]], dict[int, list[int]]]:
+    """Bucket resource usage into per-pass write/read sets.
+
+    Returns ``(writes, reads, res_writers, res_readers)`` where the last two
+    invert the first two (resource ID -> pass positions, ascending). Reads
+    outside every pass and depth/stencil writes are collected into the
+    optional sets when given.
+    """
+    n = len(index.passes)
     writes: list[set[int]] = [set() for _ in range(n)]
     reads: list[set[int]] = [set() for _ in range(n)]
-
     for rid, events in usage_data.items():
         if rid == 0:
             continue
         for ev in events:
             eid = ev.eventId
             usage_val = int(ev.usage)
-            pidx = _bucket_eid(eid, passes)
+            pidx = index.lookup(eid)
             if pidx < 0:
+                if out_of_pass_reads is not None and usage_val in _READ_USAGES:
+                    out_of_pass_reads.add(rid)
                 continue
             if usage_val in _WRITE_USAGES:
                 writes[pidx].add(rid)
+                if depth_resources is not None and usage_val == _DEPTH_STENCIL_USAGE:
+                    depth_resources.add(rid)
             elif usage_val in _READ_USAGES:
                 reads[pidx].add(rid)
             else:
                 _log.debug("unknown ResourceUsage %d at eid %d", usage_val, eid)
 
-    seen: set[tuple[int, int]] = set()
-    edges: list[dict[str, Any]] = []
-    for a in range(n):
-        if not writes[a]:
-            continue
-        for b in range(n):
-            if a == b:
-                continue
-            shared = writes[a] & reads[b]
-            if shared and (a, b) not in seen:
-                seen.add((a, b))
-                edges.append(
-                    {
-                        "src": passes[a]["name"],
-                        "dst": passes[b]["name"],
-                        "resources": sorted(shared),
-                    }
-                )
-
-    per_pass = [
-        {
-            "name": passes[i]["name"],
-            "reads": sorted(reads[i]),
-            "writes": sorted(writes[i]),
-            "load_ops": passes[i].get("load_ops", []),
-            "store_ops": passes[i].get("store_ops", []),
-        }
-        for i in range(n)
-    ]
-    return {"edges": edges, "per_pass": per_pass}
-
-
-def _bucket_eid(eid: int, passes: list[dict[str, Any]]) -> int:
-    for i, p in enumerate(passes):
-        if p["begin_eid"] <= eid <= p["end_eid"]:
-            return i
-    return -1
+    res_writers: dict[int, list[int]] = {}
+    res_readers: dict[int, list[int]] = {}
+    for pidx in range(n):
+        for rid in writes[pidx]:
+            res_writers.setdefault(rid, []).append(pidx)
+        for rid in reads[pidx]:
+            res_readers.setdefault(rid, []).append(pidx)
+    return writes, reads, res_writers, res_readers
 
 
 # ---------------------------------------------------------------------------
 # Unused render targets
 # ---------------------------------------------------------------------------
 
-_DEPTH_STENCIL_USAGE: int = 33  # DepthStencilTarget
-
 
 def find_unused_targets(
     passes: list[dict[str, Any]],
-    usage_data: dict[int, list[Any]],
+    usage_data: Mapping[int, Sequence[Any]],
     res_names: dict[int, str],
     swapchain_ids: set[int],
+    *,
+    index: PassIndex | None = None,
 ) -> dict[str, Any]:
     """Detect render targets written but never consumed by visible output.
 
@@ -974,6 +1162,7 @@ def find_unused_targets(
         usage_data: Resource ID -> EventUsage list.
         res_names: Resource ID -> human-readable name.
         swapchain_ids: Resource IDs identified as swapchain images.
+        index: Prebuilt ``PassIndex`` over *passes*; built on demand if None.
 
     Returns:
         Dict with ``unused`` list and ``waves`` count.
@@ -981,38 +1170,13 @@ def find_unused_targets(
     if not passes or not usage_data:
         return {"unused": [], "waves": 0}
 
-    n = len(passes)
-    writes: list[set[int]] = [set() for _ in range(n)]
-    reads: list[set[int]] = [set() for _ in range(n)]
+    if index is None:
+        index = PassIndex(passes)
     depth_resources: set[int] = set()
-
     out_of_pass_reads: set[int] = set()
-
-    for rid, events in usage_data.items():
-        if rid == 0:
-            continue
-        for ev in events:
-            eid = ev.eventId
-            usage_val = int(ev.usage)
-            pidx = _bucket_eid(eid, passes)
-            if pidx < 0:
-                if usage_val in _READ_USAGES:
-                    out_of_pass_reads.add(rid)
-                continue
-            if usage_val in _WRITE_USAGES:
-                writes[pidx].add(rid)
-                if usage_val == _DEPTH_STENCIL_USAGE:
-                    depth_resources.add(rid)
-            elif usage_val in _READ_USAGES:
-                reads[pidx].add(rid)
-
-    res_writers: dict[int, list[int]] = {}
-    res_readers: dict[int, list[int]] = {}
-    for pidx in range(n):
-        for rid in writes[pidx]:
-            res_writers.setdefault(rid, []).append(pidx)
-        for rid in reads[pidx]:
-            res_readers.setdefault(rid, []).append(pidx)
+    writes, reads, res_writers, res_readers = _bucket_usage(
+        index, usage_data, out_of_pass_reads, depth_resources
+    )
 
     all_written: set[int] = set()
     for ws in writes:
@@ -1022,15 +1186,17 @@ def find_unused_targets(
     live: set[int] = swapchain_ids | depth_resources | (out_of_pass_reads & all_written)
 
     # Reverse-walk: if a pass writes a live resource, its read inputs are live
-    changed = True
-    while changed:
-        changed = False
-        for pidx in range(n):
-            if writes[pidx] & live:
-                for rid in reads[pidx]:
-                    if rid not in live and rid in all_written:
-                        live.add(rid)
-                        changed = True
+    pending = list(live)
+    visited_passes: set[int] = set()
+    while pending:
+        for pidx in res_writers.get(pending.pop(), ()):
+            if pidx in visited_passes:
+                continue
+            visited_passes.add(pidx)
+            for rid in reads[pidx]:
+                if rid not in live and rid in all_written:
+                    live.add(rid)
+                    pending.append(rid)
 
     unused_rids = all_written - live
     if not unused_rids:
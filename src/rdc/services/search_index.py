@@ -0,0 +1,172 @@
+"""Token index over shader disassembly for ``rdc search``.
+
+A regex search used to run over every line of every disassembly on every
+call. :class:`DisasmIndex` splits each text into lines once and maps every
+lowercased ASCII word token to the shaders containing it. At query time the
+literal runs the pattern requires (see :func:`required_literals`) narrow the
+search to candidate shaders, and within a candidate to the lines containing
+the longest literal; only those lines are handed to the regex. Patterns
+without usable literals fall back to scanning every line, so results are
+always identical to a full scan.
+"""
+
+from __future__ import annotations
+
+import bisect
+import re
+from array import array
+from collections.abc import Callable, Iterator, Mapping
+from itertools import accumulate
+from typing import Any
+
+try:  # Python >= 3.11
+    import re._constants as _sre_c  # type: ignore[import-not-found,unused-ignore]
+    import re._parser as _sre_parse  # type: ignore[import-not-found,unused-ignore]
+except ImportError:  # pragma: no cover - Python 3.10
+    import sre_constants as _sre_c
+    import sre_parse as _sre_parse
+
+_TOKEN_RE = re.compile(r"[a-z0-9_]+")
+_MIN_FRAGMENT = 3
+
+
+def required_literals(compiled: re.Pattern[str]) -> list[str]:
+    """Return literal substrings every match of *compiled* must contain.
+
+    Only runs of plain characters in the top-level sequence (and in plain
+    capture groups) count; anything optional, repeated or alternated ends a
+    run. Literals are lowercased when the pattern ignores case. Literals that
+    are not ASCII, or that contain a line break, are dropped so a prefilter
+    built on them never rejects a real match.
+    """
+    try:
+        parsed = _sre_parse.parse(compiled.pattern, compiled.flags)
+    except re.error:
+        return []
+    runs: list[str] = []
+    current: list[str] = []
+
+    def _flush() -> None:
+        if current:
+            runs.append("".join(current))
+            current.clear()
+
+    def _walk(items: Any) -> None:
+        for op, av in items:
+            if op == _sre_c.LITERAL:
+                current.append(chr(av))
+            elif op == _sre_c.AT:
+                continue
+            elif op == _sre_c.SUBPATTERN and not av[1] and not av[2]:
+                _walk(av[3])
+            else:
+                _flush()
+
+    _walk(parsed)
+    _flush()
+    ignore_case = bool(compiled.flags & re.IGNORECASE)
+    result = []
+    for run in runs:
+        if not run.isascii() or len(run.splitlines()) != 1 or run.splitlines()[0] != run:
+            continue
+        result.append(run.lower() if ignore_case else run)
+    return result
+
+
+class DisasmIndex:
+    """Pre-split lines plus a token -> shaders inverted index.
+
+    Shaders are kept in ``disasm`` order so results come out in the same
+    order as a full scan.
+    """
+
+    def __init__(self, disasm: Mapping[int, str], source: Any = None) -> None:
+        self.source = source
+        self.sids: list[int] = list(disasm)
+        self._texts: list[str] = [disasm[sid] for sid in self.sids]
+        self.lines: list[list[str]] = []
+        self._line_starts: list[array[int]] = []
+        self._unindexed: set[int] = set()
+        postings: dict[str, array[int]] = {}
+        for pos, text in enumerate(self._texts):
+            self.lines.append(text.splitlines())
+            starts: array[int] = array("q", [0])
+            starts.extend(accumulate(map(len, text.splitlines(keepends=True))))
+            self._line_starts.append(starts)
+            if not text.isascii():
+                self._unindexed.add(pos)
+                continue
+            for tok in set(_TOKEN_RE.findall(text.lower())):
+                postings.setdefault(tok, array("I")).append(pos)
+        self._postings = postings
+        self._vocab = list(postings)
+
+    def is_current(self, disasm: Mapping[int, str]) -> bool:
+        """True if *disasm* still holds exactly the texts this index was built from."""
+        return len(disasm) == len(self.sids) and all(
+            disasm.get(sid) is text for sid, text in zip(self.sids, self._texts, strict=True)
+        )
+
+    def _token_candidates(self, literal: str) -> set[int] | None:
+        """Shader positions whose tokens can contain *literal* (None: no constraint)."""
+        folded = literal.lower()
+        spans = [(m.start(), m.end(), m.group()) for m in _TOKEN_RE.finditer(folded)]
+        found: set[int] | None = None
+        for start, end, tok in spans:
+            if start > 0 and end < len(folded):
+                hits = set(self._postings.get(tok, ()))
+            elif len(tok) >= _MIN_FRAGMENT:
+                # Edge runs may extend into the surrounding text.
+                hits = set()
+                for word in self._vocab:
+                    if tok in word:
+                        hits.update(self._postings[word])
+            else:
+                continue
+            found = hits if found is None else found & hits
+            if not found:
+                return found
+        return found
+
+    def candidates(
+        self,
+        compiled: re.Pattern[str],
+        keep: Callable[[int], bool] | None = None,
+    ) -> Iterator[tuple[int, list[str], Any]]:
+        """Yield ``(sid, lines, line_numbers)`` worth running *compiled* on.
+
+        ``line_numbers`` is a sorted list of 0-based line indexes, or a
+        ``range`` over every line when the pattern offers no literal.
+        Shaders for which *keep* returns False are skipped.
+        """
+        literals = required_literals(compiled)
+        allowed: set[int] | None = None
+        for literal in literals:
+            hits = self._token_candidates(literal)
+            if hits is not None:
+                allowed = hits if allowed is None else allowed & hits
+        needle = max(literals, key=len, default="")
+        ignore_case = bool(compiled.flags & re.IGNORECASE)
+        for pos, sid in enumerate(self.sids):
+            if keep is not None and not keep(sid):
+                continue
+            lines = self.lines[pos]
+            if not needle or pos in self._unindexed:
+                yield sid, lines, range(len(lines))
+                continue
+            if allowed is not None and pos not in allowed:
+                continue
+            text = self._texts[pos]
+            if ignore_case:
+                text = text.lower()
+            found = text.find(needle)
+            if found < 0:
+                continue
+            starts = self._line_starts[pos]
+            linenos: list[int] = []
+            while found >= 0:
+                lineno = bisect.bisect_right(starts, found) - 1
+                linenos.append(lineno)
+                # Resume at the next line: one hit per line is enough.
+                found = text.find(needle, starts[lineno + 1])
+            yield sid, lines, linenos
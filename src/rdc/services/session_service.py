@@ -278,6 +278,8 @@ def status_session() -> tuple[bool, dict[str, Any] | str]:
     daemon_result = resp.get("result", {})
     if "remote" in daemon_result:
         result["remote"] = daemon_result["remote"]
+    if "warm" in daemon_result:
+        result["warm"] = daemon_result["warm"]
     return True, result
 
 
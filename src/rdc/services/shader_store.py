@@ -0,0 +1,158 @@
+"""On-disk store for the shader cache built by ``_build_shader_cache``.
+
+Building the shader cache seeks to every draw and disassembles every unique
+shader, which can take minutes on a large capture. The result only depends
+on the capture contents, the RenderDoc build and the disassembly target, so
+it is saved under ``<data dir>/shader-cache`` keyed by a hash of those three
+and loaded back the next time the same capture is opened. The directory is
+kept under a byte budget by evicting the least recently used entries.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from rdc import _platform
+
+_log = logging.getLogger(__name__)
+
+_FORMAT = 1
+_SUFFIX = ".json.gz"
+_HASH_CHUNK = 1 << 20
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+class ShaderCacheData(NamedTuple):
+    """The three shader-cache maps held on ``DaemonState``."""
+
+    disasm: dict[int, str]
+    meta: dict[int, dict[str, Any]]
+    pipe_states: dict[int, dict[int, int]]
+
+
+def cache_dir() -> Path:
+    """Return the directory holding persisted shader caches."""
+    return _platform.data_dir() / "shader-cache"
+
+
+def max_cache_bytes() -> int:
+    """Return the store's byte budget; ``RDC_SHADER_CACHE_MB`` overrides it.
+
+    A budget of 0 disables the store.
+    """
+    raw = os.environ.get("RDC_SHADER_CACHE_MB")
+    if raw:
+        try:
+            return max(int(raw), 0) * 1024 * 1024
+        except ValueError:
+            _log.warning("ignoring invalid RDC_SHADER_CACHE_MB=%r", raw)
+    return DEFAULT_MAX_BYTES
+
+
+def capture_key(capture: str | Path, version: str, target: str) -> str | None:
+    """Hash the capture file together with the RenderDoc version and target.
+
+    Returns None when the capture cannot be read.
+    """
+    h = hashlib.sha256()
+    try:
+        with open(capture, "rb") as f:
+            while chunk := f.read(_HASH_CHUNK):
+                h.update(chunk)
+    except OSError:
+        return None
+    h.update(b"\0" + version.encode("utf-8") + b"\0" + target.encode("utf-8"))
+    return h.hexdigest()
+
+
+def _entry_path(key: str) -> Path:
+    return cache_dir() / f"{key}{_SUFFIX}"
+
+
+def load(key: str) -> ShaderCacheData | None:
+    """Return the stored cache for *key*, or None on a miss or a bad entry."""
+    path = _entry_path(key)
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            raw = json.load(f)
+        if raw.get("format") != _FORMAT:
+            return None
+        data = ShaderCacheData(
+            disasm={int(k): v for k, v in raw["disasm"].items()},
+            meta={int(k): v for k, v in raw["meta"].items()},
+            pipe_states={
+                int(eid): {int(s): sid for s, sid in stages.items()}
+                for eid, stages in raw["pipe_states"].items()
+            },
+        )
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, AttributeError, EOFError) as exc:
+        _log.warning("discarding unreadable shader cache %s: %s", path.name, exc)
+        path.unlink(missing_ok=True)
+        return None
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return data
+
+
+def store(key: str, data: ShaderCacheData, max_bytes: int | None = None) -> bool:
+    """Write *data* under *key*, then evict old entries over the budget.
+
+    Returns True when the entry was written.
+    """
+    budget = max_cache_bytes() if max_bytes is None else max_bytes
+    if budget <= 0:
+        return False
+    path = _entry_path(key)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    payload = {
+        "format": _FORMAT,
+        "disasm": data.disasm,
+        "meta": data.meta,
+        "pipe_states": data.pipe_states,
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(tmp, "wt", encoding="utf-8") as f:
+            json.dump(payload, f, separators=(",", ":"))
+        os.replace(tmp, path)
+    except OSError as exc:
+        _log.warning("could not persist shader cache: %s", exc)
+        tmp.unlink(missing_ok=True)
+        return False
+    evict(budget, keep=path)
+    return path.exists()
+
+
+def evict(max_bytes: int, keep: Path | None = None) -> int:
+    """Delete least recently used entries until the store fits *max_bytes*.
+
+    *keep* is removed only if it alone exceeds the budget. Returns the
+    number of entries deleted.
+    """
+    entries: list[tuple[float, int, Path]] = []
+    for path in cache_dir().glob(f"*{_SUFFIX}"):
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        entries.append((st.st_mtime, st.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    entries.sort(key=lambda e: (e[2] == keep, e[0]))
+    removed = 0
+    for _, size, path in entries:
+        if total <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+        removed += 1
+    return removed
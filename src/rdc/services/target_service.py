@@ -0,0 +1,70 @@
+"""Per-event output-target table.
+
+Which colour and depth targets are bound at an event only changes with the
+replay, yet ``stats``, ``pass``/``pass_attachment`` and ``draws`` each used to
+seek the replay and read ``GetPipelineState()`` to learn it. The table below
+records the answer once per event; it is also filled as a side effect of any
+walk that already has the pipeline state in hand (shader cache build, VFS
+draw population).
+"""
+
+from __future__ import annotations
+
+from typing import Any, NamedTuple
+
+
+class OutputTargets(NamedTuple):
+    """Targets bound at one event.
+
+    ``colors`` holds one resource ID per colour slot (0 where unbound);
+    ``width``/``height`` are those of the first bound colour target, or 0.
+    """
+
+    colors: tuple[int, ...]
+    depth: int
+    width: int = 0
+    height: int = 0
+
+    @property
+    def bound_colors(self) -> list[int]:
+        return [rid for rid in self.colors if rid != 0]
+
+    @property
+    def attachments(self) -> int:
+        """Bound colour targets plus the depth target, if any."""
+        return len(self.bound_colors) + (1 if self.depth else 0)
+
+
+def read_output_targets(pipe: Any, tex_map: dict[int, Any]) -> OutputTargets:
+    """Read the bound targets from a pipeline state."""
+    colors = tuple(int(t.resource) for t in pipe.GetOutputTargets())
+    depth = int(pipe.GetDepthTarget().resource)
+    width = height = 0
+    first = next((rid for rid in colors if rid != 0), 0)
+    tex = tex_map.get(first) if first else None
+    if tex is not None:
+        width, height = int(tex.width), int(tex.height)
+    return OutputTargets(colors, depth, width, height)
+
+
+class TargetTable:
+    """``eid -> OutputTargets`` for one replay."""
+
+    def __init__(self, source: Any = None) -> None:
+        self.source = source
+        self._by_eid: dict[int, OutputTargets] = {}
+
+    def __len__(self) -> int:
+        return len(self._by_eid)
+
+    def __contains__(self, eid: object) -> bool:
+        return eid in self._by_eid
+
+    def get(self, eid: int) -> OutputTargets | None:
+        return self._by_eid.get(eid)
+
+    def record(self, eid: int, pipe: Any, tex_map: dict[int, Any]) -> OutputTargets:
+        """Read and store the targets of *pipe*, the pipeline state at *eid*."""
+        targets = read_output_targets(pipe, tex_map)
+        self._by_eid[eid] = targets
+        return targets
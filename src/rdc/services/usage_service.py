@@ -0,0 +1,126 @@
+"""Resource usage table: ``GetUsage`` results captured once per replay.
+
+``ReplayController.GetUsage`` is a replay round trip per resource. The
+table below stores every resource's usage as two compact parallel arrays
+(EIDs ascending, usage enum values) so usage, usage_all, pass_deps and
+unused_targets can all be answered without touching the replay again.
+"""
+
+from __future__ import annotations
+
+import bisect
+from array import array
+from collections.abc import Callable, Iterator, Mapping
+from typing import Any, NamedTuple
+
+
+class UsageEvent(NamedTuple):
+    """One (eid, usage) entry; field names match renderdoc's ``EventUsage``."""
+
+    eventId: int  # noqa: N815
+    usage: int
+
+
+class UsageTable(Mapping[int, list[UsageEvent]]):
+    """Per-resource usage arrays, filled from ``GetUsage`` once.
+
+    The table is created with the resource IDs to cover and filled either in
+    one go or a slice at a time (see :meth:`fill`), so the daemon can build it
+    during idle time after open. Lookups are only meaningful once
+    :attr:`complete` is True. As a mapping it yields :class:`UsageEvent`
+    lists, which is the shape ``build_pass_deps`` and ``find_unused_targets``
+    consume.
+    """
+
+    def __init__(self, rid_map: dict[int, Any], source: Any = None) -> None:
+        self.source = source
+        self._rid_map = rid_map
+        self._pending: list[int] = sorted(rid_map, reverse=True)
+        self._eids: dict[int, array[int]] = {}
+        self._usages: dict[int, array[int]] = {}
+        self.usage_names: dict[int, Any] = {}
+
+    @property
+    def complete(self) -> bool:
+        return not self._pending
+
+    @property
+    def progress(self) -> tuple[int, int]:
+        """Return (resources filled, resources total)."""
+        total = len(self._rid_map)
+        return total - len(self._pending), total
+
+    def fill(self, get_usage: Callable[[Any], Any], limit: int | None = None) -> bool:
+        """Fetch usage for up to *limit* pending resources (all if None).
+
+        Args:
+            get_usage: ``controller.GetUsage``.
+            limit: Maximum number of resources to fetch in this call.
+
+        Returns:
+            True once every resource has been fetched.
+        """
+        n = len(self._pending) if limit is None else min(limit, len(self._pending))
+        for _ in range(n):
+            rid = self._pending.pop()
+            self._add(rid, get_usage(self._rid_map[rid].resourceId))
+        return self.complete
+
+    def ensure(self, rid: int, get_usage: Callable[[Any], Any]) -> None:
+        """Fetch usage for *rid* now if it is still pending."""
+        if rid in self._eids or rid not in self._rid_map:
+            return
+        self._pending.remove(rid)
+        self._add(rid, get_usage(self._rid_map[rid].resourceId))
+
+    def _add(self, rid: int, usage_list: Any) -> None:
+        pairs = sorted(((int(u.eventId), u.usage) for u in usage_list), key=lambda p: p[0])
+        eids: array[int] = array("q")
+        usages: array[int] = array("H")
+        for eid, usage in pairs:
+            value = int(usage)
+            eids.append(eid)
+            usages.append(value)
+            if value not in self.usage_names:
+                self.usage_names[value] = getattr(usage, "name", value)
+        self._eids[rid] = eids
+        self._usages[rid] = usages
+
+    def __getitem__(self, rid: int) -> list[UsageEvent]:
+        if rid not in self._eids:
+            raise KeyError(rid)
+        return [UsageEvent(e, u) for e, u in zip(self._eids[rid], self._usages[rid], strict=True)]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(sorted(self._eids))
+
+    def __len__(self) -> int:
+        return len(self._eids)
+
+    def kinds_named(self, name: Any) -> set[int]:
+        """Return the usage values whose display name equals *name*."""
+        return {value for value, n in self.usage_names.items() if n == name}
+
+    def query(
+        self,
+        rid: int,
+        *,
+        eid_min: int | None = None,
+        eid_max: int | None = None,
+        kinds: set[int] | None = None,
+    ) -> list[tuple[int, int]]:
+        """Return ``(eid, usage)`` pairs for *rid*, in EID order.
+
+        Args:
+            rid: Resource ID.
+            eid_min: Inclusive lower EID bound.
+            eid_max: Inclusive upper EID bound.
+            kinds: Usage values to keep; all when None.
+        """
+        eids = self._eids.get(rid)
+        if eids is None:
+            return []
+        usages = self._usages[rid]
+        lo = 0 if eid_min is None else bisect.bisect_left(eids, eid_min)
+        hi = len(eids) if eid_max is None else bisect.bisect_right(eids, eid_max)
+        return [(eids[i], usages[i]) for i in range(lo, hi) if kinds is None or usages[i] in kinds]
@@ -1,12 +1,15 @@
 """VFS tree cache for rdc-cli.
 
-Builds a static virtual filesystem skeleton from capture data and lazily
-populates per-draw subtrees (shader stages, bindings) on first access.
+Builds the virtual filesystem skeleton from capture data, resolving its
+nodes on demand, and lazily populates per-draw subtrees (shader stages,
+bindings) on first access.
 """
 
 from __future__ import annotations
 
+import bisect
 from collections import OrderedDict
+from collections.abc import Callable, Iterator, MutableMapping
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -76,15 +79,75 @@ class VfsNode:
     children: list[str] = field(default_factory=list)
 
 
+class VfsNodeMap(MutableMapping[str, VfsNode]):
+    """Path -> node mapping that materializes skeleton nodes on first lookup.
+
+    Explicitly assigned nodes (draw subtrees, shaders, attachments) are
+    stored as-is. Any other path is handed to *resolve*; directory nodes it
+    returns are kept so later mutations of ``children`` stick, leaves are
+    rebuilt per lookup. Iteration and ``len`` cover stored nodes only.
+    """
+
+    def __init__(self, resolve: Callable[[str], VfsNode | None]) -> None:
+        self._nodes: dict[str, VfsNode] = {}
+        self._resolve = resolve
+
+    def __getitem__(self, path: str) -> VfsNode:
+        node = self._nodes.get(path)
+        if node is None:
+            node = self._resolve(path)
+            if node is None:
+                raise KeyError(path)
+            if node.kind == "dir":
+                self._nodes[path] = node
+        return node
+
+    def __setitem__(self, path: str, node: VfsNode) -> None:
+        self._nodes[path] = node
+
+    def __delitem__(self, path: str) -> None:
+        del self._nodes[path]
+
+    def pop(self, path: str, *default: Any) -> Any:
+        return self._nodes.pop(path, *default)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._nodes)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+
 @dataclass
 class VfsTree:
-    """Virtual filesystem tree with LRU-cached draw subtrees."""
+    """Virtual filesystem tree with LRU-cached draw subtrees.
 
-    static: dict[str, VfsNode] = field(default_factory=dict)
+    The skeleton is not materialized up front: ``static`` resolves paths on
+    demand from the eid/resource tables below.
+    """
+
+    static: MutableMapping[str, VfsNode] = field(default_factory=dict)
     pass_name_map: dict[str, str] = field(default_factory=dict)
     pass_list: list[dict[str, Any]] = field(default_factory=list)
     _draw_subtrees: OrderedDict[int, dict[str, list[str]]] = field(default_factory=OrderedDict)
     _lru_capacity: int = 64
+    _event_eids: list[int] = field(default_factory=list, repr=False)
+    _event_set: set[int] = field(default_factory=set, repr=False)
+    _draw_eids: list[int] = field(default_factory=list, repr=False)
+    _draw_pos: dict[int, int] = field(default_factory=dict, repr=False)
+    _draw_sorted: list[int] = field(default_factory=list, repr=False)
+    _pass_names: list[str] = field(default_factory=list, repr=False)
+    _pass_by_name: dict[str, dict[str, Any]] = field(default_factory=dict, repr=False)
+    _resource_ids: list[str] = field(default_factory=list, repr=False)
+    _resource_set: set[str] = field(default_factory=set, repr=False)
+    _textures: dict[str, Any] = field(default_factory=dict, repr=False)
+    _buffer_ids: list[str] = field(default_factory=list, repr=False)
+    _buffer_set: set[str] = field(default_factory=set, repr=False)
+
+    def __post_init__(self) -> None:
+        nodes = VfsNodeMap(self._resolve)
+        nodes.update(self.static)
+        self.static = nodes
 
     def get_draw_subtree(self, eid: int) -> dict[str, list[str]] | None:
         """Return cached draw subtree or None, promoting on access."""
@@ -116,6 +179,180 @@ class VfsTree:
             self._evict_draw_subtree(oldest_eid)
         self._draw_subtrees[eid] = subtree
 
+    def pass_draw_eids(self, pass_info: dict[str, Any]) -> list[int]:
+        """Return draw/dispatch EIDs inside a pass's range, in event order."""
+        lo = bisect.bisect_left(self._draw_sorted, pass_info.get("begin_eid", 0))
+        hi = bisect.bisect_right(self._draw_sorted, pass_info.get("end_eid", 0))
+        return sorted(self._draw_sorted[lo:hi], key=self._draw_pos.__getitem__)
+
+    def _resolve(self, path: str) -> VfsNode | None:
+        """Build the skeleton node for *path*, or None if it does not exist."""
+        if path == "/":
+            return VfsNode("/", "dir", list(_ROOT_CHILDREN))
+        parts = path[1:].split("/") if path.startswith("/") else []
+        if not parts or parts[0] not in _ROOT_CHILDREN:
+            return None
+        resolver = _RESOLVERS.get(parts[0])
+        return resolver(self, parts) if resolver is not None else None
+
+    def _resolve_leaf(self, parts: list[str]) -> VfsNode | None:
+        return VfsNode(parts[0], "leaf") if len(parts) == 1 else None
+
+    def _resolve_events(self, parts: list[str]) -> VfsNode | None:
+        if len(parts) == 1:
+            return VfsNode("events", "dir", [str(e) for e in self._event_eids])
+        if len(parts) == 2 and parts[1].isdigit() and int(parts[1]) in self._event_set:
+            return VfsNode(parts[1], "leaf")
+        return None
+
+    def _resolve_draws(self, parts: list[str]) -> VfsNode | None:
+        if len(parts) == 1:
+            return VfsNode("draws", "dir", [str(e) for e in self._draw_eids])
+        if not parts[1].isdigit() or int(parts[1]) not in self._draw_pos:
+            return None
+        if len(parts) == 2:
+            return VfsNode(parts[1], "dir", list(_DRAW_CHILDREN))
+        child = parts[2]
+        if len(parts) == 3:
+            if child == "pipeline":
+                return VfsNode("pipeline", "dir", list(_PIPELINE_CHILDREN))
+            if child in _DRAW_DIR_CHILDREN:
+                return VfsNode(child, "dir")
+            if child in _DRAW_CHILDREN:
+                return VfsNode(child, "leaf")
+            return None
+        if len(parts) == 4 and child == "pipeline" and parts[3] in _PIPELINE_CHILDREN:
+            return VfsNode(parts[3], "leaf")
+        return None
+
+    def _resolve_passes(self, parts: list[str]) -> VfsNode | None:
+        if len(parts) == 1:
+            return VfsNode("passes", "dir", list(self._pass_names))
+        pass_info = self._pass_by_name.get(parts[1])
+        if pass_info is None:
+            return None
+        if len(parts) == 2:
+            return VfsNode(parts[1], "dir", list(_PASS_CHILDREN))
+        child = parts[2]
+        if len(parts) == 3:
+            if child == "info":
+                return VfsNode("info", "leaf")
+            if child == "draws":
+                return VfsNode("draws", "dir", [str(e) for e in self.pass_draw_eids(pass_info)])
+            if child == "attachments":
+                return VfsNode("attachments", "dir")
+            return None
+        if len(parts) == 4 and child == "draws" and parts[3].isdigit():
+            eid = int(parts[3])
+            begin = pass_info.get("begin_eid", 0)
+            if begin <= eid <= pass_info.get("end_eid", 0) and eid in self._draw_pos:
+                return VfsNode(parts[3], "alias")
+        return None
+
+    def _resolve_resources(self, parts: list[str]) -> VfsNode | None:
+        if len(parts) == 1:
+            return VfsNode("resources", "dir", list(self._resource_ids))
+        if parts[1] not in self._resource_set:
+            return None
+        if len(parts) == 2:
+            return VfsNode(parts[1], "dir", ["info", "usage"])
+        if len(parts) == 3 and parts[2] in ("info", "usage"):
+            return VfsNode(parts[2], "leaf")
+        return None
+
+    def _resolve_textures(self, parts: list[str]) -> VfsNode | None:
+        if len(parts) == 1:
+            return VfsNode("textures", "dir", list(self._textures))
+        tex = self._textures.get(parts[1])
+        if tex is None:
+            return None
+        if len(parts) == 2:
+            return VfsNode(parts[1], "dir", ["info", "image.png", "mips", "data"])
+        child = parts[2]
+        if len(parts) == 3:
+            if child == "info":
+                return VfsNode("info", "leaf")
+            if child in ("image.png", "data"):
+                return VfsNode(child, "leaf_bin")
+            if child == "mips":
+                mip_count = getattr(tex, "mips", 1)
+                sliced = [str(i) for i in range(mip_count) if _slice_count(tex, i) > 1]
+                return VfsNode("mips", "dir", [f"{i}.png" for i in range(mip_count)] + sliced)
+            return None
+        if child != "mips":
+            return None
+        mip_name = parts[3]
+        mip_str = mip_name.removesuffix(".png")
+        if not mip_str.isdigit() or int(mip_str) >= getattr(tex, "mips", 1):
+            return None
+        mip = int(mip_str)
+        if len(parts) == 4:
+            if mip_name.endswith(".png"):
+                return VfsNode(mip_name, "leaf_bin")
+            return VfsNode(mip_name, "dir", ["slices"]) if _slice_count(tex, mip) > 1 else None
+        if mip_name.endswith(".png") or parts[4] != "slices" or _slice_count(tex, mip) <= 1:
+            return None
+        slice_count = _slice_count(tex, mip)
+        if len(parts) == 5:
+            return VfsNode("slices", "dir", [f"{j}.png" for j in range(1, slice_count)])
+        if len(parts) == 6 and parts[5].endswith(".png"):
+            j = parts[5].removesuffix(".png")
+            if j.isdigit() and 1 <= int(j) < slice_count:
+                return VfsNode(parts[5], "leaf_bin")
+        return None
+
+    def _resolve_buffers(self, parts: list[str]) -> VfsNode | None:
+        if len(parts) == 1:
+            return VfsNode("buffers", "dir", list(self._buffer_ids))
+        if parts[1] not in self._buffer_set:
+            return None
+        if len(parts) == 2:
+            return VfsNode(parts[1], "dir", ["info", "data"])
+        if len(parts) == 3 and parts[2] == "info":
+            return VfsNode("info", "leaf")
+        if len(parts) == 3 and parts[2] == "data":
+            return VfsNode("data", "leaf_bin")
+        return None
+
+    def _resolve_shaders(self, parts: list[str]) -> VfsNode | None:
+        return VfsNode("shaders", "dir") if len(parts) == 1 else None
+
+    def _resolve_counters(self, parts: list[str]) -> VfsNode | None:
+        if len(parts) == 1:
+            return VfsNode("counters", "dir", ["list"])
+        if len(parts) == 2 and parts[1] == "list":
+            return VfsNode("list", "leaf")
+        return None
+
+    def _resolve_current(self, parts: list[str]) -> VfsNode | None:
+        return VfsNode("current", "alias") if len(parts) == 1 else None
+
+
+_DRAW_DIR_CHILDREN = frozenset({"shader", "bindings", "targets", "cbuffer", "pixel"})
+
+_RESOLVERS: dict[str, Callable[[VfsTree, list[str]], VfsNode | None]] = {
+    "capabilities": VfsTree._resolve_leaf,
+    "info": VfsTree._resolve_leaf,
+    "stats": VfsTree._resolve_leaf,
+    "log": VfsTree._resolve_leaf,
+    "events": VfsTree._resolve_events,
+    "draws": VfsTree._resolve_draws,
+    "passes": VfsTree._resolve_passes,
+    "resources": VfsTree._resolve_resources,
+    "textures": VfsTree._resolve_textures,
+    "buffers": VfsTree._resolve_buffers,
+    "shaders": VfsTree._resolve_shaders,
+    "counters": VfsTree._resolve_counters,
+    "current": VfsTree._resolve_current,
+}
+
+
+def _slice_count(tex: Any, mip: int) -> int:
+    """Number of slices at *mip*: depth for 3D textures, else array size."""
+    if getattr(getattr(tex, "type", None), "name", "") == "Texture3D":
+        return int(max(1, getattr(tex, "depth", 1) >> mip))
+    return int(getattr(tex, "arraysize", 1))
+
 
 def build_vfs_skeleton(
     actions: list[Any],
@@ -123,8 +360,14 @@ def build_vfs_skeleton(
     textures: list[Any] | None = None,
     buffers: list[Any] | None = None,
     sf: Any = None,
+    *,
+    pass_list: list[dict[str, Any]] | None = None,
+    flat: list[Any] | None = None,
 ) -> VfsTree:
-    """Build the static VFS skeleton from capture data.
+    """Build the VFS skeleton tables from capture data.
+
+    Only the eid, pass and resource tables are built here; nodes are
+    resolved on demand through ``tree.static``.
 
     Args:
         actions: Root action list from ReplayController.
@@ -132,130 +375,37 @@ def build_vfs_skeleton(
         textures: TextureDescription list from GetTextures().
         buffers: BufferDescription list from GetBuffers().
         sf: Optional StructuredFile for action name resolution.
+        pass_list: Precomputed pass list (the daemon passes its merged,
+            cached list); defaults to the explicit BeginPass/EndPass passes.
+        flat: Precomputed ``walk_actions`` output; walked here if omitted.
     """
     tree = VfsTree()
-    flat = walk_actions(actions, sf)
+    if flat is None:
+        flat = walk_actions(actions, sf)
 
-    draw_eids = [str(a.eid) for a in flat if a.flags & (_DRAWCALL | _DISPATCH)]
-    event_eids = [str(a.eid) for a in flat]
-    pass_list = _build_pass_list(actions, sf)
+    tree._event_eids = [a.eid for a in flat]
+    tree._event_set = set(tree._event_eids)
+    tree._draw_eids = [a.eid for a in flat if a.flags & (_DRAWCALL | _DISPATCH)]
+    tree._draw_pos = {eid: i for i, eid in enumerate(tree._draw_eids)}
+    tree._draw_sorted = sorted(tree._draw_pos)
+
+    if pass_list is None:
+        pass_list = _build_pass_list(actions, sf)
     tree.pass_list = pass_list
-    pass_names = [p["name"] for p in pass_list]
-    resource_ids = [str(int(getattr(r, "resourceId", 0))) for r in resources]
-
-    # Root
-    tree.static["/"] = VfsNode("/", "dir", list(_ROOT_CHILDREN))
-
-    # Top-level leaves
-    for leaf in ("capabilities", "info", "stats", "log"):
-        tree.static[f"/{leaf}"] = VfsNode(leaf, "leaf")
-
-    # /events
-    tree.static["/events"] = VfsNode("events", "dir", list(event_eids))
-    for eid in event_eids:
-        tree.static[f"/events/{eid}"] = VfsNode(eid, "leaf")
-
-    # /draws
-    tree.static["/draws"] = VfsNode("draws", "dir", list(draw_eids))
-    for eid in draw_eids:
-        prefix = f"/draws/{eid}"
-        tree.static[prefix] = VfsNode(eid, "dir", list(_DRAW_CHILDREN))
-        tree.static[f"{prefix}/pipeline"] = VfsNode("pipeline", "dir", list(_PIPELINE_CHILDREN))
-        for child in _PIPELINE_CHILDREN:
-            tree.static[f"{prefix}/pipeline/{child}"] = VfsNode(child, "leaf")
-        tree.static[f"{prefix}/shader"] = VfsNode("shader", "dir")
-        tree.static[f"{prefix}/bindings"] = VfsNode("bindings", "dir")
-        tree.static[f"{prefix}/targets"] = VfsNode("targets", "dir")
-        tree.static[f"{prefix}/postvs"] = VfsNode("postvs", "leaf")
-        tree.static[f"{prefix}/cbuffer"] = VfsNode("cbuffer", "dir")
-        tree.static[f"{prefix}/vbuffer"] = VfsNode("vbuffer", "leaf")
-        tree.static[f"{prefix}/ibuffer"] = VfsNode("ibuffer", "leaf")
-        tree.static[f"{prefix}/descriptors"] = VfsNode("descriptors", "leaf")
-        tree.static[f"{prefix}/pixel"] = VfsNode("pixel", "dir")
-
-    # /passes — sanitize names containing "/" to avoid path corruption
-    safe_pass_names = [n.replace("/", "_") for n in pass_names]
-    for safe, orig in zip(safe_pass_names, pass_names, strict=True):
+    # sanitize names containing "/" to avoid path corruption
+    for p in pass_list:
+        orig = p["name"]
+        safe = orig.replace("/", "_")
         if safe != orig:
             tree.pass_name_map[safe] = orig
-    tree.static["/passes"] = VfsNode("passes", "dir", list(safe_pass_names))
-    for p, name in zip(pass_list, safe_pass_names, strict=True):
-        prefix = f"/passes/{name}"
-        tree.static[prefix] = VfsNode(name, "dir", list(_PASS_CHILDREN))
-        tree.static[f"{prefix}/info"] = VfsNode("info", "leaf")
-        begin_eid = p.get("begin_eid", 0)
-        end_eid = p.get("end_eid", 0)
-        pass_draw_eids = [
-            str(a.eid)
-            for a in flat
-            if begin_eid <= a.eid <= end_eid and bool(a.flags & (_DRAWCALL | _DISPATCH))
-        ]
-        tree.static[f"{prefix}/draws"] = VfsNode("draws", "dir", list(pass_draw_eids))
-        for deid in pass_draw_eids:
-            tree.static[f"{prefix}/draws/{deid}"] = VfsNode(deid, "alias")
-        tree.static[f"{prefix}/attachments"] = VfsNode("attachments", "dir")
-
-    # /resources
-    tree.static["/resources"] = VfsNode("resources", "dir", list(resource_ids))
-    for rid in resource_ids:
-        tree.static[f"/resources/{rid}"] = VfsNode(rid, "dir", ["info", "usage"])
-        tree.static[f"/resources/{rid}/info"] = VfsNode("info", "leaf")
-        tree.static[f"/resources/{rid}/usage"] = VfsNode("usage", "leaf")
-
-    _textures = textures or []
-    _buffers = buffers or []
-
-    # /textures
-    tex_ids = [str(int(getattr(t, "resourceId", 0))) for t in _textures]
-    tree.static["/textures"] = VfsNode("textures", "dir", list(tex_ids))
-    for t in _textures:
-        rid = str(int(getattr(t, "resourceId", 0)))
-        prefix = f"/textures/{rid}"
-        tex_children = ["info", "image.png", "mips", "data"]
-        tree.static[prefix] = VfsNode(rid, "dir", list(tex_children))
-        tree.static[f"{prefix}/info"] = VfsNode("info", "leaf")
-        tree.static[f"{prefix}/image.png"] = VfsNode("image.png", "leaf_bin")
-        tree.static[f"{prefix}/data"] = VfsNode("data", "leaf_bin")
-        mip_count = getattr(t, "mips", 1)
-        mip_children = [f"{i}.png" for i in range(mip_count)]
-        tree.static[f"{prefix}/mips"] = VfsNode("mips", "dir", list(mip_children))
-        for i in range(mip_count):
-            tree.static[f"{prefix}/mips/{i}.png"] = VfsNode(f"{i}.png", "leaf_bin")
-            if getattr(getattr(t, "type", None), "name", "") == "Texture3D":
-                slice_count = max(1, getattr(t, "depth", 1) >> i)
-            else:
-                slice_count = getattr(t, "arraysize", 1)
-            if slice_count > 1:
-                mip_path = f"{prefix}/mips/{i}"
-                tree.static[f"{prefix}/mips"].children.append(str(i))
-                tree.static[mip_path] = VfsNode(str(i), "dir", ["slices"])
-                slices_path = f"{prefix}/mips/{i}/slices"
-                slice_children = [f"{j}.png" for j in range(1, slice_count)]
-                tree.static[slices_path] = VfsNode("slices", "dir", slice_children)
-                for j in range(1, slice_count):
-                    tree.static[f"{slices_path}/{j}.png"] = VfsNode(f"{j}.png", "leaf_bin")
-
-    # /buffers
-    buf_ids = [str(int(getattr(b, "resourceId", 0))) for b in _buffers]
-    tree.static["/buffers"] = VfsNode("buffers", "dir", list(buf_ids))
-    for b in _buffers:
-        rid = str(int(getattr(b, "resourceId", 0)))
-        prefix = f"/buffers/{rid}"
-        buf_children = ["info", "data"]
-        tree.static[prefix] = VfsNode(rid, "dir", list(buf_children))
-        tree.static[f"{prefix}/info"] = VfsNode("info", "leaf")
-        tree.static[f"{prefix}/data"] = VfsNode("data", "leaf_bin")
-
-    # Remaining placeholder dirs
-    tree.static["/shaders"] = VfsNode("shaders", "dir")
-
-    # /counters
-    tree.static["/counters"] = VfsNode("counters", "dir", ["list"])
-    tree.static["/counters/list"] = VfsNode("list", "leaf")
-
-    # /current alias
-    tree.static["/current"] = VfsNode("current", "alias")
-
+        tree._pass_names.append(safe)
+        tree._pass_by_name[safe] = p
+
+    tree._resource_ids = [str(int(getattr(r, "resourceId", 0))) for r in resources]
+    tree._resource_set = set(tree._resource_ids)
+    tree._textures = {str(int(getattr(t, "resourceId", 0))): t for t in textures or []}
+    tree._buffer_ids = [str(int(getattr(b, "resourceId", 0))) for b in buffers or []]
+    tree._buffer_set = set(tree._buffer_ids)
     return tree
 
 
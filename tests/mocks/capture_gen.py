@@ -0,0 +1,227 @@
+"""Parametric generator for large synthetic captures on the mock renderdoc module.
+
+``generate(spec)`` builds a ``MockReplayController`` holding an action tree of
+``passes`` render passes, each split into ``markers_per_pass`` debug-marker
+groups of ``draws_per_marker`` indexed draws, plus textures, buffers, usage
+lists and one shared vertex/index buffer pair. ``load_state(cap)`` wraps it in
+a ``DaemonState`` initialised the way the daemon does after ``OpenCapture``.
+
+Everything is deterministic for a given spec (``seed`` drives the random
+choices), so two runs see the same capture.
+"""
+
+from __future__ import annotations
+
+import random
+import struct
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING
+
+import mock_renderdoc as rd
+
+from rdc.adapter import RenderDocAdapter
+
+if TYPE_CHECKING:
+    from rdc.daemon_server import DaemonState
+
+_FIRST_RID = 1000
+
+
+@dataclass(frozen=True)
+class CaptureSpec:
+    """Size knobs for a synthetic capture."""
+
+    passes: int = 40
+    markers_per_pass: int = 5
+    draws_per_marker: int = 50
+    textures: int = 400
+    buffers: int = 400
+    usage_per_resource: int = 20
+    vertices: int = 30000
+    triangles: int = 10000
+    seed: int = 0
+
+    def scaled(self, factor: float) -> CaptureSpec:
+        """Return a copy with every count multiplied by *factor* (at least 1)."""
+
+        def _s(n: int) -> int:
+            return max(1, round(n * factor))
+
+        return replace(
+            self,
+            passes=_s(self.passes),
+            textures=_s(self.textures),
+            buffers=_s(self.buffers),
+            vertices=_s(self.vertices),
+            triangles=_s(self.triangles),
+        )
+
+    @property
+    def draw_count(self) -> int:
+        return self.passes * self.markers_per_pass * self.draws_per_marker
+
+
+@dataclass
+class SyntheticCapture:
+    """A generated capture: the controller plus handles into its contents."""
+
+    spec: CaptureSpec
+    controller: rd.MockReplayController
+    draw_eids: list[int] = field(default_factory=list)
+    texture_ids: list[int] = field(default_factory=list)
+    buffer_ids: list[int] = field(default_factory=list)
+    vertex_buffer: int = 0
+    index_buffer: int = 0
+    event_count: int = 0
+
+
+def generate(spec: CaptureSpec | None = None) -> SyntheticCapture:
+    """Build a synthetic capture for *spec* (defaults to ``CaptureSpec()``)."""
+    spec = spec or CaptureSpec()
+    rng = random.Random(spec.seed)
+    ctrl = rd.MockReplayController()
+    ctrl._api_props = rd.APIProperties(pipelineType="Vulkan")
+    cap = SyntheticCapture(spec=spec, controller=ctrl)
+
+    rid = _FIRST_RID
+    for i in range(spec.textures):
+        ctrl._resources.append(
+            rd.ResourceDescription(
+                resourceId=rd.ResourceId(rid), name=f"Texture {i}", type=rd.ResourceType.Texture
+            )
+        )
+        ctrl._textures.append(
+            rd.TextureDescription(
+                resourceId=rd.ResourceId(rid),
+                width=256 << (i % 4),
+                height=256 << (i % 4),
+                byteSize=(256 << (i % 4)) ** 2 * 4,
+                creationFlags=rd.TextureCategory.ShaderRead | rd.TextureCategory.ColorTarget,
+            )
+        )
+        cap.texture_ids.append(rid)
+        rid += 1
+    for i in range(spec.buffers + 2):
+        ctrl._resources.append(
+            rd.ResourceDescription(
+                resourceId=rd.ResourceId(rid), name=f"Buffer {i}", type=rd.ResourceType.Buffer
+            )
+        )
+        ctrl._buffers.append(rd.BufferDescription(resourceId=rd.ResourceId(rid), length=65536))
+        cap.buffer_ids.append(rid)
+        rid += 1
+    cap.index_buffer = cap.buffer_ids.pop()
+    cap.vertex_buffer = cap.buffer_ids.pop()
+
+    ctrl._actions = _action_tree(spec, cap, rng)
+    _fill_usage(spec, cap, rng)
+    _fill_mesh(spec, cap, rng)
+    return cap
+
+
+def _action_tree(
+    spec: CaptureSpec, cap: SyntheticCapture, rng: random.Random
+) -> list[rd.ActionDescription]:
+    roots: list[rd.ActionDescription] = []
+    eid = 1
+    targets = cap.texture_ids or [0]
+    for p in range(spec.passes):
+        rt = rd.ResourceId(targets[p % len(targets)])
+        begin = rd.ActionDescription(
+            eventId=eid,
+            flags=rd.ActionFlags.BeginPass | rd.ActionFlags.PassBoundary,
+            _name=f"vkCmdBeginRenderPass(C=Clear, D=Clear) #{p}",
+        )
+        eid += 1
+        for g in range(spec.markers_per_pass):
+            marker = rd.ActionDescription(
+                eventId=eid,
+                flags=rd.ActionFlags.PushMarker,
+                parent=begin,
+                _name=f"Pass {p} / Group {g}",
+            )
+            eid += 1
+            for _ in range(spec.draws_per_marker):
+                tris = rng.randint(1, 4096)
+                draw = rd.ActionDescription(
+                    eventId=eid,
+                    flags=rd.ActionFlags.Drawcall | rd.ActionFlags.Indexed,
+                    numIndices=tris * 3,
+                    numInstances=rng.choice((1, 1, 1, 4)),
+                    outputs=[rt] + [rd.ResourceId(0)] * 7,
+                    parent=marker,
+                    _name="vkCmdDrawIndexed",
+                )
+                marker.children.append(draw)
+                cap.draw_eids.append(eid)
+                eid += 1
+            begin.children.append(marker)
+        roots.append(begin)
+        roots.append(
+            rd.ActionDescription(
+                eventId=eid,
+                flags=rd.ActionFlags.EndPass | rd.ActionFlags.PassBoundary,
+                _name="vkCmdEndRenderPass()",
+            )
+        )
+        eid += 1
+    cap.event_count = eid - 1
+    return roots
+
+
+def _fill_usage(spec: CaptureSpec, cap: SyntheticCapture, rng: random.Random) -> None:
+    if not cap.draw_eids:
+        return
+    kinds = (
+        rd.ResourceUsage.VertexBuffer,
+        rd.ResourceUsage.IndexBuffer,
+        rd.ResourceUsage.VS_Constants,
+        rd.ResourceUsage.PS_Constants,
+    )
+    n = min(spec.usage_per_resource, len(cap.draw_eids))
+    usage_map = cap.controller._usage_map
+    for rid in cap.texture_ids + cap.buffer_ids:
+        eids = sorted(rng.sample(cap.draw_eids, n))
+        usage_map[rid] = [rd.EventUsage(eventId=e, usage=rng.choice(kinds)) for e in eids]
+
+
+def _fill_mesh(spec: CaptureSpec, cap: SyntheticCapture, rng: random.Random) -> None:
+    """One float4 position stream plus a uint32 triangle list, used by every draw."""
+    verts = b"".join(
+        struct.pack("<4f", rng.uniform(-1, 1), rng.uniform(-1, 1), rng.uniform(0, 1), 1.0)
+        for _ in range(spec.vertices)
+    )
+    n_idx = spec.triangles * 3
+    indices = struct.pack(f"<{n_idx}I", *(rng.randrange(spec.vertices) for _ in range(n_idx)))
+    ctrl = cap.controller
+    ctrl._buffer_data[cap.vertex_buffer] = verts
+    ctrl._buffer_data[cap.index_buffer] = indices
+    mesh = rd.MeshFormat(
+        vertexResourceId=rd.ResourceId(cap.vertex_buffer),
+        vertexByteStride=16,
+        vertexByteSize=len(verts),
+        format=rd.ResourceFormat(name="R32G32B32A32_FLOAT", compByteWidth=4, compCount=4),
+        indexResourceId=rd.ResourceId(cap.index_buffer),
+        indexByteStride=4,
+        indexByteSize=len(indices),
+        numIndices=spec.triangles * 3,
+        topology="TriangleList",
+    )
+    ctrl._mesh_data[int(rd.MeshDataStage.VSOut)] = mesh
+
+
+def load_state(cap: SyntheticCapture, *, token: str = "tok") -> DaemonState:
+    """Return a ``DaemonState`` with *cap* loaded as the open replay.
+
+    Runs the daemon's own post-``OpenCapture`` initialisation (action walk,
+    pass list, VFS skeleton), so this is also what the ``load`` benchmark
+    measures. The state's temp dir is removed at exit.
+    """
+    from rdc.daemon_server import DaemonState, _init_adapter_state
+
+    state = DaemonState(capture="synthetic.rdc", current_eid=0, token=token)
+    state.rd = rd
+    state.adapter = RenderDocAdapter(controller=cap.controller, version=(1, 41))
+    state.structured_file = state.adapter.get_structured_file()
+    _init_adapter_state(state)
+    return state
@@ -313,6 +313,59 @@ class TestTexRaw:
         assert "temp" in resp["error"]["message"]
 
 
+class TestRawBinary:
+    """tex_raw / buf_raw with ``binary: true`` stream bytes without a temp file."""
+
+    def test_tex_raw_binary(self, tmp_path):
+        state = _make_handler_state(tmp_path)
+        state.temp_dir = None
+        resp, _ = _handle_request(
+            rpc_request("tex_raw", {"id": 42, "binary": True}, token="abcdef1234567890"), state
+        )
+        r = resp["result"]
+        assert "path" not in r
+        assert bytes(r["_binary_data"]) == b"\x00\xff" * 512
+        assert r["_binary_size"] == r["size"] == r["total"] == 1024
+
+    def test_tex_raw_range(self, tmp_path):
+        state = _make_handler_state(tmp_path)
+        params = {"id": 42, "binary": True, "offset": 1, "length": 3}
+        resp, _ = _handle_request(rpc_request("tex_raw", params, token="abcdef1234567890"), state)
+        r = resp["result"]
+        assert bytes(r["_binary_data"]) == b"\xff\x00\xff"
+        assert (r["offset"], r["size"], r["total"]) == (1, 3, 1024)
+
+    def test_tex_raw_range_to_temp_file(self, tmp_path):
+        state = _make_handler_state(tmp_path)
+        params = {"id": 42, "offset": 1020}
+        resp, _ = _handle_request(rpc_request("tex_raw", params, token="abcdef1234567890"), state)
+        r = resp["result"]
+        assert r["size"] == 4
+        assert Path(r["path"]).read_bytes() == b"\x00\xff" * 2
+
+    def test_buf_raw_range_read_from_replay(self, tmp_path):
+        state = _make_handler_state(tmp_path)
+        reads = []
+
+        def _get_buffer_data(rid, offset, length):
+            reads.append((int(rid), offset, length))
+            return b"\x11" * length
+
+        state.adapter.controller.GetBufferData = _get_buffer_data
+        params = {"id": 7, "binary": True, "offset": 16, "length": 8}
+        resp, _ = _handle_request(rpc_request("buf_raw", params, token="abcdef1234567890"), state)
+        r = resp["result"]
+        assert reads == [(7, 16, 8)]
+        assert bytes(r["_binary_data"]) == b"\x11" * 8
+        assert (r["offset"], r["size"]) == (16, 8)
+
+    def test_bad_range(self, tmp_path):
+        state = _make_handler_state(tmp_path)
+        params = {"id": 7, "binary": True, "offset": -1}
+        resp, _ = _handle_request(rpc_request("buf_raw", params, token="abcdef1234567890"), state)
+        assert resp["error"]["code"] == -32602
+
+
 class TestBufInfo:
     def test_happy_path(self, tmp_path):
         state = _make_handler_state(tmp_path)
@@ -458,6 +458,16 @@ class TestCbufferRaw:
         assert out.read_bytes() == bytes(range(16))
         assert out == tmp_path / "cbuffer_10_ps_0_0.bin"
 
+    def test_binary_range(self, state: DaemonState, tmp_path: Path) -> None:
+        params = {"eid": 10, "set": 0, "binding": 0, "binary": True, "offset": 4, "length": 4}
+        resp, _ = _handle_request(
+            rpc_request("cbuffer_raw", params, token="abcdef1234567890"), state
+        )
+        r = resp["result"]
+        assert bytes(r["_binary_data"]) == bytes(range(4, 8))
+        assert (r["size"], r["total"]) == (4, 16)
+        assert not (tmp_path / "cbuffer_10_ps_0_0.bin").exists()
+
     def test_stage_specific_resources_with_same_set_binding(
         self, state: DaemonState, tmp_path: Path
     ) -> None:
@@ -711,6 +721,50 @@ class TestVbufferDecode:
         assert r["columns"] == []
         assert r["vertices"] == []
 
+    def test_binary_columns(self, state: DaemonState) -> None:
+        import numpy as np
+
+        resp, _ = _handle_request(
+            rpc_request("vbuffer_decode", {"eid": 10, "binary": True}, token="abcdef1234567890"),
+            state,
+        )
+        r = resp["result"]
+        assert "vertices" not in r
+        assert r["count"] == 3
+        assert r["_binary_size"] == 5 * 3 * 4
+        data = r["_binary_data"]
+        layout = {col["name"]: col for col in r["layout"]}
+        assert list(layout) == r["columns"]
+        u = layout["TEXCOORD.x"]
+        values = np.frombuffer(data, dtype=u["dtype"], count=3, offset=u["offset"])
+        assert values.tolist() == [0.0, 1.0, 0.5]
+
+    def test_typed_formats(self, state: DaemonState) -> None:
+        pipe = state.adapter.controller.GetPipelineState()
+        pipe._vertex_inputs = [
+            VertexInputAttribute(
+                name="NORMAL",
+                vertexBuffer=0,
+                byteOffset=0,
+                format=ResourceFormat(name="R8G8_SNORM", compByteWidth=1, compCount=2, compType=3),
+            ),
+            VertexInputAttribute(
+                name="BONES",
+                vertexBuffer=0,
+                byteOffset=2,
+                format=ResourceFormat(name="R16_UINT", compByteWidth=2, compCount=1, compType=4),
+            ),
+        ]
+        pipe._vbuffers = [BoundVBuffer(resourceId=ResourceId(42), byteSize=8, byteStride=4)]
+        raw = struct.pack("<bbH", -128, 127, 700) + struct.pack("<bbH", 0, -64, 3)
+        state.adapter.controller.GetBufferData = lambda rid, off, size: raw
+        resp, _ = _handle_request(
+            rpc_request("vbuffer_decode", {"eid": 10}, token="abcdef1234567890"), state
+        )
+        verts = resp["result"]["vertices"]
+        assert verts[0] == [-1.0, 1.0, 700.0]
+        assert verts[1] == pytest.approx([0.0, -64 / 127, 3.0])
+
 
 class TestIbufferDecode:
     def test_happy_path_u16(self, state: DaemonState) -> None:
@@ -772,6 +826,94 @@ class TestIbufferDecode:
         assert r["format"] == "none"
         assert r["indices"] == []
 
+    def _bind_indices(self, state: DaemonState, data: bytes, stride: int) -> Any:
+        pipe = state.adapter.controller.GetPipelineState()
+        pipe._ibuffer = BoundVBuffer(
+            resourceId=ResourceId(44),
+            byteOffset=0,
+            byteSize=len(data),
+            byteStride=stride,
+        )
+        orig_get = state.adapter.controller.GetBufferData
+
+        def _get(rid: Any, offset: int, length: int) -> bytes:
+            if int(rid) == 44:
+                return data
+            return orig_get(rid, offset, length)
+
+        state.adapter.controller.GetBufferData = _get
+        return pipe
+
+    def test_stats(self, state: DaemonState) -> None:
+        self._bind_indices(state, struct.pack("<6H", 4, 5, 6, 6, 5, 7), 2)
+        resp, _ = _handle_request(
+            rpc_request("ibuffer_decode", {"eid": 10}, token="abcdef1234567890"), state
+        )
+        r = resp["result"]
+        assert r["restart_index"] is None
+        assert r["stats"] == {"count": 6, "restarts": 0, "min": 4, "max": 7, "unique": 4}
+
+    def test_uint8(self, state: DaemonState) -> None:
+        self._bind_indices(state, bytes([3, 1, 2]), 1)
+        resp, _ = _handle_request(
+            rpc_request("ibuffer_decode", {"eid": 10}, token="abcdef1234567890"), state
+        )
+        r = resp["result"]
+        assert r["format"] == "uint8"
+        assert r["indices"] == [3, 1, 2]
+
+    def test_restart_param(self, state: DaemonState) -> None:
+        self._bind_indices(state, struct.pack("<5H", 0, 1, 0xFFFF, 2, 3), 2)
+        resp, _ = _handle_request(
+            rpc_request("ibuffer_decode", {"eid": 10, "restart": True}, token="abcdef1234567890"),
+            state,
+        )
+        r = resp["result"]
+        assert r["restart_index"] == 0xFFFF
+        assert r["indices"] == [0, 1, 0xFFFF, 2, 3]
+        assert r["stats"] == {"count": 5, "restarts": 1, "min": 0, "max": 3, "unique": 4}
+
+    def test_restart_from_pipeline(self, state: DaemonState) -> None:
+        pipe = self._bind_indices(state, struct.pack("<4I", 9, 0xFFFFFFFF, 9, 8), 4)
+        pipe.IsRestartEnabled = lambda: True
+        pipe.GetRestartIndex = lambda: 0xFFFFFFFF
+        resp, _ = _handle_request(
+            rpc_request("ibuffer_decode", {"eid": 10}, token="abcdef1234567890"), state
+        )
+        stats = resp["result"]["stats"]
+        assert stats == {"count": 4, "restarts": 1, "min": 8, "max": 9, "unique": 2}
+
+    def test_binary(self, state: DaemonState) -> None:
+        data = struct.pack("<4H", 7, 8, 9, 7)
+        self._bind_indices(state, data, 2)
+        resp, _ = _handle_request(
+            rpc_request("ibuffer_decode", {"eid": 10, "binary": True}, token="abcdef1234567890"),
+            state,
+        )
+        r = resp["result"]
+        assert "indices" not in r
+        assert r["_binary_size"] == len(data)
+        assert r["_binary_data"] == data
+        assert r["stats"]["unique"] == 3
+
+
+class TestIndexStats:
+    def test_wide_range_uses_unique(self) -> None:
+        import numpy as np
+
+        from rdc.handlers.buffer import _index_stats
+
+        stats = _index_stats(np.array([0, 1 << 30, 0, 5], dtype="<u4"), None)
+        assert stats == {"count": 4, "restarts": 0, "min": 0, "max": 1 << 30, "unique": 3}
+
+    def test_all_restart(self) -> None:
+        import numpy as np
+
+        from rdc.handlers.buffer import _index_stats
+
+        stats = _index_stats(np.array([255, 255], dtype="u1"), 255)
+        assert stats == {"count": 2, "restarts": 2, "min": None, "max": None, "unique": 0}
+
 
 class TestMeshVsInFallback:
     def test_empty_postvs_uses_ia_position(self, state: DaemonState) -> None:
@@ -1434,57 +1576,74 @@ class TestMeshVsInFallback:
 # --- P2-MAINT-1: buffer decode helper unit tests ---
 
 
-class TestDecodeFloatComponents:
-    """Unit tests for _decode_float_components helper."""
-
-    def test_comp_width_4_float(self) -> None:
-        from rdc.handlers.buffer import _decode_float_components
+class TestDecodeVertexAttribute:
+    """Unit tests for the strided _decode_vertex_attribute helper."""
 
-        data = struct.pack("<3f", 1.0, 2.0, 3.0)
-        result = _decode_float_components(data, 0, 4, 3)
-        assert result == pytest.approx([1.0, 2.0, 3.0])
-
-    def test_comp_width_4_single(self) -> None:
-        from rdc.handlers.buffer import _decode_float_components
+    @pytest.mark.parametrize(
+        ("data", "offset", "comp_width", "comp_count", "expected"),
+        [
+            (struct.pack("<3f", 1.0, 2.0, 3.0), 0, 4, 3, [1.0, 2.0, 3.0]),
+            (struct.pack("<f", -0.5), 0, 4, 1, [-0.5]),
+            (struct.pack("<2e", 1.0, 0.5), 0, 2, 2, [1.0, 0.5]),
+            (bytes([0, 128, 255]), 0, 1, 3, [0.0, 128 / 255.0, 1.0]),
+            (bytes([200]), 0, 1, 1, [200 / 255.0]),
+            (struct.pack("<4f", 1.0, 2.0, 3.0, 4.0), 0, 4, 4, [1.0, 2.0, 3.0, 4.0]),
+            (b"\x00\x00\x00\x00" + struct.pack("<2f", 5.0, 6.0), 4, 4, 2, [5.0, 6.0]),
+        ],
+    )
+    def test_untyped_components(
+        self, data: bytes, offset: int, comp_width: int, comp_count: int, expected: list[float]
+    ) -> None:
+        from rdc.handlers.buffer import _decode_vertex_attribute
 
-        data = struct.pack("<f", -0.5)
-        result = _decode_float_components(data, 0, 4, 1)
-        assert result == pytest.approx([-0.5])
+        values, _ = _decode_vertex_attribute(data, 1, 0, offset, comp_count, comp_width)
+        assert values[0].tolist() == pytest.approx(expected)
 
-    def test_comp_width_2_half(self) -> None:
-        from rdc.handlers.buffer import _decode_float_components
+    def test_interleaved_stride(self) -> None:
+        from rdc.handlers.buffer import _decode_vertex_attribute
 
-        data = struct.pack("<2e", 1.0, 0.5)
-        result = _decode_float_components(data, 0, 2, 2)
-        assert result == pytest.approx([1.0, 0.5])
+        data = struct.pack("<ffi", 1.0, 2.0, 0) + struct.pack("<ffi", 3.0, 4.0, 0)
+        values, dtype = _decode_vertex_attribute(data, 2, 12, 4, 1, 4)
+        assert values.tolist() == [[2.0], [4.0]]
+        assert dtype == "<f4"
 
-    def test_comp_width_1_byte_normalize(self) -> None:
-        from rdc.handlers.buffer import _decode_float_components
+    def test_past_end_is_zero(self) -> None:
+        from rdc.handlers.buffer import _decode_vertex_attribute
 
-        data = bytes([0, 128, 255])
-        result = _decode_float_components(data, 0, 1, 3)
-        assert result == pytest.approx([0.0, 128 / 255.0, 1.0])
+        data = struct.pack("<3f", 1.0, 2.0, 3.0)
+        values, _ = _decode_vertex_attribute(data, 2, 8, 0, 2, 4)
+        assert values.tolist() == [[1.0, 2.0], [3.0, 0.0]]
 
-    def test_comp_width_1_single(self) -> None:
-        from rdc.handlers.buffer import _decode_float_components
+    def test_zero_stride_repeats(self) -> None:
+        from rdc.handlers.buffer import _decode_vertex_attribute
 
-        data = bytes([200])
-        result = _decode_float_components(data, 0, 1, 1)
-        assert result == pytest.approx([200 / 255.0])
+        values, _ = _decode_vertex_attribute(struct.pack("<e", 0.5), 3, 0, 0, 1, 2)
+        assert values.tolist() == [[0.5], [0.5], [0.5]]
 
-    def test_comp_count_4(self) -> None:
-        from rdc.handlers.buffer import _decode_float_components
+    @pytest.mark.parametrize(
+        ("comp_type", "width", "raw", "expected", "dtype"),
+        [
+            (2, 2, struct.pack("<H", 65535), 1.0, "<f4"),
+            (3, 2, struct.pack("<h", -32768), -1.0, "<f4"),
+            (5, 4, struct.pack("<i", -7), -7.0, "<i4"),
+            (4, 1, bytes([9]), 9.0, "<u4"),
+            (1, 8, struct.pack("<d", 0.25), 0.25, "<f8"),
+        ],
+    )
+    def test_comp_types(
+        self, comp_type: int, width: int, raw: bytes, expected: float, dtype: str
+    ) -> None:
+        from rdc.handlers.buffer import _decode_vertex_attribute
 
-        data = struct.pack("<4f", 1.0, 2.0, 3.0, 4.0)
-        result = _decode_float_components(data, 0, 4, 4)
-        assert result == pytest.approx([1.0, 2.0, 3.0, 4.0])
+        values, col_dtype = _decode_vertex_attribute(raw, 1, width, 0, 1, width, comp_type)
+        assert values.tolist() == [[expected]]
+        assert col_dtype == dtype
 
-    def test_with_offset(self) -> None:
-        from rdc.handlers.buffer import _decode_float_components
+    def test_unsupported_width_is_zero(self) -> None:
+        from rdc.handlers.buffer import _decode_vertex_attribute
 
-        data = b"\x00\x00\x00\x00" + struct.pack("<2f", 5.0, 6.0)
-        result = _decode_float_components(data, 4, 4, 2)
-        assert result == pytest.approx([5.0, 6.0])
+        values, _ = _decode_vertex_attribute(bytes(6), 1, 6, 0, 1, 3)
+        assert values.tolist() == [[0.0]]
 
 
 class TestDecodeIndexBuffer:
@@ -0,0 +1,101 @@
+"""Tests for the synthetic capture generator and the daemon benchmark runner."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import bench_daemon
+import pytest
+from capture_gen import CaptureSpec, generate, load_state
+from conftest import rpc_request
+
+from rdc.daemon_server import _handle_request
+
+_SMALL = CaptureSpec(
+    passes=3,
+    markers_per_pass=2,
+    draws_per_marker=4,
+    textures=5,
+    buffers=6,
+    usage_per_resource=3,
+    vertices=12,
+    triangles=4,
+)
+
+
+class TestGenerate:
+    def test_counts(self) -> None:
+        cap = generate(_SMALL)
+        assert len(cap.draw_eids) == _SMALL.draw_count == 24
+        assert len(cap.texture_ids) == 5
+        assert len(cap.buffer_ids) == 6
+        # per pass: begin + markers + draws + end
+        assert cap.event_count == 3 * (1 + 2 + 8 + 1)
+
+    def test_deterministic(self) -> None:
+        a, b = generate(_SMALL), generate(_SMALL)
+        assert a.controller._usage_map == b.controller._usage_map
+        assert a.controller._buffer_data == b.controller._buffer_data
+        other = generate(CaptureSpec(**{**_SMALL.__dict__, "seed": 1}))
+        assert other.controller._buffer_data != a.controller._buffer_data
+
+    def test_scaled(self) -> None:
+        spec = CaptureSpec().scaled(0.01)
+        assert spec.passes == 1
+        assert spec.vertices == 300
+        assert spec.markers_per_pass == CaptureSpec().markers_per_pass
+
+    def test_loaded_state_answers_handlers(self) -> None:
+        cap = generate(_SMALL)
+        state = load_state(cap)
+        assert state.max_eid == cap.event_count
+
+        resp, _ = _handle_request(rpc_request("draws"), state)
+        assert [d["eid"] for d in resp["result"]["draws"]] == cap.draw_eids
+
+        resp, _ = _handle_request(rpc_request("passes"), state)
+        assert len(resp["result"]["tree"]["passes"]) == 3 * 2
+
+        resp, _ = _handle_request(rpc_request("usage_all"), state)
+        assert resp["result"]["total"] == (5 + 6) * 3
+
+        resp, _ = _handle_request(rpc_request("mesh_data", {"eid": cap.draw_eids[0]}), state)
+        assert resp["result"]["vertex_count"] == 12
+        assert resp["result"]["index_count"] == 12
+
+
+class TestBenchRunner:
+    def test_every_case_runs(self) -> None:
+        for name, fn in bench_daemon.build_cases(0.02).items():
+            fn()  # raises on an RPC error
+            assert name
+
+    def test_compare_normalises_and_flags(self) -> None:
+        baseline = {"calibration_ms": 10.0, "cases": {"a": 1.0, "b": 1.0}}
+        current = {"calibration_ms": 20.0, "cases": {"a": 2.0, "b": 5.0, "new": 1.0}}
+        rows = {r["case"]: r for r in bench_daemon.compare(current, baseline, 2.0)}
+        assert rows["a"]["ratio"] == 1.0
+        assert not rows["a"]["regressed"]
+        assert rows["b"]["ratio"] == 2.5
+        assert rows["b"]["regressed"]
+        assert rows["new"]["ratio"] is None
+
+    def test_update_then_check(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        baseline = tmp_path / "baseline.json"
+        args = ["--scale", "0.02", "--repeat", "1", "--case", "draws", "--baseline", str(baseline)]
+        assert bench_daemon.main([*args, "--update"]) == 0
+        assert set(json.loads(baseline.read_text())["cases"]) == {"draws"}
+        assert bench_daemon.main([*args, "--threshold", "1000"]) == 0
+        assert "draws" in capsys.readouterr().out
+
+    def test_scale_mismatch(self, tmp_path: Path) -> None:
+        baseline = tmp_path / "baseline.json"
+        baseline.write_text(json.dumps({"scale": 5.0, "calibration_ms": 1.0, "cases": {}}))
+        args = ["--scale", "0.02", "--repeat", "1", "--case", "draws", "--baseline", str(baseline)]
+        assert bench_daemon.main(args) == 2
+
+    def test_stored_baseline_covers_all_cases(self) -> None:
+        stored = json.loads(bench_daemon.BASELINE_PATH.read_text())
+        assert stored["scale"] == 1.0
+        assert set(stored["cases"]) == set(bench_daemon.build_cases(0.02))
@@ -117,6 +117,42 @@ def test_counters_fetch_json(monkeypatch: Any) -> None:
     assert len(data["rows"]) == 3
 
 
+def test_counters_fetch_columnar_response(monkeypatch: Any) -> None:
+    captured: dict[str, Any] = {}
+
+    def _capture(method: str, params: dict | None = None) -> dict:
+        captured["params"] = params or {}
+        return {
+            "eids": [10, 20],
+            "counters": [
+                {"id": 1, "name": "EventGPUDuration", "unit": "Seconds"},
+                {"id": 8, "name": "VSInvocations", "unit": "Absolute"},
+            ],
+            "columns": [[0.00123, 0.00456], [4096, None]],
+            "total": 2,
+        }
+
+    monkeypatch.setattr(counters_mod, "call", _capture)
+    result = CliRunner().invoke(main, ["counters"])
+    assert result.exit_code == 0
+    assert captured["params"]["columnar"] is True
+    lines = result.output.splitlines()
+    assert lines[1:] == [
+        "10\tEventGPUDuration\t0.00123\tSeconds",
+        "10\tVSInvocations\t4096\tAbsolute",
+        "20\tEventGPUDuration\t0.00456\tSeconds",
+    ]
+    result = CliRunner().invoke(main, ["counters", "--json"])
+    data = assert_json_output(result)
+    assert data["total"] == 3
+    assert data["rows"][1] == {
+        "eid": 10,
+        "counter": "VSInvocations",
+        "value": 4096,
+        "unit": "Absolute",
+    }
+
+
 # ── counters --list output options ─────────────────────────────────
 
 
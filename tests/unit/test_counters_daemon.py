@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import mock_renderdoc as rd
+import pytest
 from conftest import rpc_request
 
 from rdc.adapter import RenderDocAdapter
@@ -253,3 +254,100 @@ def test_counter_list_has_uuid() -> None:
     resp, _ = _handle_request(rpc_request("counter_list"), state)
     for c in resp["result"]["counters"]:
         assert "uuid" in c
+
+
+def test_counter_descriptors_cached_per_replay() -> None:
+    state = _state_with_counters()
+    ctrl = state.adapter.controller  # type: ignore[union-attr]
+    calls: list[int] = []
+    orig = ctrl.DescribeCounter
+    ctrl.DescribeCounter = lambda c: (calls.append(int(c)), orig(c))[1]
+    _handle_request(rpc_request("counter_list"), state)
+    _handle_request(rpc_request("counter_fetch", {"name": "PS"}), state)
+    _handle_request(rpc_request("counter_list"), state)
+    assert sorted(calls) == [1, 8, 12]
+
+
+def test_counter_fetch_memoized_per_counter() -> None:
+    state = _state_with_counters()
+    ctrl = state.adapter.controller  # type: ignore[union-attr]
+    fetched: list[list[int]] = []
+    orig = ctrl.FetchCounters
+    ctrl.FetchCounters = lambda ids: (fetched.append(sorted(int(c) for c in ids)), orig(ids))[1]
+    _handle_request(rpc_request("counter_fetch", {"name": "Invocations"}), state)
+    _handle_request(rpc_request("counter_fetch", {"name": "VS", "eid": 20}), state)
+    resp, _ = _handle_request(rpc_request("counter_fetch"), state)
+    assert fetched == [[8, 12], [1]]
+    assert resp["result"]["total"] == 6
+
+
+def test_counter_fetch_columnar() -> None:
+    state = _state_with_counters()
+    resp, _ = _handle_request(rpc_request("counter_fetch", {"columnar": True}), state)
+    r = resp["result"]
+    assert r["eids"] == [10, 20]
+    assert [c["name"] for c in r["counters"]] == [
+        "EventGPUDuration",
+        "PSInvocations",
+        "VSInvocations",
+    ]
+    assert r["columns"][1:] == [[8192, 1024], [4096, 512]]
+    assert r["total"] == 2
+    assert "rows" not in r
+
+
+def test_counter_fetch_columnar_eid_filter() -> None:
+    state = _state_with_counters()
+    resp, _ = _handle_request(
+        rpc_request("counter_fetch", {"columnar": True, "eid": 20, "name": "VS"}), state
+    )
+    r = resp["result"]
+    assert r["eids"] == [20]
+    assert r["columns"] == [[512]]
+    resp, _ = _handle_request(rpc_request("counter_fetch", {"columnar": True, "eid": 99}), state)
+    assert resp["result"]["eids"] == []
+    assert resp["result"]["columns"] == [[], [], []]
+
+
+def test_counter_fetch_retried_after_failure() -> None:
+    state = _state_with_counters()
+    ctrl = state.adapter.controller  # type: ignore[union-attr]
+    orig = ctrl.FetchCounters
+    calls: list[int] = []
+
+    def _flaky(ids: list[object]) -> object:
+        calls.append(len(ids))
+        if len(calls) == 1:
+            raise RuntimeError("counter pass failed")
+        return orig(ids)
+
+    ctrl.FetchCounters = _flaky
+    with pytest.raises(RuntimeError):
+        _handle_request(rpc_request("counter_fetch"), state)
+    resp, _ = _handle_request(rpc_request("counter_fetch"), state)
+    assert calls == [3, 3]
+    assert resp["result"]["total"] == 6
+
+
+def test_counter_fetch_refetched_after_shader_edit() -> None:
+    state = _state_with_counters()
+    state.max_eid = 100
+    ctrl = state.adapter.controller  # type: ignore[union-attr]
+    ctrl._pipe_state._shaders[rd.ShaderStage.Pixel] = rd.ResourceId(500)
+    state.built_shaders[1000] = rd.ResourceId(1000)
+    fetched: list[int] = []
+    orig = ctrl.FetchCounters
+    ctrl.FetchCounters = lambda ids: (fetched.append(len(ids)), orig(ids))[1]
+    _handle_request(rpc_request("counter_fetch"), state)
+    resp, _ = _handle_request(
+        rpc_request("shader_replace", {"eid": 10, "stage": "ps", "shader_id": 1000}), state
+    )
+    assert resp["result"]["ok"] is True
+    _handle_request(rpc_request("counter_fetch"), state)
+    assert fetched == [3, 3]
+    _handle_request(rpc_request("shader_restore", {"eid": 10, "stage": "ps"}), state)
+    _handle_request(rpc_request("counter_fetch"), state)
+    _handle_request(rpc_request("shader_restore_all"), state)
+    resp, _ = _handle_request(rpc_request("counter_fetch"), state)
+    assert fetched == [3, 3, 3, 3]
+    assert resp["result"]["total"] == 6
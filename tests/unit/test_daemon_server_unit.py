@@ -772,6 +772,8 @@ class TestSigtermHandler:
                 idle_timeout=1800,
                 no_replay=True,
                 gpu=None,
+                trace=None,
+                profile_dir=None,
             )
             mock_parser_cls.return_value.parse_args.return_value = mock_args
 
@@ -990,7 +992,7 @@ class TestEmitError:
 
 class TestNoReplayRegistry:
     def test_no_replay_methods_exact_contents(self) -> None:
-        """Registry contains exactly the expected 10 methods."""
+        """Registry contains exactly the expected 11 methods."""
         expected = frozenset(
             {
                 "ping",
@@ -999,6 +1001,7 @@ class TestNoReplayRegistry:
                 "shutdown",
                 "count",
                 "file_read",
+                "metrics",
                 "capture_run",
                 "remote_connect_run",
                 "remote_list_run",
@@ -5,6 +5,7 @@ import socket
 import subprocess
 import sys
 import time
+from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
@@ -190,3 +191,433 @@ def test_recv_line_large_message_just_over_limit() -> None:
 
     with pytest.raises(ValueError, match="max_bytes"):
         recv_line(mock_sock, max_bytes=limit)
+
+
+# ---------------------------------------------------------------------------
+# Keep-alive connections and pooled client
+# ---------------------------------------------------------------------------
+
+
+def test_daemon_keepalive_serves_many_requests_on_one_socket() -> None:
+    from rdc.daemon_client import DaemonConnection
+
+    port = _pick_port()
+    token = secrets.token_hex(8)
+    proc = _start_daemon(port, token)
+
+    try:
+        _wait_ready(port, token)
+        conn = DaemonConnection("127.0.0.1", port)
+        try:
+            assert conn.request(goto_request(token, 12, 1))["result"]["current_eid"] == 12
+            assert conn.request(status_request(token, 2))["result"]["current_eid"] == 12
+            assert conn.request(ping_request(token, 3))["result"]["ok"] is True
+        finally:
+            conn.close()
+        send_request("127.0.0.1", port, shutdown_request(token, 4))
+    finally:
+        _force_kill(proc)
+
+
+def test_daemon_pipelined_requests_matched_by_id() -> None:
+    from rdc.daemon_client import send_pipelined
+
+    port = _pick_port()
+    token = secrets.token_hex(8)
+    proc = _start_daemon(port, token)
+
+    try:
+        _wait_ready(port, token)
+        responses = send_pipelined(
+            "127.0.0.1",
+            port,
+            [goto_request(token, 5, 10), status_request(token, 11), ping_request(token, 12)],
+        )
+        assert [r["id"] for r in responses] == [10, 11, 12]
+        assert responses[1]["result"]["current_eid"] == 5
+        send_request("127.0.0.1", port, shutdown_request(token, 13))
+    finally:
+        _force_kill(proc)
+
+
+def test_daemon_parse_error_keeps_connection_open() -> None:
+    port = _pick_port()
+    token = secrets.token_hex(8)
+    proc = _start_daemon(port, token)
+
+    try:
+        _wait_ready(port, token)
+        with socket.create_connection(("127.0.0.1", port), timeout=2.0) as sock:
+            f = sock.makefile("rb")
+            sock.sendall(b"not json\n")
+            assert b'"parse error"' in f.readline()
+            import json
+
+            sock.sendall((json.dumps(ping_request(token, 7)) + "\n").encode())
+            assert json.loads(f.readline())["result"]["ok"] is True
+        send_request("127.0.0.1", port, shutdown_request(token, 8))
+    finally:
+        _force_kill(proc)
+
+
+def _one_shot_server(responses: list[bytes]) -> int:
+    """Serve one response per connection, then close it (pre keep-alive daemon)."""
+    import threading
+
+    srv = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    srv.bind(("127.0.0.1", 0))
+    srv.listen(4)
+    port = int(srv.getsockname()[1])
+
+    def _serve() -> None:
+        with srv:
+            for resp in responses:
+                conn, _ = srv.accept()
+                with conn:
+                    conn.recv(4096)
+                    conn.sendall(resp)
+
+    threading.Thread(target=_serve, daemon=True).start()
+    return port
+
+
+def test_pooled_send_reconnects_when_daemon_closed_socket() -> None:
+    from rdc.daemon_client import _pool, close_pool
+
+    port = _one_shot_server(
+        [b'{"id": 1, "result": {"n": 1}}\n', b'{"id": 2, "result": {"n": 2}}\n']
+    )
+    try:
+        first = send_request("127.0.0.1", port, {"id": 1}, timeout=2.0, pooled=True)
+        assert ("127.0.0.1", port) in _pool
+        time.sleep(0.05)
+        second = send_request("127.0.0.1", port, {"id": 2}, timeout=2.0, pooled=True)
+        assert first["result"]["n"] == 1
+        assert second["result"]["n"] == 2
+    finally:
+        close_pool()
+
+
+def test_pooled_send_not_resent_after_daemon_read_it() -> None:
+    import threading
+
+    from rdc.daemon_client import close_pool
+
+    srv = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    srv.bind(("127.0.0.1", 0))
+    srv.listen(4)
+    port = int(srv.getsockname()[1])
+    received: list[bytes] = []
+
+    def _serve() -> None:
+        with srv:
+            conn, _ = srv.accept()
+            with conn:
+                received.append(conn.recv(4096))
+                conn.sendall(b'{"id": 1, "result": {}}\n')
+                received.append(conn.recv(4096))  # executes, then drops
+            srv.settimeout(0.5)
+            try:
+                extra, _ = srv.accept()
+            except TimeoutError:
+                return
+            with extra:
+                received.append(extra.recv(4096))
+
+    thread = threading.Thread(target=_serve, daemon=True)
+    thread.start()
+    try:
+        send_request("127.0.0.1", port, {"id": 1, "method": "ping"}, timeout=2.0, pooled=True)
+        with pytest.raises(OSError):
+            send_request(
+                "127.0.0.1", port, {"id": 2, "method": "shader_replace"}, timeout=2.0, pooled=True
+            )
+        thread.join(2.0)
+        assert [b"shader_replace" in r for r in received] == [False, True]
+    finally:
+        close_pool()
+
+
+def test_pooled_send_fresh_connection_failure_propagates() -> None:
+    from rdc.daemon_client import _pool
+
+    port = _pick_port()
+    with pytest.raises(OSError):
+        send_request("127.0.0.1", port, {"id": 1}, timeout=0.5, pooled=True)
+    assert ("127.0.0.1", port) not in _pool
+
+
+def test_pipeline_rejects_duplicate_ids() -> None:
+    from rdc.daemon_client import DaemonConnection
+
+    conn = DaemonConnection.__new__(DaemonConnection)
+    with pytest.raises(ValueError, match="distinct ids"):
+        conn.pipeline([{"id": 1}, {"id": 1}])
+
+
+def test_serve_line_answers_each_request() -> None:
+    import json
+
+    from rdc.daemon_server import DaemonState, _serve_line
+
+    state = DaemonState(capture="capture.rdc", current_eid=0, token="tok")
+    left, right = socket.socketpair()
+    with left, right:
+        f = right.makefile("rb")
+        assert _serve_line(left, json.dumps(goto_request("tok", 3, 1)).encode(), state)
+        assert _serve_line(left, json.dumps(status_request("tok", 2)).encode(), state)
+        assert json.loads(f.readline())["result"]["current_eid"] == 3
+        assert json.loads(f.readline())["id"] == 2
+        assert _serve_line(left, json.dumps(shutdown_request("tok", 3)).encode(), state) is False
+
+
+# ---------------------------------------------------------------------------
+# JSON-RPC batch arrays
+# ---------------------------------------------------------------------------
+
+
+def test_process_batch_preserves_order_and_flags_invalid_entries() -> None:
+    from rdc.daemon_server import DaemonState, _process_batch
+
+    state = DaemonState(capture="capture.rdc", current_eid=0, token="tok")
+    responses, running = _process_batch(
+        [goto_request("tok", 4, 1), 42, status_request("tok", 3)], state
+    )
+    assert running is True
+    assert [r["id"] for r in responses] == [1, None, 3]
+    assert responses[1]["error"]["code"] == -32600
+    assert responses[2]["result"]["current_eid"] == 4
+
+
+def test_process_batch_skips_entries_after_shutdown() -> None:
+    from rdc.daemon_server import DaemonState, _process_batch
+
+    state = DaemonState(capture="capture.rdc", current_eid=0, token="tok")
+    responses, running = _process_batch(
+        [shutdown_request("tok", 1), status_request("tok", 2)], state
+    )
+    assert running is False
+    assert responses[0]["result"]["ok"] is True
+    assert responses[1]["error"]["code"] == -32000
+
+
+def test_process_batch_rejects_binary_results(monkeypatch: pytest.MonkeyPatch) -> None:
+    from rdc import daemon_server
+    from rdc.daemon_server import DaemonState, _process_batch
+
+    def _binary(request_id: int, params: dict, state: DaemonState) -> tuple[dict, bool]:
+        result = {"_binary_size": 3, "_binary_path": "/nonexistent"}
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}, True
+
+    monkeypatch.setitem(daemon_server._DISPATCH, "ping", _binary)
+    state = DaemonState(capture="capture.rdc", current_eid=0, token="tok")
+    responses, _ = _process_batch([ping_request("tok", 9)], state)
+    assert responses[0]["id"] == 9
+    assert responses[0]["error"]["code"] == -32602
+
+
+def test_serve_line_answers_batch_with_array() -> None:
+    import json
+
+    from rdc.daemon_server import DaemonState, _serve_line
+
+    state = DaemonState(capture="capture.rdc", current_eid=0, token="tok")
+    left, right = socket.socketpair()
+    with left, right:
+        f = right.makefile("rb")
+        batch = [goto_request("tok", 7, 1), status_request("tok", 2)]
+        assert _serve_line(left, json.dumps(batch).encode(), state)
+        reply = json.loads(f.readline())
+        assert [r["id"] for r in reply] == [1, 2]
+        assert reply[1]["result"]["current_eid"] == 7
+        assert _serve_line(left, b"[]", state)
+        assert json.loads(f.readline())["error"]["code"] == -32600
+
+
+def test_daemon_batch_round_trip() -> None:
+    from rdc.daemon_client import send_batch
+
+    port = _pick_port()
+    token = secrets.token_hex(8)
+    proc = _start_daemon(port, token)
+
+    try:
+        _wait_ready(port, token)
+        responses = send_batch(
+            "127.0.0.1",
+            port,
+            [ping_request(token, 3), goto_request(token, 8, 1), status_request(token, 2)],
+        )
+        assert [r["id"] for r in responses] == [3, 1, 2]
+        assert responses[2]["result"]["current_eid"] == 8
+        send_request("127.0.0.1", port, shutdown_request(token, 4))
+    finally:
+        _force_kill(proc)
+
+
+def test_batch_rejects_duplicate_ids() -> None:
+    from rdc.daemon_client import DaemonConnection
+
+    conn = DaemonConnection.__new__(DaemonConnection)
+    with pytest.raises(ValueError, match="distinct ids"):
+        conn.batch([{"id": 1}, {"id": 1}])
+
+
+def test_serve_line_sends_in_memory_binary() -> None:
+    import json
+    from unittest.mock import patch
+
+    from rdc.daemon_server import DaemonState, _serve_line
+
+    def _handler(request_id: int, params: Any, state: DaemonState) -> tuple[Any, bool]:
+        result = {"_binary_size": 3, "_binary_data": b"abc"}
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}, True
+
+    state = DaemonState(capture="x.rdc", current_eid=0, token="tok")
+    state.adapter = MagicMock()
+    left, right = socket.socketpair()
+    with left, right, patch.dict("rdc.daemon_server._DISPATCH", {"blob": _handler}):
+        request = {"jsonrpc": "2.0", "id": 1, "method": "blob", "params": {"_token": "tok"}}
+        assert _serve_line(left, json.dumps(request).encode(), state)
+        reader = right.makefile("rb")
+        header = json.loads(reader.readline())
+        assert header["result"] == {"_binary_size": 3}
+        assert reader.read(3) == b"abc"
+
+
+def test_serve_line_sends_memoryview_slice() -> None:
+    import json
+    from unittest.mock import patch
+
+    from rdc.daemon_server import DaemonState, _serve_line
+    from rdc.handlers._helpers import _binary_result
+
+    data = bytearray(b"--abc--")
+
+    def _handler(request_id: int, params: Any, state: DaemonState) -> tuple[Any, bool]:
+        return {"jsonrpc": "2.0", "id": request_id, "result": _binary_result({}, data, 2, 3)}, True
+
+    state = DaemonState(capture="x.rdc", current_eid=0, token="tok")
+    state.adapter = MagicMock()
+    left, right = socket.socketpair()
+    with left, right, patch.dict("rdc.daemon_server._DISPATCH", {"blob": _handler}):
+        request = {"jsonrpc": "2.0", "id": 1, "method": "blob", "params": {"_token": "tok"}}
+        assert _serve_line(left, json.dumps(request).encode(), state)
+        reader = right.makefile("rb")
+        header = json.loads(reader.readline())
+        assert header["result"] == {"offset": 2, "size": 3, "total": 7, "_binary_size": 3}
+        assert reader.read(3) == b"abc"
+
+
+# ---------------------------------------------------------------------------
+# Streamed (NDJSON) list results
+# ---------------------------------------------------------------------------
+
+
+def _stream_handler(rows: Any) -> Any:
+    def _handler(request_id: int, params: Any, state: Any) -> tuple[Any, bool]:
+        result = {"_stream": "rows", "rows": rows, "total": 3}
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}, True
+
+    return _handler
+
+
+def _serve_stream(rows: Any) -> Any:
+    """Answer one streamed request over a socketpair; return a reader on the client end."""
+    import json
+    from unittest.mock import patch
+
+    from rdc.daemon_server import DaemonState, _serve_line
+
+    state = DaemonState(capture="x.rdc", current_eid=0, token="tok")
+    state.adapter = MagicMock()
+    left, right = socket.socketpair()
+    with left, patch.dict("rdc.daemon_server._DISPATCH", {"rows": _stream_handler(rows)}):
+        request = {"jsonrpc": "2.0", "id": 1, "method": "rows", "params": {"_token": "tok"}}
+        assert _serve_line(left, json.dumps(request).encode(), state)
+    return right, right.makefile("rb")
+
+
+def test_serve_line_streams_rows_as_ndjson() -> None:
+    import json
+
+    from rdc.daemon_client import _read_stream
+
+    sock, reader = _serve_stream(iter([{"n": 0}, {"n": 1}, {"n": 2}]))
+    with sock:
+        header = json.loads(reader.readline())
+        assert header["result"] == {"_stream": "rows", "total": 3}
+        assert list(_read_stream(reader, header, "rows")) == [{"n": 0}, {"n": 1}, {"n": 2}]
+
+
+def test_encode_stream_chunks_rows_and_counts_them(monkeypatch: pytest.MonkeyPatch) -> None:
+    import json
+
+    from rdc import daemon_server
+
+    monkeypatch.setattr(daemon_server, "_STREAM_CHUNK_BYTES", 16)
+    response = {"jsonrpc": "2.0", "id": 1, "result": {"_stream": "rows", "rows": range(10)}}
+    chunks = list(daemon_server._encode_stream(response))
+    lines = b"".join(chunks).decode().splitlines()
+    assert len(chunks) > 3
+    assert [json.loads(line) for line in lines[1:-1]] == list(range(10))
+    assert json.loads(lines[-1]) == {"_stream_end": True, "count": 10}
+
+
+def test_stream_failure_reported_in_trailer() -> None:
+    import json
+
+    from rdc.daemon_client import _read_stream
+
+    def _rows() -> Any:
+        yield {"n": 0}
+        raise RuntimeError("replay lost")
+
+    sock, reader = _serve_stream(_rows())
+    with sock:
+        header = json.loads(reader.readline())
+        rows = _read_stream(reader, header, "rows")
+        assert next(rows) == {"n": 0}
+        with pytest.raises(ValueError, match="replay lost"):
+            next(rows)
+
+
+def test_read_stream_accepts_plain_result() -> None:
+    import io
+
+    from rdc.daemon_client import _read_stream
+
+    parsed = {"result": {"rows": [{"n": 1}]}}
+    assert list(_read_stream(io.BytesIO(b""), parsed, "rows")) == [{"n": 1}]
+
+
+def test_process_batch_collects_streamed_rows() -> None:
+    from unittest.mock import patch
+
+    from rdc.daemon_server import DaemonState, _process_batch
+
+    state = DaemonState(capture="x.rdc", current_eid=0, token="tok")
+    state.adapter = MagicMock()
+    request = {"jsonrpc": "2.0", "id": 4, "method": "rows", "params": {"_token": "tok"}}
+    handler = _stream_handler(iter([{"n": 0}]))
+    with patch.dict("rdc.daemon_server._DISPATCH", {"rows": handler}):
+        responses, _ = _process_batch([request], state)
+    assert responses[0]["result"] == {"rows": [{"n": 0}], "total": 3}
+
+
+def test_send_request_stream_returns_connection_to_pool() -> None:
+    from rdc.daemon_client import _pool, close_pool, send_request_stream
+
+    framed = (
+        b'{"id": 1, "result": {"_stream": "rows"}}\n{"n": 0}\n{"n": 1}\n'
+        b'{"_stream_end": true, "count": 2}\n'
+    )
+    port = _one_shot_server([framed])
+    try:
+        header, rows = send_request_stream("127.0.0.1", port, {"id": 1}, "rows", timeout=2.0)
+        assert header["result"] == {"_stream": "rows"}
+        assert ("127.0.0.1", port) not in _pool
+        assert list(rows) == [{"n": 0}, {"n": 1}]
+        assert ("127.0.0.1", port) in _pool
+    finally:
+        close_pool()
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import random
+
+import pytest
+
 from rdc.diff.alignment import (
     DrawRecord,
     align_draws,
@@ -9,6 +13,8 @@ from rdc.diff.alignment import (
     lcs_align,
     make_fallback_keys,
     make_match_keys,
+    myers_align,
+    patience_align,
 )
 
 
@@ -265,3 +271,115 @@ class TestAlignDraws:
         assert len(result) == 2
         assert result[0] == (a[0], b[0])
         assert result[1] == (a[1], b[1])
+
+
+# ---------------------------------------------------------------------------
+# Linear-space aligners
+# ---------------------------------------------------------------------------
+
+
+def _random_keys(rng: random.Random, n: int, alphabet: int) -> list[tuple[str]]:
+    return [(str(rng.randrange(alphabet)),) for _ in range(n)]
+
+
+def _mutate(rng: random.Random, keys: list[tuple[str]], edits: int) -> list[tuple[str]]:
+    out = list(keys)
+    for _ in range(edits):
+        if out and rng.random() < 0.5:
+            out.pop(rng.randrange(len(out)))
+        else:
+            out.insert(rng.randint(0, len(out)), (str(rng.randrange(8)),))
+    return out
+
+
+class TestMyersAlign:
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_lcs_random(self, seed: int) -> None:
+        rng = random.Random(seed)
+        for _ in range(400):
+            a = _random_keys(rng, rng.randint(0, 30), rng.randint(1, 6))
+            if rng.random() < 0.5:
+                b = _mutate(rng, a, rng.randint(0, 8))
+            else:
+                b = _random_keys(rng, rng.randint(0, 30), rng.randint(1, 6))
+            assert myers_align(a, b) == lcs_align(a, b)
+
+    def test_matches_lcs_large_distance(self) -> None:
+        """Enough edits to exercise checkpoint thinning and block recompute."""
+        rng = random.Random(7)
+        a = _random_keys(rng, 400, 3)
+        b = _random_keys(rng, 450, 3)
+        assert myers_align(a, b) == lcs_align(a, b)
+
+    def test_common_suffix(self) -> None:
+        a = [("X",), ("A",), ("B",)]
+        b = [("A",), ("B",)]
+        assert myers_align(a, b) == [(0, None), (1, 0), (2, 1)]
+
+    def test_empty(self) -> None:
+        assert myers_align([], [("A",)]) == [(None, 0)]
+        assert myers_align([("A",)], []) == [(0, None)]
+        assert myers_align([], []) == []
+
+    def test_large_markerless(self) -> None:
+        rng = random.Random(11)
+        a = [("Draw", str(rng.randrange(50)), "TriangleList") for _ in range(20000)]
+        b = list(a)
+        del b[5000:5010]
+        b[12000:12000] = [("Dispatch", "x", "-")] * 5
+        result = myers_align(a, b)
+        assert len(result) == 20005
+        assert sum(1 for ia, ib in result if ia is not None and ib is not None) == 19990
+
+
+class TestPatienceAlign:
+    def test_valid_alignment(self) -> None:
+        rng = random.Random(3)
+        for _ in range(300):
+            a = _random_keys(rng, rng.randint(0, 30), rng.randint(2, 40))
+            b = _mutate(rng, a, rng.randint(0, 6))
+            result = patience_align(a, b)
+            assert [ia for ia, _ in result if ia is not None] == list(range(len(a)))
+            assert [ib for _, ib in result if ib is not None] == list(range(len(b)))
+            assert all(a[ia] == b[ib] for ia, ib in result if ia is not None and ib is not None)
+
+    def test_anchors_on_unique_keys(self) -> None:
+        a = [("A",), ("U",), ("V",), ("B",)]
+        b = [("B",), ("U",), ("V",), ("A",)]
+        assert patience_align(a, b) == [
+            (0, None),
+            (None, 0),
+            (1, 1),
+            (2, 2),
+            (3, None),
+            (None, 3),
+        ]
+
+
+class TestAlignDrawsMethod:
+    def _pair(self) -> tuple[list[DrawRecord], list[DrawRecord]]:
+        a = [_rec(eid=i, marker_path="-", shader_hash=str(i % 4)) for i in range(40)]
+        b = [_rec(eid=i + 100, marker_path="-", shader_hash=str(i % 3)) for i in range(45)]
+        return a, b
+
+    @pytest.mark.parametrize("method", ["myers", "auto"])
+    def test_same_as_lcs(self, method: str) -> None:
+        a, b = self._pair()
+        assert align_draws(a, b, method=method) == align_draws(a, b, method="lcs")
+
+    def test_auto_large_uses_linear(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        import rdc.diff.alignment as alignment
+
+        monkeypatch.setattr(alignment, "_LCS_MAX_CELLS", 10)
+
+        def _fail(*_args: object) -> None:
+            raise AssertionError("dp table used")
+
+        monkeypatch.setitem(alignment._ALIGNERS, "lcs", _fail)
+        a, b = self._pair()
+        assert len(align_draws(a, b)) > 0
+
+    def test_unknown_method(self) -> None:
+        a, b = self._pair()
+        with pytest.raises(ValueError, match="unknown alignment method"):
+            align_draws(a, b, method="bogus")
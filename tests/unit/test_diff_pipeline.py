@@ -458,10 +458,12 @@ class TestQueryEachSync:
         from rdc.services import diff_service
         from rdc.services.diff_service import query_each_sync
 
-        def mock_send(host: str, port: int, payload: dict, **kw: object) -> dict:
-            return {"result": {"method": payload["method"], "port": port}}
+        def mock_send(host: str, port: int, payloads: list[dict], **kw: object) -> list[dict]:
+            return [
+                {"id": p["id"], "result": {"method": p["method"], "port": port}} for p in payloads
+            ]
 
-        monkeypatch.setattr(diff_service, "send_request", mock_send)
+        monkeypatch.setattr(diff_service, "send_batch", mock_send)
 
         ctx = _make_ctx()
         calls_a = [("m1", {"x": 1}), ("m2", {"x": 2})]
@@ -478,12 +480,15 @@ class TestQueryEachSync:
         from rdc.services import diff_service
         from rdc.services.diff_service import query_each_sync
 
-        def mock_send(host: str, port: int, payload: dict, **kw: object) -> dict:
-            if port == 5000 and payload["method"] == "m2":
-                raise ConnectionRefusedError
-            return {"result": {"ok": True}}
+        def mock_send(host: str, port: int, payloads: list[dict], **kw: object) -> list[dict]:
+            return [
+                {"id": p["id"], "error": {"code": -32002, "message": "bad"}}
+                if port == 5000 and p["method"] == "m2"
+                else {"id": p["id"], "result": {"ok": True}}
+                for p in payloads
+            ]
 
-        monkeypatch.setattr(diff_service, "send_request", mock_send)
+        monkeypatch.setattr(diff_service, "send_batch", mock_send)
 
         ctx = _make_ctx()
         calls_a = [("m1", {}), ("m2", {})]
@@ -498,10 +503,26 @@ class TestQueryEachSync:
         from rdc.services.diff_service import query_each_sync
 
         mock = MagicMock(side_effect=ConnectionRefusedError)
-        monkeypatch.setattr(diff_service, "send_request", mock)
+        monkeypatch.setattr(diff_service, "send_batch", mock)
 
         ctx = _make_ctx()
         ra, rb, err = query_each_sync(ctx, [("m1", {})], [("m1", {})])
         assert ra[0] is None
         assert rb[0] is None
         assert err != ""
+
+    def test_one_batch_per_side(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from rdc.services import diff_service
+        from rdc.services.diff_service import query_each_sync
+
+        seen: list[tuple[int, list[str]]] = []
+
+        def mock_send(host: str, port: int, payloads: list[dict], **kw: object) -> list[dict]:
+            seen.append((port, [p["method"] for p in payloads]))
+            return [{"id": p["id"], "result": {}} for p in payloads]
+
+        monkeypatch.setattr(diff_service, "send_batch", mock_send)
+
+        ctx = _make_ctx()
+        query_each_sync(ctx, [("m1", {}), ("m2", {}), ("m3", {})], [("m1", {})])
+        assert sorted(seen) == [(5000, ["m1", "m2", "m3"]), (5001, ["m1"])]
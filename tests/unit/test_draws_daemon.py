@@ -52,29 +52,28 @@ def _make_state(actions: list | None = None) -> Any:
 
 
 class TestDrawsPassFilterCallSite:
-    def test_filter_by_pass_receives_actions(self) -> None:
-        """filter_by_pass is called with non-None actions when pass param is set."""
+    def test_filter_by_pass_receives_catalog(self) -> None:
+        """filter_by_pass gets the cached pass catalog when pass param is set."""
         state = _make_state()
         captured: dict[str, Any] = {}
 
-        def _spy_fbp(flat, pass_name, actions=None, sf=None):
-            captured["actions"] = actions
-            captured["sf"] = sf
+        def _spy_fbp(flat, pass_name, actions=None, sf=None, *, catalog=None):
+            captured["catalog"] = catalog
             return flat  # pass everything through
 
         with patch("rdc.services.query_service.filter_by_pass", side_effect=_spy_fbp):
             _handle_request(rpc_request("draws", {"pass": "Colour Pass #1"}), state)
 
-        assert "actions" in captured, "filter_by_pass was not called"
-        assert captured["actions"] is not None
-        assert captured["sf"] is not None
+        assert "catalog" in captured, "filter_by_pass was not called"
+        assert captured["catalog"] is not None
+        assert captured["catalog"] is state._pass_catalog
 
     def test_filter_by_pass_not_called_without_pass_param(self) -> None:
         """filter_by_pass is not called when no pass param is supplied."""
         state = _make_state()
         call_count = 0
 
-        def _spy_fbp(flat, pass_name, actions=None, sf=None):
+        def _spy_fbp(flat, pass_name, actions=None, sf=None, *, catalog=None):
             nonlocal call_count
             call_count += 1
             return flat
@@ -293,6 +293,46 @@ class TestDrawHandler:
         assert resp["error"]["code"] == -32002
 
 
+class TestActionIndexCache:
+    def test_tree_walked_once_across_handlers(self):
+        state = _make_state()
+        actions = _build_actions()
+        calls = 0
+
+        def _roots():
+            nonlocal calls
+            calls += 1
+            return actions
+
+        state.adapter.controller.GetRootActions = _roots
+        requests = [
+            ("events", {}),
+            ("draws", {}),
+            ("draw", {"eid": 42}),
+            ("event", {"eid": 42}),
+            ("info", {}),
+        ]
+        for _ in range(2):
+            for method, params in requests:
+                resp, _ = _handle_request(rpc_request(method, params), state)
+                assert "result" in resp, (method, resp)
+        # One fetch for the action index, one for the pass catalog.
+        assert calls == 2
+
+    def test_rebuilt_for_new_adapter(self):
+        from rdc.adapter import RenderDocAdapter
+
+        state = _make_state()
+        _handle_request(rpc_request("events"), state)
+        ctrl = state.adapter.controller
+        ctrl.GetRootActions = lambda: [
+            ActionDescription(eventId=7, flags=ActionFlags.Drawcall, _name="vkCmdDraw")
+        ]
+        state.adapter = RenderDocAdapter(controller=ctrl, version=(1, 33))
+        resp, _ = _handle_request(rpc_request("events"), state)
+        assert [e["eid"] for e in resp["result"]["events"]] == [7]
+
+
 class _IntLike:
     """Helper that supports int() conversion for resource IDs."""
 
@@ -361,6 +401,25 @@ def _make_log_state(messages=None):
     return make_daemon_state(ctrl=ctrl, version=(1, 33), max_eid=300, structured_file=sf)
 
 
+class TestPassCatalogCache:
+    def test_pass_handlers_share_one_catalog(self):
+        state = _make_pass_state()
+        _handle_request(rpc_request("passes"), state)
+        catalog = state._pass_catalog
+        assert catalog is not None
+        _handle_request(rpc_request("pass", {"name": "Shadow"}), state)
+        resp, _ = _handle_request(rpc_request("count", {"what": "passes"}), state)
+        assert resp["result"]["value"] == 1
+        assert state._pass_catalog is catalog
+
+    def test_pass_detail_does_not_mutate_cache(self):
+        state = _make_pass_state()
+        resp, _ = _handle_request(rpc_request("pass", {"index": 0}), state)
+        assert "color_targets" in resp["result"]
+        assert state._pass_catalog is not None
+        assert "color_targets" not in state._pass_catalog.passes[0]
+
+
 class TestPassHandler:
     def test_pass_by_index(self):
         resp, _ = _handle_request(rpc_request("pass", {"index": 0}), _make_pass_state())
@@ -946,3 +1005,149 @@ class TestB75SDValueExtraction:
         state = _make_b75_state([child])
         resp, _ = _handle_request(rpc_request("event", {"eid": 42}), state)
         assert "777" in resp["result"]["Parameters"]
+
+
+# ---------------------------------------------------------------------------
+# Per-event output-target table
+# ---------------------------------------------------------------------------
+
+
+def _make_target_state(seeks: list[int]):
+    """Pass state whose SetFrameEvent calls are recorded in *seeks*."""
+    state = _make_pass_state()
+    state.adapter.controller.SetFrameEvent = lambda eid, force: seeks.append(eid)
+    state.tex_map = {
+        10: TextureDescription(resourceId=ResourceId(10), width=640, height=480),
+    }
+    return state
+
+
+class TestOutputTargetTable:
+    def test_stats_reads_table_after_first_call(self) -> None:
+        seeks: list[int] = []
+        state = _make_target_state(seeks)
+        resp, _ = _handle_request(rpc_request("stats"), state)
+        ps = resp["result"]["per_pass"][0]
+        assert (ps["attachments"], ps["rt_w"], ps["rt_h"]) == (2, 640, 480)
+        assert 42 in state._target_table
+        seeks.clear()
+        resp2, _ = _handle_request(rpc_request("stats"), state)
+        assert resp2["result"]["per_pass"] == resp["result"]["per_pass"]
+        assert seeks == []
+
+    def test_pass_and_attachment_share_entry(self) -> None:
+        seeks: list[int] = []
+        state = _make_target_state(seeks)
+        resp, _ = _handle_request(rpc_request("pass", {"name": "Shadow"}), state)
+        assert resp["result"]["color_targets"][0]["id"] == 10
+        seeks.clear()
+        for attachment, rid in (("color0", 10), ("depth", 20)):
+            resp, _ = _handle_request(
+                rpc_request("pass_attachment", {"name": "Shadow", "attachment": attachment}),
+                state,
+            )
+            assert resp["result"]["resource_id"] == rid
+        assert seeks == []
+
+    def test_draws_targets_opt_in(self) -> None:
+        seeks: list[int] = []
+        state = _make_target_state(seeks)
+        state.current_eid = 10
+        resp, _ = _handle_request(rpc_request("draws"), state)
+        assert "targets" not in resp["result"]["draws"][0]
+        assert seeks == []
+        resp, _ = _handle_request(rpc_request("draws", {"targets": True}), state)
+        row = resp["result"]["draws"][0]
+        assert row["targets"] == {"colors": [10], "depth": 20, "width": 640, "height": 480}
+        assert seeks == [42, 10]  # head restored to the user's event
+
+    def test_table_rebuilt_for_new_adapter(self) -> None:
+        state = _make_target_state([])
+        _handle_request(rpc_request("stats"), state)
+        table = state._target_table
+        state.adapter = _make_target_state([]).adapter
+        _handle_request(rpc_request("stats"), state)
+        assert state._target_table is not table
+
+    def test_largest_resources_top_five(self) -> None:
+        state = _make_state()
+        sizes = [64, 4096, 0, 512, 4096, 8, 1024, 2048]
+        res = [
+            ResourceDescription(
+                resourceId=ResourceId(i + 1),
+                name=f"r{i + 1}",
+                type=ResourceType.Buffer,
+                byteSize=size,
+            )
+            for i, size in enumerate(sizes)
+        ]
+        state.res_rid_map = {int(r.resourceId): r for r in res}
+        resp, _ = _handle_request(rpc_request("stats"), state)
+        largest = resp["result"]["largest_resources"]
+        assert [r["id"] for r in largest] == [2, 5, 8, 7, 4]
+
+
+# ---------------------------------------------------------------------------
+# Cursor pagination
+# ---------------------------------------------------------------------------
+
+
+def _all_pages(method: str, params: dict, state, key: str) -> list[dict]:
+    rows: list[dict] = []
+    cursor = None
+    while True:
+        page_params = {**params, "page_size": 2}
+        if cursor:
+            page_params["cursor"] = cursor
+        resp, _ = _handle_request(rpc_request(method, page_params), state)
+        result = resp["result"]
+        assert len(result[key]) <= 2
+        rows.extend(result[key])
+        cursor = result["next_cursor"]
+        if cursor is None:
+            return rows
+
+
+class TestPagination:
+    def test_events_pages_match_unpaged(self) -> None:
+        state = _make_state()
+        full, _ = _handle_request(rpc_request("events"), state)
+        assert "next_cursor" not in full["result"]
+        assert _all_pages("events", {}, state, "events") == full["result"]["events"]
+
+    def test_events_total_and_limit(self) -> None:
+        state = _make_state()
+        resp, _ = _handle_request(rpc_request("events", {"limit": 3, "page_size": 2}), state)
+        assert resp["result"]["total"] == 3
+        assert resp["result"]["next_cursor"] is not None
+
+    def test_draws_paged(self) -> None:
+        state = _make_state()
+        full, _ = _handle_request(rpc_request("draws"), state)
+        resp, _ = _handle_request(rpc_request("draws", {"page_size": 1}), state)
+        assert resp["result"]["draws"] == full["result"]["draws"][:1]
+        assert resp["result"]["summary"] == full["result"]["summary"]
+
+    def test_stale_cursor_after_reload(self) -> None:
+        state = _make_state()
+        resp, _ = _handle_request(rpc_request("events", {"page_size": 1}), state)
+        cursor = resp["result"]["next_cursor"]
+        state.adapter = _make_state().adapter
+        resp, _ = _handle_request(rpc_request("events", {"cursor": cursor}), state)
+        assert resp["error"]["code"] == -32602
+        assert "stale" in resp["error"]["message"]
+
+    def test_bad_cursor_and_page_size(self) -> None:
+        state = _make_state()
+        for params in ({"cursor": "not-a-cursor"}, {"page_size": 0}, {"page_size": "x"}):
+            resp, _ = _handle_request(rpc_request("events", params), state)
+            assert resp["error"]["code"] == -32602, params
+
+    def test_events_stream_defers_rows(self) -> None:
+        state = _make_state()
+        full, _ = _handle_request(rpc_request("events"), state)
+        resp, _ = _handle_request(rpc_request("events", {"_stream": True}), state)
+        result = resp["result"]
+        assert result["_stream"] == "events"
+        assert not isinstance(result["events"], list)
+        assert list(result["events"]) == full["result"]["events"]
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import json
+
 from click.testing import CliRunner
 
 from rdc.cli import main
@@ -15,6 +17,7 @@ def _patch_events(monkeypatch, response):
     import rdc.commands.events as mod
 
     monkeypatch.setattr(mod, "call", lambda m, p=None: response)
+    monkeypatch.setattr(mod, "call_stream", lambda m, p, key: iter(response.get(key, [])))
 
 
 def test_events_tsv(monkeypatch) -> None:
@@ -71,6 +74,41 @@ def test_events_with_filters(monkeypatch) -> None:
     assert calls[0]["range"] == "0:100"
 
 
+def _paged_call(key: str, rows: list[dict], calls: list[dict]):
+    def fake_call(m, p=None):
+        calls.append(p)
+        start = int(p.get("cursor") or 0)
+        end = start + 2
+        return {key: rows[start:end], "next_cursor": str(end) if end < len(rows) else None}
+
+    return fake_call
+
+
+def test_events_pages_through_results(monkeypatch) -> None:
+    import rdc.commands.events as mod
+
+    rows = [{"eid": i, "type": "Draw", "name": f"d{i}"} for i in range(5)]
+    calls: list[dict] = []
+    monkeypatch.setattr(mod, "call", _paged_call("events", rows, calls))
+    result = CliRunner().invoke(main, ["events"])
+    assert result.exit_code == 0
+    lines = result.output.splitlines()
+    assert lines[0] == "EID\tTYPE\tNAME"
+    assert [line.split("\t")[0] for line in lines[1:]] == ["0", "1", "2", "3", "4"]
+    assert [c.get("cursor") for c in calls] == [None, "2", "4"]
+    assert all("page_size" in c for c in calls)
+
+
+def test_events_json_collects_pages(monkeypatch) -> None:
+    import rdc.commands.events as mod
+
+    rows = [{"eid": i, "type": "Draw", "name": f"d{i}"} for i in range(3)]
+    monkeypatch.setattr(mod, "call", _paged_call("events", rows, []))
+    result = CliRunner().invoke(main, ["events", "--json"])
+    assert result.exit_code == 0
+    assert json.loads(result.output) == rows
+
+
 def test_events_no_header(monkeypatch) -> None:
     _patch_events(monkeypatch, {"events": [{"eid": 1, "type": "Draw", "name": "x"}]})
     result = CliRunner().invoke(main, ["events", "--no-header"])
@@ -254,8 +254,15 @@ class TestBufferCmd:
             temp.write_bytes(b"\xab\xcd" * 50)
             return {"path": str(temp), "size": 100}
 
+        def mock_call_binary(
+            method: str, params: dict[str, Any]
+        ) -> tuple[dict[str, Any], bytes | None]:
+            calls.append((method, dict(params)))
+            return {"size": 100}, b"\xab\xcd" * 50
+
         monkeypatch.setattr("rdc.commands.export.call", mock_call)
         monkeypatch.setattr("rdc.commands.vfs.call", mock_call)
+        monkeypatch.setattr("rdc.commands.vfs.call_binary", mock_call_binary)
         monkeypatch.setattr("rdc.commands.vfs._stdout_is_tty", lambda: False)
         out_file = tmp_path / "buf.bin"
         runner = click.testing.CliRunner()
@@ -263,15 +270,56 @@ class TestBufferCmd:
         assert result.exit_code == 0
         vfs_calls = [c for c in calls if c[0] == "vfs_ls"]
         assert any("/buffers/7/data" in str(c) for c in vfs_calls)
+        assert ("buf_raw", {"id": 7, "binary": True}) in calls
+        assert out_file.read_bytes() == b"\xab\xcd" * 50
 
     def test_buffer_pipe_mode(self, monkeypatch: Any, tmp_path: Path) -> None:
         mock = _make_mockcall(tmp_path)
         monkeypatch.setattr("rdc.commands.export.call", mock)
         monkeypatch.setattr("rdc.commands.vfs.call", mock)
+        monkeypatch.setattr(
+            "rdc.commands.vfs.call_binary", lambda m, p: ({"size": 4}, b"\x01\x02\x03\x04")
+        )
         monkeypatch.setattr("rdc.commands.vfs._stdout_is_tty", lambda: False)
         runner = click.testing.CliRunner()
         result = runner.invoke(buffer_cmd, ["7", "--raw"])
         assert result.exit_code == 0
+        assert result.stdout_bytes == b"\x01\x02\x03\x04"
+
+    def test_buffer_range_forwarded(self, monkeypatch: Any, tmp_path: Path) -> None:
+        mock = _make_mockcall(tmp_path)
+        sent: list[dict[str, Any]] = []
+
+        def mock_call_binary(method: str, params: dict[str, Any]) -> tuple[dict[str, Any], bytes]:
+            sent.append(params)
+            return {"size": 2}, b"\xcd\xab"
+
+        monkeypatch.setattr("rdc.commands.export.call", mock)
+        monkeypatch.setattr("rdc.commands.vfs.call", mock)
+        monkeypatch.setattr("rdc.commands.vfs.call_binary", mock_call_binary)
+        monkeypatch.setattr("rdc.commands.vfs._stdout_is_tty", lambda: False)
+        out_file = tmp_path / "slice.bin"
+        runner = click.testing.CliRunner()
+        result = runner.invoke(
+            buffer_cmd, ["7", "--offset", "1", "--length", "2", "-o", str(out_file)]
+        )
+        assert result.exit_code == 0
+        assert sent == [{"id": 7, "offset": 1, "length": 2, "binary": True}]
+        assert out_file.read_bytes() == b"\xcd\xab"
+
+    def test_buffer_falls_back_to_temp_file(self, monkeypatch: Any, tmp_path: Path) -> None:
+        """A daemon without binary support still answers with a temp file path."""
+        mock = _make_mockcall(tmp_path)
+        monkeypatch.setattr("rdc.commands.export.call", mock)
+        monkeypatch.setattr("rdc.commands.vfs.call", mock)
+        monkeypatch.setattr("rdc.commands.vfs.call_binary", lambda m, p: (mock(m, p), None))
+        monkeypatch.setattr("rdc.commands.vfs._load_session", lambda: None)
+        monkeypatch.setattr("rdc.commands.vfs._stdout_is_tty", lambda: False)
+        out_file = tmp_path / "buf.bin"
+        runner = click.testing.CliRunner()
+        result = runner.invoke(buffer_cmd, ["7", "-o", str(out_file)])
+        assert result.exit_code == 0
+        assert out_file.read_bytes().startswith(b"\x89PNG")
 
 
 class TestExportErrors:
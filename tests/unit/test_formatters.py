@@ -203,6 +203,8 @@ class TestRenderList:
 def _patch(monkeypatch, mod_name: str, response: dict) -> None:
     mod = __import__(f"rdc.commands.{mod_name}", fromlist=["call"])
     monkeypatch.setattr(mod, "call", lambda method, params=None: response)
+    if hasattr(mod, "call_stream"):
+        monkeypatch.setattr(mod, "call_stream", lambda method, params, key: iter(response[key]))
 
 
 _EVENTS = {
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import struct
 from typing import Any
 
 from click.testing import CliRunner
@@ -281,3 +282,114 @@ class TestNonTriangleTopologyWarning:
             "\n".join(ln for ln in result.output.split("\n") if not ln.startswith("mesh:"))
         )
         assert data["face_count"] == 0
+
+
+def _binary_mesh() -> tuple[dict[str, Any], bytes]:
+    xyz = [c for v in _MESH_RESPONSE["vertices"] for c in v[:3]]
+    payload = struct.pack("<9f", *xyz) + struct.pack("<3I", 0, 2, 1)
+    meta = {
+        k: v for k, v in _MESH_RESPONSE.items() if k not in ("vertices", "indices", "index_count")
+    }
+    meta.update(index_count=3, indices_offset=36, position_dtype="<f4", index_dtype="<u4")
+    return meta, payload
+
+
+class TestMeshBinaryFormats:
+    def _patch(self, monkeypatch: Any, calls: list[dict[str, Any]]) -> None:
+        def fake(method: str, params: dict[str, Any]) -> tuple[dict[str, Any], bytes]:
+            calls.append(params)
+            return _binary_mesh()
+
+        monkeypatch.setattr("rdc.commands.mesh.call_binary", fake)
+
+    def test_ply_inferred_from_suffix(self, monkeypatch: Any, tmp_path: Any) -> None:
+        calls: list[dict[str, Any]] = []
+        self._patch(monkeypatch, calls)
+        out = tmp_path / "mesh.ply"
+        result = CliRunner().invoke(mesh_cmd, ["-o", str(out)])
+        assert result.exit_code == 0, result.output
+        assert calls[0]["binary"] is True
+        header, body = out.read_bytes().split(b"end_header\n", 1)
+        assert b"comment rdc mesh export: eid=142" in header
+        assert b"element face 1" in header
+        assert struct.unpack_from("<3I", body, 37) == (0, 2, 1)
+
+    def test_glb_to_pipe(self, monkeypatch: Any) -> None:
+        self._patch(monkeypatch, [])
+        result = CliRunner().invoke(mesh_cmd, ["--format", "glb"])
+        assert result.exit_code == 0
+        assert result.stdout_bytes[:4] == b"glTF"
+
+    def test_gltf_requires_output(self, monkeypatch: Any) -> None:
+        self._patch(monkeypatch, [])
+        result = CliRunner().invoke(mesh_cmd, ["--format", "gltf"])
+        assert result.exit_code != 0
+        assert "-o" in result.output
+
+    def test_json_rejects_binary_format(self) -> None:
+        result = CliRunner().invoke(mesh_cmd, ["--json", "--format", "ply"])
+        assert result.exit_code != 0
+
+    def test_json_fallback_without_payload(self, monkeypatch: Any, tmp_path: Any) -> None:
+        monkeypatch.setattr(
+            "rdc.commands.mesh.call_binary", lambda m, p: (dict(_MESH_RESPONSE), None)
+        )
+        out = tmp_path / "mesh.ply"
+        result = CliRunner().invoke(mesh_cmd, ["-o", str(out), "--no-header"])
+        assert result.exit_code == 0
+        assert b"element vertex 3\n" in out.read_bytes()
+        assert b"comment" not in out.read_bytes()
+
+
+class TestMeshBatchCmd:
+    def _patch(self, monkeypatch: Any, calls: list[tuple[str, dict[str, Any]]]) -> None:
+        meta, payload = _binary_mesh()
+        meta = {k: v for k, v in meta.items() if k not in ("eid", "stage")}
+
+        def fake(method: str, params: dict[str, Any]) -> tuple[dict[str, Any], bytes]:
+            calls.append((method, params))
+            meshes = [
+                {**meta, "eid": eid, "offset": i * len(payload), "size": len(payload)}
+                for i, eid in enumerate((10, 20))
+            ]
+            result = {
+                "stage": "vs-out",
+                "meshes": meshes,
+                "skipped": [{"eid": 30, "error": "no PostVS data at this event"}],
+            }
+            return result, payload * 2
+
+        monkeypatch.setattr("rdc.commands.mesh.call_binary", fake)
+
+    def test_pass_writes_file_per_draw(self, monkeypatch: Any, tmp_path: Any) -> None:
+        calls: list[tuple[str, dict[str, Any]]] = []
+        self._patch(monkeypatch, calls)
+        out = tmp_path / "meshes"
+        result = CliRunner().invoke(mesh_cmd, ["--pass", "GBuffer", "-o", str(out)])
+        assert result.exit_code == 0, result.output
+        assert calls == [("mesh_batch", {"stage": "vs-out", "pass": "GBuffer"})]
+        assert sorted(p.name for p in out.iterdir()) == ["10.ply", "20.ply"]
+        header, body = (out / "20.ply").read_bytes().split(b"end_header\n", 1)
+        assert b"eid=20" in header
+        assert struct.unpack_from("<3I", body, 37) == (0, 2, 1)
+        assert "skipped eid 30" in result.output
+        assert "2 draws" in result.output
+
+    def test_range_obj(self, monkeypatch: Any, tmp_path: Any) -> None:
+        calls: list[tuple[str, dict[str, Any]]] = []
+        self._patch(monkeypatch, calls)
+        result = CliRunner().invoke(
+            mesh_cmd, ["--range", "10:20", "--format", "obj", "-o", str(tmp_path)]
+        )
+        assert result.exit_code == 0
+        assert calls[0][1]["range"] == "10:20"
+        assert "f 1 3 2" in (tmp_path / "10.obj").read_text()
+
+    def test_batch_needs_output_dir(self) -> None:
+        result = CliRunner().invoke(mesh_cmd, ["--range", "1:5"])
+        assert result.exit_code != 0
+        assert "-o DIR" in result.output
+
+    def test_batch_rejects_eid(self, tmp_path: Any) -> None:
+        result = CliRunner().invoke(mesh_cmd, ["5", "--range", "1:5", "-o", str(tmp_path)])
+        assert result.exit_code != 0
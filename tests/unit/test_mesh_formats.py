@@ -0,0 +1,108 @@
+"""Tests for the binary mesh encoders (PLY, glTF/GLB)."""
+
+from __future__ import annotations
+
+import json
+import random
+import struct
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from rdc.formatters.mesh import encode_glb, encode_ply, triangle_faces, write_mesh_file
+
+_POSITIONS = np.array([[0.0, 0.5, 0.0], [-0.5, -0.5, 0.0], [0.5, -0.5, 0.25]], dtype="<f4")
+_FACES = np.array([[0, 1, 2]], dtype="<u4")
+
+
+def _loop_faces(idx: list[int], topology: str) -> list[list[int]]:
+    """Reference per-triangle expansion the vectorized version must match."""
+    n = len(idx)
+    if topology == "TriangleList":
+        return [[idx[i], idx[i + 1], idx[i + 2]] for i in range(0, n - 2, 3)]
+    if topology == "TriangleStrip":
+        return [
+            [idx[i], idx[i + 1], idx[i + 2]] if i % 2 == 0 else [idx[i + 1], idx[i], idx[i + 2]]
+            for i in range(n - 2)
+        ]
+    if topology == "TriangleFan":
+        return [[idx[0], idx[i], idx[i + 1]] for i in range(1, n - 1)]
+    return []
+
+
+def _read_glb(data: bytes) -> tuple[dict, bytes]:
+    magic, version, total = struct.unpack_from("<III", data)
+    assert (magic, version, total) == (0x46546C67, 2, len(data))
+    json_len, json_type = struct.unpack_from("<II", data, 12)
+    assert json_type == 0x4E4F534A
+    doc = json.loads(data[20 : 20 + json_len])
+    bin_len, bin_type = struct.unpack_from("<II", data, 20 + json_len)
+    assert bin_type == 0x004E4942
+    start = 28 + json_len
+    return doc, data[start : start + bin_len]
+
+
+class TestTriangleFaces:
+    @pytest.mark.parametrize("topology", ["TriangleList", "TriangleStrip", "TriangleFan"])
+    @pytest.mark.parametrize("n", [0, 1, 2, 3, 4, 5, 6, 7, 10])
+    def test_matches_loop(self, topology: str, n: int) -> None:
+        idx = random.Random(n).sample(range(100), n)
+        faces = triangle_faces(idx, topology)
+        assert faces.dtype == np.uint32
+        assert faces.shape[1:] == (3,)
+        assert faces.tolist() == _loop_faces(idx, topology)
+
+    def test_other_topology_empty(self) -> None:
+        assert triangle_faces([0, 1, 2, 3], "LineList").shape == (0, 3)
+
+
+class TestPly:
+    def test_binary_layout(self) -> None:
+        data = b"".join(bytes(c) for c in encode_ply(_POSITIONS, _FACES, comment="eid=1"))
+        header, body = data.split(b"end_header\n", 1)
+        assert header.startswith(b"ply\nformat binary_little_endian 1.0\ncomment eid=1\n")
+        assert b"element vertex 3\n" in header
+        assert b"element face 1\n" in header
+        assert np.frombuffer(body, "<f4", count=9).reshape(3, 3).tolist() == _POSITIONS.tolist()
+        assert body[36] == 3
+        assert struct.unpack_from("<3I", body, 37) == (0, 1, 2)
+        assert len(body) == 36 + 13
+
+    def test_positions_not_copied(self) -> None:
+        chunks = encode_ply(_POSITIONS, _FACES)
+        assert np.shares_memory(np.frombuffer(chunks[1], "<f4"), _POSITIONS)
+
+
+class TestGltf:
+    def test_glb_roundtrip(self) -> None:
+        data = b"".join(bytes(c) for c in encode_glb(_POSITIONS, _FACES))
+        assert len(data) % 4 == 0
+        doc, blob = _read_glb(data)
+        pos_acc, idx_acc = doc["accessors"]
+        assert pos_acc["count"] == 3 and pos_acc["type"] == "VEC3"
+        assert pos_acc["min"] == pytest.approx([-0.5, -0.5, 0.0])
+        assert pos_acc["max"] == pytest.approx([0.5, 0.5, 0.25])
+        assert idx_acc["count"] == 3 and idx_acc["componentType"] == 5125
+        assert doc["meshes"][0]["primitives"][0] == {
+            "attributes": {"POSITION": 0},
+            "mode": 4,
+            "indices": 1,
+        }
+        pos_view, idx_view = doc["bufferViews"]
+        assert pos_view["byteOffset"] % 4 == 0 and idx_view["byteOffset"] % 4 == 0
+        assert np.frombuffer(blob, "<f4", count=9).tolist() == _POSITIONS.ravel().tolist()
+        idx = np.frombuffer(blob, "<u4", count=3, offset=idx_view["byteOffset"])
+        assert idx.tolist() == [0, 1, 2]
+
+    def test_glb_without_faces(self) -> None:
+        doc, _ = _read_glb(b"".join(bytes(c) for c in encode_glb(_POSITIONS, _FACES[:0])))
+        assert len(doc["accessors"]) == 1
+        assert "indices" not in doc["meshes"][0]["primitives"][0]
+
+    def test_gltf_writes_sidecar_bin(self, tmp_path: Path) -> None:
+        out = tmp_path / "mesh.gltf"
+        write_mesh_file(out, "gltf", _POSITIONS, _FACES)
+        doc = json.loads(out.read_text())
+        assert doc["buffers"] == [{"byteLength": 36 + 12, "uri": "mesh.bin"}]
+        assert (tmp_path / "mesh.bin").stat().st_size == 48
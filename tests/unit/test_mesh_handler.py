@@ -188,3 +188,92 @@ class TestMeshData:
         resp, _ = _handle_request(rpc_request("mesh_data", token="abcdef1234567890"), state)
         r = resp["result"]
         assert r["eid"] == 10
+
+    def test_mesh_data_binary(self, state: DaemonState) -> None:
+        """binary=true sends float32 xyz then uint32 indices instead of JSON arrays."""
+        state.adapter.controller._postvs[1] = _triangle_mesh(indexed=True)
+        resp, _ = _handle_request(
+            rpc_request("mesh_data", {"eid": 10, "binary": True}, token="abcdef1234567890"),
+            state,
+        )
+        r = resp["result"]
+        assert "vertices" not in r and "indices" not in r
+        assert r["position_dtype"] == "<f4"
+        assert r["index_dtype"] == "<u4"
+        assert r["indices_offset"] == 3 * 12
+        payload = r["_binary_data"]
+        assert r["_binary_size"] == len(payload) == 3 * 12 + 3 * 4
+        xyz = struct.unpack_from("<9f", payload)
+        assert xyz == pytest.approx([c for v in _VERTS for c in v[:3]])
+        assert struct.unpack_from("<3I", payload, r["indices_offset"]) == (0, 2, 1)
+
+
+class TestMeshBatch:
+    @pytest.fixture()
+    def batch_state(self, state: DaemonState) -> DaemonState:
+        actions = state.adapter.controller.GetRootActions()
+        actions += [
+            ActionDescription(eventId=e, flags=ActionFlags.Drawcall, numIndices=3, _name="Draw")
+            for e in (30, 20)
+        ]
+        actions.append(ActionDescription(eventId=25, flags=ActionFlags.SetMarker, _name="Mark"))
+        state.max_eid = 30
+        return state
+
+    def _batch(self, state: DaemonState, **params: Any) -> dict[str, Any]:
+        resp, _ = _handle_request(
+            rpc_request("mesh_batch", params, token="abcdef1234567890"), state
+        )
+        return resp
+
+    def test_range_in_replay_order_with_reuse(self, batch_state: DaemonState) -> None:
+        controller = batch_state.adapter.controller
+        reads: list[int] = []
+        seeks: list[int] = []
+        inner_read = controller.GetBufferData
+        controller.GetBufferData = lambda rid, off, n: (
+            reads.append(int(rid)) or inner_read(rid, off, n)
+        )
+        controller.SetFrameEvent = lambda eid, force: seeks.append(eid)
+        r = self._batch(batch_state, range="0:30")["result"]
+        assert [m["eid"] for m in r["meshes"]] == [10, 20, 30]
+        assert seeks == [10, 20, 30]
+        assert reads == [800]
+        assert r["reused"] == 2
+        payload = r["_binary_data"]
+        assert r["_binary_size"] == len(payload) == 3 * 36
+        m = r["meshes"][1]
+        assert (m["offset"], m["size"], m["vertex_count"]) == (36, 36, 3)
+        xyz = struct.unpack_from("<9f", payload, m["offset"])
+        assert xyz == pytest.approx([c for v in _VERTS for c in v[:3]])
+
+    @pytest.mark.parametrize("flags", [ActionFlags.Copy, ActionFlags.Clear, ActionFlags.Dispatch])
+    def test_buffer_reread_after_write(self, batch_state: DaemonState, flags: ActionFlags) -> None:
+        controller = batch_state.adapter.controller
+        controller.GetRootActions().append(ActionDescription(eventId=15, flags=flags, _name="W"))
+        reads: list[int] = []
+        inner_read = controller.GetBufferData
+        controller.GetBufferData = lambda rid, off, n: (
+            reads.append(int(rid)) or inner_read(rid, off, n)
+        )
+        r = self._batch(batch_state, range="0:30")["result"]
+        assert [m["eid"] for m in r["meshes"]] == [10, 20, 30]
+        assert reads == [800, 800]
+        assert r["reused"] == 1
+
+    def test_range_bounds(self, batch_state: DaemonState) -> None:
+        r = self._batch(batch_state, range="15:25")["result"]
+        assert [m["eid"] for m in r["meshes"]] == [20]
+
+    def test_draw_without_data_skipped(self, batch_state: DaemonState) -> None:
+        batch_state.adapter.controller._postvs.clear()
+        r = self._batch(batch_state, range=":")["result"]
+        assert r["meshes"] == []
+        assert [s["eid"] for s in r["skipped"]] == [10, 20, 30]
+        assert r["_binary_size"] == 0
+
+    def test_unknown_pass(self, batch_state: DaemonState) -> None:
+        assert self._batch(batch_state, **{"pass": "Nope"})["error"]["code"] == -32001
+
+    def test_missing_selector(self, batch_state: DaemonState) -> None:
+        assert self._batch(batch_state)["error"]["code"] == -32602
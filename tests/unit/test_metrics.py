@@ -0,0 +1,233 @@
+"""Tests for daemon request metrics (DaemonMetrics, metrics RPC, rdc status --metrics)."""
+
+from __future__ import annotations
+
+import json
+import socket
+from pathlib import Path
+from typing import Any
+
+import pytest
+from click.testing import CliRunner
+from conftest import make_daemon_state, rpc_request
+
+from rdc.cli import main
+from rdc.daemon_server import DaemonState, _handle_request, _serve_line
+from rdc.services.metrics import LATENCY_BUCKETS_MS, DaemonMetrics
+
+
+class TestDaemonMetrics:
+    def test_record_accumulates_per_method(self) -> None:
+        m = DaemonMetrics()
+        m.record("draws", 0.002, ok=True, nbytes=100)
+        m.record("draws", 0.004, ok=False, nbytes=50)
+        m.record("ping", 0.0001, ok=True, nbytes=10)
+        snap = m.snapshot()
+        draws = snap["methods"]["draws"]
+        assert draws["count"] == 2
+        assert draws["errors"] == 1
+        assert draws["total_ms"] == pytest.approx(6.0)
+        assert draws["max_ms"] == pytest.approx(4.0)
+        assert draws["bytes"] == 150
+        assert snap["requests"] == 3
+        assert snap["bytes_out"] == 160
+
+    def test_histogram_buckets(self) -> None:
+        m = DaemonMetrics()
+        m.record("x", 0.0005, ok=True)  # 0.5 ms -> first bucket
+        m.record("x", 0.003, ok=True)  # 3 ms -> <= 5
+        m.record("x", 60.0, ok=True)  # overflow
+        hist = m.snapshot()["methods"]["x"]["histogram"]
+        assert len(hist) == len(LATENCY_BUCKETS_MS) + 1
+        assert hist[0] == 1
+        assert hist[LATENCY_BUCKETS_MS.index(5)] == 1
+        assert hist[-1] == 1
+
+    def test_percentiles_from_buckets(self) -> None:
+        m = DaemonMetrics()
+        for _ in range(19):
+            m.record("x", 0.0008, ok=True)
+        m.record("x", 0.2, ok=True)
+        stats = m.snapshot()["methods"]["x"]
+        assert stats["p50_ms"] == 1
+        assert stats["p95_ms"] == 1
+        m.record("x", 0.2, ok=True)
+        assert m.snapshot()["methods"]["x"]["p95_ms"] == 250
+
+    def test_seek_hit_rate(self) -> None:
+        m = DaemonMetrics()
+        assert m.snapshot()["seeks"]["hit_rate"] is None
+        m.seek(hit=False)
+        m.seek(hit=True)
+        m.seek(hit=True)
+        m.seek(hit=True)
+        assert m.snapshot()["seeks"] == {"issued": 1, "cache_hits": 3, "hit_rate": 0.75}
+
+    def test_reset(self) -> None:
+        m = DaemonMetrics()
+        m.record("x", 0.001, ok=True, nbytes=5)
+        m.seek(hit=False)
+        m.reset()
+        snap = m.snapshot()
+        assert snap["methods"] == {}
+        assert snap["bytes_out"] == 0
+        assert snap["seeks"]["issued"] == 0
+
+    def test_trace_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "trace.jsonl"
+        m = DaemonMetrics()
+        m.open_trace(path)
+        m.record("draws", 0.002, ok=True, nbytes=42, seeks=1)
+        m.record("bogus", 0.001, ok=False)
+        m.close_trace()
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [e["method"] for e in lines] == ["draws", "bogus"]
+        assert lines[0]["bytes"] == 42
+        assert lines[0]["seeks"] == 1
+        assert lines[1]["ok"] is False
+        assert set(lines[0]) == {"ts", "method", "ms", "ok", "bytes", "seeks"}
+
+
+class TestMetricsRpc:
+    def test_counts_seeks_and_hits(self) -> None:
+        state = make_daemon_state()
+        _handle_request(rpc_request("goto", {"eid": 5}), state)
+        _handle_request(rpc_request("goto", {"eid": 5}), state)
+        _handle_request(rpc_request("goto", {"eid": 7}), state)
+        resp, _ = _handle_request(rpc_request("metrics"), state)
+        seeks = resp["result"]["seeks"]
+        assert seeks["issued"] == 2
+        assert seeks["cache_hits"] == 1
+
+    def test_cache_sizes(self) -> None:
+        state = make_daemon_state()
+        state.shader_meta[1] = {}
+        state.disasm_cache[1] = "text"
+        resp, _ = _handle_request(rpc_request("metrics"), state)
+        caches = resp["result"]["caches"]
+        assert caches["shader_meta"] == 1
+        assert caches["disasm"] == 1
+        assert caches["usage"] == 0
+        assert caches["usage_complete"] is False
+        assert caches["vfs_nodes"] == 0
+
+    def test_works_without_replay(self) -> None:
+        state = DaemonState(capture="x.rdc", current_eid=0, token="tok")
+        resp, running = _handle_request(rpc_request("metrics"), state)
+        assert running
+        assert resp["result"]["requests"] == 0
+
+    def test_reset_param(self) -> None:
+        state = make_daemon_state()
+        state.metrics.record("ping", 0.001, ok=True)
+        resp, _ = _handle_request(rpc_request("metrics", {"reset": True}), state)
+        assert resp["result"]["requests"] == 1
+        assert state.metrics.snapshot()["requests"] == 0
+
+
+class TestServeLineRecording:
+    def _serve(self, state: DaemonState, request: Any) -> bytes:
+        left, right = socket.socketpair()
+        with left, right:
+            _serve_line(left, json.dumps(request).encode(), state)
+            left.shutdown(socket.SHUT_WR)
+            return right.makefile("rb").read()
+
+    def test_records_method_latency_and_bytes(self) -> None:
+        state = DaemonState(capture="x.rdc", current_eid=0, token="tok")
+        sent = self._serve(state, rpc_request("ping"))
+        stats = state.metrics.snapshot()["methods"]["ping"]
+        assert stats["count"] == 1
+        assert stats["errors"] == 0
+        assert stats["bytes"] == len(sent)
+
+    def test_unknown_method_bucket(self) -> None:
+        state = DaemonState(capture="x.rdc", current_eid=0, token="tok")
+        self._serve(state, rpc_request("no_such_method"))
+        stats = state.metrics.snapshot()["methods"]["<unknown>"]
+        assert stats["errors"] == 1
+
+    def test_batch_entries_recorded(self) -> None:
+        state = DaemonState(capture="x.rdc", current_eid=0, token="tok")
+        sent = self._serve(state, [rpc_request("ping"), rpc_request("status")])
+        snap = state.metrics.snapshot()
+        assert snap["methods"]["ping"]["count"] == 1
+        assert snap["methods"]["status"]["count"] == 1
+        assert snap["bytes_out"] == len(sent)
+
+
+_METRICS = {
+    "uptime_s": 1.0,
+    "requests": 3,
+    "bytes_out": 1234,
+    "seeks": {"issued": 2, "cache_hits": 6, "hit_rate": 0.75},
+    "latency_buckets_ms": list(LATENCY_BUCKETS_MS),
+    "methods": {
+        "ping": {
+            "count": 1,
+            "errors": 0,
+            "total_ms": 0.1,
+            "mean_ms": 0.1,
+            "max_ms": 0.1,
+            "p50_ms": 1,
+            "p95_ms": 1,
+            "bytes": 40,
+            "seeks": 0,
+            "histogram": [],
+        },
+        "draws": {
+            "count": 2,
+            "errors": 0,
+            "total_ms": 12.0,
+            "mean_ms": 6.0,
+            "max_ms": 8.0,
+            "p50_ms": 10,
+            "p95_ms": 10,
+            "bytes": 1194,
+            "seeks": 2,
+            "histogram": [],
+        },
+    },
+    "trace": None,
+    "caches": {"shader_meta": 4, "usage": 0},
+}
+
+_STATUS = {
+    "capture": "x.rdc",
+    "current_eid": 0,
+    "opened_at": "now",
+    "daemon": "127.0.0.1:1 pid=1",
+}
+
+
+class TestStatusMetricsCmd:
+    @pytest.fixture(autouse=True)
+    def _patch(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("rdc.commands.session.status_session", lambda: (True, dict(_STATUS)))
+        monkeypatch.setattr("rdc.commands._helpers.call", lambda method, params: _METRICS)
+
+    def test_table(self) -> None:
+        result = CliRunner().invoke(main, ["status", "--metrics"])
+        assert result.exit_code == 0, result.output
+        assert "seeks: 2 issued, 6 cache hits (75%)" in result.output
+        lines = result.output.splitlines()
+        head = lines.index(next(ln for ln in lines if ln.startswith("METHOD")))
+        assert lines[head + 1].startswith("draws\t2")
+        assert lines[head + 2].startswith("ping\t1")
+        assert "caches: shader_meta=4, usage=0" in result.output
+
+    def test_json(self) -> None:
+        result = CliRunner().invoke(main, ["status", "--metrics", "--json"])
+        assert result.exit_code == 0, result.output
+        data = json.loads(result.output)
+        assert data["capture"] == "x.rdc"
+        assert data["metrics"]["requests"] == 3
+
+    def test_plain_status_skips_rpc(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        def _fail(method: str, params: Any) -> Any:
+            raise AssertionError("metrics RPC should not be called")
+
+        monkeypatch.setattr("rdc.commands._helpers.call", _fail)
+        result = CliRunner().invoke(main, ["status"])
+        assert result.exit_code == 0
+        assert "METHOD" not in result.output
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import random
 from typing import Any
 
 import mock_renderdoc as rd
@@ -177,6 +178,54 @@ class TestServiceEmptyUsageMap:
         assert result["edges"] == []
 
 
+class TestServiceMatchesPairwiseScan:
+    """The inverted-map DAG matches the pairwise pass comparison it replaced."""
+
+    @staticmethod
+    def _pairwise(passes: list[dict[str, Any]], usage: dict[int, list[Any]]) -> list[Any]:
+        writes = [set() for _ in passes]
+        reads = [set() for _ in passes]
+        for rid, events in usage.items():
+            for ev in events:
+                idx = next(
+                    (
+                        i
+                        for i, p in enumerate(passes)
+                        if p["begin_eid"] <= ev.eventId <= p["end_eid"]
+                    ),
+                    -1,
+                )
+                if idx < 0:
+                    continue
+                if ev.usage == rd.ResourceUsage.ColorTarget:
+                    writes[idx].add(rid)
+                else:
+                    reads[idx].add(rid)
+        return [
+            {"src": passes[a]["name"], "dst": passes[b]["name"], "resources": sorted(shared)}
+            for a in range(len(passes))
+            for b in range(len(passes))
+            if a != b and (shared := writes[a] & reads[b])
+        ]
+
+    def test_random_frames(self) -> None:
+        rng = random.Random(7)
+        for _ in range(20):
+            passes = [_pass(f"P{i}", i * 10 + 1, i * 10 + 8) for i in range(rng.randint(1, 30))]
+            max_eid = len(passes) * 10 + 5
+            usage = {
+                rid: [
+                    _eu(
+                        rng.randint(0, max_eid),
+                        rng.choice([rd.ResourceUsage.ColorTarget, rd.ResourceUsage.PS_Resource]),
+                    )
+                    for _ in range(rng.randint(1, 6))
+                ]
+                for rid in range(1, rng.randint(2, 40))
+            }
+            assert build_pass_deps(passes, usage)["edges"] == self._pairwise(passes, usage)
+
+
 class TestServiceMultipleWriters:
     """Case 10: Resource written by multiple passes."""
 
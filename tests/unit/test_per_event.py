@@ -0,0 +1,158 @@
+"""Tests for for_each_event and the per_event handler."""
+
+from __future__ import annotations
+
+import mock_renderdoc as rd
+import pytest
+from capture_gen import CaptureSpec, generate, load_state
+from conftest import make_daemon_state, rpc_request
+
+from rdc.daemon_server import DaemonState, _handle_request
+from rdc.handlers._helpers import for_each_event
+
+
+def _make_state() -> tuple[rd.MockReplayController, DaemonState]:
+    ctrl = rd.MockReplayController()
+    for eid in (10, 20, 30):
+        pipe = rd.MockPipeState()
+        pipe._shaders[rd.ShaderStage.Pixel] = rd.ResourceId(eid * 10)
+        ctrl._pipe_states[eid] = pipe
+    state = make_daemon_state(ctrl=ctrl, max_eid=100, rd=rd, current_eid=5)
+    return ctrl, state
+
+
+def _seeks(ctrl: rd.MockReplayController) -> list[int]:
+    return [eid for eid, _force in ctrl._set_frame_event_calls]
+
+
+class TestForEachEvent:
+    def test_sorted_deduped_and_restored_once(self) -> None:
+        ctrl, state = _make_state()
+        out = for_each_event(state, [30, 10, 30, 20], lambda eid: eid * 2)
+        assert out == {10: 20, 20: 40, 30: 60}
+        assert list(out) == [10, 20, 30]
+        assert _seeks(ctrl) == [10, 20, 30, 5]
+        assert state.current_eid == 5
+
+    def test_restores_when_visit_raises(self) -> None:
+        ctrl, state = _make_state()
+
+        def _boom(eid: int) -> None:
+            raise RuntimeError(eid)
+
+        with pytest.raises(RuntimeError):
+            for_each_event(state, [20], _boom)
+        assert _seeks(ctrl) == [20, 5]
+        assert state.current_eid == 5
+
+    def test_out_of_range(self) -> None:
+        _ctrl, state = _make_state()
+        with pytest.raises(ValueError, match="out of range"):
+            for_each_event(state, [10, 500], lambda eid: eid)
+        assert state.current_eid == 5
+
+    def test_no_events_no_seek(self) -> None:
+        ctrl, state = _make_state()
+        assert for_each_event(state, [], lambda eid: eid) == {}
+        assert _seeks(ctrl) == []
+
+    def test_shader_cache_build_walks_in_eid_order(self) -> None:
+        cap = generate(CaptureSpec(passes=2, markers_per_pass=2, draws_per_marker=3))
+        state = load_state(cap)
+        state.current_eid = cap.draw_eids[2]
+        _handle_request(rpc_request("shaders_preload"), state)
+        seeks = _seeks(cap.controller)
+        assert seeks[:-1] == cap.draw_eids
+        assert seeks[-1] == cap.draw_eids[2]
+        assert state.current_eid == cap.draw_eids[2]
+
+
+class TestPerEvent:
+    def test_results_per_event(self) -> None:
+        ctrl, state = _make_state()
+        resp, _ = _handle_request(
+            rpc_request(
+                "per_event",
+                {"eids": [20, 10, 20], "extractors": ["shader_all", "pipe_blend", "targets"]},
+            ),
+            state,
+        )
+        events = resp["result"]["events"]
+        assert [e["eid"] for e in events] == [10, 20]
+        assert set(events[0]["results"]) == {"shader_all", "pipe_blend", "targets"}
+        assert events[1]["results"]["shader_all"]["stages"][0]["shader"] == 200
+        assert "errors" not in events[0]
+        assert _seeks(ctrl) == [10, 20, 5]
+        assert state.current_eid == 5
+
+    def test_extractor_errors_reported_per_event(self) -> None:
+        _ctrl, state = _make_state()
+        resp, _ = _handle_request(
+            rpc_request(
+                "per_event",
+                {"eids": [10], "extractors": ["shader", "pipe_topology"], "params": {"stage": "x"}},
+            ),
+            state,
+        )
+        row = resp["result"]["events"][0]
+        assert row["errors"] == {"shader": "invalid stage"}
+        assert "pipe_topology" in row["results"]
+
+    def test_extractor_exception_reported_per_event(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        import rdc.handlers.query as query
+
+        ctrl, state = _make_state()
+        real = query._event_extractors
+
+        def _extractors() -> dict[str, object]:
+            table = dict(real())
+            topology = table["pipe_topology"]
+
+            def _boom(_rid: int, params: dict[str, object], _state: DaemonState) -> object:
+                if params["eid"] == 20:
+                    raise RuntimeError("replay lost")
+                return topology(_rid, params, _state)
+
+            table["pipe_topology"] = _boom
+            return table
+
+        monkeypatch.setattr(query, "_event_extractors", _extractors)
+        resp, _ = _handle_request(
+            rpc_request(
+                "per_event", {"eids": [10, 20, 30], "extractors": ["pipe_topology", "shader_all"]}
+            ),
+            state,
+        )
+        rows = resp["result"]["events"]
+        assert [r["eid"] for r in rows] == [10, 20, 30]
+        assert rows[1]["errors"] == {"pipe_topology": "replay lost"}
+        assert "shader_all" in rows[1]["results"]
+        assert all("pipe_topology" in rows[i]["results"] for i in (0, 2))
+        assert state.current_eid == 5
+        assert _seeks(ctrl)[-1] == 5
+
+    @pytest.mark.parametrize(
+        ("params", "message"),
+        [
+            ({"eids": [10], "extractors": ["nope"]}, "unknown extractor: nope"),
+            ({"eids": "10", "extractors": ["pipeline"]}, "eids must be a list of integers"),
+            ({"eids": [10], "extractors": []}, "extractors must be a non-empty list"),
+            ({"eids": [10, 500], "extractors": ["pipeline"]}, "eid 500 out of range (max: 100)"),
+        ],
+    )
+    def test_invalid_params(self, params: dict[str, object], message: str) -> None:
+        ctrl, state = _make_state()
+        resp, _ = _handle_request(rpc_request("per_event", params), state)
+        assert resp["error"] == {"code": -32602, "message": message}
+        assert _seeks(ctrl) == []
+
+    def test_mesh_batch_keeps_current_event(self) -> None:
+        cap = generate(CaptureSpec(passes=1, markers_per_pass=1, draws_per_marker=3))
+        state = load_state(cap)
+        state.current_eid = 1
+        resp, _ = _handle_request(
+            rpc_request("mesh_batch", {"range": f"{cap.draw_eids[0]}:{cap.draw_eids[-1]}"}),
+            state,
+        )
+        assert len(resp["result"]["meshes"]) == 3
+        assert state.current_eid == 1
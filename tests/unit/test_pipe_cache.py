@@ -0,0 +1,119 @@
+"""Tests for the per-event pipeline snapshot cache."""
+
+from __future__ import annotations
+
+import mock_renderdoc as rd
+import pytest
+from conftest import make_daemon_state, rpc_request
+
+from rdc.daemon_server import DaemonState, _handle_request
+from rdc.services.pipe_cache import DEFAULT_MAX_BYTES, PipeSnapshotCache, max_cache_bytes
+
+
+def _make_state() -> tuple[rd.MockReplayController, DaemonState]:
+    ctrl = rd.MockReplayController()
+    for eid in (10, 20):
+        pipe = rd.MockPipeState()
+        pipe._shaders[rd.ShaderStage.Pixel] = rd.ResourceId(eid * 10)
+        ctrl._pipe_states[eid] = pipe
+    return ctrl, make_daemon_state(ctrl=ctrl, max_eid=100, rd=rd)
+
+
+class TestPipeSnapshotCache:
+    def test_get_put(self) -> None:
+        cache = PipeSnapshotCache(1000)
+        assert cache.get(1, "a") is None
+        cache.put(1, "a", "xx")
+        cache.put(1, "b", "yyy")
+        assert cache.get(1, "a") == "xx"
+        assert (len(cache), cache.nbytes, cache.hits, cache.misses) == (1, 5, 1, 1)
+        cache.put(1, "a", "z")
+        assert cache.nbytes == 4
+
+    def test_evicts_least_recently_used_event(self) -> None:
+        cache = PipeSnapshotCache(10)
+        cache.put(1, "a", "1234")
+        cache.put(2, "a", "1234")
+        cache.get(1, "a")
+        cache.put(3, "a", "1234")
+        assert cache.get(2, "a") is None
+        assert cache.get(1, "a") == "1234"
+        assert cache.nbytes == 8
+
+    def test_oversized_entry_not_stored(self) -> None:
+        cache = PipeSnapshotCache(4)
+        cache.put(1, "a", "12345")
+        assert len(cache) == 0
+
+    def test_env_budget(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("RDC_PIPE_CACHE_MB", raising=False)
+        assert max_cache_bytes() == DEFAULT_MAX_BYTES
+        monkeypatch.setenv("RDC_PIPE_CACHE_MB", "2")
+        assert max_cache_bytes() == 2 * 1024 * 1024
+        monkeypatch.setenv("RDC_PIPE_CACHE_MB", "lots")
+        assert max_cache_bytes() == DEFAULT_MAX_BYTES
+
+
+class TestCachedHandlers:
+    def test_repeat_query_skips_replay(self) -> None:
+        ctrl, state = _make_state()
+        first, _ = _handle_request(rpc_request("shader", {"eid": 10}), state)
+        _handle_request(rpc_request("goto", {"eid": 20}), state)
+        calls = len(ctrl._set_frame_event_calls)
+        again, _ = _handle_request(rpc_request("shader", {"eid": 10}), state)
+        assert again["result"] == first["result"]
+        assert len(ctrl._set_frame_event_calls) == calls
+        assert state.current_eid == 10
+
+    def test_default_eid_is_current_eid(self) -> None:
+        ctrl, state = _make_state()
+        _handle_request(rpc_request("pipe_blend", {"eid": 20}), state)
+        _handle_request(rpc_request("goto", {"eid": 10}), state)
+        _handle_request(rpc_request("goto", {"eid": 20}), state)
+        calls = len(ctrl._set_frame_event_calls)
+        _handle_request(rpc_request("pipe_blend"), state)
+        assert len(ctrl._set_frame_event_calls) == calls
+
+    def test_params_are_part_of_key(self) -> None:
+        _ctrl, state = _make_state()
+        ps, _ = _handle_request(rpc_request("shader", {"eid": 20, "stage": "ps"}), state)
+        vs, _ = _handle_request(rpc_request("shader", {"eid": 20, "stage": "vs"}), state)
+        assert ps["result"] != vs["result"]
+        assert len(state._pipe_snapshots or []) == 1
+
+    def test_errors_not_cached(self) -> None:
+        _ctrl, state = _make_state()
+        resp, _ = _handle_request(rpc_request("pipeline", {"eid": 500}), state)
+        assert "error" in resp
+        assert len(state._pipe_snapshots or []) == 0
+
+    def test_shader_replace_invalidates(self) -> None:
+        ctrl, state = _make_state()
+        state.built_shaders[1000] = rd.ResourceId(1000)
+        _handle_request(rpc_request("shader_all", {"eid": 10}), state)
+        _handle_request(
+            rpc_request("shader_replace", {"eid": 10, "stage": "ps", "shader_id": 1000}), state
+        )
+        assert state._pipe_snapshots is None
+        calls = len(ctrl._set_frame_event_calls)
+        _handle_request(rpc_request("shader_all", {"eid": 10}), state)
+        assert len(ctrl._set_frame_event_calls) == calls + 1
+
+    def test_disabled_by_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("RDC_PIPE_CACHE_MB", "0")
+        ctrl, state = _make_state()
+        _handle_request(rpc_request("descriptors", {"eid": 10}), state)
+        _handle_request(rpc_request("goto", {"eid": 20}), state)
+        calls = len(ctrl._set_frame_event_calls)
+        _handle_request(rpc_request("descriptors", {"eid": 10}), state)
+        assert len(ctrl._set_frame_event_calls) == calls + 1
+
+    def test_metrics_report_snapshots(self) -> None:
+        _ctrl, state = _make_state()
+        _handle_request(rpc_request("pipe_viewport", {"eid": 10}), state)
+        _handle_request(rpc_request("pipe_viewport", {"eid": 10}), state)
+        resp, _ = _handle_request(rpc_request("metrics"), state)
+        caches = resp["result"]["caches"]
+        assert caches["pipe_snapshots"] == 1
+        assert caches["pipe_snapshot_bytes"] > 0
+        assert (caches["pipe_snapshot_hits"], caches["pipe_snapshot_misses"]) == (1, 1)
@@ -0,0 +1,144 @@
+"""Tests for per-request profiling (_profile param, --profile-dir, rdc --profile)."""
+
+from __future__ import annotations
+
+import pstats
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+import pytest
+from click.testing import CliRunner
+from conftest import make_daemon_state, rpc_request
+
+import rdc.commands._helpers as helpers_mod
+from rdc.cli import main
+from rdc.daemon_server import DaemonState, _handle_request
+from rdc.services.profiling import profile_call, profile_mode
+
+
+class TestProfileCall:
+    def test_mode_values(self) -> None:
+        assert profile_mode(None) is None
+        assert profile_mode(False) is None
+        assert profile_mode(True) == "cpu"
+        assert profile_mode("all") == "all"
+        with pytest.raises(ValueError, match="_profile"):
+            profile_mode("gpu")
+
+    def test_cpu_dump(self, tmp_path: Path) -> None:
+        result, info = profile_call(lambda: sum(range(100)), tmp_path / "p", "x", "cpu")
+        assert result == 4950
+        assert set(info) == {"pstats"}
+        assert pstats.Stats(info["pstats"]).total_calls > 0
+
+    def test_mem_dump(self, tmp_path: Path) -> None:
+        was_tracing = tracemalloc.is_tracing()
+        _, info = profile_call(lambda: [0] * 10000, tmp_path, "x", "mem")
+        assert info["peak_bytes"] > 0
+        assert isinstance(tracemalloc.Snapshot.load(info["tracemalloc"]), tracemalloc.Snapshot)
+        assert tracemalloc.is_tracing() == was_tracing
+
+    def test_dumps_written_when_call_raises(self, tmp_path: Path) -> None:
+        def _boom() -> None:
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            profile_call(_boom, tmp_path, "x", "cpu")
+        assert (tmp_path / "x.pstats").is_file()
+
+
+class TestProfiledRequest:
+    def test_profile_param_dumps_to_temp_dir(self, tmp_path: Path) -> None:
+        state = make_daemon_state(tmp_path=tmp_path)
+        resp, _ = _handle_request(rpc_request("goto", {"eid": 3, "_profile": True}), state)
+        info = resp["result"]["_profile"]
+        path = Path(info["pstats"])
+        assert path.parent == tmp_path / "profile"
+        assert path.name == "0001-goto.pstats"
+        assert resp["result"]["current_eid"] == 3
+
+    def test_dump_readable_via_file_read(self, tmp_path: Path) -> None:
+        state = make_daemon_state(tmp_path=tmp_path)
+        resp, _ = _handle_request(rpc_request("ping", {"_profile": "all"}), state)
+        info = resp["result"]["_profile"]
+        for key in ("pstats", "tracemalloc"):
+            read, _ = _handle_request(rpc_request("file_read", {"path": info[key]}), state)
+            assert read["result"]["_binary_path"] == str(Path(info[key]).resolve())
+
+    def test_error_response_carries_profile(self, tmp_path: Path) -> None:
+        state = make_daemon_state(tmp_path=tmp_path)
+        resp, _ = _handle_request(rpc_request("goto", {"eid": -1, "_profile": True}), state)
+        assert "pstats" in resp["error"]["data"]["_profile"]
+
+    def test_invalid_mode(self, tmp_path: Path) -> None:
+        state = make_daemon_state(tmp_path=tmp_path)
+        resp, _ = _handle_request(rpc_request("ping", {"_profile": "gpu"}), state)
+        assert resp["error"]["code"] == -32602
+
+    def test_no_temp_dir(self) -> None:
+        state = DaemonState(capture="x.rdc", current_eid=0, token="tok")
+        resp, _ = _handle_request(rpc_request("ping", {"_profile": True}), state)
+        assert resp["result"]["ok"] is True
+        assert "error" in resp["result"]["_profile"]
+
+    def test_profile_dir_profiles_every_request(self, tmp_path: Path) -> None:
+        state = make_daemon_state(profile_dir=tmp_path / "prof")
+        _handle_request(rpc_request("ping"), state)
+        _handle_request(rpc_request("status"), state)
+        names = sorted(p.name for p in (tmp_path / "prof").iterdir())
+        assert names == ["0001-ping.pstats", "0002-status.pstats"]
+
+    def test_unprofiled_by_default(self, tmp_path: Path) -> None:
+        state = make_daemon_state(tmp_path=tmp_path)
+        resp, _ = _handle_request(rpc_request("ping"), state)
+        assert "_profile" not in resp["result"]
+        assert not (tmp_path / "profile").exists()
+
+
+class TestProfileCli:
+    @pytest.fixture(autouse=True)
+    def _setup(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        monkeypatch.delenv("RDC_PROFILE", raising=False)
+        monkeypatch.delenv("RDC_PROFILE_MEM", raising=False)
+        monkeypatch.setattr(helpers_mod, "_profile_dumps", {})
+        self.state = make_daemon_state(tmp_path=tmp_path / "daemon")
+        self.sent: list[dict[str, Any]] = []
+
+        def _send(_h: str, _p: int, payload: dict[str, Any], **_kw: Any) -> dict[str, Any]:
+            self.sent.append(payload)
+            resp, _ = _handle_request(payload, self.state)
+            return resp
+
+        session = type("S", (), {"host": "h", "port": 1, "token": "tok"})()
+        monkeypatch.setattr(helpers_mod, "load_session", lambda: session)
+        monkeypatch.setattr(helpers_mod, "send_request", _send)
+
+    def test_profile_written_and_result_clean(self, tmp_path: Path) -> None:
+        out = tmp_path / "out.pstats"
+        result = CliRunner().invoke(main, ["--profile", str(out), "count", "draws"])
+        assert result.exit_code == 0, result.output
+        assert result.stdout.strip() == "0"
+        assert pstats.Stats(str(out)).total_calls > 0
+        assert self.sent[0]["params"]["_profile"] == "cpu"
+
+    def test_multiple_requests_merged(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        out = tmp_path / "out.pstats"
+        monkeypatch.setenv("RDC_PROFILE", str(out))
+        helpers_mod.call("ping", {})
+        first = pstats.Stats(str(out)).total_calls
+        helpers_mod.call("ping", {})
+        assert pstats.Stats(str(out)).total_calls > first
+
+    def test_mem_snapshot(self, tmp_path: Path) -> None:
+        out = tmp_path / "mem.tracemalloc"
+        result = CliRunner().invoke(main, ["--profile-mem", str(out), "count", "draws"])
+        assert result.exit_code == 0, result.output
+        assert self.sent[0]["params"]["_profile"] == "mem"
+        assert isinstance(tracemalloc.Snapshot.load(str(out)), tracemalloc.Snapshot)
+
+    def test_no_profile_param_without_flag(self) -> None:
+        helpers_mod.call("ping", {})
+        assert "_profile" not in self.sent[0]["params"]
@@ -10,12 +10,16 @@ from mock_renderdoc import (
 )
 
 from rdc.services.query_service import (
+    PassIndex,
     _build_pass_list,
     _build_synthetic_pass_list,
     _friendly_pass_name,
     _parse_load_store_ops,
     _pass_list_with_fallback,
     aggregate_stats,
+    build_action_index,
+    build_pass_catalog,
+    count_from_actions,
     filter_by_pass,
     filter_by_pattern,
     filter_by_type,
@@ -23,6 +27,7 @@ from rdc.services.query_service import (
     get_pass_detail,
     get_pass_hierarchy,
     get_top_draws,
+    pass_name_for_eid,
     pipeline_row,
     walk_actions,
 )
@@ -155,6 +160,78 @@ class TestFilterByType:
         assert filter_by_type(walk_actions(_build_action_tree()), "banana") == []
 
 
+class TestActionIndex:
+    def test_of_type_matches_filter_by_type(self):
+        flat = walk_actions(_build_action_tree())
+        index = build_action_index(flat)
+        for kind in ("draw", "dispatch", "clear", "copy", "banana"):
+            assert index.of_type(kind) == filter_by_type(flat, kind)
+
+    def test_eid_lookup(self):
+        flat = walk_actions(_build_action_tree())
+        index = build_action_index(flat)
+        assert index.get(42).parent_marker == "Shadow/Terrain"
+        assert index.get(99999) is None
+        assert all(flat[index.eid_to_index[a.eid]].eid == a.eid for a in flat)
+
+
+class TestPassIndex:
+    @staticmethod
+    def _pass(name, begin, end):
+        return {"name": name, "begin_eid": begin, "end_eid": end}
+
+    def test_matches_linear_scan(self):
+        passes = [
+            self._pass("A", 1, 10),
+            self._pass("B", 12, 20),
+            self._pass("Outer", 30, 60),
+            self._pass("Inner", 40, 45),
+            self._pass("Empty", 70, 69),
+        ]
+        index = PassIndex(passes)
+        for eid in range(0, 80):
+            assert index.name_for(eid) == pass_name_for_eid(eid, passes), eid
+
+    def test_lookup_positions(self):
+        passes = [self._pass("A", 5, 9), self._pass("B", 10, 10)]
+        index = PassIndex(passes)
+        assert [index.lookup(e) for e in (4, 5, 9, 10, 11)] == [-1, 0, 0, 1, -1]
+
+    def test_overlaps(self):
+        index = PassIndex([self._pass("A", 10, 20), self._pass("B", 30, 40)])
+        assert index.overlaps(15, 25)
+        assert index.overlaps(0, 10)
+        assert index.overlaps(40, 50)
+        assert not index.overlaps(21, 29)
+        assert not index.overlaps(41, 100)
+        assert not PassIndex([]).overlaps(0, 100)
+
+
+class TestPassCatalog:
+    def test_matches_pass_list(self):
+        actions = _build_action_tree()
+        catalog = build_pass_catalog(actions)
+        assert catalog.passes == _pass_list_with_fallback(actions)
+        assert catalog.find("shadow") is catalog.passes[0]
+        assert catalog.find(0) is catalog.passes[0]
+        assert catalog.find(99) is None
+        assert catalog.index.name_for(42) == "Shadow"
+
+    def test_get_pass_detail_returns_copy(self):
+        catalog = build_pass_catalog(_build_action_tree())
+        detail = get_pass_detail([], identifier="Shadow", catalog=catalog)
+        detail["extra"] = 1
+        assert "extra" not in catalog.passes[0]
+
+    def test_count_from_cached_catalog_and_flat(self):
+        actions = _build_action_tree()
+        catalog = build_pass_catalog(actions)
+        flat = walk_actions(actions)
+        for what in ("events", "passes", "draws", "triangles", "dispatches", "clears"):
+            cached = count_from_actions([], what, catalog=catalog, flat=flat)
+            assert cached == count_from_actions(actions, what), what
+
+
 class TestFilterByPass:
     def test_shadow(self):
         shadow = filter_by_pass(walk_actions(_build_action_tree()), "Shadow")
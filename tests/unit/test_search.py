@@ -306,6 +306,21 @@ class TestSearchHandler:
         assert state.disasm_cache[100] == "sentinel"
         assert len(state.disasm_cache) == call_count_before
 
+    def test_index_reused_and_refreshed(self, state: DaemonState) -> None:
+        _handle_request(
+            rpc_request("search", {"pattern": "OpCapability"}, token="abcdef1234567890"), state
+        )
+        index = state._search_index
+        assert index is not None
+        _handle_request(rpc_request("search", {"pattern": "Op"}, token="abcdef1234567890"), state)
+        assert state._search_index is index
+        state.disasm_cache[100] = "sentinel line"
+        resp, _ = _handle_request(
+            rpc_request("search", {"pattern": "sentinel"}, token="abcdef1234567890"), state
+        )
+        assert state._search_index is not index
+        assert [m["shader"] for m in resp["result"]["matches"]] == [100]
+
 
 # ---------------------------------------------------------------------------
 # Tests: shader_list_info handler
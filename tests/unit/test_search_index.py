@@ -0,0 +1,122 @@
+"""Tests for the disassembly search index."""
+
+from __future__ import annotations
+
+import random
+import re
+
+import pytest
+
+from rdc.services.search_index import DisasmIndex, required_literals
+
+_DISASM = {
+    100: "; Vertex Shader\nOpCapability Shader\n%in_pos = OpLoad %v4float %pos\nOpReturn\n",
+    200: "; Pixel Shader\r\nOpCapability Shader\r\n%color = OpLoad %v4float %tex\r\nOpKill",
+    300: "",
+    400: "; Compute\nOpCapability Shader\n%ſample = OpLoad %uint %idx\n",
+}
+
+
+def _full_scan(disasm: dict[int, str], compiled: re.Pattern[str]) -> list[tuple[int, int]]:
+    return [
+        (sid, n)
+        for sid, text in disasm.items()
+        for n, line in enumerate(text.splitlines())
+        if compiled.search(line)
+    ]
+
+
+def _indexed(index: DisasmIndex, compiled: re.Pattern[str]) -> list[tuple[int, int]]:
+    return [
+        (sid, n)
+        for sid, lines, linenos in index.candidates(compiled)
+        for n in linenos
+        if compiled.search(lines[n])
+    ]
+
+
+class TestRequiredLiterals:
+    @pytest.mark.parametrize(
+        ("pattern", "flags", "expected"),
+        [
+            ("OpLoad", 0, ["OpLoad"]),
+            ("OpLoad", re.IGNORECASE, ["opload"]),
+            ("(?i)OpLoad", 0, ["opload"]),
+            (r"^%\w+ = OpLoad$", 0, ["%", " = OpLoad"]),
+            ("Op(Load|Store)", 0, ["Op"]),
+            ("(Op)Load", 0, ["OpLoad"]),
+            ("OpLoads?", 0, ["OpLoad"]),
+            ("Load|Store", 0, []),
+            ("(?i:Op)Load", 0, ["Load"]),
+            ("café", 0, []),
+            ("a\nb", 0, []),
+        ],
+    )
+    def test_runs(self, pattern: str, flags: int, expected: list[str]) -> None:
+        assert required_literals(re.compile(pattern, flags)) == expected
+
+
+class TestDisasmIndex:
+    def test_lines_presplit(self) -> None:
+        index = DisasmIndex(_DISASM)
+        assert index.lines[1] == _DISASM[200].splitlines()
+
+    def test_prefilter_narrows_lines(self) -> None:
+        index = DisasmIndex(_DISASM)
+        got = {sid: list(n) for sid, _l, n in index.candidates(re.compile("OpKill"))}
+        assert got == {200: [3], 400: [0, 1, 2]}  # 400 is not ASCII: scanned in full
+
+    def test_unknown_token_has_no_candidates(self) -> None:
+        index = DisasmIndex({k: v for k, v in _DISASM.items() if k != 400})
+        assert list(index.candidates(re.compile("% = OpNope "))) == []
+
+    def test_keep_skips_shaders(self) -> None:
+        index = DisasmIndex(_DISASM)
+        sids = [sid for sid, _l, _n in index.candidates(re.compile("Op"), lambda s: s == 100)]
+        assert sids == [100]
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [
+            "OpLoad",
+            "opload",
+            "v4float %p",
+            "Shader$",
+            r"%\w+ = OpLoad",
+            "Op(Return|Kill)",
+            "Shader\r",
+            "SAMPLE",
+            "ad %v",
+            "",
+        ],
+    )
+    @pytest.mark.parametrize("flags", [0, re.IGNORECASE])
+    def test_matches_full_scan(self, pattern: str, flags: int) -> None:
+        compiled = re.compile(pattern, flags)
+        assert _indexed(DisasmIndex(_DISASM), compiled) == _full_scan(_DISASM, compiled)
+
+    def test_random_literals_match_full_scan(self) -> None:
+        rng = random.Random(7)
+        words = ["OpLoad", "OpStore", "%v4float", "%ptr", "=", "_tmp1", "Uniform", "x"]
+        disasm = {
+            sid: "\n".join(
+                " ".join(rng.choice(words) for _ in range(rng.randint(0, 6)))
+                for _ in range(rng.randint(0, 12))
+            )
+            for sid in range(40)
+        }
+        index = DisasmIndex(disasm)
+        for _ in range(200):
+            line = " ".join(rng.choice(words) for _ in range(3))
+            a = rng.randrange(len(line))
+            pattern = re.escape(line[a : a + rng.randint(1, 12)])
+            for flags in (0, re.IGNORECASE):
+                compiled = re.compile(pattern, flags)
+                assert _indexed(index, compiled) == _full_scan(disasm, compiled), pattern
+
+    def test_is_current_tracks_texts(self) -> None:
+        disasm = dict(_DISASM)
+        index = DisasmIndex(disasm)
+        assert index.is_current(disasm)
+        disasm[100] = "sentinel"
+        assert not index.is_current(disasm)
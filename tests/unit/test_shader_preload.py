@@ -23,7 +23,15 @@ from mock_renderdoc import (
 
 from rdc.adapter import RenderDocAdapter
 from rdc.cli import main
-from rdc.daemon_server import DaemonState, _build_shader_cache, _handle_request
+from rdc.commands.session import status_cmd
+from rdc.daemon_server import (
+    DaemonState,
+    _build_shader_cache,
+    _handle_request,
+    _idle_step,
+)
+from rdc.handlers._helpers import _restore_shader_cache
+from rdc.services import shader_store
 from rdc.vfs.tree_cache import build_vfs_skeleton
 
 # ---------------------------------------------------------------------------
@@ -196,6 +204,158 @@ class TestBuildShaderCacheIdempotent:
         assert s.disasm_cache[100] == "sentinel"
 
 
+class TestPersistentShaderCache:
+    def _reopen(self, s: DaemonState) -> DaemonState:
+        fresh = DaemonState(capture=s.capture, current_eid=0, token=s.token)
+        fresh.adapter = s.adapter
+        fresh.rd = s.rd
+        fresh.vfs_tree = build_vfs_skeleton(s.adapter.get_root_actions(), [])  # type: ignore[union-attr]
+        return fresh
+
+    def test_reopen_skips_replay(
+        self, tracked_state: tuple[DaemonState, list[int]], tmp_path: Path
+    ) -> None:
+        s, call_log = tracked_state
+        capture = tmp_path / "frame.rdc"
+        capture.write_bytes(b"RDOC capture bytes")
+        s.capture = str(capture)
+        assert _restore_shader_cache(s) is False
+        _build_shader_cache(s)
+        assert list(shader_store.cache_dir().glob("*.json.gz"))
+        seeks = len(call_log)
+
+        again = self._reopen(s)
+        assert _restore_shader_cache(again) is True
+        _build_shader_cache(again)
+        assert len(call_log) == seeks
+        assert again.disasm_cache == s.disasm_cache
+        assert again.shader_meta == s.shader_meta
+        assert again._pipe_states_cache == s._pipe_states_cache
+        assert again.vfs_tree is not None
+        assert "/shaders/100" in again.vfs_tree.static
+
+    def test_changed_capture_misses(
+        self, tracked_state: tuple[DaemonState, list[int]], tmp_path: Path
+    ) -> None:
+        s, _ = tracked_state
+        capture = tmp_path / "frame.rdc"
+        capture.write_bytes(b"first")
+        s.capture = str(capture)
+        _restore_shader_cache(s)
+        _build_shader_cache(s)
+        capture.write_bytes(b"second")
+        assert _restore_shader_cache(self._reopen(s)) is False
+
+    def test_not_persisted_while_shader_replaced(
+        self, tracked_state: tuple[DaemonState, list[int]], tmp_path: Path
+    ) -> None:
+        s, _ = tracked_state
+        capture = tmp_path / "frame.rdc"
+        capture.write_bytes(b"RDOC capture bytes")
+        s.capture = str(capture)
+        s.shader_replacements[100] = ResourceId(100)
+        assert _restore_shader_cache(s) is False
+        _build_shader_cache(s)
+        assert s._shader_cache_built
+        assert not list(shader_store.cache_dir().glob("*.json.gz"))
+        s.shader_replacements.clear()
+        assert _restore_shader_cache(self._reopen(s)) is False
+
+    def test_missing_capture_not_persisted(
+        self, tracked_state: tuple[DaemonState, list[int]]
+    ) -> None:
+        s, _ = tracked_state
+        assert _restore_shader_cache(s) is False
+        assert s._shader_store_key is None
+        _build_shader_cache(s)
+        assert not shader_store.cache_dir().exists()
+
+    def test_disabled_by_zero_budget(
+        self,
+        tracked_state: tuple[DaemonState, list[int]],
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setenv("RDC_SHADER_CACHE_MB", "0")
+        s, _ = tracked_state
+        capture = tmp_path / "frame.rdc"
+        capture.write_bytes(b"bytes")
+        s.capture = str(capture)
+        assert _restore_shader_cache(s) is False
+        assert s._shader_store_key is None
+
+    def test_open_does_not_hash_capture(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from capture_gen import CaptureSpec, generate, load_state
+
+        capture = tmp_path / "frame.rdc"
+        capture.write_bytes(b"RDOC capture bytes")
+        hashed: list[str] = []
+        real_key = shader_store.capture_key
+
+        def _key(path: str | Path, version: str, target: str) -> str | None:
+            hashed.append(str(path))
+            return real_key(path, version, target)
+
+        monkeypatch.setattr(shader_store, "capture_key", _key)
+        cap = generate(CaptureSpec(passes=1, markers_per_pass=1, draws_per_marker=2))
+        first = load_state(cap)
+        assert hashed == []
+        first.capture = str(capture)
+        _build_shader_cache(first)
+        assert hashed == [str(capture)]
+
+        reopened = load_state(cap)
+        reopened.capture = str(capture)
+        assert hashed == [str(capture)]
+        seeks = len(cap.controller._set_frame_event_calls)
+        _build_shader_cache(reopened)
+        assert reopened._shader_cache_built
+        assert len(cap.controller._set_frame_event_calls) == seeks
+
+
+class TestShaderStore:
+    def _data(self, n: int) -> shader_store.ShaderCacheData:
+        return shader_store.ShaderCacheData({1: "x" * n}, {1: {"uses": 1}}, {10: {0: 1}})
+
+    def test_round_trip_int_keys(self) -> None:
+        shader_store.store("k", self._data(4))
+        data = shader_store.load("k")
+        assert data == self._data(4)
+
+    def test_key_depends_on_target_and_version(self, tmp_path: Path) -> None:
+        capture = tmp_path / "c.rdc"
+        capture.write_bytes(b"abc")
+        base = shader_store.capture_key(capture, "v1.41", "SPIR-V")
+        assert base is not None
+        assert shader_store.capture_key(capture, "v1.41", "GLSL") != base
+        assert shader_store.capture_key(capture, "v1.42", "SPIR-V") != base
+        assert shader_store.capture_key(tmp_path / "missing.rdc", "v1.41", "SPIR-V") is None
+
+    def test_evicts_least_recently_used(self) -> None:
+        import os
+
+        for i, key in enumerate(("a", "b", "c")):
+            shader_store.store(key, self._data(10))
+            path = shader_store.cache_dir() / f"{key}.json.gz"
+            os.utime(path, (1000 + i, 1000 + i))
+        size = (shader_store.cache_dir() / "a.json.gz").stat().st_size
+        assert shader_store.load("a") is not None  # touch: now most recent
+        removed = shader_store.evict(2 * size)
+        assert removed == 1
+        assert shader_store.load("b") is None
+        assert shader_store.load("a") is not None
+        assert shader_store.load("c") is not None
+
+    def test_corrupt_entry_discarded(self) -> None:
+        path = shader_store.cache_dir() / "bad.json.gz"
+        path.parent.mkdir(parents=True)
+        path.write_bytes(b"not gzip")
+        assert shader_store.load("bad") is None
+        assert not path.exists()
+
+
 class TestShaderMetaContainsEids:
     def test_eids_present(self, state: DaemonState) -> None:
         _build_shader_cache(state)
@@ -226,6 +386,17 @@ class TestBuildShaderCachePopulatesCaches:
         assert state.vfs_tree.static.get("/shaders/100") is not None
         assert state.vfs_tree.static.get("/shaders/200") is not None
 
+    def test_output_targets_recorded(self, tracked_state: tuple[DaemonState, list[int]]) -> None:
+        s, call_log = tracked_state
+        _build_shader_cache(s)
+        assert s._target_table is not None
+        assert all(eid in s._target_table for eid in (10, 20, 30))
+        call_log.clear()
+        s.structured_file = SimpleNamespace(chunks=[])
+        resp, _ = _handle_request(rpc_request("stats", token="abcdef1234567890"), s)
+        assert "error" not in resp
+        assert call_log == []
+
 
 # ---------------------------------------------------------------------------
 # Tests: shaders_preload RPC handler
@@ -328,6 +499,132 @@ class TestOpenPreloadFlag:
         assert len(preload_calls) == 0
 
 
+class TestBackgroundWarm:
+    def _drain(self, s: DaemonState) -> int:
+        steps = 0
+        while _idle_step(s):
+            steps += 1
+            assert steps < 100
+        return steps
+
+    def test_warm_rpc_reports_progress(self, tracked_state: tuple[DaemonState, list[int]]) -> None:
+        s, call_log = tracked_state
+        s.res_rid_map = {1: ResourceDescription(resourceId=ResourceId(1), name="res0")}
+        s.adapter.controller.GetUsage = lambda _rid: []  # type: ignore[union-attr]
+        resp, _ = _handle_request(rpc_request("warm", token="abcdef1234567890"), s)
+        r = resp["result"]
+        assert r["done"] is False
+        assert r["stage"] == "actions"
+        assert call_log == []
+
+        self._drain(s)
+        status, _ = _handle_request(rpc_request("status", token="abcdef1234567890"), s)
+        warm = status["result"]["warm"]
+        assert warm["done"] is True
+        assert warm["actions"] is True
+        assert warm["shaders"] == [3, 3]
+        assert warm["usage"] == [1, 1]
+        assert s._shader_cache_built
+        assert set(s.disasm_cache) == {100, 200, 300}
+
+    def test_shader_stage_is_sliced(
+        self, tracked_state: tuple[DaemonState, list[int]], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("rdc.daemon_server._IDLE_SHADER_BATCH", 1)
+        s, call_log = tracked_state
+        s.current_eid = 20
+        _handle_request(rpc_request("warm", token="abcdef1234567890"), s)
+        _idle_step(s)  # actions
+        _idle_step(s)  # first draw
+        assert s._shader_build is not None
+        assert s._shader_build.progress == (1, 3)
+        assert not s.disasm_cache
+        assert s._eid_cache == 20
+        status, _ = _handle_request(rpc_request("status", token="abcdef1234567890"), s)
+        assert status["result"]["warm"]["stage"] == "shaders"
+        assert status["result"]["warm"]["shaders"] == [1, 3]
+
+        # An interactive request finishes the build without revisiting draws.
+        _build_shader_cache(s)
+        assert [e for e in call_log if e != 20] == [10, 30]
+        assert s._shader_cache_built
+
+    def test_status_without_warm(self, state: DaemonState) -> None:
+        resp, _ = _handle_request(rpc_request("status", token="abcdef1234567890"), state)
+        assert "warm" not in resp["result"]
+
+    def test_failed_stage_reported(self, state: DaemonState) -> None:
+        def _boom(*_a: Any) -> None:
+            raise RuntimeError("replay lost")
+
+        state.adapter.controller.SetFrameEvent = _boom  # type: ignore[union-attr]
+        _handle_request(rpc_request("warm", token="abcdef1234567890"), state)
+        self._drain(state)
+        resp, _ = _handle_request(rpc_request("status", token="abcdef1234567890"), state)
+        warm = resp["result"]["warm"]
+        assert warm["done"] is True
+        assert warm["error"] == "shaders: replay lost"
+
+    def test_open_warm_calls_rpc(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        monkeypatch.delenv("RDC_SESSION", raising=False)
+        monkeypatch.setattr("rdc.services.session_service._renderdoc_available", lambda: False)
+        mock_proc = MagicMock()
+        mock_proc.pid = 999
+        monkeypatch.setattr(
+            "rdc.services.session_service.start_daemon",
+            lambda *a, **kw: mock_proc,
+        )
+        monkeypatch.setattr(
+            "rdc.services.session_service.wait_for_ping",
+            lambda *a, **kw: (True, ""),
+        )
+
+        captured: list[dict[str, Any]] = []
+        import rdc.commands._helpers as helpers_mod
+
+        session = type("S", (), {"host": "127.0.0.1", "port": 1, "token": "tok"})()
+        monkeypatch.setattr(helpers_mod, "load_session", lambda: session)
+
+        def _capture_send(_h: str, _p: int, payload: dict[str, Any], **_kw: Any) -> dict[str, Any]:
+            captured.append(payload)
+            return {"result": {"done": False, "stage": "actions"}}
+
+        monkeypatch.setattr(helpers_mod, "send_request", _capture_send)
+
+        capture_file = tmp_path / "test.rdc"
+        capture_file.touch()
+        result = CliRunner().invoke(main, ["open", "--warm", str(capture_file)])
+        assert result.exit_code == 0
+        assert "warming caches in background" in result.output
+        assert [c["method"] for c in captured] == ["warm"]
+
+    def test_status_cmd_shows_warm(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(
+            "rdc.commands.session.status_session",
+            lambda: (
+                True,
+                {
+                    "capture": "frame.rdc",
+                    "current_eid": 0,
+                    "opened_at": "2026-01-01",
+                    "daemon": "127.0.0.1:9999 pid=123",
+                    "warm": {
+                        "done": False,
+                        "stage": "usage",
+                        "error": None,
+                        "actions": True,
+                        "shaders": [40, 40],
+                        "usage": [12, 300],
+                    },
+                },
+            ),
+        )
+        monkeypatch.delenv("RDC_SESSION", raising=False)
+        result = CliRunner().invoke(status_cmd)
+        assert result.exit_code == 0
+        assert "warm: running (usage): shaders 40/40 draws, usage 12/300 resources" in result.output
+
+
 # ---------------------------------------------------------------------------
 # Tests: handler callers use cache, not _collect_pipe_states
 # ---------------------------------------------------------------------------
@@ -12,7 +12,6 @@ from click.testing import CliRunner
 
 from rdc.cli import main
 from rdc.commands import _helpers as helpers_mod
-from rdc.commands import snapshot as snap_mod
 
 _PIPELINE_RESPONSE = {"eid": 142, "row": {"stages": []}}
 
@@ -54,6 +53,8 @@ def _build_send_request_mock(
     ) -> dict[str, Any]:
         method = payload["method"]
         params = payload.get("params", {})
+        if method == "pipeline":
+            return {"jsonrpc": "2.0", "id": 1, "result": _PIPELINE_RESPONSE}
         if method == "shader_all":
             return {"jsonrpc": "2.0", "id": 1, "result": {"eid": 142, "stages": stages}}
         if method == "shader_disasm":
@@ -86,15 +87,25 @@ def _build_send_request_mock(
     return fake_send_request
 
 
+def _batched(fake_send_request: Any) -> Any:
+    """Adapt a per-request fake into a send_batch fake that keeps request ids."""
+
+    def fake_send_batch(
+        host: str, port: int, payloads: list[dict[str, Any]], **_kw: Any
+    ) -> list[dict[str, Any]]:
+        return [{**fake_send_request(host, port, p), "id": p["id"]} for p in payloads]
+
+    return fake_send_batch
+
+
 class TestSnapshotHappyPath:
     def test_all_files_written(self, tmp_path: Path) -> None:
         out_dir = tmp_path / "snap"
         mock_sr = _build_send_request_mock(tmp_path, color_targets=1, has_depth=True)
 
         with (
-            patch.object(snap_mod, "call", return_value=_PIPELINE_RESPONSE),
             patch.object(helpers_mod, "require_session", return_value=_SESSION),
-            patch.object(helpers_mod, "send_request", side_effect=mock_sr),
+            patch.object(helpers_mod, "send_batch", side_effect=_batched(mock_sr)),
         ):
             result = CliRunner().invoke(main, ["snapshot", "142", "-o", str(out_dir)])
 
@@ -120,9 +131,8 @@ class TestSnapshotHappyPath:
         )
 
         with (
-            patch.object(snap_mod, "call", return_value=_PIPELINE_RESPONSE),
             patch.object(helpers_mod, "require_session", return_value=_SESSION),
-            patch.object(helpers_mod, "send_request", side_effect=mock_sr),
+            patch.object(helpers_mod, "send_batch", side_effect=_batched(mock_sr)),
         ):
             result = CliRunner().invoke(main, ["snapshot", "142", "-o", str(out_dir)])
 
@@ -135,9 +145,8 @@ class TestSnapshotHappyPath:
         mock_sr = _build_send_request_mock(tmp_path, color_targets=1, has_depth=True)
 
         with (
-            patch.object(snap_mod, "call", return_value=_PIPELINE_RESPONSE),
             patch.object(helpers_mod, "require_session", return_value=_SESSION),
-            patch.object(helpers_mod, "send_request", side_effect=mock_sr),
+            patch.object(helpers_mod, "send_batch", side_effect=_batched(mock_sr)),
         ):
             result = CliRunner().invoke(main, ["snapshot", "142", "-o", str(out_dir), "--json"])
 
@@ -156,9 +165,8 @@ class TestSnapshotPartialFailures:
         )
 
         with (
-            patch.object(snap_mod, "call", return_value=_PIPELINE_RESPONSE),
             patch.object(helpers_mod, "require_session", return_value=_SESSION),
-            patch.object(helpers_mod, "send_request", side_effect=mock_sr),
+            patch.object(helpers_mod, "send_batch", side_effect=_batched(mock_sr)),
         ):
             result = CliRunner().invoke(main, ["snapshot", "142", "-o", str(out_dir)])
 
@@ -172,9 +180,8 @@ class TestSnapshotPartialFailures:
         mock_sr = _build_send_request_mock(tmp_path, color_targets=0, has_depth=True)
 
         with (
-            patch.object(snap_mod, "call", return_value=_PIPELINE_RESPONSE),
             patch.object(helpers_mod, "require_session", return_value=_SESSION),
-            patch.object(helpers_mod, "send_request", side_effect=mock_sr),
+            patch.object(helpers_mod, "send_batch", side_effect=_batched(mock_sr)),
         ):
             result = CliRunner().invoke(main, ["snapshot", "142", "-o", str(out_dir)])
 
@@ -188,9 +195,8 @@ class TestSnapshotPartialFailures:
         mock_sr = _build_send_request_mock(tmp_path, color_targets=1, has_depth=False)
 
         with (
-            patch.object(snap_mod, "call", return_value=_PIPELINE_RESPONSE),
             patch.object(helpers_mod, "require_session", return_value=_SESSION),
-            patch.object(helpers_mod, "send_request", side_effect=mock_sr),
+            patch.object(helpers_mod, "send_batch", side_effect=_batched(mock_sr)),
         ):
             result = CliRunner().invoke(main, ["snapshot", "142", "-o", str(out_dir)])
 
@@ -204,9 +210,8 @@ class TestSnapshotPartialFailures:
         mock_sr = _build_send_request_mock(tmp_path, color_targets=3, has_depth=True)
 
         with (
-            patch.object(snap_mod, "call", return_value=_PIPELINE_RESPONSE),
             patch.object(helpers_mod, "require_session", return_value=_SESSION),
-            patch.object(helpers_mod, "send_request", side_effect=mock_sr),
+            patch.object(helpers_mod, "send_batch", side_effect=_batched(mock_sr)),
         ):
             result = CliRunner().invoke(main, ["snapshot", "142", "-o", str(out_dir)])
 
@@ -233,6 +238,8 @@ class TestSnapshotRemoteSkips:
         ) -> dict[str, Any]:
             method = payload["method"]
             params = payload.get("params", {})
+            if method == "pipeline":
+                return {"jsonrpc": "2.0", "id": 1, "result": _PIPELINE_RESPONSE}
             if method == "shader_all":
                 return {"jsonrpc": "2.0", "id": 1, "result": {"eid": 142, "stages": []}}
             if method == "rt_export":
@@ -268,9 +275,8 @@ class TestSnapshotRemoteSkips:
             tmp_path, color_error_code=-32002, depth_error_code=-32001
         )
         with (
-            patch.object(snap_mod, "call", return_value=_PIPELINE_RESPONSE),
             patch.object(helpers_mod, "require_session", return_value=_SESSION),
-            patch.object(helpers_mod, "send_request", side_effect=mock_sr),
+            patch.object(helpers_mod, "send_batch", side_effect=_batched(mock_sr)),
         ):
             result = CliRunner().invoke(main, ["snapshot", "142", "-o", str(out_dir)])
 
@@ -286,9 +292,8 @@ class TestSnapshotRemoteSkips:
             tmp_path, color_error_code=-32001, depth_error_code=-32002
         )
         with (
-            patch.object(snap_mod, "call", return_value=_PIPELINE_RESPONSE),
             patch.object(helpers_mod, "require_session", return_value=_SESSION),
-            patch.object(helpers_mod, "send_request", side_effect=mock_sr),
+            patch.object(helpers_mod, "send_batch", side_effect=_batched(mock_sr)),
         ):
             result = CliRunner().invoke(main, ["snapshot", "142", "-o", str(out_dir)])
 
@@ -301,10 +306,49 @@ class TestSnapshotFatalFailures:
     def test_pipeline_fails(self, tmp_path: Path) -> None:
         out_dir = tmp_path / "snap"
 
-        with patch.object(snap_mod, "call", side_effect=SystemExit(1)):
+        def fake_send_request(
+            host: str, port: int, payload: dict[str, Any], **_kw: Any
+        ) -> dict[str, Any]:
+            if payload["method"] == "pipeline":
+                return {"jsonrpc": "2.0", "id": 1, "error": {"code": -32002, "message": "bad eid"}}
+            return {"jsonrpc": "2.0", "id": 1, "result": {}}
+
+        with (
+            patch.object(helpers_mod, "require_session", return_value=_SESSION),
+            patch.object(helpers_mod, "send_batch", side_effect=_batched(fake_send_request)),
+        ):
             result = CliRunner().invoke(main, ["snapshot", "142", "-o", str(out_dir)])
 
         assert result.exit_code == 1
+        assert "bad eid" in result.output
+        assert not (out_dir / "pipeline.json").exists()
+
+    def test_single_round_trip(self, tmp_path: Path) -> None:
+        out_dir = tmp_path / "snap"
+        mock_sr = _build_send_request_mock(tmp_path, color_targets=1, has_depth=True)
+        batch = _batched(mock_sr)
+        sent: list[list[dict[str, Any]]] = []
+        timeouts: list[float] = []
+
+        def recording_batch(host: str, port: int, payloads: Any, **kw: Any) -> Any:
+            sent.append(payloads)
+            timeouts.append(kw["timeout"])
+            return batch(host, port, payloads, **kw)
+
+        with (
+            patch.object(helpers_mod, "require_session", return_value=_SESSION),
+            patch.object(helpers_mod, "send_batch", side_effect=recording_batch),
+            patch.object(helpers_mod, "send_request", side_effect=AssertionError("no 1:1")),
+        ):
+            result = CliRunner().invoke(main, ["snapshot", "142", "-o", str(out_dir)])
+
+        assert result.exit_code == 0
+        assert len(sent) == 1
+        methods = [p["method"] for p in sent[0]]
+        assert methods[0] == "pipeline"
+        assert methods.count("rt_export") == 8
+        assert len({p["id"] for p in sent[0]}) == len(sent[0])
+        assert timeouts == [30.0 * len(sent[0])]
 
     def test_no_session(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         out_dir = tmp_path / "snap"
@@ -377,6 +377,8 @@ class TestSnapshotSplit:
         def mock_send(host: str, port: int, payload: dict[str, Any], **kw: Any) -> dict[str, Any]:
             method = payload["method"]
             params = payload.get("params", {})
+            if method == "pipeline":
+                return {"result": _PIPELINE_RESPONSE}
             if method == "shader_all":
                 return {"result": {"eid": 142, "stages": []}}
             if method == "shader_disasm":
@@ -394,9 +396,14 @@ class TestSnapshotSplit:
                 return {"result": {"ok": True}}
             return {"result": {}}
 
+        def mock_batch(
+            host: str, port: int, payloads: list[dict[str, Any]], **kw: Any
+        ) -> list[dict[str, Any]]:
+            return [{**mock_send(host, port, p), "id": p["id"]} for p in payloads]
+
         monkeypatch.setattr(helpers_mod, "send_request", mock_send)
+        monkeypatch.setattr(helpers_mod, "send_batch", mock_batch)
         monkeypatch.setattr(helpers_mod, "require_session", lambda: _SESSION_TUPLE)
-        monkeypatch.setattr("rdc.commands.snapshot.call", lambda *a, **kw: _PIPELINE_RESPONSE)
 
         return out_dir
 
@@ -13,6 +13,14 @@ from rdc.commands import usage as usage_mod
 
 def _patch(monkeypatch: Any, response: dict) -> None:
     monkeypatch.setattr(usage_mod, "call", lambda method, params=None: response)
+    _patch_stream(monkeypatch, lambda method, params=None: response)
+
+
+def _patch_stream(monkeypatch: Any, fake_call: Any) -> None:
+    """Serve ``call_stream`` from a fake ``call``."""
+    monkeypatch.setattr(
+        usage_mod, "call_stream", lambda method, params, key: iter(fake_call(method, params)[key])
+    )
 
 
 _SINGLE_RESPONSE = {
@@ -71,7 +79,7 @@ def test_usage_all_type_filter(monkeypatch: Any) -> None:
         captured["params"] = params or {}
         return {"rows": [{"id": 97, "name": "2D Image 97", "eid": 6, "usage": "Clear"}], "total": 1}
 
-    monkeypatch.setattr(usage_mod, "call", _capture)
+    _patch_stream(monkeypatch, _capture)
     result = CliRunner().invoke(main, ["usage", "--all", "--type", "Texture"])
     assert result.exit_code == 0
     assert captured["params"].get("type") == "Texture"
@@ -86,7 +94,7 @@ def test_usage_all_usage_filter(monkeypatch: Any) -> None:
         row = {"id": 97, "name": "2D Image 97", "eid": 11, "usage": "ColorTarget"}
         return {"rows": [row], "total": 1}
 
-    monkeypatch.setattr(usage_mod, "call", _capture)
+    _patch_stream(monkeypatch, _capture)
     result = CliRunner().invoke(main, ["usage", "--all", "--usage", "ColorTarget"])
     assert result.exit_code == 0
     assert captured["params"].get("usage") == "ColorTarget"
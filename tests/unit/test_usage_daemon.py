@@ -133,3 +133,136 @@ def test_usage_all_no_adapter() -> None:
     state = DaemonState(capture="x.rdc", current_eid=0, token="tok")
     resp, _ = _handle_request(rpc_request("usage_all"), state)
     assert resp["error"]["code"] == -32002
+
+
+# ---------------------------------------------------------------------------
+# usage table: range / kind queries, one GetUsage per resource
+# ---------------------------------------------------------------------------
+
+
+def test_usage_range_param() -> None:
+    state = _state_with_usage()
+    resp, _ = _handle_request(rpc_request("usage", {"id": 97, "range": "7:12"}), state)
+    assert [e["eid"] for e in resp["result"]["entries"]] == [11, 12]
+    resp, _ = _handle_request(rpc_request("usage", {"id": 97, "range": ":11"}), state)
+    assert [e["eid"] for e in resp["result"]["entries"]] == [6, 11]
+
+
+def test_usage_kind_param() -> None:
+    state = _state_with_usage()
+    resp, _ = _handle_request(rpc_request("usage", {"id": 97, "usage": "CopySrc"}), state)
+    assert resp["result"]["entries"] == [{"eid": 12, "usage": "CopySrc"}]
+
+
+def test_usage_all_range_param() -> None:
+    state = _state_with_usage()
+    resp, _ = _handle_request(rpc_request("usage_all", {"range": "11:11"}), state)
+    rows = resp["result"]["rows"]
+    assert [(r["id"], r["eid"]) for r in rows] == [(97, 11), (105, 11)]
+
+
+def test_usage_bad_range() -> None:
+    state = _state_with_usage()
+    resp, _ = _handle_request(rpc_request("usage", {"id": 97, "range": "a:b"}), state)
+    assert resp["error"]["code"] == -32602
+    resp, _ = _handle_request(rpc_request("usage_all", {"range": "12"}), state)
+    assert resp["error"]["code"] == -32602
+
+
+def _count_get_usage(state: DaemonState) -> list[int]:
+    assert state.adapter is not None
+    ctrl = state.adapter.controller
+    calls: list[int] = []
+    original = ctrl.GetUsage
+
+    def _tracking(rid: object) -> object:
+        calls.append(int(rid))  # type: ignore[call-overload]
+        return original(rid)
+
+    ctrl.GetUsage = _tracking
+    return calls
+
+
+def test_usage_table_built_once() -> None:
+    state = _state_with_usage()
+    calls = _count_get_usage(state)
+    _handle_request(rpc_request("usage", {"id": 97}), state)
+    assert calls == [97]
+    _handle_request(rpc_request("usage_all"), state)
+    _handle_request(rpc_request("usage_all", {"usage": "Clear"}), state)
+    _handle_request(rpc_request("usage", {"id": 105}), state)
+    assert sorted(calls) == [97, 105, 200]
+
+
+def test_usage_table_rebuilt_on_new_adapter() -> None:
+    state = _state_with_usage()
+    _handle_request(rpc_request("usage_all"), state)
+    assert state.adapter is not None
+    state.adapter = RenderDocAdapter(controller=state.adapter.controller, version=(1, 33))
+    calls = _count_get_usage(state)
+    _handle_request(rpc_request("usage_all"), state)
+    assert sorted(calls) == [97, 105, 200]
+
+
+def test_idle_step_fills_incrementally(monkeypatch: object) -> None:
+    import rdc.daemon_server as ds
+    from rdc.handlers._helpers import WarmUp
+
+    state = _state_with_usage()
+    state._warm = WarmUp(pending=["usage"])
+    monkeypatch.setattr(ds, "_IDLE_USAGE_BATCH", 2)  # type: ignore[attr-defined]
+    assert ds._idle_step(state) is True
+    assert state._usage_table is not None
+    assert state._usage_table.progress == (2, 3)
+    assert ds._idle_step(state) is False
+    assert state._usage_table.complete
+    calls = _count_get_usage(state)
+    resp, _ = _handle_request(rpc_request("usage_all"), state)
+    assert resp["result"]["total"] == 4
+    assert calls == []
+
+
+def test_idle_step_without_table() -> None:
+    from rdc.daemon_server import _idle_step
+
+    assert _idle_step(_state_with_usage()) is False
+
+
+def test_usage_table_query() -> None:
+    from rdc.services.usage_service import UsageTable
+
+    state = _state_with_usage()
+    assert state.adapter is not None
+    table = UsageTable(state.res_rid_map)
+    assert table.fill(state.adapter.controller.GetUsage, limit=1) is False
+    assert table.fill(state.adapter.controller.GetUsage) is True
+    assert list(table) == [97, 105, 200]
+    assert [u.eventId for u in table[97]] == [6, 11, 12]
+    clear = table.kinds_named("Clear")
+    assert table.query(97, kinds=clear) == [(6, int(rd.ResourceUsage.Clear))]
+    assert table.query(97, eid_min=7, eid_max=11) == [(11, int(rd.ResourceUsage.ColorTarget))]
+    assert table.query(999) == []
+
+
+def test_usage_all_paged() -> None:
+    state = _state_with_usage()
+    full, _ = _handle_request(rpc_request("usage_all"), state)
+    resp, _ = _handle_request(rpc_request("usage_all", {"page_size": 3}), state)
+    first = resp["result"]
+    assert first["total"] == 4
+    assert first["rows"] == full["result"]["rows"][:3]
+    resp, _ = _handle_request(
+        rpc_request("usage_all", {"page_size": 3, "cursor": first["next_cursor"]}), state
+    )
+    assert resp["result"]["rows"] == full["result"]["rows"][3:]
+    assert resp["result"]["next_cursor"] is None
+
+
+def test_usage_all_stream() -> None:
+    state = _state_with_usage()
+    full, _ = _handle_request(rpc_request("usage_all"), state)
+    resp, _ = _handle_request(rpc_request("usage_all", {"_stream": True}), state)
+    result = resp["result"]
+    assert result["_stream"] == "rows"
+    assert result["total"] == 4
+    assert list(result["rows"]) == full["result"]["rows"]
@@ -158,6 +158,35 @@ def test_ls_json(monkeypatch) -> None:
     assert len(parsed) == 2
 
 
+def test_ls_long_pages_print_header_once(monkeypatch) -> None:
+    pages = {
+        None: {
+            "path": "/events",
+            "kind": "dir",
+            "long": True,
+            "columns": ["EID", "NAME", "TYPE"],
+            "children": [{"name": "1", "eid": 1, "type": "Draw"}],
+            "next_cursor": "c1",
+        },
+        "c1": {
+            "path": "/events",
+            "kind": "dir",
+            "long": True,
+            "columns": ["EID", "NAME", "TYPE"],
+            "children": [{"name": "2", "eid": 2, "type": "Draw"}],
+            "next_cursor": None,
+        },
+    }
+
+    def fake_call(method, params=None):
+        return pages[params.get("cursor")]
+
+    monkeypatch.setattr(vfs_mod, "call", fake_call)
+    result = CliRunner().invoke(ls_cmd, ["-l", "/events"])
+    assert result.exit_code == 0
+    assert result.output.splitlines() == ["EID\tNAME\tTYPE", "1\t1\tDraw", "2\t2\tDraw"]
+
+
 def test_ls_not_a_directory(monkeypatch) -> None:
     _patch(
         monkeypatch,
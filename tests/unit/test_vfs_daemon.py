@@ -636,3 +636,23 @@ class TestVfsShaderUsedBy:
         resp, _ = _handle_request(rpc_request("vfs_ls", {"path": "/shaders/1"}), state)
         used_by = next(c for c in resp["result"]["children"] if c["name"] == "used-by")
         assert used_by["kind"] == "leaf"
+
+
+class TestVfsLsPagination:
+    def test_long_events_paged(self):
+        state = _make_state()
+        params = {"path": "/events", "long": True}
+        full, _ = _handle_request(rpc_request("vfs_ls", params), state)
+        children: list[dict] = []
+        cursor = None
+        while True:
+            page_params = {**params, "page_size": 1, **({"cursor": cursor} if cursor else {})}
+            resp, _ = _handle_request(rpc_request("vfs_ls", page_params), state)
+            result = resp["result"]
+            assert result["columns"] == full["result"]["columns"]
+            assert result["total"] == len(full["result"]["children"])
+            children.extend(result["children"])
+            cursor = result["next_cursor"]
+            if cursor is None:
+                break
+        assert children == full["result"]["children"]
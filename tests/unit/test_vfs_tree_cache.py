@@ -215,6 +215,27 @@ class TestBuildVfsSkeleton:
         assert skeleton.static["/passes/ShadowPass/info"].kind == "leaf"
         assert skeleton.static["/passes/ShadowPass/draws"].kind == "dir"
 
+    def test_pass_draws_alias_outside_range_missing(self, skeleton: VfsTree) -> None:
+        assert skeleton.static["/passes/ShadowPass/draws/10"].kind == "alias"
+        assert skeleton.static.get("/passes/ShadowPass/draws/30") is None
+        assert skeleton.static.get("/passes/ShadowPass/draws/2") is None
+
+    def test_list_pass_with_many_draws(self) -> None:
+        n = 20000
+        draws = [
+            ActionDescription(eventId=i, flags=ActionFlags.Drawcall, _name=f"Draw #{i}")
+            for i in range(2, n + 2)
+        ]
+        actions = [
+            ActionDescription(eventId=1, flags=ActionFlags.BeginPass, _name="Big", children=draws),
+            ActionDescription(eventId=n + 2, flags=ActionFlags.EndPass, _name="End Big"),
+        ]
+        tree = build_vfs_skeleton(actions, [])
+        listing = tree.static["/passes/Big/draws"]
+        assert len(listing.children) == n
+        for name in listing.children:
+            assert tree.static[f"/passes/Big/draws/{name}"].kind == "alias"
+
     def test_resources_children(self, skeleton: VfsTree) -> None:
         res = skeleton.static["/resources"]
         assert res.kind == "dir"
@@ -819,3 +840,60 @@ class TestRenderTreeRoot:
         result = render_tree_root("/", node, max_depth=1)
         lines = result.split("\n")
         assert lines[1] == "\\-- current@"
+
+
+# ---------------------------------------------------------------------------
+# Lazy skeleton resolution
+# ---------------------------------------------------------------------------
+
+
+class TestLazySkeleton:
+    def test_nothing_materialized_at_build(self, skeleton: VfsTree) -> None:
+        assert len(skeleton.static) == 0
+
+    def test_dir_nodes_kept_after_lookup(self, skeleton: VfsTree) -> None:
+        node = skeleton.static["/passes/GBuffer/attachments"]
+        node.children = ["color0"]
+        assert skeleton.static["/passes/GBuffer/attachments"].children == ["color0"]
+
+    def test_pass_draws_resolved_by_range(self, skeleton: VfsTree) -> None:
+        assert skeleton.static["/passes/ShadowPass/draws"].children == ["10", "20"]
+        assert skeleton.static["/passes/ShadowPass/draws/20"].kind == "alias"
+        assert "/passes/ShadowPass/draws/30" not in skeleton.static
+
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "",
+            "/nope",
+            "/events/999",
+            "/events/abc",
+            "/draws/1",
+            "/draws/10/nope",
+            "/draws/10/pipeline/nope",
+            "/draws/10/shader/vs",
+            "/passes/Missing",
+            "/resources/99/info",
+            "/info/x",
+            "/textures/5",
+        ],
+    )
+    def test_unknown_paths(self, skeleton: VfsTree, path: str) -> None:
+        assert skeleton.static.get(path) is None
+
+    def test_texture_slice_paths(self) -> None:
+        tex = TextureDescription(resourceId=ResourceId(7), mips=2, arraysize=3)
+        skel = build_vfs_skeleton([], [], textures=[tex])
+        assert skel.static["/textures/7/mips"].children == ["0.png", "1.png", "0", "1"]
+        assert skel.static["/textures/7/mips/1/slices"].children == ["1.png", "2.png"]
+        assert skel.static["/textures/7/mips/1/slices/2.png"].kind == "leaf_bin"
+        assert "/textures/7/mips/1/slices/3.png" not in skel.static
+        assert "/textures/7/mips/2.png" not in skel.static
+        assert "/textures/7/mips/0.png/slices" not in skel.static
+
+    def test_flat_reused(self) -> None:
+        from rdc.services.query_service import walk_actions
+
+        flat = walk_actions(_make_actions())
+        skel = build_vfs_skeleton([], [], flat=flat, pass_list=[])
+        assert skel.static["/draws"].children == ["10", "20", "30", "50"]